@@ -0,0 +1,171 @@
+from typing import Any, Dict, NamedTuple, Tuple
+
+
+# LLM 호출이 불가능할 때 사용하는 결정적 대체 응답 엔진.
+# 테이블은 모듈 로드 시 한 번만 만들어지며 실제 category/priority 값(영문 리터럴)을 키로 사용합니다.
+
+
+class _AnalysisRule(NamedTuple):
+    base_difficulty: float
+    difficulty_slope: float
+    base_duration: int
+    min_duration: int
+    base_probability: float
+    probability_divisor: float
+    suggestion: str
+
+
+class _PlanRule(NamedTuple):
+    title: str
+    description: str
+    steps: Tuple[Tuple[str, str, int], ...]
+
+
+_ANALYSIS_RULES: Dict[str, _AnalysisRule] = {
+    "health": _AnalysisRule(
+        6.5, 2.0, 90, 30, 0.75, 200,
+        "건강 목표는 꾸준함이 핵심입니다. 현재 {progress_rate:.1f}% 달성하셨네요! 작은 습관부터 시작하여 점진적으로 강도를 높여가세요."
+    ),
+    "education": _AnalysisRule(
+        7.0, 1.5, 120, 60, 0.70, 250,
+        "학습은 반복과 이해가 중요합니다. {progress_rate:.1f}% 진행 중이시군요. 매일 조금씩이라도 꾸준히 학습하고 복습 시간을 확보하세요."
+    ),
+    "career": _AnalysisRule(
+        7.5, 1.0, 100, 45, 0.80, 300,
+        "업무 목표는 체계적인 계획과 실행이 중요합니다. {progress_rate:.1f}% 달성 중이시네요. 우선순위를 정하고 단계별로 접근해보세요."
+    ),
+    "personal": _AnalysisRule(
+        5.5, 2.0, 80, 30, 0.85, 400,
+        "개인 목표는 즐거움이 우선입니다! {progress_rate:.1f}% 진행 중이군요. 부담을 갖지 말고 재미있게 접근하세요."
+    ),
+    "finance": _AnalysisRule(
+        7.0, 1.5, 180, 60, 0.70, 250,
+        "재정 목표는 자동화와 기록이 중요합니다. 현재 {progress_rate:.1f}% 달성하셨네요. 고정 지출을 점검하고 정기적으로 저축 금액을 확인하세요."
+    ),
+}
+
+_DEFAULT_ANALYSIS_SUGGESTION = "현재 {progress_rate:.1f}% 진행 중입니다. 목표를 작은 단위로 나누어 꾸준히 진행해보세요."
+
+_PRIORITY_MULTIPLIERS: Dict[str, float] = {
+    "high": 1.2,
+    "medium": 1.0,
+    "low": 0.8,
+}
+
+_PLAN_RULES: Dict[str, _PlanRule] = {
+    "health": _PlanRule(
+        "{goal_title} 건강 실행 계획",
+        "건강한 습관 형성을 위한 단계별 계획",
+        (
+            ("기초 체력 평가", "현재 상태를 파악하고 {target_value}{unit} 목표 달성을 위한 기초 체력을 측정합니다.", 30),
+            ("점진적 강도 증가", "몸에 무리가 가지 않도록 천천히 강도를 높여가며 꾸준한 습관을 만듭니다.", 45),
+            ("진도 추적 및 조정", "매주 진도를 체크하고 몸의 변화에 맞춰 계획을 조정합니다.", 20),
+        ),
+    ),
+    "education": _PlanRule(
+        "{goal_title} 학습 실행 계획",
+        "효과적인 학습을 위한 체계적 접근법",
+        (
+            ("학습 자료 정리", "{goal_title} 목표 달성을 위한 필요한 자료와 커리큘럼을 정리합니다.", 60),
+            ("일일 학습 루틴", "매일 일정한 시간에 집중적으로 학습할 수 있는 루틴을 만듭니다.", 90),
+            ("복습 및 실습", "배운 내용을 복습하고 실제로 적용해볼 수 있는 시간을 확보합니다.", 60),
+        ),
+    ),
+    "career": _PlanRule(
+        "{goal_title} 업무 실행 계획",
+        "업무 효율성 극대화를 위한 전략적 계획",
+        (
+            ("작업 분석 및 우선순위", "{goal_title} 달성을 위해 필요한 업무들을 분석하고 우선순위를 정합니다.", 45),
+            ("시간 관리 시스템", "효율적인 시간 배분과 집중력 향상을 위한 시스템을 구축합니다.", 30),
+            ("성과 측정 및 개선", "정기적으로 성과를 측정하고 개선점을 찾아 적용합니다.", 40),
+        ),
+    ),
+    "personal": _PlanRule(
+        "{goal_title} 개인 실행 계획",
+        "즐거운 자기계발을 위한 단계별 접근",
+        (
+            ("기초 준비 및 환경 조성", "{goal_title} 활동을 위한 필요한 도구나 환경을 준비합니다.", 30),
+            ("기본기 익히기", "부담 없이 기본기부터 차근차근 익혀가며 재미를 찾습니다.", 60),
+            ("실력 향상 및 도전", "점차 실력을 향상시키며 새로운 도전을 시도합니다.", 90),
+        ),
+    ),
+    "finance": _PlanRule(
+        "{goal_title} 재정 실행 계획",
+        "안정적인 재정 목표 달성을 위한 단계별 계획",
+        (
+            ("현금 흐름 점검", "최근 수입과 지출을 정리하고 {target_value}{unit} 목표에 필요한 월별 금액을 계산합니다.", 60),
+            ("자동 저축 설정", "급여일에 맞춰 자동 이체를 설정하여 꾸준히 저축합니다.", 30),
+            ("월간 점검", "매월 진도를 확인하고 지출 계획을 조정합니다.", 30),
+        ),
+    ),
+}
+
+_DEFAULT_PLAN = _PlanRule(
+    "{goal_title} 실행 계획",
+    "목표 달성을 위한 체계적 접근법",
+    (
+        ("현재 상황 분석", "현재 {progress_rate:.1f}% 달성 상태를 분석하고 남은 과제를 파악합니다.", 45),
+        ("단계별 실행", "목표를 작은 단위로 나누어 단계적으로 실행합니다.", 60),
+        ("지속적인 관리", "꾸준한 진도 체크와 동기 부여를 통해 목표를 완성합니다.", 30),
+    ),
+)
+
+
+def _progress_rate(goal_doc: Dict[str, Any]) -> float:
+    target_value = goal_doc.get("target_value") or 0
+    if not target_value:
+        return 0.0
+    return (goal_doc.get("current_value", 0) / target_value) * 100
+
+
+def fallback_analysis(goal_doc: Dict[str, Any]) -> Dict[str, Any]:
+    """목표 내용 기반 맞춤형 분석을 생성합니다."""
+    progress_rate = _progress_rate(goal_doc)
+    rule = _ANALYSIS_RULES.get(goal_doc.get("category", ""))
+
+    if rule is None:
+        difficulty_score = 7.0
+        estimated_duration = 60
+        success_probability = 0.75
+        suggestions = _DEFAULT_ANALYSIS_SUGGESTION.format(progress_rate=progress_rate)
+    else:
+        difficulty_score = rule.base_difficulty + (progress_rate / 100) * rule.difficulty_slope
+        estimated_duration = max(rule.min_duration, int(rule.base_duration - progress_rate))
+        success_probability = rule.base_probability + (progress_rate / rule.probability_divisor)
+        suggestions = rule.suggestion.format(progress_rate=progress_rate)
+
+    # 우선순위에 따른 조정
+    multiplier = _PRIORITY_MULTIPLIERS.get(goal_doc.get("priority", "medium"), 1.0)
+    difficulty_score *= multiplier
+    estimated_duration = int(estimated_duration / multiplier)
+
+    return {
+        "difficulty_score": max(1.0, min(10.0, difficulty_score)),
+        "estimated_duration": max(1, estimated_duration),
+        "success_probability": max(0.1, min(1.0, success_probability)),
+        "suggestions": suggestions,
+    }
+
+
+def fallback_plan(goal_doc: Dict[str, Any]) -> Dict[str, Any]:
+    """목표 카테고리에 맞는 실행 계획을 생성합니다."""
+    rule = _PLAN_RULES.get(goal_doc.get("category", ""), _DEFAULT_PLAN)
+    values = {
+        "goal_title": goal_doc["title"],
+        "target_value": goal_doc.get("target_value"),
+        "unit": goal_doc.get("unit", ""),
+        "progress_rate": _progress_rate(goal_doc),
+    }
+    return {
+        "title": rule.title.format(**values),
+        "description": rule.description,
+        "steps": [
+            {
+                "step_number": number,
+                "title": title,
+                "description": description.format(**values),
+                "estimated_time": estimated_time,
+            }
+            for number, (title, description, estimated_time) in enumerate(rule.steps, start=1)
+        ],
+    }
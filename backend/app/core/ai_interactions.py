@@ -0,0 +1,178 @@
+import asyncio
+import zlib
+from collections import defaultdict
+from datetime import datetime
+from typing import Any, Dict, List, Optional, Tuple
+
+from bson import Binary
+from motor.motor_asyncio import AsyncIOMotorDatabase
+from pymongo import UpdateOne
+from pymongo.errors import BulkWriteError
+
+from app.core.config import settings
+
+DUPLICATE_KEY_ERROR = 11000
+
+
+class AIInteractionBuffer:
+    """ai_interactions 기록을 메모리에 모았다가 insert_many 로 한 번에 저장합니다.
+
+    프롬프트는 템플릿 ID와 파라미터로, 큰 응답은 zlib 으로 압축해 저장하며
+    원본 기록은 TTL 인덱스로 만료되고 일별 사용량 통계(ai_usage_daily)는 영구 보관됩니다.
+    """
+
+    def __init__(
+        self,
+        db: AsyncIOMotorDatabase,
+        max_buffer_size: int = settings.AI_INTERACTION_BUFFER_SIZE,
+        flush_interval: float = settings.AI_INTERACTION_FLUSH_INTERVAL_SECONDS,
+        compress_threshold: int = settings.AI_INTERACTION_COMPRESS_THRESHOLD_BYTES,
+    ):
+        self.db = db
+        self.max_buffer_size = max_buffer_size
+        self.flush_interval = flush_interval
+        self.compress_threshold = compress_threshold
+        self._buffer: List[Dict[str, Any]] = []
+        self._lock = asyncio.Lock()
+        self._flusher: Optional[asyncio.Task] = None
+        self._pending: set = set()
+        # 아직 ai_usage_daily 에 반영하지 못한 (날짜, 종류) 별 증가분
+        self._daily_stats: Dict[Tuple[str, str], Dict[str, int]] = defaultdict(
+            lambda: {"count": 0, "tokens_used": 0}
+        )
+
+    def record(
+        self,
+        *,
+        user_id: str,
+        goal_id: Optional[str],
+        interaction_type: str,
+        template_id: str,
+        params: Dict[str, Any],
+        ai_response: str,
+        tokens_used: int = 0,
+    ) -> None:
+        """상호작용 기록을 버퍼에 추가합니다. 요청 경로에서 DB 왕복이 발생하지 않습니다."""
+        doc: Dict[str, Any] = {
+            "user_id": user_id,
+            "goal_id": goal_id,
+            "interaction_type": interaction_type,
+            "prompt": {"template_id": template_id, "params": params},
+            "tokens_used": tokens_used,
+            "created_at": datetime.utcnow(),
+        }
+        encoded = (ai_response or "").encode("utf-8")
+        if len(encoded) > self.compress_threshold:
+            doc["ai_response_z"] = Binary(zlib.compress(encoded))
+            doc["ai_response_encoding"] = "zlib"
+        else:
+            doc["ai_response"] = ai_response
+        self._buffer.append(doc)
+
+        if len(self._buffer) >= self.max_buffer_size:
+            task = asyncio.create_task(self.flush())
+            self._pending.add(task)
+            task.add_done_callback(self._pending.discard)
+
+    async def flush(self) -> int:
+        """버퍼에 쌓인 기록을 저장하고 일별 통계를 갱신합니다.
+
+        저장과 통계 갱신은 따로 재시도합니다. 다시 버퍼에 넣는 기록은 저장되지 않은 것뿐이고,
+        이전 시도에서 이미 저장된 기록(같은 _id 의 중복 키 오류)은 저장된 것으로 봅니다.
+        """
+        async with self._lock:
+            stored: List[Dict[str, Any]] = []
+            if self._buffer:
+                batch, self._buffer = self._buffer, []
+                stored, failed = await self._insert(batch)
+                if failed:
+                    # 다음 플러시에서 재시도하되 버퍼가 무한히 커지지 않도록 제한
+                    room = max(0, self.max_buffer_size * 10 - len(self._buffer))
+                    self._buffer[:0] = failed[:room]
+                self._add_daily_stats(stored)
+
+            if self._daily_stats:
+                try:
+                    await self._write_daily_stats()
+                except Exception as e:
+                    print(f"AI 사용량 일별 통계 갱신 실패 ({len(self._daily_stats)}건, 다음 플러시에서 재시도): {e}")
+
+            return len(stored)
+
+    async def _insert(self, batch: List[Dict[str, Any]]) -> Tuple[List[Dict[str, Any]], List[Dict[str, Any]]]:
+        """(저장된 기록, 다시 시도할 기록)."""
+        try:
+            await self.db.ai_interactions.insert_many(batch, ordered=False)
+            return batch, []
+        except BulkWriteError as e:
+            retry = {
+                error["index"] for error in e.details.get("writeErrors", [])
+                if error.get("code") != DUPLICATE_KEY_ERROR
+            }
+            if retry:
+                print(f"AI 상호작용 기록 저장 실패 ({len(retry)}/{len(batch)}건): {e}")
+            return (
+                [doc for index, doc in enumerate(batch) if index not in retry],
+                [doc for index, doc in enumerate(batch) if index in retry],
+            )
+        except Exception as e:
+            # 일부가 저장되었을 수 있지만 _id 가 같으므로 재시도 시 중복 키로 걸러짐
+            print(f"AI 상호작용 기록 저장 실패 ({len(batch)}건): {e}")
+            return [], batch
+
+    def _add_daily_stats(self, docs: List[Dict[str, Any]]) -> None:
+        for doc in docs:
+            key = (doc["created_at"].strftime("%Y-%m-%d"), doc["interaction_type"])
+            self._daily_stats[key]["count"] += 1
+            self._daily_stats[key]["tokens_used"] += doc["tokens_used"] or 0
+
+    async def _write_daily_stats(self) -> None:
+        stats, self._daily_stats = self._daily_stats, defaultdict(lambda: {"count": 0, "tokens_used": 0})
+        operations = [
+            UpdateOne(
+                {"_id": f"{day}:{interaction_type}"},
+                {
+                    "$inc": values,
+                    "$setOnInsert": {"date": day, "interaction_type": interaction_type},
+                },
+                upsert=True,
+            )
+            for (day, interaction_type), values in stats.items()
+        ]
+        try:
+            await self.db.ai_usage_daily.bulk_write(operations, ordered=False)
+        except Exception:
+            # 반영하지 못한 증가분은 다음 플러시의 증가분과 합쳐 다시 씀
+            for key, values in stats.items():
+                self._daily_stats[key]["count"] += values["count"]
+                self._daily_stats[key]["tokens_used"] += values["tokens_used"]
+            raise
+
+    async def _run_periodic_flush(self) -> None:
+        while True:
+            await asyncio.sleep(self.flush_interval)
+            await self.flush()
+
+    def start(self) -> None:
+        if self._flusher is None:
+            self._flusher = asyncio.create_task(self._run_periodic_flush())
+
+    async def close(self) -> None:
+        """주기적 플러시를 멈추고 남은 기록을 모두 저장합니다."""
+        if self._flusher is not None:
+            self._flusher.cancel()
+            try:
+                await self._flusher
+            except asyncio.CancelledError:
+                pass
+            self._flusher = None
+        if self._pending:
+            await asyncio.gather(*self._pending, return_exceptions=True)
+        await self.flush()
+
+
+def decode_ai_response(doc: Dict[str, Any]) -> str:
+    """저장된 ai_interactions 문서에서 응답 원문을 복원합니다."""
+    if doc.get("ai_response_encoding") == "zlib":
+        return zlib.decompress(doc["ai_response_z"]).decode("utf-8")
+    return doc.get("ai_response", "")
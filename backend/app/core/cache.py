@@ -0,0 +1,421 @@
+import asyncio
+import json
+import math
+import random
+import time
+import uuid
+from collections import OrderedDict
+from typing import Any, Awaitable, Callable, Dict, Iterable, List, NamedTuple, Optional, Set, Tuple
+
+from redis.asyncio import Redis
+
+from app.core.metrics import CACHE_REQUESTS
+from app.core.read_routing import remember_current_write
+
+# 2단계 읽기 캐시: 프로세스 내 LRU/TTL + Redis
+# 항목에는 태그(사용자/목표 단위)를 붙이고, 쓰기 후 태그로 무효화하면
+# Redis 의 항목을 지우고 pub/sub 으로 모든 워커의 로컬 캐시에도 전파합니다.
+
+INVALIDATION_CHANNEL = "cache:invalidate"
+_KEY_PREFIX = "cache"
+# 로컬에서 추적하는 태그 무효화 횟수의 최대 개수 (밀려난 태그는 0 으로 보여 저장을 건너뛰는 안전한 방향)
+_TAG_EPOCH_LIMIT = 10000
+
+# 계산을 시작할 때 읽은 태그 버전이 그대로일 때만 저장 (계산 중 무효화된 값은 저장하지 않음)
+# KEYS: 항목 키, 태그 버전 키 n개, 태그 집합 키 n개 / ARGV: 값, TTL(ms), 태그 버전 n개
+_STORE_SCRIPT = """
+local n = (#KEYS - 1) / 2
+for i = 1, n do
+    local version = redis.call('GET', KEYS[1 + i]) or '0'
+    if version ~= ARGV[2 + i] then
+        return 0
+    end
+end
+redis.call('SET', KEYS[1], ARGV[1], 'PX', ARGV[2])
+for i = 1, n do
+    redis.call('SADD', KEYS[1 + n + i], KEYS[1])
+    redis.call('PEXPIRE', KEYS[1 + n + i], ARGV[2])
+end
+return 1
+"""
+
+# 태그 버전을 올리고 태그에 속한 항목을 삭제
+# KEYS: (태그 버전 키, 태그 집합 키) 쌍 / ARGV: 태그 버전 키 TTL(ms)
+_INVALIDATE_SCRIPT = """
+for i = 1, #KEYS, 2 do
+    redis.call('INCR', KEYS[i])
+    redis.call('PEXPIRE', KEYS[i], ARGV[1])
+    for _, key in ipairs(redis.call('SMEMBERS', KEYS[i + 1])) do
+        redis.call('DEL', key)
+    end
+    redis.call('DEL', KEYS[i + 1])
+end
+return 1
+"""
+
+
+def user_tag(user_id: str) -> str:
+    return f"user:{user_id}"
+
+
+def goal_tag(goal_id: str) -> str:
+    return f"goal:{goal_id}"
+
+
+def _version_key(tag: str) -> str:
+    return f"{_KEY_PREFIX}:tagver:{tag}"
+
+
+def _tag_set_key(tag: str) -> str:
+    return f"{_KEY_PREFIX}:tag:{tag}"
+
+
+class _Entry(NamedTuple):
+    value: Any
+    expires_at: float  # Redis 계층 기준 만료 시각 (조기 갱신 판단에 사용)
+    delta: float  # 값을 계산하는 데 걸린 시간 (초)
+    tags: Tuple[str, ...]
+
+
+class TwoTierCache:
+    """프로세스 내 LRU/TTL 캐시와 Redis 캐시를 차례로 확인하는 읽기 캐시.
+
+    - 같은 키를 동시에 계산하지 않도록 프로세스 안에서는 진행 중인 계산을 공유하고,
+      워커 사이에서는 Redis SET NX 잠금을 잡은 워커만 계산합니다.
+    - 자주 읽히는 항목은 만료 직전에 확률적으로 미리 다시 계산합니다 (XFetch).
+    - Redis 가 없거나 오류가 나면 로컬 캐시만 사용하고, 값은 항상 loader 로 계산할 수 있습니다.
+
+    값은 Redis 에 JSON 으로 저장하므로 loader 는 JSON 으로 직렬화 가능한 값을 반환해야 합니다.
+    """
+
+    def __init__(
+        self,
+        redis: Optional[Redis],
+        *,
+        local_max_entries: int,
+        local_ttl: float,
+        ttl: int,
+        lock_timeout: float,
+        early_refresh_beta: float,
+        enabled: bool = True,
+    ):
+        self.redis = redis
+        self.local_max_entries = local_max_entries
+        self.local_ttl = local_ttl
+        self.ttl = ttl
+        self.lock_timeout = lock_timeout
+        self.early_refresh_beta = early_refresh_beta
+        self.enabled = enabled
+        self._instance_id = uuid.uuid4().hex
+        self._local: "OrderedDict[str, Tuple[_Entry, float]]" = OrderedDict()
+        self._tag_keys: Dict[str, Set[str]] = {}
+        self._tag_epochs: "OrderedDict[str, int]" = OrderedDict()
+        self._inflight: Dict[str, asyncio.Future] = {}
+        self._background: Set[asyncio.Task] = set()
+        self._listener: Optional[asyncio.Task] = None
+        self._counts: Dict[Tuple[str, str], int] = {}
+        self._events = {"early_refresh": 0, "stale_fill_skipped": 0, "invalidations": 0}
+        if redis is not None:
+            self._store_script = redis.register_script(_STORE_SCRIPT)
+            self._invalidate_script = redis.register_script(_INVALIDATE_SCRIPT)
+
+    # ---- 조회 ----
+
+    async def get_or_set(
+        self,
+        namespace: str,
+        key: str,
+        loader: Callable[[], Awaitable[Any]],
+        tags: Iterable[str] = (),
+        ttl: Optional[int] = None,
+    ) -> Any:
+        """캐시된 값을 반환하고, 없으면 loader 로 계산해 두 계층에 저장합니다.
+
+        loader 가 예외를 발생시키면(예: 404) 저장하지 않고 그대로 전달합니다.
+        """
+        if not self.enabled:
+            return await loader()
+
+        full_key = f"{_KEY_PREFIX}:{namespace}:{key}"
+        tags = tuple(tags)
+        ttl = ttl or self.ttl
+
+        entry = self._local_get(full_key)
+        if entry is not None:
+            self._count(namespace, "local_hit")
+        else:
+            entry = await self._redis_get(full_key)
+            if entry is not None:
+                self._count(namespace, "redis_hit")
+                self._local_set(full_key, entry)
+        if entry is not None:
+            self._maybe_refresh_early(full_key, entry, loader, tags, ttl)
+            return entry.value
+
+        self._count(namespace, "miss")
+        return await self._load(full_key, loader, tags, ttl)
+
+    async def _load(
+        self, full_key: str, loader: Callable[[], Awaitable[Any]], tags: Tuple[str, ...], ttl: int
+    ) -> Any:
+        """같은 키의 동시 계산을 하나로 합칩니다."""
+        inflight = self._inflight.get(full_key)
+        if inflight is not None:
+            return await asyncio.shield(inflight)
+
+        future = asyncio.get_running_loop().create_future()
+        self._inflight[full_key] = future
+        try:
+            value = await self._fill(full_key, loader, tags, ttl)
+        except asyncio.CancelledError:
+            future.cancel()
+            raise
+        except BaseException as e:
+            future.set_exception(e)
+            future.exception()  # 기다리는 요청이 없어도 경고가 출력되지 않도록 처리된 것으로 표시
+            raise
+        else:
+            future.set_result(value)
+            return value
+        finally:
+            self._inflight.pop(full_key, None)
+
+    async def _fill(
+        self, full_key: str, loader: Callable[[], Awaitable[Any]], tags: Tuple[str, ...], ttl: int
+    ) -> Any:
+        local_epochs = self._epochs(tags)
+        versions = await self._redis_versions(tags)
+        locked = await self._acquire_lock(full_key)
+        if locked is False:
+            # 다른 워커가 계산 중이면 결과가 저장될 때까지 잠시 기다림
+            entry = await self._wait_for_fill(full_key)
+            if entry is not None:
+                self._local_set(full_key, entry)
+                return entry.value
+        try:
+            started = time.time()
+            value = await loader()
+            delta = time.time() - started
+            entry = _Entry(value, time.time() + ttl, delta, tags)
+            stored = await self._redis_set(full_key, entry, ttl, versions)
+            if stored and self._epochs(tags) == local_epochs:
+                self._local_set(full_key, entry)
+            else:
+                self._events["stale_fill_skipped"] += 1
+            return value
+        finally:
+            if locked:
+                await self._release_lock(full_key)
+
+    def _maybe_refresh_early(
+        self, full_key: str, entry: _Entry, loader: Callable[[], Awaitable[Any]], tags: Tuple[str, ...], ttl: int
+    ) -> None:
+        """XFetch: 계산 시간이 길수록, 만료가 가까울수록 높은 확률로 미리 다시 계산합니다."""
+        if self.early_refresh_beta <= 0 or full_key in self._inflight:
+            return
+        gap = -entry.delta * self.early_refresh_beta * math.log(1.0 - random.random())
+        if time.time() + gap < entry.expires_at:
+            return
+        self._events["early_refresh"] += 1
+        task = asyncio.create_task(self._load(full_key, loader, tags, ttl))
+        self._background.add(task)
+        task.add_done_callback(self._finish_background)
+
+    def _finish_background(self, task: asyncio.Task) -> None:
+        self._background.discard(task)
+        if not task.cancelled() and task.exception() is not None:
+            print(f"캐시 조기 갱신 실패: {task.exception()}")
+
+    # ---- 로컬 계층 ----
+
+    def _local_get(self, full_key: str) -> Optional[_Entry]:
+        item = self._local.get(full_key)
+        if item is None:
+            return None
+        entry, local_expires_at = item
+        if time.time() >= local_expires_at:
+            self._local_pop(full_key)
+            return None
+        self._local.move_to_end(full_key)
+        return entry
+
+    def _local_set(self, full_key: str, entry: _Entry) -> None:
+        self._local_pop(full_key)
+        self._local[full_key] = (entry, min(time.time() + self.local_ttl, entry.expires_at))
+        for tag in entry.tags:
+            self._tag_keys.setdefault(tag, set()).add(full_key)
+        while len(self._local) > self.local_max_entries:
+            self._local_pop(next(iter(self._local)))
+
+    def _local_pop(self, full_key: str) -> None:
+        item = self._local.pop(full_key, None)
+        if item is None:
+            return
+        for tag in item[0].tags:
+            keys = self._tag_keys.get(tag)
+            if keys is not None:
+                keys.discard(full_key)
+                if not keys:
+                    del self._tag_keys[tag]
+
+    def _drop_local(self, tags: Iterable[str]) -> None:
+        for tag in tags:
+            self._tag_epochs[tag] = self._tag_epochs.get(tag, 0) + 1
+            self._tag_epochs.move_to_end(tag)
+            for full_key in list(self._tag_keys.get(tag, ())):
+                self._local_pop(full_key)
+        while len(self._tag_epochs) > _TAG_EPOCH_LIMIT:
+            self._tag_epochs.popitem(last=False)
+
+    def _epochs(self, tags: Tuple[str, ...]) -> Tuple[int, ...]:
+        return tuple(self._tag_epochs.get(tag, 0) for tag in tags)
+
+    # ---- Redis 계층 ----
+
+    async def _redis_get(self, full_key: str) -> Optional[_Entry]:
+        if self.redis is None:
+            return None
+        try:
+            raw = await self.redis.get(full_key)
+        except Exception as e:
+            print(f"캐시 조회 실패 (Redis) - {full_key}: {e}")
+            return None
+        if raw is None:
+            return None
+        payload = json.loads(raw)
+        return _Entry(payload["v"], payload["e"], payload["d"], tuple(payload["t"]))
+
+    async def _redis_versions(self, tags: Tuple[str, ...]) -> Optional[List[str]]:
+        if self.redis is None or not tags:
+            return []
+        try:
+            versions = await self.redis.mget([_version_key(tag) for tag in tags])
+        except Exception as e:
+            print(f"캐시 태그 버전 조회 실패 (Redis): {e}")
+            return None
+        return [version or "0" for version in versions]
+
+    async def _redis_set(self, full_key: str, entry: _Entry, ttl: int, versions: Optional[List[str]]) -> bool:
+        """태그 버전이 바뀌지 않았을 때만 저장합니다. Redis 를 쓰지 않으면 True."""
+        if self.redis is None:
+            return True
+        if versions is None:
+            return False  # 버전을 확인하지 못했으면 오래된 값일 수 있으므로 저장하지 않음
+        payload = json.dumps({"v": entry.value, "e": entry.expires_at, "d": entry.delta, "t": list(entry.tags)})
+        try:
+            stored = await self._store_script(
+                keys=[full_key, *map(_version_key, entry.tags), *map(_tag_set_key, entry.tags)],
+                args=[payload, int(ttl * 1000), *versions],
+            )
+        except Exception as e:
+            print(f"캐시 저장 실패 (Redis) - {full_key}: {e}")
+            return False
+        return bool(stored)
+
+    async def _acquire_lock(self, full_key: str) -> Optional[bool]:
+        """True: 잠금 획득, False: 다른 워커가 계산 중, None: Redis 미사용/오류 (잠금 없이 계산)."""
+        if self.redis is None:
+            return None
+        try:
+            return bool(await self.redis.set(
+                f"{full_key}:lock", self._instance_id, nx=True, px=int(self.lock_timeout * 1000)
+            ))
+        except Exception:
+            return None
+
+    async def _release_lock(self, full_key: str) -> None:
+        try:
+            await self.redis.delete(f"{full_key}:lock")
+        except Exception:
+            pass
+
+    async def _wait_for_fill(self, full_key: str) -> Optional[_Entry]:
+        deadline = time.monotonic() + self.lock_timeout
+        while time.monotonic() < deadline:
+            await asyncio.sleep(0.05)
+            entry = await self._redis_get(full_key)
+            if entry is not None:
+                return entry
+        return None
+
+    # ---- 무효화 ----
+
+    async def invalidate(self, *tags: str) -> None:
+        """태그가 붙은 항목을 로컬/Redis 에서 삭제하고 다른 워커에 알립니다."""
+        tags = tuple(tag for tag in tags if tag)
+        if not self.enabled or not tags:
+            return
+        # 태그 버전을 올리기 전에 이 요청의 쓰기 시각을 저장해야 무효화 직후의 동시 읽기가
+        # 쓰기 이전 데이터를 세컨더리에서 읽어 새 버전으로 다시 캐시하지 않음
+        await remember_current_write()
+        self._events["invalidations"] += 1
+        self._drop_local(tags)
+        if self.redis is None:
+            return
+        keys: List[str] = []
+        for tag in tags:
+            keys.extend((_version_key(tag), _tag_set_key(tag)))
+        try:
+            # 태그 버전은 진행 중인 계산이 끝날 때까지는 남아 있어야 하므로 항목 TTL 보다 길게 유지
+            await self._invalidate_script(keys=keys, args=[int(self.ttl * 2 * 1000)])
+            await self.redis.publish(
+                INVALIDATION_CHANNEL, json.dumps({"origin": self._instance_id, "tags": list(tags)})
+            )
+        except Exception as e:
+            print(f"캐시 무효화 실패 (Redis) - {tags}: {e}")
+
+    async def _listen(self) -> None:
+        while True:
+            pubsub = self.redis.pubsub()
+            try:
+                await pubsub.subscribe(INVALIDATION_CHANNEL)
+                async for message in pubsub.listen():
+                    if message["type"] != "message":
+                        continue
+                    data = json.loads(message["data"])
+                    if data.get("origin") != self._instance_id:
+                        self._drop_local(data.get("tags", []))
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                print(f"캐시 무효화 구독 실패, 5초 후 다시 연결합니다: {e}")
+                # 연결이 끊긴 동안의 무효화 메시지를 놓쳤을 수 있으므로 로컬 캐시를 비움
+                self._local.clear()
+                self._tag_keys.clear()
+                await asyncio.sleep(5)
+            finally:
+                await pubsub.aclose()
+
+    def start(self) -> None:
+        if self.enabled and self.redis is not None and self._listener is None:
+            self._listener = asyncio.create_task(self._listen())
+
+    async def close(self) -> None:
+        tasks = list(self._background)
+        if self._listener is not None:
+            tasks.append(self._listener)
+            self._listener = None
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+
+    # ---- 통계 ----
+
+    def _count(self, namespace: str, result: str) -> None:
+        self._counts[(namespace, result)] = self._counts.get((namespace, result), 0) + 1
+        CACHE_REQUESTS.labels(namespace, result).inc()
+
+    def snapshot(self) -> Dict[str, Any]:
+        """네임스페이스별 로컬/Redis 적중 수, 미스 수, 적중률."""
+        namespaces: Dict[str, Dict[str, Any]] = {}
+        for (namespace, result), count in self._counts.items():
+            namespaces.setdefault(namespace, {"local_hit": 0, "redis_hit": 0, "miss": 0})[result] = count
+        for stats in namespaces.values():
+            total = stats["local_hit"] + stats["redis_hit"] + stats["miss"]
+            stats["hit_rate"] = round((stats["local_hit"] + stats["redis_hit"]) / total, 4) if total else 0.0
+        return {
+            "enabled": self.enabled,
+            "local_entries": len(self._local),
+            "namespaces": namespaces,
+            **self._events,
+        }
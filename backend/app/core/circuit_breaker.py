@@ -0,0 +1,125 @@
+import time
+from collections import deque
+from typing import Any, Deque, Dict, Tuple
+
+
+class CircuitOpenError(Exception):
+    """회로가 열려 있어 외부 호출을 시도하지 않았을 때 발생합니다."""
+
+
+class CircuitBreaker:
+    """오류율과 지연 시간 기준으로 외부 의존성 호출을 차단하는 회로 차단기입니다.
+
+    closed: 모든 호출 허용, 최근 호출 결과를 슬라이딩 윈도우로 집계
+    open: 호출 즉시 차단, open_seconds 경과 후 half-open 으로 전환
+    half-open: 시험 호출만 허용, 성공하면 closed / 실패하면 다시 open
+    """
+
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+    def __init__(
+        self,
+        name: str,
+        failure_rate_threshold: float = 0.5,
+        slow_call_threshold: float = 10.0,
+        slow_call_rate_threshold: float = 0.5,
+        window_size: int = 20,
+        minimum_calls: int = 5,
+        open_seconds: float = 30.0,
+        half_open_max_calls: int = 1,
+    ):
+        self.name = name
+        self.failure_rate_threshold = failure_rate_threshold
+        self.slow_call_threshold = slow_call_threshold
+        self.slow_call_rate_threshold = slow_call_rate_threshold
+        self.minimum_calls = minimum_calls
+        self.open_seconds = open_seconds
+        self.half_open_max_calls = half_open_max_calls
+
+        self._state = self.CLOSED
+        self._window: Deque[Tuple[bool, bool]] = deque(maxlen=window_size)
+        self._opened_at = 0.0
+        self._half_open_calls = 0
+        self._total_rejected = 0
+
+    @property
+    def state(self) -> str:
+        if self._state == self.OPEN and time.monotonic() - self._opened_at >= self.open_seconds:
+            self._state = self.HALF_OPEN
+            self._half_open_calls = 0
+        return self._state
+
+    def allow_request(self) -> bool:
+        """호출을 시도해도 되는지 확인합니다."""
+        state = self.state
+        if state == self.CLOSED:
+            return True
+        if state == self.HALF_OPEN and self._half_open_calls < self.half_open_max_calls:
+            self._half_open_calls += 1
+            return True
+        self._total_rejected += 1
+        return False
+
+    def record_success(self, latency: float) -> None:
+        slow = latency >= self.slow_call_threshold
+        if self._state == self.HALF_OPEN:
+            if slow:
+                self._trip()
+            else:
+                self._reset()
+            return
+        self._window.append((False, slow))
+        self._evaluate()
+
+    def record_failure(self, latency: float = 0.0) -> None:
+        if self._state == self.HALF_OPEN:
+            self._trip()
+            return
+        self._window.append((True, latency >= self.slow_call_threshold))
+        self._evaluate()
+
+    def release(self) -> None:
+        """결과 없이 끝난 호출(취소 등)의 half-open 시험 슬롯을 돌려줍니다.
+
+        취소는 의존성의 상태를 알려주지 않으므로 성공/실패로 집계하지 않습니다.
+        """
+        if self._state == self.HALF_OPEN and self._half_open_calls > 0:
+            self._half_open_calls -= 1
+
+    def _evaluate(self) -> None:
+        calls = len(self._window)
+        if calls < self.minimum_calls:
+            return
+        failures = sum(1 for failed, _ in self._window if failed)
+        slow_calls = sum(1 for _, slow in self._window if slow)
+        if (
+            failures / calls >= self.failure_rate_threshold
+            or slow_calls / calls >= self.slow_call_rate_threshold
+        ):
+            self._trip()
+
+    def _trip(self) -> None:
+        self._state = self.OPEN
+        self._opened_at = time.monotonic()
+        self._window.clear()
+
+    def _reset(self) -> None:
+        self._state = self.CLOSED
+        self._window.clear()
+        self._half_open_calls = 0
+
+    def snapshot(self) -> Dict[str, Any]:
+        """헬스 체크에 노출할 현재 상태를 반환합니다."""
+        calls = len(self._window)
+        failures = sum(1 for failed, _ in self._window if failed)
+        slow_calls = sum(1 for _, slow in self._window if slow)
+        return {
+            "name": self.name,
+            "state": self.state,
+            "window_calls": calls,
+            "failure_rate": failures / calls if calls else 0.0,
+            "slow_call_rate": slow_calls / calls if calls else 0.0,
+            "rejected_calls": self._total_rejected,
+        }
@@ -0,0 +1,202 @@
+import base64
+from datetime import datetime, timezone
+from typing import Any, Dict, List, Optional, Tuple
+
+from motor.motor_asyncio import AsyncIOMotorDatabase
+from redis.asyncio import Redis
+from redis.exceptions import WatchError
+
+from app.core.config import settings
+from app.models.community import CommunityFeedPage, CommunityPost
+
+# 커뮤니티 피드: community_posts 컬렉션 + 카테고리별 Redis 최신 글 리스트
+# 리스트에는 최근 COMMUNITY_FEED_CACHE_SIZE 개의 글이 최신순으로 들어 있으며
+# 캐시가 없거나 범위를 벗어난 요청은 (created_at, _id) 키셋 페이지네이션으로 Mongo 에서 읽습니다.
+# 리스트는 프라이머리에서 읽은 글로만 채우고, 채우는 동안 작성된 글은 최근 글 목록(_RECENT_KEY)에서 합칩니다.
+
+ALL_CATEGORIES = "all"
+_RECENT_KEY = "community:feed:recent"
+# 리스트를 채우는 도중 최근 글 목록이 바뀌면 다시 읽는 횟수 (모두 실패하면 이번에는 채우지 않음)
+_WARM_ATTEMPTS = 3
+
+
+def _feed_key(category: Optional[str]) -> str:
+    return f"community:feed:{category or ALL_CATEGORIES}"
+
+
+def encode_cursor(created_at: datetime, post_id: str) -> str:
+    raw = f"{created_at.isoformat()}|{post_id}"
+    return base64.urlsafe_b64encode(raw.encode("utf-8")).decode("ascii")
+
+
+def decode_cursor(cursor: str) -> Tuple[datetime, str]:
+    """커서를 (created_at, _id) 로 복원합니다. 형식이 잘못되면 ValueError 를 발생시킵니다."""
+    try:
+        raw = base64.urlsafe_b64decode(cursor.encode("ascii")).decode("utf-8")
+        created_at, post_id = raw.split("|", 1)
+        return datetime.fromisoformat(created_at), post_id
+    except Exception as e:
+        raise ValueError("잘못된 커서입니다.") from e
+
+
+def _to_post(doc: Dict[str, Any]) -> CommunityPost:
+    return CommunityPost(
+        id=str(doc["_id"]),
+        user_id=str(doc["user_id"]),
+        author=doc["author"],
+        title=doc["title"],
+        content=doc["content"],
+        category=doc["category"],
+        created_at=doc["created_at"]
+    )
+
+
+def _score(created_at: datetime) -> float:
+    return created_at.replace(tzinfo=timezone.utc).timestamp()
+
+
+def _page(posts: List[CommunityPost], has_more: bool) -> CommunityFeedPage:
+    next_cursor = None
+    if has_more and posts:
+        next_cursor = encode_cursor(posts[-1].created_at, posts[-1].id)
+    return CommunityFeedPage(posts=posts, next_cursor=next_cursor)
+
+
+async def push_post(redis: Redis, post: CommunityPost) -> None:
+    """새 글을 최근 글 목록과 전체/카테고리 리스트 앞에 추가합니다.
+
+    LPUSHX 를 사용해 이미 채워진 리스트에만 추가하므로, 비어 있는 캐시가
+    일부 글만 가진 채로 완전한 피드처럼 보이는 일이 없습니다.
+    리스트가 아직 없어 건너뛴 글은 최근 글 목록에 남아 있어 _warm_cache 가 합칩니다.
+    """
+    payload = post.model_dump_json()
+    score = _score(post.created_at)
+    try:
+        async with redis.pipeline(transaction=True) as pipe:
+            pipe.zadd(_RECENT_KEY, {payload: score})
+            pipe.zremrangebyscore(_RECENT_KEY, "-inf", score - settings.COMMUNITY_FEED_RECENT_SECONDS)
+            for key in (_feed_key(None), _feed_key(post.category)):
+                pipe.lpushx(key, payload)
+                pipe.ltrim(key, 0, settings.COMMUNITY_FEED_CACHE_SIZE - 1)
+            await pipe.execute()
+    except Exception as e:
+        print(f"커뮤니티 피드 캐시 갱신 실패: {e}")
+
+
+async def _read_cached(
+    redis: Redis,
+    category: Optional[str],
+    cursor: Optional[Tuple[datetime, str]],
+    limit: int
+) -> Optional[CommunityFeedPage]:
+    try:
+        entries = await redis.lrange(_feed_key(category), 0, -1)
+    except Exception as e:
+        print(f"커뮤니티 피드 캐시 조회 실패: {e}")
+        return None
+    if not entries:
+        return None
+
+    posts = [CommunityPost.model_validate_json(entry) for entry in entries]
+    # 리스트가 가득 차지 않았다면 해당 피드 전체가 캐시에 들어 있음
+    complete = len(posts) < settings.COMMUNITY_FEED_CACHE_SIZE
+    if cursor is not None:
+        posts = [post for post in posts if (post.created_at, post.id) < cursor]
+
+    if len(posts) > limit:
+        return _page(posts[:limit], has_more=True)
+    if complete:
+        return _page(posts, has_more=False)
+    # 캐시 범위를 벗어난 페이지는 Mongo 에서 조회
+    return None
+
+
+def _merge_recent(posts: List[CommunityPost], recent: List[str], category: Optional[str]) -> List[CommunityPost]:
+    """Mongo 에서 읽은 글에 그 뒤 작성된 최근 글을 합쳐 최신순 캐시 크기만큼 반환합니다."""
+    size = settings.COMMUNITY_FEED_CACHE_SIZE
+    merged = list(posts)
+    known = {post.id for post in posts}
+    # 가득 찬 리스트라면 가장 오래된 글보다 이전 글은 캐시 범위 밖
+    oldest = (posts[-1].created_at, posts[-1].id) if len(posts) >= size else None
+    for payload in recent:
+        post = CommunityPost.model_validate_json(payload)
+        if post.id in known or (category and post.category != category):
+            continue
+        if oldest is not None and (post.created_at, post.id) < oldest:
+            continue
+        merged.append(post)
+    merged.sort(key=lambda post: (post.created_at, post.id), reverse=True)
+    return merged[:size]
+
+
+async def _warm_cache(redis: Redis, category: Optional[str], docs: List[Dict[str, Any]]) -> None:
+    """프라이머리에서 읽은 글로 리스트를 다시 채웁니다.
+
+    읽은 뒤 작성된 글은 push_post 가 리스트가 없거나 곧 덮어써져 놓칠 수 있으므로 최근 글 목록에서 합칩니다.
+    최근 글 목록을 WATCH 하므로 합친 뒤 저장하기 전에 새 글이 추가되면 다시 읽고,
+    저장한 뒤 작성된 글은 push_post 가 리스트에 추가합니다.
+    """
+    key = _feed_key(category)
+    posts = [_to_post(doc) for doc in docs]
+    try:
+        async with redis.pipeline(transaction=True) as pipe:
+            for _ in range(_WARM_ATTEMPTS):
+                try:
+                    await pipe.watch(_RECENT_KEY)
+                    recent = await pipe.zrange(_RECENT_KEY, 0, -1)
+                    merged = _merge_recent(posts, recent, category)
+                    pipe.multi()
+                    pipe.delete(key)
+                    pipe.rpush(key, *[post.model_dump_json() for post in merged])
+                    pipe.expire(key, settings.COMMUNITY_FEED_CACHE_TTL_SECONDS)
+                    await pipe.execute()
+                    return
+                except WatchError:
+                    continue
+    except Exception as e:
+        print(f"커뮤니티 피드 캐시 적재 실패: {e}")
+
+
+async def get_feed_page(
+    db: AsyncIOMotorDatabase,
+    redis: Optional[Redis],
+    category: Optional[str] = None,
+    cursor: Optional[str] = None,
+    limit: int = 20,
+    primary: Optional[AsyncIOMotorDatabase] = None
+) -> CommunityFeedPage:
+    """커뮤니티 피드 한 페이지를 조회합니다 (Redis 우선, 없으면 Mongo).
+
+    db 가 세컨더리로 라우팅된 데이터베이스라면 primary 를 함께 넘깁니다. 캐시를 채우는 첫 페이지는
+    primary 에서 읽어, 오래된 세컨더리 데이터가 TTL 동안 캐시에 남지 않게 합니다.
+    """
+    position = decode_cursor(cursor) if cursor else None
+
+    if redis is not None:
+        cached = await _read_cached(redis, category, position, limit)
+        if cached is not None:
+            return cached
+
+    filter_query: Dict[str, Any] = {}
+    if category:
+        filter_query["category"] = category
+    if position is not None:
+        created_at, post_id = position
+        filter_query["$or"] = [
+            {"created_at": {"$lt": created_at}},
+            {"created_at": created_at, "_id": {"$lt": post_id}}
+        ]
+
+    # 첫 페이지가 캐시에 없으면 캐시 크기만큼 읽어 리스트를 채움
+    warm = redis is not None and position is None
+    fetch = max(limit + 1, settings.COMMUNITY_FEED_CACHE_SIZE) if warm else limit + 1
+    source = primary if warm and primary is not None else db
+    docs = await source.community_posts.find(filter_query).sort(
+        [("created_at", -1), ("_id", -1)]
+    ).limit(fetch).to_list(length=fetch)
+
+    if warm and docs:
+        await _warm_cache(redis, category, docs[:settings.COMMUNITY_FEED_CACHE_SIZE])
+
+    posts = [_to_post(doc) for doc in docs[:limit]]
+    return _page(posts, has_more=len(docs) > limit)
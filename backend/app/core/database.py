@@ -1,7 +1,61 @@
 from motor.motor_asyncio import AsyncIOMotorDatabase
 from fastapi import Request
+from redis.asyncio import Redis
+from typing import Callable, Optional
+
+from app.core.ai_interactions import AIInteractionBuffer
+from app.core.cache import TwoTierCache
+from app.core.deadline_scheduler import DeadlineScanner
+from app.core.goal_status import GoalStatusEngine
+from app.core.live_updates import LiveUpdateHub
+from app.core.read_routing import ReadRouter
 
 
 def get_database(request: Request) -> AsyncIOMotorDatabase:
     """FastAPI 요청에서 MongoDB 데이터베이스 인스턴스를 가져옵니다."""
-    return request.app.state.mongodb 
\ No newline at end of file
+    return request.app.state.mongodb 
+
+
+def get_read_router(request: Request) -> ReadRouter:
+    """FastAPI 요청에서 라우트별 읽기 라우터를 가져옵니다."""
+    return request.app.state.read_router
+
+
+def get_read_database(route: str) -> Callable[[Request], AsyncIOMotorDatabase]:
+    """READ_PREFERENCES 의 route 읽기 선호도를 적용한 데이터베이스 의존성 (조금 오래된 데이터를 보여도 되는 읽기용)."""
+    def dependency(request: Request) -> AsyncIOMotorDatabase:
+        return request.app.state.read_router.database(route)
+    return dependency
+
+
+def get_ai_interaction_buffer(request: Request) -> AIInteractionBuffer:
+    """FastAPI 요청에서 AI 상호작용 기록 버퍼를 가져옵니다."""
+    return request.app.state.ai_interaction_buffer
+
+
+def get_redis(request: Request) -> Optional[Redis]:
+    """FastAPI 요청에서 Redis 클라이언트를 가져옵니다 (설정되지 않았으면 None)."""
+    return getattr(request.app.state, "redis", None)
+
+
+def get_cache(request: Request) -> TwoTierCache:
+    """FastAPI 요청에서 2단계 읽기 캐시를 가져옵니다."""
+    return request.app.state.cache
+
+
+
+def get_live_updates(request: Request) -> LiveUpdateHub:
+    """FastAPI 요청에서 실시간 업데이트 허브를 가져옵니다."""
+    return request.app.state.live_updates
+
+
+
+def get_deadline_scanner(request: Request) -> DeadlineScanner:
+    """FastAPI 요청에서 마감일 알림 스캔 작업을 가져옵니다."""
+    return request.app.state.deadline_scanner
+
+
+
+def get_goal_status_engine(request: Request) -> GoalStatusEngine:
+    """FastAPI 요청에서 목표 상태 자동 전환 엔진을 가져옵니다."""
+    return request.app.state.goal_status_engine
@@ -0,0 +1,190 @@
+import threading
+from collections import Counter
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Any, Callable, Iterator, List, NamedTuple, Optional, Tuple
+
+from pymongo import monitoring
+from starlette.datastructures import MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from app.core.config import settings
+
+# 요청 단위 MongoDB 호출 예산과 N+1 감지
+# Motor 는 pymongo 작업을 스레드 풀에서 실행할 때 contextvars 를 복사하므로
+# 명령 이벤트 리스너에서 현재 요청의 집계 객체를 찾을 수 있습니다.
+
+# 커서 후속 명령은 결과 크기에 따라 늘어나므로 호출 수/반복 판단에서 제외 (시간은 합산)
+CURSOR_COMMANDS = frozenset({"getMore", "killCursors", "endSessions"})
+
+
+class DBBudget(NamedTuple):
+    max_commands: int
+    max_repeats: int
+
+
+class DBBudgetExceeded(AssertionError):
+    """strict 모드에서 라우트가 DB 호출 예산을 넘었을 때 발생합니다."""
+
+
+def db_call_budget(max_commands: int, max_repeats: Optional[int] = None) -> Callable:
+    """라우트 핸들러의 요청당 MongoDB 명령 수 예산을 선언합니다.
+
+    max_repeats 는 같은 형태(컬렉션, 명령, 필터 구조)의 쿼리가 한 요청에서
+    실행될 수 있는 최대 횟수입니다. 라우터 데코레이터 아래에 적용합니다.
+
+        @router.put("/{goal_id}")
+        @db_call_budget(5)
+        async def update_goal(...):
+    """
+    budget = DBBudget(max_commands, max_repeats or settings.DB_BUDGET_DEFAULT_MAX_REPEATS)
+
+    def decorator(func: Callable) -> Callable:
+        func.__db_budget__ = budget
+        return func
+
+    return decorator
+
+
+def value_shape(value: Any) -> str:
+    """값을 지우고 구조(키와 값의 타입)만 남긴 쿼리 형태를 만듭니다."""
+    if isinstance(value, dict):
+        return "{" + ",".join(f"{key}:{value_shape(item)}" for key, item in sorted(value.items())) + "}"
+    if isinstance(value, (list, tuple)):
+        return "[" + ",".join(sorted({value_shape(item) for item in value})) + "]"
+    return type(value).__name__
+
+
+def query_shape(command_name: str, command: Any) -> Tuple[str, str, str]:
+    """(컬렉션, 명령, 필터 구조) 로 쿼리 형태를 식별합니다."""
+    collection = command.get(command_name)
+    if not isinstance(collection, str):
+        collection = "-"
+    if command_name == "find":
+        target = command.get("filter", {})
+    elif command_name in ("findAndModify", "count"):
+        target = command.get("query", {})
+    elif command_name == "distinct":
+        target = [command.get("key"), command.get("query", {})]
+    elif command_name == "aggregate":
+        target = command.get("pipeline", [])
+    elif command_name == "update":
+        target = [update.get("q", {}) for update in command.get("updates", [])]
+    elif command_name == "delete":
+        target = [delete.get("q", {}) for delete in command.get("deletes", [])]
+    else:
+        target = None
+    return collection, command_name, value_shape(target) if target is not None else ""
+
+
+class RequestDBStats:
+    """한 요청 동안 실행된 MongoDB 명령 수, 총 DB 시간, 쿼리 형태별 실행 횟수."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.commands = 0
+        self.duration_micros = 0
+        self.shapes: Counter = Counter()
+
+    @property
+    def duration_ms(self) -> float:
+        return self.duration_micros / 1000
+
+    def record_started(self, command_name: str, command: Any) -> None:
+        if command_name in CURSOR_COMMANDS:
+            return
+        shape = query_shape(command_name, command)
+        with self._lock:
+            self.commands += 1
+            self.shapes[shape] += 1
+
+    def record_finished(self, duration_micros: int) -> None:
+        with self._lock:
+            self.duration_micros += duration_micros
+
+    def max_repeats(self) -> int:
+        return max(self.shapes.values(), default=0)
+
+    def violations(self, budget: DBBudget) -> List[str]:
+        problems = []
+        if self.commands > budget.max_commands:
+            problems.append(f"MongoDB 명령 {self.commands}회 (예산 {budget.max_commands}회)")
+        for (collection, command_name, shape), count in self.shapes.items():
+            if count > budget.max_repeats:
+                problems.append(
+                    f"같은 형태의 쿼리 {count}회 반복 (허용 {budget.max_repeats}회): "
+                    f"{collection}.{command_name} {shape}"
+                )
+        return problems
+
+
+_current_stats: ContextVar[Optional[RequestDBStats]] = ContextVar("db_request_stats", default=None)
+
+
+@contextmanager
+def track_db_calls() -> Iterator[RequestDBStats]:
+    """블록 안에서 실행된 MongoDB 명령을 집계합니다 (요청 밖의 코드 검증에도 사용)."""
+    stats = RequestDBStats()
+    token = _current_stats.set(stats)
+    try:
+        yield stats
+    finally:
+        _current_stats.reset(token)
+
+
+class DBBudgetListener(monitoring.CommandListener):
+    """pymongo 명령 이벤트를 현재 요청의 RequestDBStats 에 기록합니다."""
+
+    def started(self, event) -> None:
+        stats = _current_stats.get()
+        if stats is not None:
+            stats.record_started(event.command_name, event.command)
+
+    def succeeded(self, event) -> None:
+        stats = _current_stats.get()
+        if stats is not None:
+            stats.record_finished(event.duration_micros)
+
+    def failed(self, event) -> None:
+        stats = _current_stats.get()
+        if stats is not None:
+            stats.record_finished(event.duration_micros)
+
+
+class DBBudgetMiddleware:
+    """요청마다 MongoDB 호출을 집계하고 라우트의 예산과 비교하는 ASGI 미들웨어.
+
+    DEBUG 설정이 켜져 있으면 X-DB-Commands / X-DB-Time-Ms / X-DB-Max-Repeats
+    응답 헤더를 추가합니다. 예산 초과 시 DB_BUDGET_MODE 에 따라
+    경고를 출력(warn)하거나 DBBudgetExceeded 를 발생(strict, 테스트용)시킵니다.
+    """
+
+    def __init__(self, app: ASGIApp):
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http" or settings.DB_BUDGET_MODE == "off":
+            await self.app(scope, receive, send)
+            return
+
+        with track_db_calls() as stats:
+            async def send_with_headers(message: Message) -> None:
+                if message["type"] == "http.response.start" and settings.DEBUG:
+                    headers = MutableHeaders(scope=message)
+                    headers.append("X-DB-Commands", str(stats.commands))
+                    headers.append("X-DB-Time-Ms", f"{stats.duration_ms:.3f}")
+                    headers.append("X-DB-Max-Repeats", str(stats.max_repeats()))
+                await send(message)
+
+            await self.app(scope, receive, send_with_headers)
+
+        budget = getattr(scope.get("endpoint"), "__db_budget__", None) or DBBudget(
+            settings.DB_BUDGET_DEFAULT_MAX_COMMANDS, settings.DB_BUDGET_DEFAULT_MAX_REPEATS
+        )
+        problems = stats.violations(budget)
+        if not problems:
+            return
+        message = f"DB 호출 예산 초과 - {scope['method']} {scope['path']}: " + "; ".join(problems)
+        if settings.DB_BUDGET_MODE == "strict":
+            raise DBBudgetExceeded(message)
+        print(message)
@@ -0,0 +1,218 @@
+import math
+import random
+import time
+import uuid
+from datetime import datetime, timedelta, timezone
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Tuple
+
+from motor.motor_asyncio import AsyncIOMotorDatabase
+from pymongo import UpdateOne
+from redis.asyncio import Redis
+
+from app.core.metrics import DEADLINE_NOTIFICATIONS
+
+if TYPE_CHECKING:
+    from apscheduler.schedulers.asyncio import AsyncIOScheduler
+
+# 마감 임박/마감 초과 목표를 주기적으로 찾아 notifications 컬렉션에 알림을 남깁니다.
+# 조회 구간(마감 초과 확인 기간 ~ 임박 알림 기간)을 마감일 기준 샤드로 나누고,
+# 각 샤드는 (status, deadline, _id) 인덱스의 범위 스캔을 배치 단위로 읽습니다.
+# 워커들은 같은 주기(window)에 Redis lease 로 샤드를 나눠 가지므로 한 목표는 주기마다 한 번만 처리되고,
+# 알림은 (목표, 종류, 마감일) 키로 upsert 하므로 재시작이나 lease 만료로 다시 처리되어도 중복되지 않습니다.
+
+DEADLINE_APPROACHING = "deadline_approaching"
+DEADLINE_OVERDUE = "deadline_overdue"
+
+_LEASE_PREFIX = "deadline-scan"
+_EPOCH = datetime(1970, 1, 1)
+
+
+def notification_key(goal_id: str, kind: str, deadline: datetime) -> str:
+    return f"{goal_id}:{kind}:{deadline.isoformat()}"
+
+
+def _notification(goal_doc: Dict[str, Any], reference: datetime) -> Dict[str, Any]:
+    deadline = goal_doc["deadline"]
+    goal_id = str(goal_doc["_id"])
+    if deadline < reference:
+        kind = DEADLINE_OVERDUE
+        message = f"'{goal_doc['title']}' 목표의 마감일이 지났습니다. 목표를 조정하거나 완료 처리해 보세요."
+    else:
+        kind = DEADLINE_APPROACHING
+        days = max(math.ceil((deadline - reference).total_seconds() / 86400), 1)
+        message = f"'{goal_doc['title']}' 목표의 마감일까지 {days}일 남았습니다. 조금만 더 힘내세요!"
+    return {
+        "key": notification_key(goal_id, kind, deadline),
+        "user_id": str(goal_doc["user_id"]),
+        "goal_id": goal_id,
+        "kind": kind,
+        "title": goal_doc["title"],
+        "message": message,
+        "deadline": deadline,
+        "read": False,
+    }
+
+
+class DeadlineScanner:
+    """마감일 범위 스캔 작업. 워커마다 APScheduler 로 같은 주기에 실행됩니다.
+
+    주기 번호(window)와 샤드 경계는 현재 시각이 아니라 주기 시작 시각에서 계산하므로
+    모든 워커가 같은 샤드 구간을 보고, lease 는 주기가 끝날 때까지 유지해 같은 주기에 다시 처리되지 않습니다.
+    Redis 가 없으면(로컬 개발) 모든 샤드를 직접 처리합니다.
+    """
+
+    def __init__(
+        self,
+        db: AsyncIOMotorDatabase,
+        redis: Optional[Redis],
+        *,
+        interval: int,
+        shards: int,
+        batch_size: int,
+        horizon: timedelta,
+        overdue_lookback: timedelta,
+        enabled: bool = True,
+    ):
+        self.db = db
+        self.redis = redis
+        self.interval = interval
+        self.shards = shards
+        self.batch_size = batch_size
+        self.horizon = horizon
+        self.overdue_lookback = overdue_lookback
+        self.enabled = enabled
+        self._worker_id = uuid.uuid4().hex
+        self._scheduler: Optional["AsyncIOScheduler"] = None
+        self._last_run: Optional[Dict[str, Any]] = None
+        self._totals = {"runs": 0, "shards": 0, "goals": 0, "notifications": 0, "errors": 0}
+
+    # ---- 구간 계산 ----
+
+    def window_of(self, now: datetime) -> Tuple[int, datetime]:
+        """주기 번호와 주기 시작 시각 (UTC naive, 저장된 deadline 과 같은 형식)."""
+        window = int((now - _EPOCH).total_seconds()) // self.interval
+        return window, _EPOCH + timedelta(seconds=window * self.interval)
+
+    def shard_ranges(self, window_start: datetime) -> List[Tuple[datetime, datetime]]:
+        """[주기 시작 - 마감 초과 확인 기간, 주기 시작 + 임박 알림 기간) 을 샤드 수만큼 나눈 deadline 구간."""
+        low = window_start - self.overdue_lookback
+        span = (self.horizon + self.overdue_lookback) / self.shards
+        return [
+            (low + span * index, low + span * (index + 1) if index < self.shards - 1 else window_start + self.horizon)
+            for index in range(self.shards)
+        ]
+
+    # ---- 실행 ----
+
+    async def _claim(self, window: int, shard: int) -> bool:
+        if self.redis is None:
+            return True
+        key = f"{_LEASE_PREFIX}:{window}:{shard}"
+        # 주기가 끝난 뒤에도 잠시 유지해 늦게 시작한 워커가 같은 주기를 다시 처리하지 않도록 함
+        return bool(await self.redis.set(key, self._worker_id, nx=True, ex=self.interval * 2))
+
+    async def _scan_shard(self, low: datetime, high: datetime, reference: datetime) -> Tuple[int, int]:
+        """deadline ∈ [low, high) 인 활성 목표를 (deadline, _id) 키셋으로 배치마다 읽어 알림을 upsert 합니다."""
+        scanned = created = 0
+        query: Dict[str, Any] = {"status": "active", "deadline": {"$gte": low, "$lt": high}}
+        while True:
+            batch = await self.db.goals.find(
+                query,
+                {"user_id": 1, "title": 1, "deadline": 1}
+            ).sort([("deadline", 1), ("_id", 1)]).limit(self.batch_size).to_list(self.batch_size)
+            if not batch:
+                break
+            scanned += len(batch)
+
+            now = datetime.utcnow()
+            operations = []
+            kinds = []
+            for goal_doc in batch:
+                notification = _notification(goal_doc, reference)
+                kinds.append(notification["kind"])
+                operations.append(UpdateOne(
+                    {"key": notification["key"]},
+                    {"$setOnInsert": {**notification, "created_at": now}},
+                    upsert=True
+                ))
+            result = await self.db.notifications.bulk_write(operations, ordered=False)
+            created += result.upserted_count
+            for index in result.upserted_ids:
+                DEADLINE_NOTIFICATIONS.labels(kinds[index]).inc()
+
+            if len(batch) < self.batch_size:
+                break
+            last = batch[-1]
+            # 다음 배치: 마지막으로 읽은 (deadline, _id) 다음부터
+            query = {
+                "status": "active",
+                "deadline": {"$gte": last["deadline"], "$lt": high},
+                "$or": [
+                    {"deadline": {"$gt": last["deadline"]}},
+                    {"deadline": last["deadline"], "_id": {"$gt": last["_id"]}},
+                ],
+            }
+        return scanned, created
+
+    async def run_once(self, now: Optional[datetime] = None) -> Dict[str, Any]:
+        """이번 주기에서 아직 아무도 처리하지 않은 샤드를 처리합니다."""
+        window, window_start = self.window_of(now or datetime.utcnow())
+        ranges = self.shard_ranges(window_start)
+        # 워커마다 다른 샤드부터 시작해 lease 경합을 줄임
+        offset = random.randrange(self.shards)
+        started = time.perf_counter()
+        summary = {"window": window, "shards": [], "goals": 0, "notifications": 0}
+        for step in range(self.shards):
+            shard = (offset + step) % self.shards
+            try:
+                if not await self._claim(window, shard):
+                    continue
+                low, high = ranges[shard]
+                scanned, created = await self._scan_shard(low, high, window_start)
+            except Exception as e:
+                self._totals["errors"] += 1
+                print(f"마감일 스캔 실패 - window: {window}, shard: {shard}: {e}")
+                continue
+            summary["shards"].append(shard)
+            summary["goals"] += scanned
+            summary["notifications"] += created
+
+        summary["duration_ms"] = round((time.perf_counter() - started) * 1000, 3)
+        self._last_run = summary
+        self._totals["runs"] += 1
+        self._totals["shards"] += len(summary["shards"])
+        self._totals["goals"] += summary["goals"]
+        self._totals["notifications"] += summary["notifications"]
+        return summary
+
+    def start(self) -> None:
+        if not self.enabled or self._scheduler is not None:
+            return
+        # APScheduler 는 시작 시간을 줄이기 위해 작업을 켤 때 가져옴
+        from apscheduler.schedulers.asyncio import AsyncIOScheduler
+
+        self._scheduler = AsyncIOScheduler(timezone="UTC")
+        self._scheduler.add_job(
+            self.run_once,
+            "interval",
+            seconds=self.interval,
+            next_run_time=datetime.now(timezone.utc),
+            max_instances=1,
+            coalesce=True,
+            id="deadline_scan",
+        )
+        self._scheduler.start()
+
+    async def close(self) -> None:
+        if self._scheduler is not None:
+            self._scheduler.shutdown(wait=False)
+            self._scheduler = None
+
+    def snapshot(self) -> Dict[str, Any]:
+        return {
+            "enabled": self.enabled,
+            "interval_seconds": self.interval,
+            "shards": self.shards,
+            "last_run": self._last_run,
+            "totals": dict(self._totals),
+        }
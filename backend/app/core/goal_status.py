@@ -0,0 +1,248 @@
+import time
+import uuid
+from datetime import datetime, timedelta, timezone
+from typing import TYPE_CHECKING, Any, Callable, Dict, List, NamedTuple, Optional
+
+from bson import ObjectId
+from motor.motor_asyncio import AsyncIOMotorDatabase
+from redis.asyncio import Redis
+
+from app.core.cache import TwoTierCache, goal_tag, user_tag
+from app.core.leaderboard import remove_goal_scores
+from app.core.metrics import GOAL_STATUS_TRANSITIONS
+from app.core.similarity import set_signature_status
+
+if TYPE_CHECKING:
+    from apscheduler.schedulers.asyncio import AsyncIOScheduler
+
+# 목표 상태 자동 전환: 목표치에 도달한 활성 목표는 completed, 마감이 오래 지난 활성 목표는 expired 로 바꿔
+# status: "active" 조회(유사 사용자, 일괄 분석, 마감일 스캔 등)의 대상이 계속 늘어나지 않도록 합니다.
+# 백그라운드 엔진은 조건부 update_many 를 배치로 실행하고, 진도 기록은 같은 업데이트 안에서 완료를 반영합니다.
+# 전환마다 goal_status_events 에 기록을 남깁니다.
+
+TARGET_REACHED = "target_reached"
+DEADLINE_EXPIRED = "deadline_expired"
+
+_LEASE_PREFIX = "goal-status"
+_EPOCH = datetime(1970, 1, 1)
+
+# 목표치에 도달한 목표 (target_value 가 0 이하인 목표는 제외)
+_TARGET_REACHED_EXPR = {"$and": [{"$gt": ["$target_value", 0]}, {"$gte": ["$current_value", "$target_value"]}]}
+
+
+class Transition(NamedTuple):
+    reason: str
+    to_status: str
+    filter: Callable[[datetime, timedelta], Dict[str, Any]]
+
+
+TRANSITIONS = [
+    Transition(TARGET_REACHED, "completed", lambda now, expire_after: {
+        "status": "active",
+        "$expr": _TARGET_REACHED_EXPR,
+    }),
+    Transition(DEADLINE_EXPIRED, "expired", lambda now, expire_after: {
+        "status": "active",
+        "deadline": {"$lt": now - expire_after},
+        # 목표치에 도달한 목표는 expired 가 아니라 completed 대상
+        "$expr": {"$or": [{"$lte": ["$target_value", 0]}, {"$lt": ["$current_value", "$target_value"]}]},
+    }),
+]
+
+
+def _event(goal_doc: Dict[str, Any], to_status: str, reason: str, source: str, at: datetime) -> Dict[str, Any]:
+    return {
+        "goal_id": str(goal_doc["_id"]),
+        "user_id": str(goal_doc["user_id"]),
+        "from_status": goal_doc.get("status", "active"),
+        "to_status": to_status,
+        "reason": reason,
+        "source": source,
+        "created_at": at,
+    }
+
+
+def progress_update(value: float, now: datetime) -> List[Dict[str, Any]]:
+    """current_value 를 설정하면서 목표치에 도달한 활성 목표는 같은 업데이트에서 completed 로 바꾸는 파이프라인.
+
+    한 $set 단계 안의 "$status" 는 바뀌기 전 값을 가리키므로 조건 판단이 한 번에 이루어집니다.
+    """
+    reached = {"$and": [{"$eq": ["$status", "active"]}, {"$gt": ["$target_value", 0]}, {"$gte": [value, "$target_value"]}]}
+    return [{"$set": {
+        "current_value": value,
+        "updated_at": now,
+        "status_transition": {
+            "$cond": [reached, {"id": ObjectId(), "reason": TARGET_REACHED, "at": now}, "$status_transition"]
+        },
+        "status": {"$cond": [reached, "completed", "$status"]},
+    }}]
+
+
+async def record_transition(
+    db: AsyncIOMotorDatabase,
+    before: Dict[str, Any],
+    after: Dict[str, Any],
+    source: str
+) -> bool:
+    """진도 기록 등 요청 경로에서 상태가 바뀌었으면 이벤트와 유사도 인덱스 상태를 반영합니다."""
+    if after.get("status") == before.get("status"):
+        return False
+    reason = (after.get("status_transition") or {}).get("reason", source)
+    try:
+        await db.goal_status_events.insert_one(
+            _event(before, after["status"], reason, source, after.get("updated_at") or datetime.utcnow())
+        )
+        await set_signature_status(db, [str(after["_id"])], after["status"])
+    except Exception as e:
+        print(f"목표 상태 전환 기록 실패 - goal_id: {after.get('_id')}: {e}")
+    GOAL_STATUS_TRANSITIONS.labels(reason).inc()
+    return True
+
+
+class GoalStatusEngine:
+    """주기마다 TRANSITIONS 의 조건에 맞는 활성 목표를 배치 단위로 전환합니다.
+
+    여러 워커가 같은 주기에 시작해도 Redis lease 를 잡은 워커 하나만 실행합니다.
+    배치마다 고유한 status_transition.id 를 함께 기록하므로, 동시에 다른 요청이 목표를 바꿔
+    일부만 전환되었을 때도 실제로 전환된 목표에 대해서만 이벤트를 남깁니다.
+    """
+
+    def __init__(
+        self,
+        db: AsyncIOMotorDatabase,
+        redis: Optional[Redis],
+        cache: Optional[TwoTierCache],
+        *,
+        interval: int,
+        batch_size: int,
+        max_batches: int,
+        expire_after: timedelta,
+        enabled: bool = True,
+    ):
+        self.db = db
+        self.redis = redis
+        self.cache = cache
+        self.interval = interval
+        self.batch_size = batch_size
+        self.max_batches = max_batches
+        self.expire_after = expire_after
+        self.enabled = enabled
+        self._worker_id = uuid.uuid4().hex
+        self._scheduler: Optional["AsyncIOScheduler"] = None
+        self._last_run: Optional[Dict[str, Any]] = None
+        self._totals: Dict[str, int] = {"runs": 0, TARGET_REACHED: 0, DEADLINE_EXPIRED: 0, "errors": 0}
+
+    async def _claim(self, now: datetime) -> bool:
+        if self.redis is None:
+            return True
+        window = int((now - _EPOCH).total_seconds()) // self.interval
+        return bool(await self.redis.set(
+            f"{_LEASE_PREFIX}:{window}", self._worker_id, nx=True, ex=self.interval * 2
+        ))
+
+    async def _apply_batch(self, transition: Transition, now: datetime) -> int:
+        query = transition.filter(now, self.expire_after)
+        candidates = await self.db.goals.find(
+            query, {"user_id": 1, "status": 1}
+        ).limit(self.batch_size).to_list(self.batch_size)
+        if not candidates:
+            return 0
+
+        ids = [goal_doc["_id"] for goal_doc in candidates]
+        batch_id = ObjectId()
+        result = await self.db.goals.update_many(
+            {"_id": {"$in": ids}, **query},
+            {"$set": {
+                "status": transition.to_status,
+                "updated_at": now,
+                "status_transition": {"id": batch_id, "reason": transition.reason, "at": now},
+            }}
+        )
+        if result.modified_count != len(candidates):
+            # 조회와 갱신 사이에 바뀐 목표는 제외
+            changed = {
+                goal_doc["_id"]
+                async for goal_doc in self.db.goals.find(
+                    {"_id": {"$in": ids}, "status_transition.id": batch_id}, {"_id": 1}
+                )
+            }
+            candidates = [goal_doc for goal_doc in candidates if goal_doc["_id"] in changed]
+        if not candidates:
+            return 0
+
+        await self.db.goal_status_events.insert_many([
+            _event(goal_doc, transition.to_status, transition.reason, "engine", now) for goal_doc in candidates
+        ])
+        goal_ids = [str(goal_doc["_id"]) for goal_doc in candidates]
+        await set_signature_status(self.db, goal_ids, transition.to_status)
+        if transition.to_status != "completed":
+            await remove_goal_scores(self.redis, goal_ids)
+        if self.cache is not None:
+            tags = {user_tag(str(goal_doc["user_id"])) for goal_doc in candidates}
+            tags.update(goal_tag(goal_id) for goal_id in goal_ids)
+            await self.cache.invalidate(*tags)
+        GOAL_STATUS_TRANSITIONS.labels(transition.reason).inc(len(candidates))
+        return len(candidates)
+
+    async def run_once(self, now: Optional[datetime] = None) -> Optional[Dict[str, Any]]:
+        """이번 주기를 맡았으면 전환을 실행하고 전환 수를 반환합니다 (다른 워커가 맡았으면 None)."""
+        now = now or datetime.utcnow()
+        try:
+            if not await self._claim(now):
+                return None
+        except Exception as e:
+            print(f"목표 상태 전환 lease 획득 실패: {e}")
+            return None
+
+        started = time.perf_counter()
+        summary: Dict[str, Any] = {"started_at": now.isoformat()}
+        for transition in TRANSITIONS:
+            count = 0
+            try:
+                for _ in range(self.max_batches):
+                    applied = await self._apply_batch(transition, now)
+                    count += applied
+                    if applied < self.batch_size:
+                        break
+            except Exception as e:
+                self._totals["errors"] += 1
+                print(f"목표 상태 전환 실패 - {transition.reason}: {e}")
+            summary[transition.reason] = count
+            self._totals[transition.reason] += count
+
+        summary["duration_ms"] = round((time.perf_counter() - started) * 1000, 3)
+        self._last_run = summary
+        self._totals["runs"] += 1
+        return summary
+
+    def start(self) -> None:
+        if not self.enabled or self._scheduler is not None:
+            return
+        # 비활성화된 워커에서는 APScheduler 를 가져오지 않음
+        from apscheduler.schedulers.asyncio import AsyncIOScheduler
+
+        self._scheduler = AsyncIOScheduler(timezone="UTC")
+        self._scheduler.add_job(
+            self.run_once,
+            "interval",
+            seconds=self.interval,
+            next_run_time=datetime.now(timezone.utc),
+            max_instances=1,
+            coalesce=True,
+            id="goal_status",
+        )
+        self._scheduler.start()
+
+    async def close(self) -> None:
+        if self._scheduler is not None:
+            self._scheduler.shutdown(wait=False)
+            self._scheduler = None
+
+    def snapshot(self) -> Dict[str, Any]:
+        return {
+            "enabled": self.enabled,
+            "interval_seconds": self.interval,
+            "expire_after_days": self.expire_after.days,
+            "last_run": self._last_run,
+            "totals": dict(self._totals),
+        }
@@ -0,0 +1,233 @@
+import asyncio
+import math
+import threading
+import time
+from collections import deque
+from datetime import datetime
+from typing import Any, Deque, Dict, Optional
+
+from motor.motor_asyncio import AsyncIOMotorDatabase
+from pymongo import monitoring
+from redis.asyncio import Redis
+
+# 헬스 체크: MongoDB 커넥션 풀 통계 수집과 준비 상태(readiness) 확인
+
+
+class _PoolStats:
+    __slots__ = (
+        "open_connections", "in_use", "max_in_use", "waiting",
+        "checkouts", "checkout_failures", "cleared", "waits_ms"
+    )
+
+    def __init__(self, wait_window: int):
+        self.open_connections = 0
+        self.in_use = 0
+        self.max_in_use = 0
+        self.waiting = 0
+        self.checkouts = 0
+        self.checkout_failures: Dict[str, int] = {}
+        self.cleared = 0
+        self.waits_ms: Deque[float] = deque(maxlen=wait_window)
+
+
+class PoolStatsListener(monitoring.ConnectionPoolListener):
+    """pymongo 커넥션 풀 이벤트로 서버별 사용 중 연결 수와 체크아웃 대기 시간을 집계합니다.
+
+    Motor 는 pymongo 작업을 스레드 풀에서 실행하므로 체크아웃 시작/완료 이벤트는
+    같은 스레드에서 발생합니다. 시작 시각은 스레드 로컬에 보관합니다.
+    """
+
+    def __init__(self, wait_window: int = 1000):
+        self.wait_window = wait_window
+        self._lock = threading.Lock()
+        self._local = threading.local()
+        self._pools: Dict[str, _PoolStats] = {}
+
+    def _pool(self, address) -> _PoolStats:
+        key = f"{address[0]}:{address[1]}"
+        pool = self._pools.get(key)
+        if pool is None:
+            pool = self._pools[key] = _PoolStats(self.wait_window)
+        return pool
+
+    def _finish_wait(self, pool: _PoolStats) -> None:
+        started = getattr(self._local, "checkout_started", None)
+        self._local.checkout_started = None
+        pool.waiting = max(pool.waiting - 1, 0)
+        if started is not None:
+            pool.waits_ms.append((time.perf_counter() - started) * 1000)
+
+    def pool_created(self, event) -> None:
+        with self._lock:
+            self._pool(event.address)
+
+    def pool_ready(self, event) -> None:
+        pass
+
+    def pool_cleared(self, event) -> None:
+        with self._lock:
+            self._pool(event.address).cleared += 1
+
+    def pool_closed(self, event) -> None:
+        pass
+
+    def connection_created(self, event) -> None:
+        with self._lock:
+            self._pool(event.address).open_connections += 1
+
+    def connection_ready(self, event) -> None:
+        pass
+
+    def connection_closed(self, event) -> None:
+        with self._lock:
+            pool = self._pool(event.address)
+            pool.open_connections = max(pool.open_connections - 1, 0)
+
+    def connection_check_out_started(self, event) -> None:
+        self._local.checkout_started = time.perf_counter()
+        with self._lock:
+            self._pool(event.address).waiting += 1
+
+    def connection_check_out_failed(self, event) -> None:
+        with self._lock:
+            pool = self._pool(event.address)
+            self._finish_wait(pool)
+            pool.checkout_failures[event.reason] = pool.checkout_failures.get(event.reason, 0) + 1
+
+    def connection_checked_out(self, event) -> None:
+        with self._lock:
+            pool = self._pool(event.address)
+            self._finish_wait(pool)
+            pool.checkouts += 1
+            pool.in_use += 1
+            pool.max_in_use = max(pool.max_in_use, pool.in_use)
+
+    def connection_checked_in(self, event) -> None:
+        with self._lock:
+            pool = self._pool(event.address)
+            pool.in_use = max(pool.in_use - 1, 0)
+
+    def snapshot(self) -> Dict[str, Dict[str, Any]]:
+        """서버 주소별 풀 상태와 최근 체크아웃 대기 시간(ms) 분포를 반환합니다."""
+        with self._lock:
+            pools = {address: (pool, sorted(pool.waits_ms)) for address, pool in self._pools.items()}
+
+        result = {}
+        for address, (pool, waits) in pools.items():
+            wait_stats = {"samples": len(waits), "avg_ms": 0.0, "p50_ms": 0.0, "p99_ms": 0.0, "max_ms": 0.0}
+            if waits:
+                wait_stats.update({
+                    "avg_ms": round(sum(waits) / len(waits), 3),
+                    "p50_ms": round(waits[len(waits) // 2], 3),
+                    "p99_ms": round(waits[math.ceil(len(waits) * 0.99) - 1], 3),
+                    "max_ms": round(waits[-1], 3),
+                })
+            result[address] = {
+                "open_connections": pool.open_connections,
+                "in_use": pool.in_use,
+                "max_in_use": pool.max_in_use,
+                "waiting": pool.waiting,
+                "checkouts": pool.checkouts,
+                "checkout_failures": dict(pool.checkout_failures),
+                "cleared": pool.cleared,
+                "checkout_wait": wait_stats,
+            }
+        return result
+
+    def exhausted(self, max_pool_size: int) -> bool:
+        """모든 연결이 사용 중이고 체크아웃을 기다리는 작업이 있는 풀이 있는지 확인합니다."""
+        with self._lock:
+            return any(
+                pool.in_use >= max_pool_size and pool.waiting > 0
+                for pool in self._pools.values()
+            )
+
+
+class ReadinessProbe:
+    """MongoDB/Redis 에 짧은 타임아웃으로 ping 을 보내 준비 상태를 판단합니다.
+
+    결과는 cache_seconds 동안 재사용하므로 로드 밸런서가 자주 호출해도
+    의존성에 부하를 주지 않습니다. MongoDB 는 필수 의존성이고, Redis 는
+    없어도 캐시 없이 동작하므로 실패 시 degraded 로만 표시합니다.
+    """
+
+    READY = "ready"
+    DEGRADED = "degraded"
+    NOT_READY = "not_ready"
+
+    def __init__(
+        self,
+        db: AsyncIOMotorDatabase,
+        redis: Optional[Redis],
+        pool_stats: PoolStatsListener,
+        max_pool_size: int,
+        mongo_timeout: float = 1.0,
+        redis_timeout: float = 0.5,
+        cache_seconds: float = 2.0,
+    ):
+        self.db = db
+        self.redis = redis
+        self.pool_stats = pool_stats
+        self.max_pool_size = max_pool_size
+        self.mongo_timeout = mongo_timeout
+        self.redis_timeout = redis_timeout
+        self.cache_seconds = cache_seconds
+
+        self._lock = asyncio.Lock()
+        self._result: Optional[Dict[str, Any]] = None
+        self._checked_at = 0.0
+
+    def _fresh(self) -> bool:
+        return self._result is not None and time.monotonic() - self._checked_at < self.cache_seconds
+
+    async def _ping(self, call, timeout: float) -> Dict[str, Any]:
+        started = time.perf_counter()
+        try:
+            await asyncio.wait_for(call(), timeout=timeout)
+            status, error = "ok", None
+        except asyncio.TimeoutError:
+            status, error = "error", f"{timeout}초 안에 응답하지 않았습니다."
+        except Exception as e:
+            status, error = "error", str(e)
+        check = {"status": status, "latency_ms": round((time.perf_counter() - started) * 1000, 3)}
+        if error:
+            check["error"] = error
+        return check
+
+    async def _run_checks(self) -> Dict[str, Any]:
+        mongo_check = self._ping(lambda: self.db.command("ping"), self.mongo_timeout)
+        if self.redis is not None:
+            mongo, redis = await asyncio.gather(
+                mongo_check, self._ping(self.redis.ping, self.redis_timeout)
+            )
+        else:
+            mongo, redis = await mongo_check, {"status": "disabled"}
+
+        pool_exhausted = self.pool_stats.exhausted(self.max_pool_size)
+        if mongo["status"] != "ok" or pool_exhausted:
+            status = self.NOT_READY
+        elif redis["status"] != "ok":
+            status = self.DEGRADED
+        else:
+            status = self.READY
+
+        return {
+            "status": status,
+            "checks": {"mongodb": mongo, "redis": redis},
+            "mongodb_pool": {
+                "max_pool_size": self.max_pool_size,
+                "exhausted": pool_exhausted,
+                "servers": self.pool_stats.snapshot(),
+            },
+            "checked_at": datetime.utcnow().isoformat(),
+        }
+
+    async def check(self) -> Dict[str, Any]:
+        if self._fresh():
+            return self._result
+        async with self._lock:
+            # 동시에 들어온 프로브는 먼저 실행된 확인 결과를 공유
+            if not self._fresh():
+                self._result = await self._run_checks()
+                self._checked_at = time.monotonic()
+        return self._result
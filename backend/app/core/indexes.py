@@ -0,0 +1,134 @@
+from typing import Any, Dict, Iterable, List, Optional
+
+from motor.motor_asyncio import AsyncIOMotorDatabase
+from pymongo.errors import OperationFailure
+
+from app.models.indexes import IndexKeys, IndexSpec, indexes_by_collection
+
+# 인덱스 레지스트리(app/models/indexes.py)를 실제 DB 와 맞추는 동기화 로직
+
+# 다른 인덱스의 접두사여도 고유한 역할이 있어 중복으로 보지 않는 옵션
+_SPECIAL_OPTIONS = ("unique", "expireAfterSeconds", "partialFilterExpression", "sparse", "collation")
+
+
+def _normalize_keys(key: Iterable) -> IndexKeys:
+    normalized = []
+    for field, direction in key:
+        if isinstance(direction, float):
+            direction = int(direction)
+        normalized.append((field, direction))
+    return tuple(normalized)
+
+
+def _label(collection: str, name: str) -> str:
+    return f"{collection}.{name}"
+
+
+def find_redundant(existing: Dict[str, Dict[str, Any]]) -> List[str]:
+    """다른 인덱스의 접두사라서 없어도 같은 쿼리를 처리할 수 있는 인덱스 이름 목록."""
+    keys_by_name = {name: _normalize_keys(info["key"]) for name, info in existing.items()}
+    redundant = []
+    for name, keys in keys_by_name.items():
+        info = existing[name]
+        if name == "_id_" or any(option in info for option in _SPECIAL_OPTIONS):
+            continue
+        if not all(isinstance(direction, int) for _, direction in keys):
+            continue  # text/2dsphere 등 특수 인덱스
+        for other_name, other_keys in keys_by_name.items():
+            if other_name != name and len(other_keys) > len(keys) and other_keys[:len(keys)] == keys:
+                redundant.append(name)
+                break
+    return redundant
+
+
+async def _sync_collection(
+    db: AsyncIOMotorDatabase,
+    collection: str,
+    specs: List[IndexSpec],
+    report: Dict[str, List[str]],
+    drop_unregistered: bool
+) -> None:
+    existing = await db[collection].index_information()
+    by_keys = {_normalize_keys(info["key"]): (name, info) for name, info in existing.items()}
+    registered_names = set()
+
+    for spec in specs:
+        current = by_keys.get(spec.keys)
+        if current is None:
+            options: Dict[str, Any] = {"name": spec.name}
+            if spec.unique:
+                options["unique"] = True
+            if spec.expire_after_seconds is not None:
+                options["expireAfterSeconds"] = spec.expire_after_seconds
+            try:
+                await db[collection].create_index(list(spec.keys), **options)
+            except OperationFailure as e:
+                report["conflicts"].append(f"{_label(collection, spec.name)}: {e}")
+                continue
+            registered_names.add(spec.name)
+            report["created"].append(_label(collection, spec.name))
+            continue
+
+        name, info = current
+        registered_names.add(name)
+        if bool(info.get("unique")) != spec.unique:
+            report["conflicts"].append(
+                f"{_label(collection, name)}: unique={bool(info.get('unique'))} (레지스트리: {spec.unique})"
+            )
+        if spec.expire_after_seconds is not None and info.get("expireAfterSeconds") != spec.expire_after_seconds:
+            # TTL 은 인덱스를 다시 만들지 않고 collMod 로 변경
+            await db.command({
+                "collMod": collection,
+                "index": {"name": name, "expireAfterSeconds": spec.expire_after_seconds},
+            })
+            report["updated"].append(_label(collection, name))
+
+    existing = await db[collection].index_information()
+    for name in existing:
+        if name == "_id_" or name in registered_names:
+            continue
+        if drop_unregistered:
+            await db[collection].drop_index(name)
+            report["dropped"].append(_label(collection, name))
+        else:
+            report["unregistered"].append(_label(collection, name))
+    if drop_unregistered:
+        existing = await db[collection].index_information()
+    report["redundant"].extend(_label(collection, name) for name in find_redundant(existing))
+
+
+async def sync_indexes(
+    db: AsyncIOMotorDatabase,
+    collections: Optional[List[str]] = None,
+    drop_unregistered: bool = False
+) -> Dict[str, List[str]]:
+    """레지스트리에 있는 인덱스 중 없는 것을 만들고 TTL 변경을 반영합니다.
+
+    레지스트리에 없는 인덱스는 drop_unregistered 가 True 일 때만 삭제하고,
+    그 외에는 unregistered / redundant 로 보고만 합니다.
+    """
+    report: Dict[str, List[str]] = {
+        "created": [], "updated": [], "conflicts": [], "unregistered": [], "redundant": [], "dropped": []
+    }
+    for collection, specs in indexes_by_collection().items():
+        if collections is not None and collection not in collections:
+            continue
+        await _sync_collection(db, collection, specs, report, drop_unregistered)
+    return report
+
+
+async def sync_indexes_in_background(db: AsyncIOMotorDatabase) -> None:
+    """서버 시작을 막지 않도록 lifespan 에서 별도 태스크로 실행합니다."""
+    try:
+        report = await sync_indexes(db)
+    except Exception as e:
+        print(f"인덱스 설정 실패: {e}")
+        return
+    if report["created"] or report["updated"]:
+        print(f"인덱스 생성/변경: {report['created'] + report['updated']}")
+    for conflict in report["conflicts"]:
+        print(f"인덱스 충돌: {conflict}")
+    if report["redundant"]:
+        print(f"중복 인덱스 (다른 인덱스의 접두사): {report['redundant']}")
+    if report["unregistered"]:
+        print(f"레지스트리에 없는 인덱스: {report['unregistered']}")
@@ -0,0 +1,143 @@
+from typing import Any, Dict, List, Optional, Tuple
+
+from motor.motor_asyncio import AsyncIOMotorDatabase
+from redis.asyncio import Redis
+
+# 카테고리별 리더보드 (Redis sorted set, member: goal_id, score: current_value / target_value)
+
+CATEGORIES = ("health", "education", "career", "personal", "finance")
+RANKED_STATUSES = ("active", "completed")
+
+
+def leaderboard_key(category: str) -> str:
+    return f"leaderboard:{category}"
+
+
+def progress_score(goal_doc: Dict[str, Any]) -> Optional[float]:
+    """리더보드 점수(달성률, 최대 1.0)를 계산합니다. 순위 대상이 아니면 None."""
+    target_value = goal_doc.get("target_value") or 0
+    if goal_doc.get("status", "active") not in RANKED_STATUSES or target_value <= 0:
+        return None
+    return min(max(goal_doc.get("current_value", 0) / target_value, 0.0), 1.0)
+
+
+async def update_goal_score(redis: Optional[Redis], goal_doc: Dict[str, Any]) -> None:
+    """목표의 current_value/상태/카테고리 변경을 리더보드에 반영합니다."""
+    if redis is None:
+        return
+    goal_id = str(goal_doc["_id"])
+    score = progress_score(goal_doc)
+    try:
+        async with redis.pipeline(transaction=False) as pipe:
+            # 카테고리가 바뀌었을 수 있으므로 다른 카테고리에서는 제거
+            for category in CATEGORIES:
+                if category != goal_doc.get("category") or score is None:
+                    pipe.zrem(leaderboard_key(category), goal_id)
+            if score is not None and goal_doc.get("category") in CATEGORIES:
+                pipe.zadd(leaderboard_key(goal_doc["category"]), {goal_id: score})
+            await pipe.execute()
+    except Exception as e:
+        print(f"리더보드 갱신 실패 - goal_id: {goal_id}: {e}")
+
+
+async def remove_goal_score(redis: Optional[Redis], goal_id: str) -> None:
+    if redis is None:
+        return
+    try:
+        async with redis.pipeline(transaction=False) as pipe:
+            for category in CATEGORIES:
+                pipe.zrem(leaderboard_key(category), goal_id)
+            await pipe.execute()
+    except Exception as e:
+        print(f"리더보드 삭제 실패 - goal_id: {goal_id}: {e}")
+
+
+async def remove_goal_scores(redis: Optional[Redis], goal_ids: List[str]) -> None:
+    """여러 목표를 한 번의 파이프라인으로 리더보드에서 제거합니다 (상태 자동 전환용)."""
+    if redis is None or not goal_ids:
+        return
+    try:
+        async with redis.pipeline(transaction=False) as pipe:
+            for category in CATEGORIES:
+                pipe.zrem(leaderboard_key(category), *goal_ids)
+            await pipe.execute()
+    except Exception as e:
+        print(f"리더보드 삭제 실패 - 목표 {len(goal_ids)}개: {e}")
+
+
+async def top_goals(redis: Redis, category: str, limit: int) -> List[Tuple[str, float]]:
+    return await redis.zrevrange(leaderboard_key(category), 0, limit - 1, withscores=True)
+
+
+async def goal_ranks(redis: Redis, category: str, goal_ids: List[str]) -> Tuple[int, List[Dict[str, Any]]]:
+    """목표별 순위(1부터)와 점수, 리더보드 전체 인원을 반환합니다."""
+    key = leaderboard_key(category)
+    async with redis.pipeline(transaction=False) as pipe:
+        pipe.zcard(key)
+        for goal_id in goal_ids:
+            pipe.zrevrank(key, goal_id)
+            pipe.zscore(key, goal_id)
+        results = await pipe.execute()
+
+    total = results[0]
+    ranks = []
+    for index, goal_id in enumerate(goal_ids):
+        rank, score = results[1 + index * 2], results[2 + index * 2]
+        if rank is not None:
+            ranks.append({"goal_id": goal_id, "rank": rank + 1, "score": score})
+    return total, ranks
+
+
+async def rebuild_leaderboards(
+    db: AsyncIOMotorDatabase,
+    redis: Redis,
+    batch_size: int = 1000
+) -> int:
+    """goals 컬렉션을 커서로 스트리밍하여 리더보드를 다시 채웁니다.
+
+    임시 키에 적재한 뒤 RENAME 으로 교체하므로 재구축 중에도 기존 순위가 조회됩니다.
+    """
+    temp_keys = {category: f"{leaderboard_key(category)}:rebuild" for category in CATEGORIES}
+    await redis.delete(*temp_keys.values())
+
+    ranked = 0
+    pending: Dict[str, Dict[str, float]] = {}
+    projection = {"category": 1, "current_value": 1, "target_value": 1, "status": 1}
+    cursor = db.goals.find(
+        {"status": {"$in": list(RANKED_STATUSES)}, "category": {"$in": list(CATEGORIES)}},
+        projection
+    ).batch_size(batch_size)
+
+    async def flush() -> None:
+        async with redis.pipeline(transaction=False) as pipe:
+            for category, members in pending.items():
+                pipe.zadd(temp_keys[category], members)
+            await pipe.execute()
+        pending.clear()
+
+    buffered = 0
+    async for goal_doc in cursor:
+        score = progress_score(goal_doc)
+        if score is None:
+            continue
+        pending.setdefault(goal_doc["category"], {})[str(goal_doc["_id"])] = score
+        buffered += 1
+        ranked += 1
+        if buffered >= batch_size:
+            await flush()
+            buffered = 0
+    if pending:
+        await flush()
+
+    async with redis.pipeline(transaction=True) as pipe:
+        for category, temp_key in temp_keys.items():
+            pipe.exists(temp_key)
+        exists = await pipe.execute()
+    async with redis.pipeline(transaction=True) as pipe:
+        for (category, temp_key), present in zip(temp_keys.items(), exists):
+            if present:
+                pipe.rename(temp_key, leaderboard_key(category))
+            else:
+                pipe.delete(leaderboard_key(category))
+        await pipe.execute()
+    return ranked
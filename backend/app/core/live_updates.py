@@ -0,0 +1,220 @@
+import asyncio
+import json
+from typing import Any, Dict, Optional, Set
+
+from bson import ObjectId
+from fastapi.encoders import jsonable_encoder
+from motor.motor_asyncio import AsyncIOMotorDatabase
+from pymongo.errors import OperationFailure, PyMongoError
+
+from app.core.metrics import LIVE_UPDATE_CONNECTIONS, LIVE_UPDATE_MESSAGES
+
+# 실시간 업데이트: 워커마다 하나의 MongoDB change stream 으로 goals/progress_logs 변경을 받아
+# 해당 사용자의 WebSocket 연결들에 변경분(delta)만 전달합니다.
+# 클라이언트는 목록 전체를 다시 가져오지 않고 insert/update 메시지를 적용하며,
+# resync 메시지를 받았을 때만 목록을 다시 조회합니다.
+
+WATCHED_COLLECTIONS = ("goals", "progress_logs")
+
+# change stream 을 지원하지 않는 배포(단일 mongod)에서 발생하는 오류 코드
+_NOT_REPLICA_SET_CODES = {40573}
+# resume token 이 oplog 에서 밀려났거나 더 이상 유효하지 않을 때의 오류 코드
+_HISTORY_LOST_CODES = {136, 280, 286}
+
+_RESYNC = json.dumps({"type": "resync"})
+
+
+def _encode(document: Dict[str, Any]) -> Dict[str, Any]:
+    return jsonable_encoder(document, custom_encoder={ObjectId: str})
+
+
+class Subscription:
+    """WebSocket 연결 하나가 받을 메시지 대기열.
+
+    대기열이 가득 차면(느린 클라이언트) 쌓인 메시지를 버리고 resync 하나만 남깁니다.
+    """
+
+    def __init__(self, user_id: str, max_size: int):
+        self.user_id = user_id
+        self.queue: "asyncio.Queue[str]" = asyncio.Queue(maxsize=max_size)
+
+    def push(self, message: str) -> bool:
+        try:
+            self.queue.put_nowait(message)
+            return True
+        except asyncio.QueueFull:
+            while not self.queue.empty():
+                self.queue.get_nowait()
+            self.queue.put_nowait(_RESYNC)
+            return False
+
+
+class LiveUpdateHub:
+    """워커당 하나의 change stream 감시자와 사용자별 구독 목록.
+
+    감시 작업은 처리한 마지막 resume token 을 기억해 두었다가, 연결이 끊기면 그 지점부터 이어서
+    받으므로 재시작 사이의 이벤트를 잃지 않습니다. token 이 너무 오래되어 이어받을 수 없으면
+    모든 연결에 resync 를 보내 목록을 다시 조회하게 합니다.
+    """
+
+    def __init__(
+        self,
+        db: AsyncIOMotorDatabase,
+        *,
+        queue_size: int,
+        max_connections: int,
+        enabled: bool = True,
+        retry_seconds: float = 5.0,
+    ):
+        self.db = db
+        self.queue_size = queue_size
+        self.max_connections = max_connections
+        self.enabled = enabled
+        self.retry_seconds = retry_seconds
+        self.available = False  # change stream 이 열려 있는지 여부
+        self._subscriptions: Dict[str, Set[Subscription]] = {}
+        self._connections = 0
+        self._resume_token: Optional[Dict[str, Any]] = None
+        self._watcher: Optional[asyncio.Task] = None
+        self._events = {"received": 0, "delivered": 0, "dropped": 0, "resumes": 0, "resyncs": 0}
+
+    # ---- 구독 ----
+
+    def subscribe(self, user_id: str) -> Optional[Subscription]:
+        """연결을 등록합니다. 워커당 최대 연결 수를 넘으면 None."""
+        if self._connections >= self.max_connections:
+            return None
+        subscription = Subscription(user_id, self.queue_size)
+        self._subscriptions.setdefault(user_id, set()).add(subscription)
+        self._connections += 1
+        LIVE_UPDATE_CONNECTIONS.inc()
+        return subscription
+
+    def unsubscribe(self, subscription: Subscription) -> None:
+        subscriptions = self._subscriptions.get(subscription.user_id)
+        if not subscriptions or subscription not in subscriptions:
+            return
+        subscriptions.discard(subscription)
+        if not subscriptions:
+            del self._subscriptions[subscription.user_id]
+        self._connections -= 1
+        LIVE_UPDATE_CONNECTIONS.dec()
+
+    # ---- 변경 이벤트 처리 ----
+
+    def handle_change(self, change: Dict[str, Any]) -> None:
+        """change stream 이벤트 하나를 해당 사용자의 연결들에 전달합니다."""
+        self._events["received"] += 1
+        document = change.get("fullDocument")
+        if not document:
+            # updateLookup 시점에 이미 삭제된 문서
+            return
+        user_id = str(document.get("user_id"))
+        subscriptions = self._subscriptions.get(user_id)
+        if not subscriptions:
+            return
+
+        collection = change["ns"]["coll"]
+        document_id = str(document["_id"])
+        if change["operationType"] == "update":
+            description = change.get("updateDescription") or {}
+            fields = {path.split(".", 1)[0] for path in description.get("updatedFields", {})}
+            message = {
+                "type": "update",
+                "collection": collection,
+                "id": document_id,
+                "fields": _encode({field: document.get(field) for field in fields}),
+                "removed": [path for path in description.get("removedFields", []) if "." not in path],
+            }
+        else:
+            # insert, replace 는 문서 전체를 보냄
+            body = {key: value for key, value in document.items() if key != "_id"}
+            body["id"] = document_id
+            message = {
+                "type": "insert" if change["operationType"] == "insert" else "replace",
+                "collection": collection,
+                "id": document_id,
+                "document": _encode(body),
+            }
+
+        payload = json.dumps(message, ensure_ascii=False)
+        for subscription in subscriptions:
+            if subscription.push(payload):
+                self._events["delivered"] += 1
+                LIVE_UPDATE_MESSAGES.labels(collection, "sent").inc()
+            else:
+                self._events["dropped"] += 1
+                LIVE_UPDATE_MESSAGES.labels(collection, "dropped").inc()
+
+    def _broadcast_resync(self) -> None:
+        self._events["resyncs"] += 1
+        for subscriptions in self._subscriptions.values():
+            for subscription in subscriptions:
+                subscription.push(_RESYNC)
+
+    # ---- change stream 감시 ----
+
+    async def _watch(self) -> None:
+        pipeline = [{
+            "$match": {
+                "ns.coll": {"$in": list(WATCHED_COLLECTIONS)},
+                "operationType": {"$in": ["insert", "update", "replace"]},
+            }
+        }]
+        while True:
+            try:
+                async with self.db.watch(
+                    pipeline, full_document="updateLookup", resume_after=self._resume_token
+                ) as stream:
+                    self.available = True
+                    while stream.alive:
+                        # 변경이 없어도 빈 배치마다 token 이 앞으로 이동하므로 매번 갱신
+                        change = await stream.try_next()
+                        if change is not None:
+                            self.handle_change(change)
+                        self._resume_token = stream.resume_token
+            except asyncio.CancelledError:
+                raise
+            except OperationFailure as e:
+                self.available = False
+                if e.code in _NOT_REPLICA_SET_CODES:
+                    print(f"MongoDB 가 레플리카 셋이 아니어서 실시간 업데이트를 사용할 수 없습니다: {e}")
+                    return
+                if e.code in _HISTORY_LOST_CODES:
+                    # 이어받을 수 없으므로 현재 시점부터 다시 시작하고 클라이언트는 목록을 다시 조회
+                    print(f"change stream 을 이어받을 수 없어 처음부터 다시 시작합니다: {e}")
+                    self._resume_token = None
+                    self._broadcast_resync()
+                    continue
+                print(f"change stream 오류, {self.retry_seconds}초 후 이어서 받습니다: {e}")
+                await asyncio.sleep(self.retry_seconds)
+            except PyMongoError as e:
+                self.available = False
+                print(f"change stream 연결 끊김, {self.retry_seconds}초 후 이어서 받습니다: {e}")
+                await asyncio.sleep(self.retry_seconds)
+            self._events["resumes"] += 1
+
+    def start(self) -> None:
+        if self.enabled and self._watcher is None:
+            self._watcher = asyncio.create_task(self._watch())
+
+    async def close(self) -> None:
+        if self._watcher is not None:
+            self._watcher.cancel()
+            try:
+                await self._watcher
+            except asyncio.CancelledError:
+                pass
+            self._watcher = None
+        self.available = False
+
+    def snapshot(self) -> Dict[str, Any]:
+        return {
+            "enabled": self.enabled,
+            "available": self.available,
+            "connections": self._connections,
+            "users": len(self._subscriptions),
+            "max_connections": self.max_connections,
+            "has_resume_token": self._resume_token is not None,
+            "events": dict(self._events),
+        }
@@ -0,0 +1,167 @@
+import json
+import re
+import time
+from abc import ABC, abstractmethod
+from dataclasses import dataclass
+from typing import Any, Dict, List, Optional
+
+from app.core.circuit_breaker import CircuitBreaker, CircuitOpenError
+from app.core.config import settings
+from app.core.metrics import observe_llm_call
+
+llm_breaker = CircuitBreaker(
+    settings.LLM_PROVIDER,
+    failure_rate_threshold=settings.LLM_BREAKER_FAILURE_RATE_THRESHOLD,
+    slow_call_threshold=settings.LLM_BREAKER_SLOW_CALL_SECONDS,
+    slow_call_rate_threshold=settings.LLM_BREAKER_SLOW_CALL_RATE_THRESHOLD,
+    window_size=settings.LLM_BREAKER_WINDOW_SIZE,
+    minimum_calls=settings.LLM_BREAKER_MINIMUM_CALLS,
+    open_seconds=settings.LLM_BREAKER_OPEN_SECONDS,
+)
+
+
+@dataclass
+class LLMResult:
+    content: str
+    tokens_used: int
+
+
+class LLMProvider(ABC):
+    """채팅 완성 API 제공자 인터페이스입니다."""
+
+    name = "base"
+
+    @abstractmethod
+    async def complete(
+        self,
+        messages: List[Dict[str, str]],
+        max_tokens: int,
+        temperature: float,
+        model: str,
+    ) -> LLMResult:
+        """메시지에 대한 완성 결과를 반환합니다."""
+
+    async def aclose(self) -> None:
+        pass
+
+
+class OpenAICompatibleProvider(LLMProvider):
+    """OpenAI 및 OpenAI 호환 서버(로컬 스텁 포함)를 호출하는 제공자입니다."""
+
+    def __init__(self, name: str, api_key: str, base_url: Optional[str] = None):
+        from openai import AsyncOpenAI
+
+        self.name = name
+        self.client = AsyncOpenAI(
+            api_key=api_key,
+            base_url=base_url,
+            timeout=settings.LLM_TIMEOUT_SECONDS,
+            max_retries=settings.LLM_MAX_RETRIES,
+        )
+
+    async def complete(self, messages, max_tokens, temperature, model) -> LLMResult:
+        response = await self.client.chat.completions.create(
+            model=model,
+            messages=messages,
+            max_tokens=max_tokens,
+            temperature=temperature,
+        )
+        return LLMResult(
+            content=response.choices[0].message.content or "",
+            tokens_used=response.usage.total_tokens if response.usage else 0,
+        )
+
+    async def aclose(self) -> None:
+        await self.client.close()
+
+
+def _create_provider() -> LLMProvider:
+    if settings.LLM_PROVIDER == "openai":
+        return OpenAICompatibleProvider(
+            "openai", api_key=settings.OPENAI_API_KEY, base_url=settings.LLM_BASE_URL
+        )
+    if settings.LLM_PROVIDER == "stub":
+        return OpenAICompatibleProvider(
+            "stub", api_key="stub", base_url=settings.LLM_BASE_URL or settings.LLM_STUB_URL
+        )
+    raise ValueError(f"지원하지 않는 LLM 제공자입니다: {settings.LLM_PROVIDER}")
+
+
+_provider: Optional[LLMProvider] = None
+
+
+def get_llm_provider() -> LLMProvider:
+    """설정에 맞는 LLM 제공자를 처음 사용할 때 생성해 반환합니다."""
+    global _provider
+    if _provider is None:
+        _provider = _create_provider()
+    return _provider
+
+
+def set_llm_provider(provider: Optional[LLMProvider]) -> None:
+    """벤치마크 등에서 LLM 제공자를 교체합니다."""
+    global _provider
+    _provider = provider
+
+
+async def close_llm_provider() -> None:
+    global _provider
+    if _provider is not None:
+        await _provider.aclose()
+        _provider = None
+
+
+async def chat_completion(
+    messages: List[Dict[str, str]],
+    max_tokens: int,
+    temperature: float = 0.7,
+    model: Optional[str] = None,
+    interaction_type: str = "unknown",
+) -> LLMResult:
+    """회로 차단기를 거쳐 채팅 완성 API를 호출합니다.
+
+    회로가 열려 있으면 네트워크 호출 없이 즉시 CircuitOpenError 를 발생시킵니다.
+    호출 시간과 사용 토큰은 interaction_type 별 지표로 기록됩니다.
+    """
+    if not llm_breaker.allow_request():
+        observe_llm_call(interaction_type, "circuit_open", 0.0)
+        raise CircuitOpenError(f"{llm_breaker.name} 회로가 열려 있습니다.")
+
+    started = time.perf_counter()
+    try:
+        result = await get_llm_provider().complete(
+            messages, max_tokens, temperature, model or settings.LLM_MODEL
+        )
+    except Exception:
+        elapsed = time.perf_counter() - started
+        llm_breaker.record_failure(elapsed)
+        observe_llm_call(interaction_type, "error", elapsed)
+        raise
+    except BaseException:
+        # 클라이언트 연결 종료나 타임아웃으로 취소되면 half-open 시험 슬롯을 돌려줌
+        llm_breaker.release()
+        raise
+    elapsed = time.perf_counter() - started
+    llm_breaker.record_success(elapsed)
+    observe_llm_call(interaction_type, "success", elapsed, result.tokens_used)
+    return result
+
+
+def extract_json(ai_response: str) -> Any:
+    """LLM 응답에서 JSON 부분만 추출해 파싱합니다."""
+    # JSON 부분만 추출 (```json과 ``` 제거)
+    json_match = re.search(r'```json\s*(.*?)\s*```', ai_response, re.DOTALL)
+    if json_match:
+        json_content = json_match.group(1)
+    else:
+        # ```이 없는 경우 전체 응답에서 JSON 찾기
+        json_match = re.search(r'\{.*\}', ai_response, re.DOTALL)
+        if json_match:
+            json_content = json_match.group(0)
+        else:
+            json_content = ai_response
+    
+    # JSON 파싱 시도
+    if json_content:
+        return json.loads(json_content)
+    return {}
@@ -0,0 +1,183 @@
+import os
+import time
+from typing import Any, Dict, List, Optional, Tuple
+
+from prometheus_client import (
+    CONTENT_TYPE_LATEST, CollectorRegistry, Counter, Gauge, Histogram, generate_latest, multiprocess
+)
+from pymongo import monitoring
+from starlette.routing import Match
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+# Prometheus 지표: HTTP 라우트, MongoDB 명령, LLM 호출 지연 시간, 읽기 캐시 적중, 실시간 업데이트, 마감일 알림, 목표 상태 전환
+# gunicorn 다중 워커 환경에서는 PROMETHEUS_MULTIPROC_DIR 를 설정하면 워커별 지표를 합산합니다.
+
+UNMATCHED_ROUTE = "unmatched"
+
+HTTP_REQUEST_DURATION = Histogram(
+    "http_request_duration_seconds",
+    "라우트별 HTTP 요청 처리 시간",
+    ["method", "route"],
+)
+HTTP_REQUESTS = Counter(
+    "http_requests_total",
+    "라우트/상태 코드별 HTTP 요청 수",
+    ["method", "route", "status"],
+)
+MONGODB_COMMAND_DURATION = Histogram(
+    "mongodb_command_duration_seconds",
+    "컬렉션/명령별 MongoDB 명령 처리 시간",
+    ["collection", "command"],
+    buckets=(0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5),
+)
+MONGODB_COMMAND_FAILURES = Counter(
+    "mongodb_command_failures_total",
+    "컬렉션/명령별 MongoDB 명령 실패 수",
+    ["collection", "command"],
+)
+LLM_REQUEST_DURATION = Histogram(
+    "llm_request_duration_seconds",
+    "상호작용 유형별 LLM 호출 시간",
+    ["interaction_type", "outcome"],
+    buckets=(0.1, 0.25, 0.5, 1.0, 2.0, 4.0, 8.0, 15.0, 30.0),
+)
+LLM_TOKENS = Counter(
+    "llm_tokens_total",
+    "상호작용 유형별 LLM 사용 토큰 수",
+    ["interaction_type"],
+)
+
+CACHE_REQUESTS = Counter(
+    "cache_requests_total",
+    "네임스페이스별 읽기 캐시 조회 결과 (local_hit | redis_hit | miss)",
+    ["namespace", "result"],
+)
+
+LIVE_UPDATE_CONNECTIONS = Gauge(
+    "live_updates_connections",
+    "현재 열려 있는 /ws 연결 수",
+    multiprocess_mode="livesum",
+)
+LIVE_UPDATE_MESSAGES = Counter(
+    "live_updates_messages_total",
+    "컬렉션/결과별 실시간 업데이트 메시지 수 (sent | dropped)",
+    ["collection", "result"],
+)
+
+DEADLINE_NOTIFICATIONS = Counter(
+    "deadline_notifications_total",
+    "마감일 스캔으로 새로 만든 알림 수",
+    ["kind"],
+)
+
+GOAL_STATUS_TRANSITIONS = Counter(
+    "goal_status_transitions_total",
+    "사유별 목표 상태 자동 전환 수 (target_reached | deadline_expired)",
+    ["reason"],
+)
+
+
+def observe_llm_call(interaction_type: str, outcome: str, duration: float, tokens_used: int = 0) -> None:
+    LLM_REQUEST_DURATION.labels(interaction_type, outcome).observe(duration)
+    if tokens_used:
+        LLM_TOKENS.labels(interaction_type).inc(tokens_used)
+
+
+def metrics_response() -> Tuple[bytes, str]:
+    """현재 지표를 Prometheus 텍스트 형식으로 반환합니다."""
+    if os.environ.get("PROMETHEUS_MULTIPROC_DIR"):
+        registry = CollectorRegistry()
+        multiprocess.MultiProcessCollector(registry)
+        return generate_latest(registry), CONTENT_TYPE_LATEST
+    return generate_latest(), CONTENT_TYPE_LATEST
+
+
+def mark_process_dead(pid: int) -> None:
+    """종료된 gunicorn 워커의 다중 프로세스 지표 파일을 정리합니다."""
+    if os.environ.get("PROMETHEUS_MULTIPROC_DIR"):
+        multiprocess.mark_process_dead(pid)
+
+
+class PrometheusMiddleware:
+    """라우트 템플릿(/api/goals/{goal_id}) 단위로 요청 시간과 상태 코드를 기록하는 ASGI 미들웨어.
+
+    실제 경로 대신 템플릿을 라벨로 사용하므로 ID 가 포함된 경로가 늘어나도
+    시계열 수가 라우트 수로 제한됩니다.
+    """
+
+    def __init__(self, app: ASGIApp):
+        self.app = app
+        self._endpoint_paths: Optional[Dict[Any, List[str]]] = None
+
+    def _route_template(self, scope: Scope) -> str:
+        endpoint = scope.get("endpoint")
+        if endpoint is None:
+            return UNMATCHED_ROUTE
+        routes = scope["app"].router.routes
+        if self._endpoint_paths is None:
+            paths: Dict[Any, List[str]] = {}
+            for route in routes:
+                if getattr(route, "endpoint", None) is not None:
+                    paths.setdefault(route.endpoint, []).append(route.path)
+            self._endpoint_paths = paths
+        candidates = self._endpoint_paths.get(endpoint, [])
+        if len(candidates) == 1:
+            return candidates[0]
+        # 여러 경로가 같은 엔드포인트를 공유하면 경로를 다시 매칭
+        for route in routes:
+            if getattr(route, "endpoint", None) is endpoint and route.matches(scope)[0] == Match.FULL:
+                return route.path
+        return UNMATCHED_ROUTE
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        started = time.perf_counter()
+        status_code = 500
+
+        async def send_with_status(message: Message) -> None:
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_with_status)
+        finally:
+            route = self._route_template(scope)
+            HTTP_REQUEST_DURATION.labels(scope["method"], route).observe(time.perf_counter() - started)
+            HTTP_REQUESTS.labels(scope["method"], route, str(status_code)).inc()
+
+
+class MongoCommandMetrics(monitoring.CommandListener):
+    """pymongo 명령 이벤트로 컬렉션/명령별 처리 시간을 기록합니다."""
+
+    def __init__(self):
+        self._pending: Dict[Tuple[Any, int], Tuple[str, str]] = {}
+
+    @staticmethod
+    def _collection(command_name: str, command: Dict[str, Any]) -> str:
+        if command_name == "getMore":
+            target = command.get("collection")
+        else:
+            target = command.get(command_name)
+        return target if isinstance(target, str) else "-"
+
+    def started(self, event) -> None:
+        self._pending[(event.connection_id, event.request_id)] = (
+            self._collection(event.command_name, event.command),
+            event.command_name,
+        )
+
+    def succeeded(self, event) -> None:
+        labels = self._pending.pop((event.connection_id, event.request_id), None)
+        if labels is not None:
+            MONGODB_COMMAND_DURATION.labels(*labels).observe(event.duration_micros / 1_000_000)
+
+    def failed(self, event) -> None:
+        labels = self._pending.pop((event.connection_id, event.request_id), None)
+        if labels is not None:
+            MONGODB_COMMAND_DURATION.labels(*labels).observe(event.duration_micros / 1_000_000)
+            MONGODB_COMMAND_FAILURES.labels(*labels).inc()
@@ -0,0 +1,114 @@
+from typing import Any, Dict
+
+
+# AI 프롬프트 템플릿 (ai_interactions 에는 렌더링된 전문 대신 템플릿 ID와 파라미터만 저장)
+# 저장된 기록을 다시 렌더링할 수 있도록 더 이상 쓰지 않는 버전도 지우지 않고 남겨 둠
+PROMPT_TEMPLATES: Dict[str, str] = {
+    "analysis.v1": """
+    다음 목표를 분석해주세요:
+
+    제목: {title}
+    설명: {description}
+    카테고리: {category}
+    목표값: {target_value} {unit}
+    현재값: {current_value} {unit}
+    마감일: {deadline}
+    우선순위: {priority}
+
+    다음 관점에서 분석하고 JSON 형태로 응답해주세요:
+    1. 목표의 구체성 및 달성 가능성 (1-10점)
+    2. 예상 소요 기간 (일 단위)
+    3. 성공 확률 (0-1 사이의 값)
+    4. 개선 제안 사항
+
+    응답 형식:
+    {{
+        "difficulty_score": 숫자,
+        "estimated_duration": 숫자,
+        "success_probability": 숫자,
+        "suggestions": "제안사항 텍스트"
+    }}
+    """,
+    "analysis_batch.v1": """
+    다음 {count}개의 목표를 각각 분석해주세요:
+    {goals}
+    각 목표를 다음 관점에서 분석하고 JSON 형태로 응답해주세요:
+    1. 목표의 구체성 및 달성 가능성 (1-10점)
+    2. 예상 소요 기간 (일 단위)
+    3. 성공 확률 (0-1 사이의 값)
+    4. 개선 제안 사항
+
+    응답 형식 (goal_id 는 위에 표시된 목표 ID를 그대로 사용):
+    {{
+        "results": [
+            {{
+                "goal_id": "목표 ID",
+                "difficulty_score": 숫자,
+                "estimated_duration": 숫자,
+                "success_probability": 숫자,
+                "suggestions": "제안사항 텍스트"
+            }}
+        ]
+    }}
+    """,
+    "analysis_batch_item.v1": """
+    [목표 ID: {goal_id}]
+    제목: {title}
+    설명: {description}
+    카테고리: {category}
+    목표값: {target_value} {unit}
+    현재값: {current_value} {unit}
+    마감일: {deadline}
+    우선순위: {priority}
+    """,
+    "planning.v1": """
+    다음 목표를 위한 상세한 실행 계획을 단계별로 작성해주세요:
+
+    목표: {title}
+    설명: {description}
+    목표값: {target_value} {unit}
+    마감일: {deadline}
+
+    다음 형식으로 응답해주세요:
+    1. 각 단계별 제목과 설명
+    2. 예상 소요 시간 (분 단위)
+    3. 구체적인 실행 방법
+
+    JSON 형태로 응답:
+    {{
+        "title": "실행 계획 제목",
+        "description": "계획 설명",
+        "steps": [
+            {{
+                "step_number": 1,
+                "title": "단계 제목",
+                "description": "단계 설명",
+                "estimated_time": 소요시간(분)
+            }}
+        ]
+    }}
+    """,
+    "coaching.v1": """
+    다음 사용자에게 {message_type} 코칭 메시지를 작성해주세요:
+
+    목표: {title}
+    진도율: {progress_rate:.1f}%
+    현재값: {current_value} {unit}
+    목표값: {target_value} {unit}
+    마감일: {deadline}
+
+    최근 활동이 있다면 이를 참고하여 격려하고, 구체적인 다음 단계를 제안해주세요.
+    따뜻하고 동기부여가 되는 톤으로 작성해주세요.
+    """,
+    "coaching_summary.v1": "목표: {title}, 진도율: {progress_rate:.1f}%",
+}
+
+
+def render_prompt(template_id: str, params: Dict[str, Any]) -> str:
+    """템플릿 ID와 파라미터로 프롬프트를 렌더링합니다."""
+    return PROMPT_TEMPLATES[template_id].format(**params)
+
+
+def estimate_tokens(text: str) -> int:
+    """토크나이저 없이 토큰 수를 추정합니다 (UTF-8 4바이트당 약 1토큰)."""
+    return max(1, len(text.encode("utf-8")) // 4)
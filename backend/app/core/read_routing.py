@@ -0,0 +1,294 @@
+import asyncio
+import base64
+from contextlib import asynccontextmanager
+from contextvars import ContextVar
+from typing import Any, AsyncIterator, Awaitable, Callable, Dict, Optional, Tuple
+
+import bson
+from motor.motor_asyncio import AsyncIOMotorClientSession, AsyncIOMotorDatabase
+from pymongo import monitoring
+from pymongo.read_preferences import Nearest, Primary, PrimaryPreferred, Secondary, SecondaryPreferred
+from redis.asyncio import Redis
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from app.core.security import verify_token
+
+# 라우트별 읽기 선호도 (READ_PREFERENCES) 와 인과적 일관성 세션
+# 커뮤니티처럼 조금 오래된 데이터를 보여도 되는 읽기는 max staleness 안의 세컨더리에서 읽고,
+# 목표/진도처럼 사용자가 방금 쓴 내용을 다시 보는 읽기는 그 사용자의 마지막 쓰기 시각(operationTime/$clusterTime)으로
+# 인과적 세션을 시작해 세컨더리가 그 쓰기를 반영할 때까지 기다리게 합니다 (afterClusterTime).
+# 마지막 쓰기 시각은 요청 중 실행된 쓰기 명령의 응답에서 잡아 Redis 에 사용자별로 저장하므로 워커 간에 공유됩니다.
+
+WRITE_COMMANDS = frozenset({"insert", "update", "delete", "findAndModify"})
+_KEY_PREFIX = "causal"
+
+_READ_PREFERENCES = {
+    "primary": Primary,
+    "primaryPreferred": PrimaryPreferred,
+    "secondary": Secondary,
+    "secondaryPreferred": SecondaryPreferred,
+    "nearest": Nearest,
+}
+
+# 저장된 값보다 새로운 쓰기 시각일 때만 갱신 (늦게 끝난 요청이 더 오래된 시각으로 덮어쓰지 않도록)
+# KEYS: 사용자 키 / ARGV: 값, operationTime(초), operationTime(증분), TTL(초)
+_REMEMBER_SCRIPT = """
+local current = redis.call('GET', KEYS[1])
+if current then
+    local t, i = string.match(current, '^(%d+):(%d+):')
+    if t and (tonumber(t) > tonumber(ARGV[2]) or (tonumber(t) == tonumber(ARGV[2]) and tonumber(i) >= tonumber(ARGV[3]))) then
+        redis.call('EXPIRE', KEYS[1], ARGV[4])
+        return 0
+    end
+end
+redis.call('SET', KEYS[1], ARGV[1], 'EX', ARGV[4])
+return 1
+"""
+
+
+def read_preference(mode: str, max_staleness: int):
+    """설정 이름의 읽기 선호도 (primary 외에는 max staleness 적용, -1 이면 제한 없음)."""
+    if mode not in _READ_PREFERENCES:
+        raise ValueError(f"알 수 없는 읽기 선호도입니다: {mode}")
+    if mode == "primary":
+        return Primary()
+    return _READ_PREFERENCES[mode](max_staleness=max_staleness)
+
+
+class WriteToken:
+    """요청 중 실행된 마지막 쓰기 명령의 operationTime 과 $clusterTime (레플리카 셋에서만 응답에 포함)."""
+
+    __slots__ = ("operation_time", "cluster_time")
+
+    def __init__(self, operation_time=None, cluster_time: Optional[Dict[str, Any]] = None):
+        self.operation_time = operation_time
+        self.cluster_time = cluster_time
+
+    def record(self, reply: Dict[str, Any]) -> None:
+        operation_time = reply.get("operationTime")
+        if operation_time is None or (self.operation_time is not None and operation_time <= self.operation_time):
+            return
+        self.operation_time = operation_time
+        self.cluster_time = reply.get("$clusterTime")
+
+    def encode(self) -> str:
+        payload = base64.b64encode(bson.encode({
+            "operationTime": self.operation_time, "clusterTime": self.cluster_time
+        })).decode()
+        return f"{self.operation_time.time}:{self.operation_time.inc}:{payload}"
+
+    @classmethod
+    def decode(cls, value: str) -> "WriteToken":
+        doc = bson.decode(base64.b64decode(value.split(":", 2)[2]))
+        return cls(doc["operationTime"], doc.get("clusterTime"))
+
+
+_current_write: ContextVar[Optional[WriteToken]] = ContextVar("causal_write_token", default=None)
+# 현재 요청의 쓰기 시각을 바로 저장하는 함수 (CausalWriteMiddleware 가 지정)
+_remember_current: ContextVar[Optional[Callable[[], Awaitable[None]]]] = ContextVar("causal_remember", default=None)
+
+
+async def remember_current_write() -> None:
+    """현재 요청에서 지금까지 실행된 쓰기의 시각을 응답을 기다리지 않고 바로 저장합니다.
+
+    캐시 무효화 전에 호출해야 합니다. 무효화 후 응답 전에 같은 사용자의 동시 읽기가 들어오면
+    아직 이 쓰기를 반영하지 않은 세컨더리에서 읽고, 그 값을 새 태그 버전으로 캐시에 다시 채우기 때문입니다.
+    요청 밖(백그라운드 작업)이나 쓰기가 없었으면 아무 일도 하지 않습니다.
+    """
+    remember = _remember_current.get()
+    if remember is not None:
+        await remember()
+
+
+class CausalWriteListener(monitoring.CommandListener):
+    """쓰기 명령 응답의 operationTime 을 현재 요청의 WriteToken 에 기록합니다.
+
+    DBBudgetListener 와 같이 Motor 가 스레드 풀로 복사한 contextvars 로 현재 요청을 찾습니다.
+    """
+
+    def started(self, event) -> None:
+        pass
+
+    def succeeded(self, event) -> None:
+        if event.command_name in WRITE_COMMANDS:
+            token = _current_write.get()
+            if token is not None:
+                token.record(event.reply)
+
+    def failed(self, event) -> None:
+        pass
+
+
+class CausalReads:
+    """한 요청에서 라우트 읽기에 쓸 데이터베이스와, 사용자의 마지막 쓰기 이후를 읽는 인과적 세션."""
+
+    def __init__(
+        self,
+        db: AsyncIOMotorDatabase,
+        primary: Optional[AsyncIOMotorDatabase] = None,
+        router: Optional["ReadRouter"] = None,
+        user_id: Optional[str] = None
+    ):
+        self.db = db
+        self._primary = primary or db
+        self._router = router
+        self._user_id = user_id
+        self._token: Optional[asyncio.Future] = None
+
+    async def _load_token(self) -> Optional[WriteToken]:
+        if self._router is None:
+            return None
+        if self._token is None:
+            # 같은 요청의 동시 조회(목표 번들 등)가 Redis 를 한 번만 읽도록 공유
+            self._token = asyncio.ensure_future(self._router.last_write(self._user_id))
+        return await self._token
+
+    @asynccontextmanager
+    async def session(self) -> AsyncIterator[Tuple[AsyncIOMotorDatabase, Optional[AsyncIOMotorClientSession]]]:
+        """(데이터베이스, 세션). 최근 쓰기가 있으면 그 시각 이후로 맞춘 인과적 세션, 없으면 세션 없이 읽습니다.
+
+        마지막 쓰기 시각을 확인할 수 없으면 프라이머리에서 읽습니다.
+        세션은 동시에 여러 작업에 쓸 수 없으므로 동시 조회마다 따로 엽니다.
+        """
+        try:
+            token = await self._load_token()
+        except Exception as e:
+            print(f"마지막 쓰기 시각 조회 실패 - 프라이머리에서 읽음 (user_id: {self._user_id}): {e}")
+            yield self._primary, None
+            return
+        if token is None:
+            yield self.db, None
+            return
+        async with await self.db.client.start_session(causal_consistency=True) as session:
+            if token.cluster_time:
+                session.advance_cluster_time(token.cluster_time)
+            session.advance_operation_time(token.operation_time)
+            yield self.db, session
+
+
+class ReadRouter:
+    """READ_PREFERENCES 의 라우트별 읽기 선호도를 적용한 데이터베이스를 만들고, 사용자별 마지막 쓰기 시각을 관리합니다.
+
+    Redis 가 없으면 사용자별 읽기(for_user) 는 프라이머리에서 읽습니다.
+    """
+
+    def __init__(
+        self,
+        db: AsyncIOMotorDatabase,
+        redis: Optional[Redis],
+        *,
+        preferences: Dict[str, str],
+        max_staleness: int,
+        causal_window: int,
+        enabled: bool = True,
+    ):
+        self.db = db
+        self.redis = redis
+        self.max_staleness = max_staleness
+        self.causal_window = causal_window
+        self.enabled = enabled
+        self.preferences = dict(preferences)
+        self._databases: Dict[str, AsyncIOMotorDatabase] = {}
+        for route, mode in self.preferences.items():
+            preference = read_preference(mode, max_staleness)
+            if mode != "primary":
+                self._databases[route] = db.with_options(read_preference=preference)
+        self._remember_script = redis.register_script(_REMEMBER_SCRIPT) if redis is not None else None
+        self._counts = {"remembered": 0, "causal_reads": 0}
+
+    def database(self, route: str) -> AsyncIOMotorDatabase:
+        """라우트의 읽기 선호도를 적용한 데이터베이스 (설정이 없거나 비활성화되어 있으면 프라이머리)."""
+        if not self.enabled:
+            return self.db
+        return self._databases.get(route, self.db)
+
+    def for_user(self, route: str, user_id: str) -> CausalReads:
+        """사용자가 방금 쓴 내용을 다시 읽는 라우트용 (세컨더리에서 읽어도 자신의 쓰기는 보임)."""
+        db = self.database(route)
+        if db is self.db:
+            return CausalReads(self.db)
+        if self.redis is None:
+            return CausalReads(self.db)
+        return CausalReads(db, self.db, self, user_id)
+
+    async def remember_write(self, user_id: str, token: WriteToken) -> None:
+        if self._remember_script is None or token.operation_time is None:
+            return
+        try:
+            await self._remember_script(
+                keys=[f"{_KEY_PREFIX}:{user_id}"],
+                args=[token.encode(), token.operation_time.time, token.operation_time.inc, self.causal_window]
+            )
+            self._counts["remembered"] += 1
+        except Exception as e:
+            print(f"마지막 쓰기 시각 저장 실패 - user_id: {user_id}: {e}")
+
+    async def last_write(self, user_id: str) -> Optional[WriteToken]:
+        """마지막 쓰기 시각 (causal_window 안에 쓰기가 없었으면 None)."""
+        value = await self.redis.get(f"{_KEY_PREFIX}:{user_id}")
+        if value is None:
+            return None
+        self._counts["causal_reads"] += 1
+        return WriteToken.decode(value)
+
+    def snapshot(self) -> Dict[str, Any]:
+        return {
+            "enabled": self.enabled,
+            "preferences": self.preferences,
+            "max_staleness_seconds": self.max_staleness,
+            "causal_window_seconds": self.causal_window,
+            "counts": dict(self._counts),
+        }
+
+
+class CausalWriteMiddleware:
+    """요청 중 쓰기가 있었으면 응답을 보내기 전에 사용자의 마지막 쓰기 시각을 저장하는 ASGI 미들웨어.
+
+    응답 시작 전에 저장하므로 클라이언트가 응답을 받은 뒤 보낸 다음 읽기는 항상 이 쓰기를 봅니다.
+    캐시 무효화는 그보다 먼저 remember_current_write 로 저장하므로 응답 전의 동시 읽기도 이 쓰기를 봅니다.
+    사용자는 Authorization 헤더의 토큰으로 식별합니다.
+    """
+
+    def __init__(self, app: ASGIApp):
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        router: Optional[ReadRouter] = getattr(scope["app"].state, "read_router", None) if scope["type"] == "http" else None
+        if router is None or not router.enabled or scope["method"] in ("GET", "HEAD", "OPTIONS"):
+            await self.app(scope, receive, send)
+            return
+
+        token = WriteToken()
+        remembered_time = None
+
+        async def remember() -> None:
+            nonlocal remembered_time
+            # 이미 저장한 시각이면 Redis 를 다시 호출하지 않음 (무효화 때 저장한 뒤 쓰기가 없었던 경우)
+            if token.operation_time is None or token.operation_time == remembered_time:
+                return
+            user_id = _user_id(scope)
+            if user_id:
+                await router.remember_write(user_id, token)
+                remembered_time = token.operation_time
+
+        async def send_after_remember(message: Message) -> None:
+            if message["type"] == "http.response.start":
+                await remember()
+            await send(message)
+
+        context = _current_write.set(token)
+        remember_context = _remember_current.set(remember)
+        try:
+            await self.app(scope, receive, send_after_remember)
+        finally:
+            _remember_current.reset(remember_context)
+            _current_write.reset(context)
+
+
+def _user_id(scope: Scope) -> Optional[str]:
+    for name, value in scope.get("headers", []):
+        if name == b"authorization":
+            scheme, _, credentials = value.decode("latin-1").partition(" ")
+            if scheme.lower() == "bearer" and credentials:
+                return verify_token(credentials)
+    return None
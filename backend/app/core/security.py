@@ -1,10 +1,16 @@
 from datetime import datetime, timedelta
+from functools import lru_cache
 from typing import Any, Union
-from passlib.context import CryptContext
 from jose import jwt
 from app.core.config import settings
 
-pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
+
+@lru_cache(maxsize=1)
+def _pwd_context():
+    """passlib/bcrypt 는 로그인·회원가입에서만 쓰이므로 처음 필요할 때 가져옵니다."""
+    from passlib.context import CryptContext
+
+    return CryptContext(schemes=["bcrypt"], deprecated="auto")
 
 
 def create_access_token(
@@ -22,11 +28,11 @@ def create_access_token(
 
 
 def verify_password(plain_password: str, hashed_password: str) -> bool:
-    return pwd_context.verify(plain_password, hashed_password)
+    return _pwd_context().verify(plain_password, hashed_password)
 
 
 def get_password_hash(password: str) -> str:
-    return pwd_context.hash(password)
+    return _pwd_context().hash(password)
 
 
 def verify_token(token: str) -> Union[str, None]:
@@ -0,0 +1,168 @@
+import hashlib
+import math
+import random
+import re
+from datetime import datetime
+from typing import Any, Dict, Iterable, List, Set
+
+from motor.motor_asyncio import AsyncIOMotorDatabase
+from pymongo import DeleteOne, UpdateOne
+
+from app.core.config import settings
+
+# 목표 텍스트 유사도 인덱스 (MinHash 서명 + LSH 버킷, goal_signatures 컬렉션)
+
+_MERSENNE_PRIME = (1 << 61) - 1
+_rng = random.Random(settings.SIMILARITY_SEED)
+_PERMUTATIONS = [
+    (_rng.randrange(1, _MERSENNE_PRIME), _rng.randrange(0, _MERSENNE_PRIME))
+    for _ in range(settings.SIMILARITY_NUM_PERM)
+]
+_ROWS_PER_BAND = settings.SIMILARITY_NUM_PERM // settings.SIMILARITY_BANDS
+_WHITESPACE = re.compile(r"\s+")
+
+
+def _hash64(value: str) -> int:
+    return int.from_bytes(hashlib.blake2b(value.encode("utf-8"), digest_size=8).digest(), "little")
+
+
+def shingles(goal_doc: Dict[str, Any]) -> Set[str]:
+    """제목/설명의 문자 n-gram 과 단위, 목표값 규모 특징을 추출합니다.
+
+    공백 단위 분리가 아닌 문자 n-gram 을 사용하므로 한국어에도 그대로 동작합니다.
+    """
+    size = settings.SIMILARITY_SHINGLE_SIZE
+    text = f"{goal_doc.get('title', '')} {goal_doc.get('description', '')}"
+    text = _WHITESPACE.sub(" ", text.lower()).strip()
+
+    features = {text[i:i + size] for i in range(max(1, len(text) - size + 1))}
+    unit = str(goal_doc.get("unit") or "").strip().lower()
+    if unit:
+        features.add(f"unit:{unit}")
+    target_value = goal_doc.get("target_value") or 0
+    if target_value > 0:
+        features.add(f"magnitude:{math.floor(math.log10(target_value))}")
+    return features
+
+
+def minhash(features: Iterable[str]) -> List[int]:
+    hashes = [_hash64(feature) for feature in features] or [0]
+    return [
+        min((a * h + b) % _MERSENNE_PRIME for h in hashes)
+        for a, b in _PERMUTATIONS
+    ]
+
+
+def lsh_bands(signature: List[int]) -> List[str]:
+    """서명을 밴드로 나누어 LSH 버킷 키를 만듭니다."""
+    bands = []
+    for band in range(settings.SIMILARITY_BANDS):
+        rows = signature[band * _ROWS_PER_BAND:(band + 1) * _ROWS_PER_BAND]
+        digest = hashlib.blake2b(repr(rows).encode("ascii"), digest_size=8).hexdigest()
+        bands.append(f"{band}:{digest}")
+    return bands
+
+
+def estimate_similarity(signature_a: List[int], signature_b: List[int]) -> float:
+    """두 MinHash 서명으로 Jaccard 유사도를 추정합니다."""
+    matches = sum(1 for a, b in zip(signature_a, signature_b) if a == b)
+    return matches / len(signature_a)
+
+
+def _signature_update(goal_doc: Dict[str, Any]) -> UpdateOne:
+    signature = minhash(shingles(goal_doc))
+    return UpdateOne(
+        {"_id": str(goal_doc["_id"])},
+        {"$set": {
+            "user_id": str(goal_doc["user_id"]),
+            "title": goal_doc.get("title"),
+            "category": goal_doc.get("category"),
+            "status": goal_doc.get("status", "active"),
+            "signature": signature,
+            "bands": lsh_bands(signature),
+            "updated_at": datetime.utcnow(),
+        }},
+        upsert=True,
+    )
+
+
+async def index_goal(db: AsyncIOMotorDatabase, goal_doc: Dict[str, Any]) -> None:
+    """목표 생성/수정 시 서명을 갱신합니다. 실패해도 요청은 계속 진행합니다."""
+    try:
+        await db.goal_signatures.bulk_write([_signature_update(goal_doc)])
+    except Exception as e:
+        print(f"유사도 인덱스 갱신 실패 - goal_id: {goal_doc.get('_id')}: {e}")
+
+
+async def remove_goal(db: AsyncIOMotorDatabase, goal_id: str) -> None:
+    try:
+        await db.goal_signatures.bulk_write([DeleteOne({"_id": str(goal_id)})])
+    except Exception as e:
+        print(f"유사도 인덱스 삭제 실패 - goal_id: {goal_id}: {e}")
+
+
+async def set_signature_status(db: AsyncIOMotorDatabase, goal_ids: List[str], status: str) -> None:
+    """목표 상태가 자동으로 바뀌었을 때 서명의 상태만 갱신합니다 (서명은 그대로)."""
+    await db.goal_signatures.update_many(
+        {"_id": {"$in": [str(goal_id) for goal_id in goal_ids]}},
+        {"$set": {"status": status, "updated_at": datetime.utcnow()}}
+    )
+
+
+async def rebuild_index(db: AsyncIOMotorDatabase, batch_size: int = 500) -> int:
+    """goals 컬렉션 전체를 커서로 읽어 서명을 다시 만듭니다."""
+    operations: List[UpdateOne] = []
+    indexed = 0
+    projection = {"title": 1, "description": 1, "unit": 1, "target_value": 1,
+                  "user_id": 1, "category": 1, "status": 1}
+    async for goal_doc in db.goals.find({}, projection).batch_size(batch_size):
+        operations.append(_signature_update(goal_doc))
+        if len(operations) >= batch_size:
+            await db.goal_signatures.bulk_write(operations, ordered=False)
+            indexed += len(operations)
+            operations = []
+    if operations:
+        await db.goal_signatures.bulk_write(operations, ordered=False)
+        indexed += len(operations)
+    return indexed
+
+
+async def find_similar_goals(
+    db: AsyncIOMotorDatabase,
+    user_id: str,
+    skip: int = 0,
+    limit: int = 10
+) -> List[Dict[str, Any]]:
+    """사용자의 활성 목표와 텍스트가 유사한 다른 사용자의 목표를 순위대로 반환합니다.
+
+    LSH 버킷이 하나 이상 겹치는 후보만 조회하므로 전체 목표 수에 선형 비례하지 않습니다.
+    사용자당 가장 유사한 목표 하나만 남깁니다.
+    """
+    own = await db.goal_signatures.find(
+        {"user_id": user_id, "status": "active"},
+        {"signature": 1, "bands": 1}
+    ).to_list(length=None)
+    if not own:
+        return []
+
+    bands = sorted({band for doc in own for band in doc["bands"]})
+    candidates = await db.goal_signatures.find(
+        {"bands": {"$in": bands}, "status": "active", "user_id": {"$ne": user_id}},
+        {"signature": 1, "user_id": 1, "title": 1, "category": 1}
+    ).limit(settings.SIMILARITY_MAX_CANDIDATES).to_list(length=None)
+
+    best_by_user: Dict[str, Dict[str, Any]] = {}
+    for candidate in candidates:
+        score = max(estimate_similarity(doc["signature"], candidate["signature"]) for doc in own)
+        current = best_by_user.get(candidate["user_id"])
+        if current is None or score > current["similarity"]:
+            best_by_user[candidate["user_id"]] = {
+                "user_id": candidate["user_id"],
+                "goal_id": candidate["_id"],
+                "goal_title": candidate.get("title"),
+                "goal_category": candidate.get("category"),
+                "similarity": round(score, 4),
+            }
+
+    ranked = sorted(best_by_user.values(), key=lambda item: (-item["similarity"], item["user_id"]))
+    return ranked[skip:skip + limit]
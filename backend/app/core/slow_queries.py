@@ -0,0 +1,186 @@
+import asyncio
+import threading
+from datetime import datetime
+from typing import Any, Dict, List, Optional, Tuple
+
+from pymongo import monitoring
+
+from app.core.db_budget import query_shape, value_shape
+
+# 느린 MongoDB 쿼리 기록: 임계값을 넘은 명령의 형태(값 제외)를 모으고
+# 형태별로 한 번씩 explain 을 실행해 사용된 인덱스를 함께 보관합니다.
+
+EXPLAINABLE_COMMANDS = frozenset({"find", "aggregate", "count", "distinct", "findAndModify", "update", "delete"})
+SYSTEM_DATABASES = frozenset({"admin", "config", "local"})
+# explain 에 넘기면 안 되는 세션/드라이버 필드
+_DRIVER_FIELDS = frozenset({"lsid", "txnNumber", "readConcern", "writeConcern", "autocommit", "startTransaction"})
+
+
+def _query_parts(command_name: str, command: Dict[str, Any]) -> Dict[str, str]:
+    """필터는 구조만 남기고 (실제 값은 저장하지 않음) 정렬/프로젝션은 그대로 보관합니다."""
+    if command_name == "aggregate":
+        # 파이프라인은 단계 순서가 의미 있으므로 순서를 유지
+        return {"pipeline": "[" + ",".join(value_shape(stage) for stage in command.get("pipeline", [])) + "]"}
+    if command_name == "find":
+        filter_query, sort, projection = command.get("filter"), command.get("sort"), command.get("projection")
+    elif command_name == "findAndModify":
+        filter_query, sort, projection = command.get("query"), command.get("sort"), command.get("fields")
+    elif command_name in ("count", "distinct"):
+        filter_query, sort, projection = command.get("query"), None, None
+    elif command_name == "update":
+        filter_query, sort, projection = [update.get("q") for update in command.get("updates", [])], None, None
+    else:
+        filter_query, sort, projection = [delete.get("q") for delete in command.get("deletes", [])], None, None
+
+    parts = {"filter": value_shape(filter_query or {})}
+    if sort:
+        parts["sort"] = str(dict(sort))
+    if projection:
+        parts["projection"] = str(dict(projection))
+    return parts
+
+
+def _explainable_command(command: Dict[str, Any]) -> Dict[str, Any]:
+    return {
+        key: value for key, value in command.items()
+        if not key.startswith("$") and key not in _DRIVER_FIELDS
+    }
+
+
+def summarize_plan(explain_result: Dict[str, Any]) -> Dict[str, Any]:
+    """explain 결과에서 실행 단계와 사용 인덱스를 추출합니다."""
+    planner = explain_result.get("queryPlanner")
+    if planner is None:
+        # aggregate: 첫 단계의 $cursor 에 queryPlanner 가 들어 있음
+        for stage in explain_result.get("stages", []):
+            if "$cursor" in stage:
+                planner = stage["$cursor"].get("queryPlanner")
+                break
+    winning_plan = (planner or {}).get("winningPlan", {})
+    winning_plan = winning_plan.get("queryPlan", winning_plan)  # SBE 엔진 형식
+
+    stages: List[str] = []
+    indexes: List[str] = []
+
+    def walk(node: Any) -> None:
+        if isinstance(node, dict):
+            if "stage" in node:
+                stages.append(node["stage"])
+            if "indexName" in node:
+                indexes.append(node["indexName"])
+            for value in node.values():
+                walk(value)
+        elif isinstance(node, list):
+            for item in node:
+                walk(item)
+
+    walk(winning_plan)
+    return {
+        "indexes": indexes,
+        "stages": stages,
+        "collection_scan": "COLLSCAN" in stages,
+    }
+
+
+class SlowQueryLog(monitoring.CommandListener):
+    """임계값을 넘은 MongoDB 명령을 형태별로 집계하는 명령 리스너.
+
+    가장 느린 max_entries 개의 형태만 유지하며, 새 형태가 들어오면 최대 지연이
+    가장 작은 항목을 밀어냅니다. 새 형태가 처음 기록될 때 이벤트 루프에서
+    explain(queryPlanner) 을 비동기로 한 번 실행합니다.
+    """
+
+    def __init__(self, threshold_ms: float, max_entries: int = 50, explain: bool = True):
+        self.threshold_micros = threshold_ms * 1000
+        self.max_entries = max_entries
+        self.explain_enabled = explain
+        self._lock = threading.Lock()
+        self._pending: Dict[Tuple[Any, int], Tuple[str, Dict[str, Any]]] = {}
+        self._entries: Dict[Tuple[str, str, str, str], Dict[str, Any]] = {}
+        self._client = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+
+    def bind(self, client, loop: asyncio.AbstractEventLoop) -> None:
+        """explain 실행에 사용할 Motor 클라이언트와 이벤트 루프를 연결합니다."""
+        self._client = client
+        self._loop = loop
+
+    def started(self, event) -> None:
+        if event.command_name in EXPLAINABLE_COMMANDS and event.database_name not in SYSTEM_DATABASES:
+            self._pending[(event.connection_id, event.request_id)] = (event.database_name, event.command)
+
+    def succeeded(self, event) -> None:
+        self._finish(event)
+
+    def failed(self, event) -> None:
+        self._finish(event)
+
+    def _finish(self, event) -> None:
+        pending = self._pending.pop((event.connection_id, event.request_id), None)
+        if pending is None or event.duration_micros < self.threshold_micros:
+            return
+        database_name, command = pending
+        self.record(database_name, event.command_name, command, event.duration_micros / 1000)
+
+    def record(self, database_name: str, command_name: str, command: Dict[str, Any], duration_ms: float) -> None:
+        collection, _, shape = query_shape(command_name, command)
+        key = (database_name, collection, command_name, shape)
+        now = datetime.utcnow()
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                if len(self._entries) >= self.max_entries:
+                    fastest = min(self._entries, key=lambda k: self._entries[k]["max_ms"])
+                    if self._entries[fastest]["max_ms"] >= duration_ms:
+                        return
+                    del self._entries[fastest]
+                entry = self._entries[key] = {
+                    "database": database_name,
+                    "collection": collection,
+                    "command": command_name,
+                    "shape": _query_parts(command_name, command),
+                    "count": 0,
+                    "total_ms": 0.0,
+                    "max_ms": 0.0,
+                    "first_seen": now,
+                    "plan": None,
+                    "explain_error": None,
+                }
+                schedule_explain = self.explain_enabled and self._loop is not None
+            else:
+                schedule_explain = False
+            entry["count"] += 1
+            entry["total_ms"] += duration_ms
+            entry["max_ms"] = max(entry["max_ms"], duration_ms)
+            entry["last_seen"] = now
+
+        if schedule_explain:
+            asyncio.run_coroutine_threadsafe(
+                self._explain(key, database_name, _explainable_command(command)), self._loop
+            )
+
+    async def _explain(self, key, database_name: str, command: Dict[str, Any]) -> None:
+        try:
+            result = await self._client[database_name].command("explain", command, verbosity="queryPlanner")
+            plan, error = summarize_plan(result), None
+        except Exception as e:
+            plan, error = None, str(e)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                entry["plan"] = plan
+                entry["explain_error"] = error
+
+    def snapshot(self) -> List[Dict[str, Any]]:
+        """느린 쿼리 형태를 최대 지연 시간 내림차순으로 반환합니다."""
+        with self._lock:
+            entries = [dict(entry) for entry in self._entries.values()]
+        for entry in entries:
+            entry["avg_ms"] = round(entry["total_ms"] / entry["count"], 3)
+            entry["total_ms"] = round(entry["total_ms"], 3)
+            entry["max_ms"] = round(entry["max_ms"], 3)
+        return sorted(entries, key=lambda entry: entry["max_ms"], reverse=True)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
@@ -14,6 +14,20 @@ class ActionStep(BaseModel):
     completed_at: Optional[datetime] = None
 
 
+class ActionStepUpdate(BaseModel):
+    is_completed: bool
+
+
+class ActionPlanProgress(BaseModel):
+    plan_id: str
+    step_number: int
+    is_completed: bool
+    completed_at: Optional[datetime] = None
+    completed_steps: int
+    total_steps: int
+    completion_rate: float  # 0-100
+
+
 class ActionPlanBase(BaseModel):
     title: str
     description: str
@@ -0,0 +1,44 @@
+from pydantic import BaseModel, Field, ConfigDict
+from typing import Optional, Literal, List
+from datetime import datetime
+from bson import ObjectId
+from .user import PyObjectId
+
+
+class CommunityPostBase(BaseModel):
+    title: str = Field(min_length=1, max_length=200)
+    content: str = Field(min_length=1, max_length=5000)
+    category: Literal["health", "education", "career", "personal", "finance"]
+
+
+class CommunityPostCreate(CommunityPostBase):
+    pass
+
+
+class CommunityPostInDB(CommunityPostBase):
+    id: PyObjectId = Field(default_factory=PyObjectId, alias="_id")
+    user_id: PyObjectId
+    author: str
+    created_at: datetime = Field(default_factory=datetime.utcnow)
+
+    model_config = ConfigDict(
+        populate_by_name=True,
+        arbitrary_types_allowed=True,
+        json_encoders={ObjectId: str}
+    )
+
+
+class CommunityPost(CommunityPostBase):
+    id: str
+    user_id: str
+    author: str
+    created_at: datetime
+
+    model_config = ConfigDict(
+        populate_by_name=True
+    )
+
+
+class CommunityFeedPage(BaseModel):
+    posts: List[CommunityPost]
+    next_cursor: Optional[str] = None
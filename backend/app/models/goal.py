@@ -35,13 +35,13 @@ class GoalUpdate(BaseModel):
     unit: Optional[str] = None
     deadline: Optional[datetime] = None
     priority: Optional[Literal["high", "medium", "low"]] = None
-    status: Optional[Literal["active", "completed", "paused", "cancelled"]] = None
+    status: Optional[Literal["active", "completed", "paused", "cancelled", "expired"]] = None
 
 
 class GoalInDB(GoalBase):
     id: PyObjectId = Field(default_factory=PyObjectId, alias="_id")
     user_id: PyObjectId
-    status: Literal["active", "completed", "paused", "cancelled"] = "active"
+    status: Literal["active", "completed", "paused", "cancelled", "expired"] = "active"
     ai_analysis: Optional[AIAnalysis] = None
     created_at: datetime = Field(default_factory=datetime.utcnow)
     updated_at: datetime = Field(default_factory=datetime.utcnow)
@@ -56,7 +56,7 @@ class GoalInDB(GoalBase):
 class Goal(GoalBase):
     id: str
     user_id: str
-    status: Literal["active", "completed", "paused", "cancelled"]
+    status: Literal["active", "completed", "paused", "cancelled", "expired"]
     ai_analysis: Optional[AIAnalysis] = None
     created_at: datetime
     updated_at: datetime
@@ -0,0 +1,149 @@
+from typing import Dict, List, NamedTuple, Optional, Tuple
+
+from app.core.config import settings
+
+# MongoDB 인덱스 레지스트리: 애플리케이션이 사용하는 인덱스의 단일 기준
+# 서버 시작 시(main.py lifespan) 또는 scripts/sync_indexes.py 로 실제 DB 와 맞춥니다.
+
+IndexKeys = Tuple[Tuple[str, int], ...]
+
+
+class IndexSpec(NamedTuple):
+    collection: str
+    keys: IndexKeys
+    name: str
+    unique: bool = False
+    expire_after_seconds: Optional[int] = None
+
+
+class QueryShape(NamedTuple):
+    """라우터/모듈이 실행하는 쿼리의 형태 (인덱스 커버리지 검사용)."""
+    source: str
+    collection: str
+    equality: Tuple[str, ...] = ()
+    sort: IndexKeys = ()
+
+
+INDEXES: List[IndexSpec] = [
+    # users: 로그인/회원가입 이메일 조회
+    IndexSpec("users", (("email", 1),), "email_unique", unique=True),
+
+    # goals: 목표 목록 (상태/카테고리 필터 + 최신순)
+    IndexSpec("goals", (("user_id", 1), ("created_at", -1)), "user_created_at"),
+    IndexSpec(
+        "goals",
+        (("user_id", 1), ("status", 1), ("category", 1), ("created_at", -1)),
+        "user_status_category_created_at"
+    ),
+    # goals: 같은 카테고리의 활성 목표 (유사 사용자 집계, 리더보드 재구축)
+    IndexSpec("goals", (("status", 1), ("category", 1), ("created_at", -1)), "status_category_created_at"),
+
+    # goals: 마감일 알림 스캔 (활성 목표의 deadline 범위 + _id 키셋)
+    IndexSpec("goals", (("status", 1), ("deadline", 1), ("_id", 1)), "status_deadline"),
+
+    # notifications: 중복 방지 키, 사용자별 최신순 폴링, 만료 (TTL)
+    IndexSpec("notifications", (("key", 1),), "key_unique", unique=True),
+    IndexSpec("notifications", (("user_id", 1), ("created_at", -1)), "user_created_at"),
+    IndexSpec(
+        "notifications",
+        (("created_at", 1),),
+        "created_at_ttl",
+        expire_after_seconds=settings.NOTIFICATION_TTL_DAYS * 24 * 60 * 60
+    ),
+
+    # goal_status_events: 목표별 상태 전환 이력
+    IndexSpec("goal_status_events", (("goal_id", 1), ("created_at", -1)), "goal_created_at"),
+
+    # progress_logs / action_plans: 목표별 최신 기록
+    IndexSpec(
+        "progress_logs",
+        (("goal_id", 1), ("user_id", 1), ("created_at", -1)),
+        "goal_user_created_at"
+    ),
+    IndexSpec(
+        "action_plans",
+        (("goal_id", 1), ("user_id", 1), ("created_at", -1)),
+        "goal_user_created_at"
+    ),
+
+    # ai_interactions: 원본 기록 만료 (TTL)
+    IndexSpec(
+        "ai_interactions",
+        (("created_at", 1),),
+        "created_at_ttl",
+        expire_after_seconds=settings.AI_INTERACTION_TTL_DAYS * 24 * 60 * 60
+    ),
+
+    # goal_signatures: MinHash/LSH 버킷 조회
+    IndexSpec("goal_signatures", (("bands", 1), ("status", 1)), "bands_status"),
+    IndexSpec("goal_signatures", (("user_id", 1), ("status", 1)), "user_status"),
+
+    # community_posts: (created_at, _id) 키셋 페이지네이션
+    IndexSpec("community_posts", (("category", 1), ("created_at", -1), ("_id", -1)), "category_feed"),
+    IndexSpec("community_posts", (("created_at", -1), ("_id", -1)), "feed"),
+]
+
+# _id 조회를 제외한 애플리케이션 쿼리 형태. 새 쿼리를 추가하면 여기에도 등록합니다.
+QUERY_SHAPES: List[QueryShape] = [
+    QueryShape("auth.register/login", "users", ("email",)),
+    QueryShape("goals.get_goals", "goals", ("user_id",), (("created_at", -1),)),
+    QueryShape("goals.get_goals(status, category)", "goals", ("user_id", "status", "category"), (("created_at", -1),)),
+    QueryShape("community.find_similar_users(distinct)", "goals", ("user_id", "status")),
+    QueryShape("community.find_similar_users(aggregate)", "goals", ("category", "status"), (("created_at", -1),)),
+    QueryShape("community.get_my_leaderboard_rank", "goals", ("user_id", "category")),
+    QueryShape("leaderboard.rebuild_leaderboards", "goals", ("status", "category")),
+    QueryShape("progress.get_progress_logs", "progress_logs", ("goal_id", "user_id"), (("created_at", -1),)),
+    QueryShape("coaching_messages.recent_progress", "progress_logs", ("goal_id", "user_id"), (("created_at", -1),)),
+    QueryShape("goals.get_goal_bundle(logs)", "progress_logs", ("goal_id", "user_id"), (("created_at", -1),)),
+    QueryShape("goals.get_goal_bundle(plan)", "action_plans", ("goal_id", "user_id"), (("created_at", -1),)),
+    QueryShape("deadline_scheduler.scan_shard", "goals", ("status",), (("deadline", 1), ("_id", 1))),
+    QueryShape("goal_status.target_reached", "goals", ("status",)),
+    QueryShape("goal_status.deadline_expired", "goals", ("status",)),
+    QueryShape("notifications.get_notifications", "notifications", ("user_id",), (("created_at", -1),)),
+    QueryShape("similarity.find_similar_goals(own)", "goal_signatures", ("user_id", "status")),
+    QueryShape("similarity.find_similar_goals(candidates)", "goal_signatures", ("bands", "status")),
+    QueryShape("community_feed.get_feed_page", "community_posts", (), (("created_at", -1), ("_id", -1))),
+    QueryShape("community_feed.get_feed_page(category)", "community_posts", ("category",), (("created_at", -1), ("_id", -1))),
+]
+
+
+def indexes_by_collection() -> Dict[str, List[IndexSpec]]:
+    grouped: Dict[str, List[IndexSpec]] = {}
+    for spec in INDEXES:
+        grouped.setdefault(spec.collection, []).append(spec)
+    return grouped
+
+
+def _matches_sort(keys: IndexKeys, sort: IndexKeys) -> bool:
+    if len(keys) < len(sort) or not sort:
+        return False
+    forward = keys[:len(sort)] == sort
+    backward = keys[:len(sort)] == tuple((field, -direction) for field, direction in sort)
+    return forward or backward
+
+
+def covering_index(shape: QueryShape, indexes: Optional[List[IndexSpec]] = None) -> Optional[Tuple[IndexSpec, bool]]:
+    """쿼리를 처리할 수 있는 가장 적합한 인덱스와 정렬까지 인덱스로 처리되는지를 반환합니다.
+
+    인덱스 앞쪽 필드가 쿼리의 동등 조건 필드로 시작해야 사용 가능한 것으로 보고,
+    동등 조건 접두사 바로 뒤에 정렬 키가 이어지면 정렬도 인덱스로 처리됩니다 (ESR 규칙).
+    """
+    candidates = [spec for spec in (indexes if indexes is not None else INDEXES) if spec.collection == shape.collection]
+    equality = set(shape.equality)
+    best: Optional[Tuple[Tuple[int, bool], IndexSpec, bool]] = None
+    for spec in candidates:
+        prefix = 0
+        while prefix < len(spec.keys) and spec.keys[prefix][0] in equality:
+            prefix += 1
+        sort_covered = _matches_sort(spec.keys[prefix:], shape.sort)
+        if prefix == 0 and not sort_covered:
+            continue
+        rank = (prefix, sort_covered)
+        if best is None or rank > best[0]:
+            best = (rank, spec, sort_covered)
+    return (best[1], best[2]) if best else None
+
+
+def uncovered_queries(shapes: Optional[List[QueryShape]] = None) -> List[QueryShape]:
+    """등록된 인덱스로 처리할 수 없는 쿼리 형태 목록."""
+    return [shape for shape in (shapes if shapes is not None else QUERY_SHAPES) if covering_index(shape) is None]
@@ -0,0 +1,23 @@
+from pydantic import BaseModel, ConfigDict
+from typing import List, Literal
+from datetime import datetime
+
+
+class Notification(BaseModel):
+    id: str
+    user_id: str
+    goal_id: str
+    kind: Literal["deadline_approaching", "deadline_overdue"]
+    title: str
+    message: str
+    deadline: datetime
+    read: bool
+    created_at: datetime
+
+    model_config = ConfigDict(
+        populate_by_name=True
+    )
+
+
+class NotificationReadRequest(BaseModel):
+    ids: List[str]
@@ -2,25 +2,79 @@ from fastapi import APIRouter, Depends, HTTPException, status, Query
 from motor.motor_asyncio import AsyncIOMotorDatabase
 from bson import ObjectId
 from datetime import datetime
-from typing import Dict, Any
-import openai
+from typing import Dict, Any, List
+from pydantic import ValidationError
+import json
 
 from app.models.user import User
+from app.models.action_plan import ActionStep
 from app.routers.auth import get_current_user
-from app.core.database import get_database
+from app.core.database import get_database, get_ai_interaction_buffer
+from app.core.db_budget import db_call_budget
+from app.core.ai_interactions import AIInteractionBuffer
+from app.core.prompts import render_prompt
+from app.core.llm import chat_completion, extract_json
 from app.core.config import settings
+from app.core.ai_fallback import fallback_plan
 
 router = APIRouter()
 
-# OpenAI 클라이언트 설정
-openai.api_key = settings.OPENAI_API_KEY
+
+def _parse_steps(raw_steps: Any) -> List[Dict[str, Any]]:
+    """AI 응답의 단계 목록을 ActionStep 으로 검증합니다.
+
+    형식이 맞지 않는 단계는 건너뛰고, 단계 번호는 응답 순서대로 1부터 다시 매깁니다
+    (단계 완료 API 가 step_number 로 단계를 찾으므로 번호가 겹치면 안 됨).
+    """
+    if not isinstance(raw_steps, list):
+        return []
+    steps = []
+    for raw_step in raw_steps:
+        if not isinstance(raw_step, dict):
+            continue
+        try:
+            step = ActionStep(
+                step_number=len(steps) + 1,
+                title=raw_step.get("title"),
+                description=raw_step.get("description", ""),
+                estimated_time=max(int(raw_step.get("estimated_time") or 0), 0)
+            )
+        except (ValidationError, TypeError, ValueError):
+            continue
+        steps.append(step.model_dump())
+    return steps
+
+
+def _parse_plan(ai_response: str, goal_doc: Dict[str, Any]) -> Dict[str, Any]:
+    """AI 응답을 실행 계획으로 파싱하고, 파싱할 단계가 없으면 카테고리별 기본 계획을 사용합니다."""
+    try:
+        parsed = extract_json(ai_response or "")
+    except (json.JSONDecodeError, ValueError) as parse_error:
+        print(f"실행 계획 응답 파싱 실패: {parse_error}")
+        parsed = {}
+    if not isinstance(parsed, dict):
+        parsed = {}
+
+    steps = _parse_steps(parsed.get("steps"))
+    if not steps:
+        print(f"실행 계획 단계 없음 - 기본 계획 사용 (goal_id: {goal_doc['_id']})")
+        parsed = fallback_plan(goal_doc)
+        steps = _parse_steps(parsed["steps"])
+
+    return {
+        "title": str(parsed.get("title") or f"{goal_doc['title']} 실행 계획"),
+        "description": str(parsed.get("description") or "AI가 생성한 맞춤형 실행 계획"),
+        "steps": steps,
+    }
 
 
 @router.post("/generate-plan")
+@db_call_budget(5)
 async def generate_action_plan(
     goal_id: str = Query(..., description="목표 ID"),
     current_user: User = Depends(get_current_user),
-    db: AsyncIOMotorDatabase = Depends(get_database)
+    db: AsyncIOMotorDatabase = Depends(get_database),
+    interactions: AIInteractionBuffer = Depends(get_ai_interaction_buffer)
 ) -> Dict[str, Any]:
     """목표를 위한 실행 계획을 AI로 생성합니다."""
     print(f"AI 실행 계획 요청 - goal_id: {goal_id}, user_id: {current_user.id}")
@@ -49,217 +103,47 @@ async def generate_action_plan(
         )
     
     # 실행 계획 생성 프롬프트
-    prompt = f"""
-    다음 목표를 위한 상세한 실행 계획을 단계별로 작성해주세요:
-    
-    목표: {goal_doc['title']}
-    설명: {goal_doc['description']}
-    목표값: {goal_doc['target_value']} {goal_doc['unit']}
-    마감일: {goal_doc['deadline']}
-    
-    다음 형식으로 응답해주세요:
-    1. 각 단계별 제목과 설명
-    2. 예상 소요 시간 (분 단위)
-    3. 구체적인 실행 방법
-    
-    JSON 형태로 응답:
-    {{
-        "title": "실행 계획 제목",
-        "description": "계획 설명",
-        "steps": [
-            {{
-                "step_number": 1,
-                "title": "단계 제목",
-                "description": "단계 설명",
-                "estimated_time": 소요시간(분)
-            }}
-        ]
-    }}
-    """
+    prompt_params = {
+        "title": goal_doc['title'],
+        "description": goal_doc['description'],
+        "target_value": goal_doc['target_value'],
+        "unit": goal_doc['unit'],
+        "deadline": goal_doc['deadline'],
+    }
+    prompt = render_prompt("planning.v1", prompt_params)
     
     try:
-        print(f"실행 계획 OpenAI API 호출 시작")
+        print(f"실행 계획 LLM API 호출 시작 - provider: {settings.LLM_PROVIDER}")
         
-        # OpenAI API 호출 (실제 API가 없으면 fallback 사용)
+        # LLM API 호출 (회로가 열려 있거나 호출이 실패하면 fallback 사용)
         try:
-            response = openai.chat.completions.create(
-                model="gpt-4o-mini",
+            result = await chat_completion(
                 messages=[
                     {"role": "system", "content": "당신은 실행 계획 수립 전문가입니다."},
                     {"role": "user", "content": prompt}
                 ],
                 max_tokens=800,
-                temperature=0.7
+                temperature=0.7,
+                interaction_type="planning"
             )
+            ai_response = result.content
+            tokens_used = result.tokens_used
             print(f"실행 계획 OpenAI API 호출 성공")
         except Exception as openai_error:
             print(f"실행 계획 OpenAI API 호출 실패: {openai_error}")
-            
             # 목표 내용 기반 맞춤형 실행 계획 생성
-            progress_rate = (goal_doc['current_value'] / goal_doc['target_value']) * 100
-            goal_title = goal_doc['title']
-            category = goal_doc.get('category', '기본')
-            
-            # 카테고리별 맞춤 실행 계획
-            category_plans = {
-                "건강": {
-                    "title": f"{goal_title} 건강 실행 계획",
-                    "description": "건강한 습관 형성을 위한 단계별 계획",
-                    "steps": [
-                        {
-                            "step_number": 1,
-                            "title": "기초 체력 평가",
-                            "description": f"현재 상태를 파악하고 {goal_doc['target_value']}{goal_doc['unit']} 목표 달성을 위한 기초 체력을 측정합니다.",
-                            "estimated_time": 30
-                        },
-                        {
-                            "step_number": 2,
-                            "title": "점진적 강도 증가",
-                            "description": "몸에 무리가 가지 않도록 천천히 강도를 높여가며 꾸준한 습관을 만듭니다.",
-                            "estimated_time": 45
-                        },
-                        {
-                            "step_number": 3,
-                            "title": "진도 추적 및 조정",
-                            "description": "매주 진도를 체크하고 몸의 변화에 맞춰 계획을 조정합니다.",
-                            "estimated_time": 20
-                        }
-                    ]
-                },
-                "학습": {
-                    "title": f"{goal_title} 학습 실행 계획",
-                    "description": "효과적인 학습을 위한 체계적 접근법",
-                    "steps": [
-                        {
-                            "step_number": 1,
-                            "title": "학습 자료 정리",
-                            "description": f"{goal_title} 목표 달성을 위한 필요한 자료와 커리큘럼을 정리합니다.",
-                            "estimated_time": 60
-                        },
-                        {
-                            "step_number": 2,
-                            "title": "일일 학습 루틴",
-                            "description": "매일 일정한 시간에 집중적으로 학습할 수 있는 루틴을 만듭니다.",
-                            "estimated_time": 90
-                        },
-                        {
-                            "step_number": 3,
-                            "title": "복습 및 실습",
-                            "description": "배운 내용을 복습하고 실제로 적용해볼 수 있는 시간을 확보합니다.",
-                            "estimated_time": 60
-                        }
-                    ]
-                },
-                "업무": {
-                    "title": f"{goal_title} 업무 실행 계획",
-                    "description": "업무 효율성 극대화를 위한 전략적 계획",
-                    "steps": [
-                        {
-                            "step_number": 1,
-                            "title": "작업 분석 및 우선순위",
-                            "description": f"{goal_title} 달성을 위해 필요한 업무들을 분석하고 우선순위를 정합니다.",
-                            "estimated_time": 45
-                        },
-                        {
-                            "step_number": 2,
-                            "title": "시간 관리 시스템",
-                            "description": "효율적인 시간 배분과 집중력 향상을 위한 시스템을 구축합니다.",
-                            "estimated_time": 30
-                        },
-                        {
-                            "step_number": 3,
-                            "title": "성과 측정 및 개선",
-                            "description": "정기적으로 성과를 측정하고 개선점을 찾아 적용합니다.",
-                            "estimated_time": 40
-                        }
-                    ]
-                },
-                "취미": {
-                    "title": f"{goal_title} 취미 실행 계획",
-                    "description": "즐거운 취미 생활을 위한 단계별 접근",
-                    "steps": [
-                        {
-                            "step_number": 1,
-                            "title": "기초 준비 및 환경 조성",
-                            "description": f"{goal_title} 활동을 위한 필요한 도구나 환경을 준비합니다.",
-                            "estimated_time": 30
-                        },
-                        {
-                            "step_number": 2,
-                            "title": "기본기 익히기",
-                            "description": "부담 없이 기본기부터 차근차근 익혀가며 재미를 찾습니다.",
-                            "estimated_time": 60
-                        },
-                        {
-                            "step_number": 3,
-                            "title": "실력 향상 및 도전",
-                            "description": "점차 실력을 향상시키며 새로운 도전을 시도합니다.",
-                            "estimated_time": 90
-                        }
-                    ]
-                }
-            }
-            
-            # 기본 계획
-            default_plan = {
-                "title": f"{goal_title} 실행 계획",
-                "description": "목표 달성을 위한 체계적 접근법",
-                "steps": [
-                    {
-                        "step_number": 1,
-                        "title": "현재 상황 분석",
-                        "description": f"현재 {progress_rate:.1f}% 달성 상태를 분석하고 남은 과제를 파악합니다.",
-                        "estimated_time": 45
-                    },
-                    {
-                        "step_number": 2,
-                        "title": "단계별 실행",
-                        "description": "목표를 작은 단위로 나누어 단계적으로 실행합니다.",
-                        "estimated_time": 60
-                    },
-                    {
-                        "step_number": 3,
-                        "title": "지속적인 관리",
-                        "description": "꾸준한 진도 체크와 동기 부여를 통해 목표를 완성합니다.",
-                        "estimated_time": 30
-                    }
-                ]
-            }
-            
-            # 카테고리에 맞는 계획 선택
-            plan = category_plans.get(category, default_plan)
-            
-            # OpenAI API 실패 시 더미 응답 생성
-            class DummyResponse:
-                def __init__(self):
-                    self.choices = [DummyChoice()]
-                    self.usage = DummyUsage()
-            
-            class DummyChoice:
-                def __init__(self):
-                    self.message = DummyMessage()
-            
-            class DummyMessage:
-                def __init__(self):
-                    import json
-                    self.content = json.dumps(plan, ensure_ascii=False)
-            
-            class DummyUsage:
-                def __init__(self):
-                    self.total_tokens = 0
-            
-            response = DummyResponse()
-            print(f"맞춤형 실행 계획 사용 - 카테고리: {category}")
-        
-        ai_response = response.choices[0].message.content
+            ai_response = json.dumps(fallback_plan(goal_doc), ensure_ascii=False)
+            tokens_used = 0
+            print(f"맞춤형 실행 계획 사용 - 카테고리: {goal_doc.get('category', '기본')}")
         
         # 실행 계획을 데이터베이스에 저장
+        plan = _parse_plan(ai_response, goal_doc)
         action_plan = {
             "goal_id": goal_id,
             "user_id": str(current_user.id),
-            "title": f"{goal_doc['title']} 실행 계획",
-            "description": "AI가 생성한 맞춤형 실행 계획",
-            "steps": [],  # 실제로는 AI 응답을 파싱해야 함
+            "title": plan["title"],
+            "description": plan["description"],
+            "steps": plan["steps"],
             "ai_generated": True,
             "created_at": datetime.utcnow(),
             "updated_at": datetime.utcnow()
@@ -268,26 +152,20 @@ async def generate_action_plan(
         result = await db.action_plans.insert_one(action_plan)
         
         # AI 상호작용 기록 저장
-        tokens_used = 0
-        try:
-            if hasattr(response, 'usage') and response.usage and hasattr(response.usage, 'total_tokens'):
-                tokens_used = response.usage.total_tokens
-        except:
-            tokens_used = 0
-            
-        await db.ai_interactions.insert_one({
-            "user_id": str(current_user.id),
-            "goal_id": goal_id,
-            "interaction_type": "planning",
-            "user_input": prompt,
-            "ai_response": ai_response,
-            "tokens_used": tokens_used,
-            "created_at": datetime.utcnow()
-        })
+        interactions.record(
+            user_id=str(current_user.id),
+            goal_id=goal_id,
+            interaction_type="planning",
+            template_id="planning.v1",
+            params=prompt_params,
+            ai_response=ai_response,
+            tokens_used=tokens_used
+        )
         
         return {
             "plan_id": str(result.inserted_id),
             "plan": ai_response,
+            "steps": plan["steps"],
             "message": "실행 계획이 생성되었습니다."
         }
         
@@ -0,0 +1,77 @@
+from fastapi import APIRouter, Depends, HTTPException, status, Path
+from motor.motor_asyncio import AsyncIOMotorDatabase
+from bson import ObjectId
+from datetime import datetime
+from typing import Any, Dict, List, Annotated, Tuple
+from pymongo import ReturnDocument
+
+from app.models.action_plan import ActionStepUpdate, ActionPlanProgress
+from app.models.user import User
+from app.routers.auth import get_current_user
+from app.core.database import get_database
+from app.core.db_budget import db_call_budget
+
+router = APIRouter()
+
+
+def plan_completion(steps: List[Dict[str, Any]]) -> Tuple[int, int, float]:
+    """(완료한 단계 수, 전체 단계 수, 완료율 %)."""
+    total = len(steps)
+    completed = sum(1 for step in steps if step.get("is_completed"))
+    return completed, total, round(completed / total * 100, 1) if total else 0.0
+
+
+@router.patch("/{plan_id}/steps/{step_number}", response_model=ActionPlanProgress)
+@db_call_budget(3)
+async def update_action_step(
+    plan_id: str,
+    request: ActionStepUpdate,
+    current_user: Annotated[User, Depends(get_current_user)],
+    db: Annotated[AsyncIOMotorDatabase, Depends(get_database)],
+    step_number: int = Path(..., ge=1)
+):
+    """실행 계획의 한 단계를 완료/미완료로 표시하고 계획의 완료율을 반환합니다.
+
+    arrayFilters 로 해당 단계만 바꾸는 단일 업데이트이므로 계획 전체를 읽고 다시 쓰지 않으며,
+    같은 계획의 다른 단계를 동시에 바꿔도 서로 덮어쓰지 않습니다.
+    """
+    if not ObjectId.is_valid(plan_id):
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="실행 계획을 찾을 수 없습니다."
+        )
+
+    now = datetime.utcnow()
+    plan_doc = await db.action_plans.find_one_and_update(
+        {
+            "_id": ObjectId(plan_id),
+            "user_id": str(current_user.id),
+            "steps.step_number": step_number
+        },
+        {"$set": {
+            "steps.$[step].is_completed": request.is_completed,
+            "steps.$[step].completed_at": now if request.is_completed else None,
+            "updated_at": now
+        }},
+        array_filters=[{"step.step_number": step_number}],
+        projection={"steps.step_number": 1, "steps.is_completed": 1, "steps.completed_at": 1},
+        return_document=ReturnDocument.AFTER
+    )
+    if not plan_doc:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="실행 계획 또는 단계를 찾을 수 없습니다."
+        )
+
+    steps = plan_doc.get("steps", [])
+    step = next(step for step in steps if step.get("step_number") == step_number)
+    completed, total, completion_rate = plan_completion(steps)
+    return ActionPlanProgress(
+        plan_id=plan_id,
+        step_number=step_number,
+        is_completed=step.get("is_completed", False),
+        completed_at=step.get("completed_at"),
+        completed_steps=completed,
+        total_steps=total,
+        completion_rate=completion_rate
+    )
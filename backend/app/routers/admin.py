@@ -0,0 +1,86 @@
+import secrets
+from typing import Optional
+
+from fastapi import APIRouter, Depends, Header, HTTPException, Request, status
+
+from app.core.cache import TwoTierCache
+from app.core.config import settings
+from app.core.database import get_cache, get_deadline_scanner, get_goal_status_engine, get_live_updates, get_read_router
+from app.core.deadline_scheduler import DeadlineScanner
+from app.core.goal_status import GoalStatusEngine
+from app.core.live_updates import LiveUpdateHub
+from app.core.read_routing import ReadRouter
+from app.core.slow_queries import SlowQueryLog
+
+router = APIRouter()
+
+
+async def require_admin(x_admin_key: Optional[str] = Header(None)) -> None:
+    """X-Admin-Key 헤더를 ADMIN_API_KEY 와 비교합니다 (키가 설정되지 않으면 비활성화)."""
+    if not settings.ADMIN_API_KEY:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="관리자 API 가 비활성화되어 있습니다."
+        )
+    if not x_admin_key or not secrets.compare_digest(x_admin_key, settings.ADMIN_API_KEY):
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="관리자 권한이 필요합니다."
+        )
+
+
+def get_slow_query_log(request: Request) -> SlowQueryLog:
+    return request.app.state.slow_queries
+
+
+@router.get("/slow-queries", dependencies=[Depends(require_admin)])
+async def get_slow_queries(slow_queries: SlowQueryLog = Depends(get_slow_query_log)):
+    """임계값을 넘은 MongoDB 쿼리 형태와 explain 결과(사용 인덱스)를 최대 지연 시간 순으로 조회합니다."""
+    return {
+        "threshold_ms": settings.SLOW_QUERY_THRESHOLD_MS,
+        "queries": slow_queries.snapshot()
+    }
+
+
+@router.delete("/slow-queries", dependencies=[Depends(require_admin)])
+async def clear_slow_queries(slow_queries: SlowQueryLog = Depends(get_slow_query_log)):
+    """수집된 느린 쿼리 기록을 초기화합니다."""
+    slow_queries.clear()
+    return {"message": "느린 쿼리 기록이 초기화되었습니다."}
+
+
+@router.get("/cache", dependencies=[Depends(require_admin)])
+async def get_cache_stats(cache: TwoTierCache = Depends(get_cache)):
+    """읽기 캐시의 네임스페이스별 적중(로컬/Redis)/미스 수와 적중률을 조회합니다."""
+    return cache.snapshot()
+
+
+@router.get("/live-updates", dependencies=[Depends(require_admin)])
+async def get_live_update_stats(hub: LiveUpdateHub = Depends(get_live_updates)):
+    """이 워커의 /ws 연결 수와 change stream 상태(이벤트 수, resume token 보유 여부)를 조회합니다."""
+    return hub.snapshot()
+
+
+@router.get("/deadline-scan", dependencies=[Depends(require_admin)])
+async def get_deadline_scan_stats(scanner: DeadlineScanner = Depends(get_deadline_scanner)):
+    """이 워커의 마감일 알림 스캔 상태 (마지막 주기에 처리한 샤드, 누적 처리 수)를 조회합니다."""
+    return scanner.snapshot()
+
+
+@router.get("/goal-status", dependencies=[Depends(require_admin)])
+async def get_goal_status_stats(engine: GoalStatusEngine = Depends(get_goal_status_engine)):
+    """목표 상태 자동 전환 엔진의 마지막 실행 결과와 사유별 누적 전환 수를 조회합니다."""
+    return engine.snapshot()
+
+
+@router.post("/goal-status/run", dependencies=[Depends(require_admin)])
+async def run_goal_status_engine(engine: GoalStatusEngine = Depends(get_goal_status_engine)):
+    """다음 주기를 기다리지 않고 상태 전환을 실행합니다 (이번 주기를 다른 워커가 이미 실행했으면 건너뜀)."""
+    summary = await engine.run_once()
+    return {"ran": summary is not None, "summary": summary}
+
+
+@router.get("/read-routing", dependencies=[Depends(require_admin)])
+async def get_read_routing_stats(read_router: ReadRouter = Depends(get_read_router)):
+    """라우트별 읽기 선호도 설정과 인과적 읽기/쓰기 시각 저장 횟수를 조회합니다."""
+    return read_router.snapshot()
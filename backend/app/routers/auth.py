@@ -3,11 +3,12 @@ from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
 from motor.motor_asyncio import AsyncIOMotorDatabase
 from datetime import datetime
 from bson import ObjectId
-from typing import Optional
+from typing import Any, List, Optional
 
 from app.core.security import create_access_token, verify_password, get_password_hash, verify_token
 from app.models.user import UserCreate, UserInDB, User
 from app.core.database import get_database
+from app.core.db_budget import db_call_budget
 from pydantic import BaseModel
 
 
@@ -31,19 +32,11 @@ async def get_current_user(
             detail="인증되지 않은 사용자입니다."
         )
     
-    # ObjectId와 문자열 모두 시도하여 사용자 조회
-    user_doc = None
-    
-    # 먼저 ObjectId로 시도
-    try:
-        object_id = ObjectId(user_id)
-        user_doc = await db.users.find_one({"_id": object_id})
-    except Exception:
-        pass
-    
-    # ObjectId로 찾지 못했으면 문자열로 시도
-    if not user_doc:
-        user_doc = await db.users.find_one({"_id": user_id})
+    # ObjectId/문자열 _id 를 한 번에 조회 (API 로 가입한 사용자는 문자열 _id)
+    id_candidates: List[Any] = [user_id]
+    if ObjectId.is_valid(user_id):
+        id_candidates.append(ObjectId(user_id))
+    user_doc = await db.users.find_one({"_id": {"$in": id_candidates}})
     
     if not user_doc:
         raise HTTPException(
@@ -61,6 +54,7 @@ async def get_current_user(
 
 
 @router.post("/register", response_model=dict)
+@db_call_budget(2)
 async def register(
     user_data: UserCreate,
     db: AsyncIOMotorDatabase = Depends(get_database)
@@ -95,6 +89,7 @@ async def register(
 
 
 @router.post("/login", response_model=dict)
+@db_call_budget(1)
 async def login(
     login_data: LoginRequest,
     db: AsyncIOMotorDatabase = Depends(get_database)
@@ -119,6 +114,7 @@ async def login(
 
 
 @router.get("/me", response_model=User)
+@db_call_budget(2)
 async def get_current_user_info(
     current_user: User = Depends(get_current_user)
 ):
@@ -127,6 +123,7 @@ async def get_current_user_info(
 
 
 @router.post("/refresh", response_model=dict)
+@db_call_budget(2)
 async def refresh_token(
     current_user: User = Depends(get_current_user)
 ):
@@ -2,26 +2,110 @@ from fastapi import APIRouter, Depends, HTTPException, status, Query
 from motor.motor_asyncio import AsyncIOMotorDatabase
 from bson import ObjectId
 from datetime import datetime
-from typing import Dict, Any
-import openai
+from typing import Dict, Any, Tuple, Callable, Awaitable
+import random
 
 from app.models.user import User
 from app.routers.auth import get_current_user
-from app.core.database import get_database
+from app.core.database import get_database, get_ai_interaction_buffer
+from app.core.db_budget import db_call_budget
+from app.core.ai_interactions import AIInteractionBuffer
+from app.core.prompts import render_prompt
+from app.core.llm import chat_completion
+from app.core.cache import TwoTierCache, goal_tag
 from app.core.config import settings
 
 router = APIRouter()
 
-# OpenAI 클라이언트 설정
-openai.api_key = settings.OPENAI_API_KEY
+
+async def _generate_coaching_message(
+    goal_doc: Dict[str, Any],
+    prompt_params: Dict[str, Any]
+) -> Tuple[str, int]:
+    """LLM 제공자로 코칭 메시지를 생성하고, 실패하면 템플릿 메시지를 사용합니다."""
+    try:
+        result = await chat_completion(
+            messages=[
+                {"role": "system", "content": "당신은 따뜻하고 동기부여를 잘하는 목표 달성 코치입니다."},
+                {"role": "user", "content": render_prompt("coaching.v1", prompt_params)}
+            ],
+            max_tokens=300,
+            temperature=0.8,
+            interaction_type="coaching"
+        )
+        if result.content:
+            return result.content.strip(), result.tokens_used
+    except Exception as e:
+        print(f"코칭 메시지 LLM 호출 실패: {e}")
+    
+    progress_rate = prompt_params["progress_rate"]
+    coaching_messages = [
+        f"안녕하세요! '{goal_doc['title']}' 목표에 대한 현재 진도율이 {progress_rate:.1f}%입니다. 꾸준히 잘 하고 계시네요! 💪",
+        f"목표 달성을 위해 오늘도 한 걸음씩 나아가고 계시는군요! {goal_doc['title']} 목표까지 {goal_doc['target_value'] - goal_doc['current_value']:.1f}{goal_doc['unit']} 남았습니다.",
+        f"훌륭합니다! 현재 {progress_rate:.1f}% 달성하셨어요. 이 속도라면 목표 달성이 충분히 가능할 것 같습니다! 🎯",
+        f"매일 조금씩이라도 진전을 보이는 것이 중요해요. {goal_doc['title']} 목표를 향해 꾸준히 노력하고 계시는 모습이 보기 좋습니다! ✨"
+    ]
+    return random.choice(coaching_messages), 0
+
+
+async def get_cached_coaching_message(
+    cache: TwoTierCache,
+    interactions: AIInteractionBuffer,
+    user_id: str,
+    goal_id: str,
+    load_goal: Callable[[], Awaitable[Dict[str, Any]]],
+    message_type: str = "daily"
+) -> Dict[str, Any]:
+    """목표 태그로 캐시한 코칭 메시지를 반환합니다 (목표 번들용).
+
+    진도 기록이나 목표 수정으로 목표 태그가 무효화되었을 때만 LLM 을 다시 호출하므로
+    페이지를 열 때마다 LLM 호출과 AI 상호작용 기록이 생기지 않습니다.
+    load_goal 은 캐시에 없을 때만 호출됩니다.
+    """
+    async def generate() -> Dict[str, Any]:
+        goal = await load_goal()
+        prompt_params = {
+            "message_type": message_type,
+            "title": goal['title'],
+            "progress_rate": (goal['current_value'] / goal['target_value']) * 100,
+            "current_value": goal['current_value'],
+            "target_value": goal['target_value'],
+            "unit": goal['unit'],
+            "deadline": goal['deadline'],
+        }
+        coaching_message, tokens_used = await _generate_coaching_message(goal, prompt_params)
+        interactions.record(
+            user_id=user_id,
+            goal_id=goal_id,
+            interaction_type="coaching",
+            template_id="coaching.v1",
+            params=prompt_params,
+            ai_response=coaching_message,
+            tokens_used=tokens_used
+        )
+        return {
+            "message": coaching_message,
+            "type": message_type,
+            "created_at": datetime.utcnow().isoformat()
+        }
+
+    return await cache.get_or_set(
+        "coaching",
+        f"{user_id}:{goal_id}:{message_type}",
+        generate,
+        tags=[goal_tag(goal_id)],
+        ttl=settings.CACHE_COACHING_TTL_SECONDS
+    )
 
 
 @router.post("/get-coaching")
+@db_call_budget(5)
 async def get_coaching_message_post(
     goal_id: str = Query(..., description="목표 ID"),
     message_type: str = Query("daily", description="메시지 타입"),
     current_user: User = Depends(get_current_user),
-    db: AsyncIOMotorDatabase = Depends(get_database)
+    db: AsyncIOMotorDatabase = Depends(get_database),
+    interactions: AIInteractionBuffer = Depends(get_ai_interaction_buffer)
 ) -> Dict[str, Any]:
     """개인화된 코칭 메시지를 생성합니다."""
     # 목표 조회 - 문자열 방식 먼저 시도
@@ -57,41 +141,29 @@ async def get_coaching_message_post(
     # 코칭 메시지 생성 프롬프트
     progress_rate = (goal_doc['current_value'] / goal_doc['target_value']) * 100
     
-    prompt = f"""
-    다음 사용자에게 {message_type} 코칭 메시지를 작성해주세요:
-    
-    목표: {goal_doc['title']}
-    진도율: {progress_rate:.1f}%
-    현재값: {goal_doc['current_value']} {goal_doc['unit']}
-    목표값: {goal_doc['target_value']} {goal_doc['unit']}
-    마감일: {goal_doc['deadline']}
-    
-    최근 활동이 있다면 이를 참고하여 격려하고, 구체적인 다음 단계를 제안해주세요.
-    따뜻하고 동기부여가 되는 톤으로 작성해주세요.
-    """
+    prompt_params = {
+        "message_type": message_type,
+        "title": goal_doc['title'],
+        "progress_rate": progress_rate,
+        "current_value": goal_doc['current_value'],
+        "target_value": goal_doc['target_value'],
+        "unit": goal_doc['unit'],
+        "deadline": goal_doc['deadline'],
+    }
     
     try:
-        # OpenAI API 대신 임시 메시지 생성 (개발용)
-        coaching_messages = [
-            f"안녕하세요! '{goal_doc['title']}' 목표에 대한 현재 진도율이 {progress_rate:.1f}%입니다. 꾸준히 잘 하고 계시네요! 💪",
-            f"목표 달성을 위해 오늘도 한 걸음씩 나아가고 계시는군요! {goal_doc['title']} 목표까지 {goal_doc['target_value'] - goal_doc['current_value']:.1f}{goal_doc['unit']} 남았습니다.",
-            f"훌륭합니다! 현재 {progress_rate:.1f}% 달성하셨어요. 이 속도라면 목표 달성이 충분히 가능할 것 같습니다! 🎯",
-            f"매일 조금씩이라도 진전을 보이는 것이 중요해요. {goal_doc['title']} 목표를 향해 꾸준히 노력하고 계시는 모습이 보기 좋습니다! ✨"
-        ]
-        
-        import random
-        coaching_message = random.choice(coaching_messages)
+        coaching_message, tokens_used = await _generate_coaching_message(goal_doc, prompt_params)
         
         # AI 상호작용 기록 저장
-        await db.ai_interactions.insert_one({
-            "user_id": str(current_user.id),
-            "goal_id": goal_id,
-            "interaction_type": "coaching",
-            "user_input": prompt,
-            "ai_response": coaching_message,
-            "tokens_used": 0,  # 임시 메시지이므로 0
-            "created_at": datetime.utcnow()
-        })
+        interactions.record(
+            user_id=str(current_user.id),
+            goal_id=goal_id,
+            interaction_type="coaching",
+            template_id="coaching.v1",
+            params=prompt_params,
+            ai_response=coaching_message,
+            tokens_used=tokens_used
+        )
         
         return {
             "message": coaching_message,
@@ -107,11 +179,13 @@ async def get_coaching_message_post(
 
 
 @router.get("/get-coaching/{goal_id}")
+@db_call_budget(5)
 async def get_coaching_message_get(
     goal_id: str,
     message_type: str = Query("daily", description="메시지 타입"),
     current_user: User = Depends(get_current_user),
-    db: AsyncIOMotorDatabase = Depends(get_database)
+    db: AsyncIOMotorDatabase = Depends(get_database),
+    interactions: AIInteractionBuffer = Depends(get_ai_interaction_buffer)
 ) -> Dict[str, Any]:
     """개인화된 코칭 메시지를 생성합니다 (GET 방식)."""
     print(f"AI 코칭 메시지 요청 - goal_id: {goal_id}, message_type: {message_type}, user_id: {current_user.id}")
@@ -150,28 +224,29 @@ async def get_coaching_message_get(
     # 코칭 메시지 생성
     progress_rate = (goal_doc['current_value'] / goal_doc['target_value']) * 100
     
+    prompt_params = {
+        "message_type": message_type,
+        "title": goal_doc['title'],
+        "progress_rate": progress_rate,
+        "current_value": goal_doc['current_value'],
+        "target_value": goal_doc['target_value'],
+        "unit": goal_doc['unit'],
+        "deadline": goal_doc['deadline'],
+    }
+    
     try:
-        # 개인화된 격려 메시지 생성
-        coaching_messages = [
-            f"안녕하세요! '{goal_doc['title']}' 목표에 대한 현재 진도율이 {progress_rate:.1f}%입니다. 꾸준히 잘 하고 계시네요! 💪",
-            f"목표 달성을 위해 오늘도 한 걸음씩 나아가고 계시는군요! {goal_doc['title']} 목표까지 {goal_doc['target_value'] - goal_doc['current_value']:.1f}{goal_doc['unit']} 남았습니다.",
-            f"훌륭합니다! 현재 {progress_rate:.1f}% 달성하셨어요. 이 속도라면 목표 달성이 충분히 가능할 것 같습니다! 🎯",
-            f"매일 조금씩이라도 진전을 보이는 것이 중요해요. {goal_doc['title']} 목표를 향해 꾸준히 노력하고 계시는 모습이 보기 좋습니다! ✨"
-        ]
-        
-        import random
-        coaching_message = random.choice(coaching_messages)
+        coaching_message, tokens_used = await _generate_coaching_message(goal_doc, prompt_params)
         
         # AI 상호작용 기록 저장
-        await db.ai_interactions.insert_one({
-            "user_id": str(current_user.id),
-            "goal_id": goal_id,
-            "interaction_type": "coaching",
-            "user_input": f"목표: {goal_doc['title']}, 진도율: {progress_rate:.1f}%",
-            "ai_response": coaching_message,
-            "tokens_used": 0,  # 임시 메시지이므로 0
-            "created_at": datetime.utcnow()
-        })
+        interactions.record(
+            user_id=str(current_user.id),
+            goal_id=goal_id,
+            interaction_type="coaching",
+            template_id="coaching.v1",
+            params=prompt_params,
+            ai_response=coaching_message,
+            tokens_used=tokens_used
+        )
         
         return {
             "message": coaching_message,
@@ -1,68 +1,274 @@
-from fastapi import APIRouter, Depends
+from fastapi import APIRouter, Depends, HTTPException, Query, status
 from motor.motor_asyncio import AsyncIOMotorDatabase
 from bson import ObjectId
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Literal, Optional
+from datetime import datetime
+from redis.asyncio import Redis
 
 from app.models.user import User
+from app.models.community import CommunityPostCreate, CommunityPostInDB, CommunityPost, CommunityFeedPage
 from app.routers.auth import get_current_user
-from app.core.database import get_database
+from app.core.database import get_database, get_read_database, get_redis
+from app.core.db_budget import db_call_budget
+from app.core.similarity import find_similar_goals
+from app.core.community_feed import get_feed_page, push_post
+from app.core.leaderboard import top_goals, goal_ranks
 
 router = APIRouter()
 
 
+async def _fetch_profiles(db: AsyncIOMotorDatabase, user_ids: List[str]) -> Dict[str, Dict[str, Any]]:
+    """사용자 프로필을 한 번의 $in 조회로 가져옵니다 (문자열 _id 와 ObjectId _id 모두 지원)."""
+    id_candidates: List[Any] = list(user_ids)
+    id_candidates += [ObjectId(user_id) for user_id in user_ids if ObjectId.is_valid(user_id)]
+    users_by_id = {}
+    async for user_doc in db.users.find(
+        {"_id": {"$in": id_candidates}},
+        {"profile.name": 1, "profile.avatar_url": 1}
+    ):
+        users_by_id[str(user_doc["_id"])] = user_doc
+    return users_by_id
+
+
+async def _find_similar_users_by_text(
+    db: AsyncIOMotorDatabase,
+    user_id: str,
+    skip: int,
+    limit: int
+) -> List[Dict[str, Any]]:
+    """MinHash/LSH 인덱스로 목표 텍스트가 유사한 사용자를 찾습니다."""
+    neighbours = await find_similar_goals(db, user_id, skip=skip, limit=limit)
+    if not neighbours:
+        return []
+    
+    users_by_id = await _fetch_profiles(db, [neighbour["user_id"] for neighbour in neighbours])
+    
+    similar_users = []
+    for neighbour in neighbours:
+        user_doc = users_by_id.get(neighbour["user_id"])
+        if not user_doc:
+            continue
+        similar_users.append({
+            "user_id": str(user_doc["_id"]),
+            "name": user_doc["profile"]["name"],
+            "avatar_url": user_doc["profile"].get("avatar_url"),
+            "goal_id": neighbour["goal_id"],
+            "goal_title": neighbour["goal_title"],
+            "goal_category": neighbour["goal_category"],
+            "similarity": neighbour["similarity"]
+        })
+    
+    return similar_users
+
+
 @router.get("/users/similar-goals")
+@db_call_budget(5)
 async def find_similar_users(
     current_user: User = Depends(get_current_user),
-    db: AsyncIOMotorDatabase = Depends(get_database)
+    db: AsyncIOMotorDatabase = Depends(get_read_database("community")),
+    skip: int = Query(0, ge=0, description="건너뛸 사용자 수"),
+    limit: int = Query(10, ge=1, le=50, description="조회할 사용자 수"),
+    mode: Literal["category", "text"] = Query("category", description="매칭 방식 (category: 카테고리 일치, text: 목표 텍스트 유사도)")
 ) -> List[Dict[str, Any]]:
-    """유사한 목표를 가진 사용자를 찾습니다."""
-    # 현재 사용자의 활성 목표 조회
-    user_goals = []
-    async for goal in db.goals.find({
-        "user_id": ObjectId(current_user.id),
+    """유사한 목표를 가진 사용자를 찾습니다.
+
+    매칭 건수와 관계없이 distinct 1회, aggregate 1회, users 일괄 조회 1회만 실행합니다.
+    """
+    # user_id 는 문자열로 저장되므로 문자열로 조회
+    user_id = str(current_user.id)
+    
+    if mode == "text":
+        return await _find_similar_users_by_text(db, user_id, skip, limit)
+    
+    # 현재 사용자의 활성 목표 카테고리 조회
+    categories = await db.goals.distinct("category", {
+        "user_id": user_id,
         "status": "active"
-    }):
-        user_goals.append(goal)
+    })
     
-    if not user_goals:
+    if not categories:
         return []
     
-    # 유사한 카테고리의 목표를 가진 다른 사용자 찾기
-    categories = [goal["category"] for goal in user_goals]
+    # 같은 카테고리의 활성 목표를 사용자별로 묶고 겹치는 카테고리 수로 순위 결정
+    pipeline = [
+        {"$match": {
+            "category": {"$in": categories},
+            "status": "active",
+            "user_id": {"$ne": user_id}
+        }},
+        {"$sort": {"created_at": -1}},
+        {"$group": {
+            "_id": "$user_id",
+            "categories": {"$addToSet": "$category"},
+            "goal_count": {"$sum": 1},
+            "goal_title": {"$first": "$title"},
+            "goal_category": {"$first": "$category"}
+        }},
+        {"$addFields": {"category_overlap": {"$size": "$categories"}}},
+        {"$sort": {"category_overlap": -1, "goal_count": -1, "_id": 1}},
+        {"$skip": skip},
+        {"$limit": limit}
+    ]
+    candidates = await db.goals.aggregate(pipeline).to_list(length=limit)
+    
+    if not candidates:
+        return []
+    
+    users_by_id = await _fetch_profiles(db, [str(candidate["_id"]) for candidate in candidates])
     
     similar_users = []
-    async for goal in db.goals.find({
-        "category": {"$in": categories},
-        "status": "active",
-        "user_id": {"$ne": ObjectId(current_user.id)}
-    }).limit(10):
-        # 사용자 정보 조회
-        user_doc = await db.users.find_one({"_id": goal["user_id"]})
-        if user_doc:
-            similar_users.append({
-                "user_id": str(user_doc["_id"]),
-                "name": user_doc["profile"]["name"],
-                "avatar_url": user_doc["profile"].get("avatar_url"),
-                "goal_title": goal["title"],
-                "goal_category": goal["category"]
-            })
+    for candidate in candidates:
+        user_doc = users_by_id.get(str(candidate["_id"]))
+        if not user_doc:
+            continue
+        similar_users.append({
+            "user_id": str(user_doc["_id"]),
+            "name": user_doc["profile"]["name"],
+            "avatar_url": user_doc["profile"].get("avatar_url"),
+            "goal_title": candidate["goal_title"],
+            "goal_category": candidate["goal_category"],
+            "shared_categories": sorted(candidate["categories"]),
+            "category_overlap": candidate["category_overlap"]
+        })
     
     return similar_users
 
 
-@router.get("/posts")
-async def get_community_posts(
-    db: AsyncIOMotorDatabase = Depends(get_database)
+@router.get("/leaderboards/{category}")
+@db_call_budget(3)
+async def get_leaderboard(
+    category: Literal["health", "education", "career", "personal", "finance"],
+    limit: int = Query(10, ge=1, le=100, description="조회할 순위 수"),
+    current_user: User = Depends(get_current_user),
+    db: AsyncIOMotorDatabase = Depends(get_read_database("community")),
+    redis: Optional[Redis] = Depends(get_redis)
 ) -> List[Dict[str, Any]]:
-    """커뮤니티 게시글을 조회합니다."""
-    # 간단한 더미 데이터 반환
-    return [
-        {
-            "id": "1",
-            "title": "다이어트 목표 달성 팁 공유",
-            "content": "3개월 동안 10kg 감량에 성공했습니다!",
-            "author": "건강한사람",
-            "category": "health",
-            "created_at": "2024-01-15T10:00:00"
-        }
-    ] 
\ No newline at end of file
+    """카테고리별 달성률 상위 목표를 조회합니다."""
+    if redis is None:
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail="리더보드를 사용할 수 없습니다."
+        )
+    
+    entries = await top_goals(redis, category, limit)
+    if not entries:
+        return []
+    
+    goal_ids = [goal_id for goal_id, _ in entries]
+    goals_by_id = {}
+    async for goal_doc in db.goals.find(
+        {"_id": {"$in": goal_ids}},
+        {"title": 1, "user_id": 1, "unit": 1}
+    ):
+        goals_by_id[str(goal_doc["_id"])] = goal_doc
+    users_by_id = await _fetch_profiles(db, list({str(doc["user_id"]) for doc in goals_by_id.values()}))
+    
+    leaderboard = []
+    for rank, (goal_id, score) in enumerate(entries, start=1):
+        goal_doc = goals_by_id.get(goal_id)
+        if not goal_doc:
+            continue
+        user_doc = users_by_id.get(str(goal_doc["user_id"]))
+        leaderboard.append({
+            "rank": rank,
+            "goal_id": goal_id,
+            "goal_title": goal_doc["title"],
+            "user_id": str(goal_doc["user_id"]),
+            "name": user_doc["profile"]["name"] if user_doc else None,
+            "avatar_url": user_doc["profile"].get("avatar_url") if user_doc else None,
+            "progress_rate": round(score * 100, 1)
+        })
+    
+    return leaderboard
+
+
+@router.get("/leaderboards/{category}/me")
+@db_call_budget(3)
+async def get_my_leaderboard_rank(
+    category: Literal["health", "education", "career", "personal", "finance"],
+    current_user: User = Depends(get_current_user),
+    db: AsyncIOMotorDatabase = Depends(get_read_database("community")),
+    redis: Optional[Redis] = Depends(get_redis)
+) -> Dict[str, Any]:
+    """카테고리 리더보드에서 내 목표들의 순위를 조회합니다."""
+    if redis is None:
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail="리더보드를 사용할 수 없습니다."
+        )
+    
+    goal_ids = [
+        str(goal_doc["_id"])
+        async for goal_doc in db.goals.find(
+            {"user_id": str(current_user.id), "category": category},
+            {"_id": 1}
+        )
+    ]
+    total, ranks = await goal_ranks(redis, category, goal_ids)
+    
+    return {
+        "category": category,
+        "total": total,
+        "best_rank": min((entry["rank"] for entry in ranks), default=None),
+        "goals": [
+            {**entry, "progress_rate": round(entry["score"] * 100, 1)}
+            for entry in ranks
+        ]
+    }
+
+
+@router.get("/posts", response_model=CommunityFeedPage)
+@db_call_budget(1)
+async def get_community_posts(
+    db: AsyncIOMotorDatabase = Depends(get_read_database("community")),
+    primary: AsyncIOMotorDatabase = Depends(get_database),
+    redis: Optional[Redis] = Depends(get_redis),
+    category: Optional[Literal["health", "education", "career", "personal", "finance"]] = Query(None, description="카테고리 필터"),
+    cursor: Optional[str] = Query(None, description="이전 페이지의 next_cursor"),
+    limit: int = Query(20, ge=1, le=100, description="조회할 게시글 수")
+):
+    """커뮤니티 게시글을 최신순으로 조회합니다."""
+    try:
+        return await get_feed_page(db, redis, category=category, cursor=cursor, limit=limit, primary=primary)
+    except ValueError as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=str(e)
+        )
+
+
+@router.post("/posts", response_model=CommunityPost)
+@db_call_budget(3)
+async def create_community_post(
+    post_data: CommunityPostCreate,
+    current_user: User = Depends(get_current_user),
+    db: AsyncIOMotorDatabase = Depends(get_database),
+    redis: Optional[Redis] = Depends(get_redis)
+):
+    """커뮤니티 게시글을 작성합니다."""
+    # MongoDB 는 밀리초 단위로 저장하므로 캐시와 커서가 일치하도록 미리 절삭
+    now = datetime.utcnow()
+    post_in_db = CommunityPostInDB(
+        user_id=str(current_user.id),
+        author=current_user.profile.name,
+        title=post_data.title,
+        content=post_data.content,
+        category=post_data.category,
+        created_at=now.replace(microsecond=now.microsecond // 1000 * 1000)
+    )
+    post_doc = post_in_db.model_dump(by_alias=True)
+    await db.community_posts.insert_one(post_doc)
+    
+    post = CommunityPost(
+        id=str(post_doc["_id"]),
+        user_id=str(post_doc["user_id"]),
+        author=post_doc["author"],
+        title=post_doc["title"],
+        content=post_doc["content"],
+        category=post_doc["category"],
+        created_at=post_doc["created_at"]
+    )
+    if redis is not None:
+        await push_post(redis, post)
+    
+    return post
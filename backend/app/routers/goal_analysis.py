@@ -2,25 +2,58 @@ from fastapi import APIRouter, Depends, HTTPException, status, Query
 from motor.motor_asyncio import AsyncIOMotorDatabase
 from bson import ObjectId
 from datetime import datetime
-from typing import Dict, Any
-import openai
+from typing import Dict, Any, List, Optional
+from pydantic import BaseModel
+from pymongo import UpdateOne
+import json
+import time
 
 from app.models.user import User
 from app.routers.auth import get_current_user
-from app.core.database import get_database
+from app.core.cache import TwoTierCache, goal_tag, user_tag
+from app.core.database import get_cache, get_database, get_ai_interaction_buffer
+from app.core.db_budget import db_call_budget
+from app.core.ai_interactions import AIInteractionBuffer
+from app.core.prompts import render_prompt, estimate_tokens
 from app.core.config import settings
+from app.core.llm import chat_completion, extract_json
+from app.core.ai_fallback import fallback_analysis
 
 router = APIRouter()
 
-# OpenAI 클라이언트 설정
-openai.api_key = settings.OPENAI_API_KEY
+ANALYSIS_SYSTEM_PROMPT = "당신은 개인 목표 달성을 돕는 전문 코치입니다. 반드시 JSON 형태로만 응답해주세요."
+# 단일 분석 응답 한 건에 필요한 예상 출력 토큰 수
+ANALYSIS_COMPLETION_TOKENS = 150
+
+
+class AnalyzeGoalsRequest(BaseModel):
+    goal_ids: Optional[List[str]] = None  # 비어 있으면 모든 활성 목표를 분석
+
+
+def _normalize_analysis(parsed_analysis: Dict[str, Any]) -> Dict[str, Any]:
+    """필수 필드를 검증하고 값 범위를 제한합니다."""
+    ai_analysis = {
+        "difficulty_score": float(parsed_analysis.get("difficulty_score", 7.0)),
+        "estimated_duration": int(parsed_analysis.get("estimated_duration", 30)),
+        "success_probability": float(parsed_analysis.get("success_probability", 0.75)),
+        "suggestions": str(parsed_analysis.get("suggestions", "꾸준히 노력하세요!"))
+    }
+    
+    # 값 범위 검증
+    ai_analysis["difficulty_score"] = max(1.0, min(10.0, ai_analysis["difficulty_score"]))
+    ai_analysis["success_probability"] = max(0.0, min(1.0, ai_analysis["success_probability"]))
+    ai_analysis["estimated_duration"] = max(1, ai_analysis["estimated_duration"])
+    return ai_analysis
 
 
 @router.post("/analyze-goal")
+@db_call_budget(5)
 async def analyze_goal(
     goal_id: str = Query(..., description="목표 ID"),
     current_user: User = Depends(get_current_user),
-    db: AsyncIOMotorDatabase = Depends(get_database)
+    db: AsyncIOMotorDatabase = Depends(get_database),
+    interactions: AIInteractionBuffer = Depends(get_ai_interaction_buffer),
+    cache: TwoTierCache = Depends(get_cache)
 ) -> Dict[str, Any]:
     """목표를 AI로 분석합니다."""
     print(f"AI 목표 분석 요청 - goal_id: {goal_id}, user_id: {current_user.id}")
@@ -49,170 +82,49 @@ async def analyze_goal(
         )
     
     # AI 분석 프롬프트 생성
-    prompt = f"""
-    다음 목표를 분석해주세요:
-    
-    제목: {goal_doc['title']}
-    설명: {goal_doc['description']}
-    카테고리: {goal_doc['category']}
-    목표값: {goal_doc['target_value']} {goal_doc['unit']}
-    현재값: {goal_doc['current_value']} {goal_doc['unit']}
-    마감일: {goal_doc['deadline']}
-    우선순위: {goal_doc['priority']}
-    
-    다음 관점에서 분석하고 JSON 형태로 응답해주세요:
-    1. 목표의 구체성 및 달성 가능성 (1-10점)
-    2. 예상 소요 기간 (일 단위)
-    3. 성공 확률 (0-1 사이의 값)
-    4. 개선 제안 사항
-    
-    응답 형식:
-    {{
-        "difficulty_score": 숫자,
-        "estimated_duration": 숫자,
-        "success_probability": 숫자,
-        "suggestions": "제안사항 텍스트"
-    }}
-    """
+    prompt_params = {
+        "title": goal_doc['title'],
+        "description": goal_doc['description'],
+        "category": goal_doc['category'],
+        "target_value": goal_doc['target_value'],
+        "current_value": goal_doc['current_value'],
+        "unit": goal_doc['unit'],
+        "deadline": goal_doc['deadline'],
+        "priority": goal_doc['priority'],
+    }
+    prompt = render_prompt("analysis.v1", prompt_params)
     
     try:
-        print(f"OpenAI API 호출 시작 - model: gpt-4o-mini")
+        print(f"LLM API 호출 시작 - provider: {settings.LLM_PROVIDER}, model: {settings.LLM_MODEL}")
         
-        # OpenAI API 호출 (실제 API가 없으면 fallback 사용)
+        # LLM API 호출 (회로가 열려 있거나 호출이 실패하면 fallback 사용)
         try:
-            response = openai.chat.completions.create(
-                model="gpt-4o-mini",
+            result = await chat_completion(
                 messages=[
-                    {"role": "system", "content": "당신은 개인 목표 달성을 돕는 전문 코치입니다. 반드시 JSON 형태로만 응답해주세요."},
+                    {"role": "system", "content": ANALYSIS_SYSTEM_PROMPT},
                     {"role": "user", "content": prompt}
                 ],
                 max_tokens=500,
-                temperature=0.7
+                temperature=0.7,
+                interaction_type="analysis"
             )
+            ai_response = result.content
+            tokens_used = result.tokens_used
             print(f"OpenAI API 호출 성공")
         except Exception as openai_error:
             print(f"OpenAI API 호출 실패: {openai_error}")
             # 목표 내용 기반 맞춤형 분석 생성
-            
-            # 진도율 계산
-            progress_rate = (goal_doc['current_value'] / goal_doc['target_value']) * 100
-            
-            # 카테고리별 맞춤 분석
-            category_analysis = {
-                "건강": {
-                    "difficulty_score": 6.5 + (progress_rate / 100) * 2,
-                    "estimated_duration": max(30, int(90 - progress_rate)),
-                    "success_probability": 0.75 + (progress_rate / 200),
-                    "suggestions": f"건강 목표는 꾸준함이 핵심입니다. 현재 {progress_rate:.1f}% 달성하셨네요! 작은 습관부터 시작하여 점진적으로 강도를 높여가세요."
-                },
-                "학습": {
-                    "difficulty_score": 7.0 + (progress_rate / 100) * 1.5,
-                    "estimated_duration": max(60, int(120 - progress_rate)),
-                    "success_probability": 0.70 + (progress_rate / 250),
-                    "suggestions": f"학습은 반복과 이해가 중요합니다. {progress_rate:.1f}% 진행 중이시군요. 매일 조금씩이라도 꾸준히 학습하고 복습 시간을 확보하세요."
-                },
-                "업무": {
-                    "difficulty_score": 7.5 + (progress_rate / 100) * 1,
-                    "estimated_duration": max(45, int(100 - progress_rate)),
-                    "success_probability": 0.80 + (progress_rate / 300),
-                    "suggestions": f"업무 목표는 체계적인 계획과 실행이 중요합니다. {progress_rate:.1f}% 달성 중이시네요. 우선순위를 정하고 단계별로 접근해보세요."
-                },
-                "취미": {
-                    "difficulty_score": 5.5 + (progress_rate / 100) * 2,
-                    "estimated_duration": max(30, int(80 - progress_rate)),
-                    "success_probability": 0.85 + (progress_rate / 400),
-                    "suggestions": f"취미 활동은 즐거움이 우선입니다! {progress_rate:.1f}% 진행 중이군요. 부담을 갖지 말고 재미있게 접근하세요."
-                }
-            }
-            
-            # 기본값 설정
-            default_analysis = {
-                "difficulty_score": 7.0,
-                "estimated_duration": 60,
-                "success_probability": 0.75,
-                "suggestions": f"현재 {progress_rate:.1f}% 진행 중입니다. 목표를 작은 단위로 나누어 꾸준히 진행해보세요."
-            }
-            
-            # 카테고리에 맞는 분석 선택
-            analysis = category_analysis.get(goal_doc.get('category', ''), default_analysis)
-            
-            # 우선순위에 따른 조정
-            priority_multiplier = {
-                "높음": 1.2,
-                "중간": 1.0,
-                "낮음": 0.8
-            }
-            multiplier = priority_multiplier.get(goal_doc.get('priority', '중간'), 1.0)
-            analysis['difficulty_score'] *= multiplier
-            analysis['estimated_duration'] = int(analysis['estimated_duration'] / multiplier)
-            
-            # 값 범위 제한
-            analysis['difficulty_score'] = max(1.0, min(10.0, analysis['difficulty_score']))
-            analysis['success_probability'] = max(0.1, min(1.0, analysis['success_probability']))
-            
-            # OpenAI API 실패 시 더미 응답 생성
-            class DummyResponse:
-                def __init__(self):
-                    self.choices = [DummyChoice()]
-                    self.usage = DummyUsage()
-            
-            class DummyChoice:
-                def __init__(self):
-                    self.message = DummyMessage()
-            
-            class DummyMessage:
-                def __init__(self):
-                    import json
-                    self.content = json.dumps(analysis, ensure_ascii=False)
-            
-            class DummyUsage:
-                def __init__(self):
-                    self.total_tokens = 0
-            
-            response = DummyResponse()
+            ai_response = json.dumps(fallback_analysis(goal_doc), ensure_ascii=False)
+            tokens_used = 0
             print(f"맞춤형 더미 분석 사용 - 카테고리: {goal_doc.get('category', '기본')}")
         
-        ai_response = response.choices[0].message.content
-        
         # AI 응답 유효성 검사
         if not ai_response:
             ai_response = "{}"
         
         # AI 응답을 JSON으로 파싱
-        import json
-        import re
-        
         try:
-            # JSON 부분만 추출 (```json과 ``` 제거)
-            json_match = re.search(r'```json\s*(.*?)\s*```', ai_response, re.DOTALL)
-            if json_match:
-                json_content = json_match.group(1)
-            else:
-                # ```이 없는 경우 전체 응답에서 JSON 찾기
-                json_match = re.search(r'\{.*\}', ai_response, re.DOTALL)
-                if json_match:
-                    json_content = json_match.group(0)
-                else:
-                    json_content = ai_response
-            
-            # JSON 파싱 시도
-            if json_content:
-                parsed_analysis = json.loads(json_content)
-            else:
-                parsed_analysis = {}
-            
-            # 필수 필드 검증 및 기본값 설정
-            ai_analysis = {
-                "difficulty_score": float(parsed_analysis.get("difficulty_score", 7.0)),
-                "estimated_duration": int(parsed_analysis.get("estimated_duration", 30)),
-                "success_probability": float(parsed_analysis.get("success_probability", 0.75)),
-                "suggestions": str(parsed_analysis.get("suggestions", "꾸준히 노력하세요!"))
-            }
-            
-            # 값 범위 검증
-            ai_analysis["difficulty_score"] = max(1.0, min(10.0, ai_analysis["difficulty_score"]))
-            ai_analysis["success_probability"] = max(0.0, min(1.0, ai_analysis["success_probability"]))
-            ai_analysis["estimated_duration"] = max(1, ai_analysis["estimated_duration"])
+            ai_analysis = _normalize_analysis(extract_json(ai_response))
             
         except (json.JSONDecodeError, ValueError, KeyError) as parse_error:
             print(f"AI 응답 파싱 실패: {parse_error}")
@@ -227,27 +139,21 @@ async def analyze_goal(
             }
         
         await db.goals.update_one(
-            {"_id": ObjectId(goal_id) if ObjectId.is_valid(goal_id) else goal_id},
+            {"_id": goal_doc["_id"]},
             {"$set": {"ai_analysis": ai_analysis, "updated_at": datetime.utcnow()}}
         )
+        await cache.invalidate(user_tag(str(current_user.id)), goal_tag(goal_id))
         
         # AI 상호작용 기록 저장
-        tokens_used = 0
-        try:
-            if hasattr(response, 'usage') and response.usage and hasattr(response.usage, 'total_tokens'):
-                tokens_used = response.usage.total_tokens
-        except:
-            tokens_used = 0
-            
-        await db.ai_interactions.insert_one({
-            "user_id": str(current_user.id),
-            "goal_id": goal_id,
-            "interaction_type": "analysis",
-            "user_input": prompt,
-            "ai_response": ai_response,
-            "tokens_used": tokens_used,
-            "created_at": datetime.utcnow()
-        })
+        interactions.record(
+            user_id=str(current_user.id),
+            goal_id=goal_id,
+            interaction_type="analysis",
+            template_id="analysis.v1",
+            params=prompt_params,
+            ai_response=ai_response,
+            tokens_used=tokens_used
+        )
         
         return {
             "analysis": ai_analysis,
@@ -259,4 +165,170 @@ async def analyze_goal(
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail=f"AI 분석 중 오류가 발생했습니다: {str(e)}"
-        ) 
\ No newline at end of file
+        ) 
+
+def _chunk_by_token_budget(items: List[Dict[str, Any]]) -> List[List[Dict[str, Any]]]:
+    """렌더링된 목표 블록을 토큰 예산과 최대 개수에 맞춰 묶습니다."""
+    chunks: List[List[Dict[str, Any]]] = []
+    current: List[Dict[str, Any]] = []
+    current_tokens = 0
+    
+    for item in items:
+        item_tokens = item["prompt_tokens"] + ANALYSIS_COMPLETION_TOKENS
+        if current and (
+            current_tokens + item_tokens > settings.AI_BATCH_TOKEN_BUDGET
+            or len(current) >= settings.AI_BATCH_MAX_GOALS
+        ):
+            chunks.append(current)
+            current = []
+            current_tokens = 0
+        current.append(item)
+        current_tokens += item_tokens
+    
+    if current:
+        chunks.append(current)
+    return chunks
+
+
+@router.post("/analyze-goals")
+@db_call_budget(4)
+async def analyze_goals(
+    request: AnalyzeGoalsRequest,
+    current_user: User = Depends(get_current_user),
+    db: AsyncIOMotorDatabase = Depends(get_database),
+    interactions: AIInteractionBuffer = Depends(get_ai_interaction_buffer),
+    cache: TwoTierCache = Depends(get_cache)
+) -> Dict[str, Any]:
+    """여러 목표를 하나의 프롬프트로 묶어 AI로 분석합니다."""
+    user_id = str(current_user.id)
+    filter_query: Dict[str, Any] = {"user_id": user_id}
+    if request.goal_ids:
+        # 문자열 _id 와 ObjectId _id 를 모두 조회
+        id_candidates: List[Any] = list(request.goal_ids)
+        id_candidates += [ObjectId(goal_id) for goal_id in request.goal_ids if ObjectId.is_valid(goal_id)]
+        filter_query["_id"] = {"$in": id_candidates}
+    else:
+        filter_query["status"] = "active"
+    
+    goal_docs = await db.goals.find(filter_query).to_list(length=None)
+    if not goal_docs:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="분석할 목표를 찾을 수 없습니다."
+        )
+    
+    items = []
+    for goal_doc in goal_docs:
+        goal_block = render_prompt("analysis_batch_item.v1", {
+            "goal_id": str(goal_doc["_id"]),
+            "title": goal_doc["title"],
+            "description": goal_doc["description"],
+            "category": goal_doc["category"],
+            "target_value": goal_doc["target_value"],
+            "current_value": goal_doc["current_value"],
+            "unit": goal_doc["unit"],
+            "deadline": goal_doc["deadline"],
+            "priority": goal_doc["priority"],
+        })
+        items.append({
+            "goal_doc": goal_doc,
+            "block": goal_block,
+            "prompt_tokens": estimate_tokens(goal_block)
+        })
+    
+    system_tokens = estimate_tokens(ANALYSIS_SYSTEM_PROMPT)
+    results = []
+    operations = []
+    now = datetime.utcnow()
+    
+    chunks = _chunk_by_token_budget(items)
+    for chunk in chunks:
+        goal_ids = [str(item["goal_doc"]["_id"]) for item in chunk]
+        prompt_params = {"count": len(chunk), "goals": "".join(item["block"] for item in chunk)}
+        prompt = render_prompt("analysis_batch.v1", prompt_params)
+        
+        parsed_by_goal: Dict[str, Any] = {}
+        ai_response = ""
+        tokens_used = 0
+        started = time.perf_counter()
+        try:
+            result = await chat_completion(
+                messages=[
+                    {"role": "system", "content": ANALYSIS_SYSTEM_PROMPT},
+                    {"role": "user", "content": prompt}
+                ],
+                max_tokens=ANALYSIS_COMPLETION_TOKENS * len(chunk) + 100,
+                temperature=0.7,
+                interaction_type="analysis_batch"
+            )
+            ai_response = result.content
+            tokens_used = result.tokens_used
+            parsed = extract_json(ai_response)
+            entries = parsed.get("results", []) if isinstance(parsed, dict) else parsed
+            for entry in entries:
+                if isinstance(entry, dict) and entry.get("goal_id") is not None:
+                    parsed_by_goal[str(entry["goal_id"])] = entry
+        except Exception as e:
+            print(f"일괄 분석 실패 - {len(chunk)}개 목표를 fallback 으로 처리: {e}")
+        latency_ms = (time.perf_counter() - started) * 1000
+        
+        for item in chunk:
+            goal_doc = item["goal_doc"]
+            goal_id = str(goal_doc["_id"])
+            source = "ai"
+            try:
+                ai_analysis = _normalize_analysis(parsed_by_goal[goal_id])
+            except (KeyError, TypeError, ValueError, AttributeError):
+                # 이 목표에 해당하는 응답 조각을 파싱하지 못한 경우 개별 fallback
+                ai_analysis = fallback_analysis(goal_doc)
+                source = "fallback"
+            
+            operations.append(UpdateOne(
+                {"_id": goal_doc["_id"]},
+                {"$set": {"ai_analysis": ai_analysis, "updated_at": now}}
+            ))
+            results.append({
+                "goal_id": goal_id,
+                "analysis": ai_analysis,
+                "source": source,
+                "tokens_used": tokens_used / len(chunk),
+                "estimated_prompt_tokens": item["prompt_tokens"] + system_tokens / len(chunk),
+                "latency_ms": round(latency_ms / len(chunk), 2)
+            })
+        
+        interactions.record(
+            user_id=user_id,
+            goal_id=None,
+            interaction_type="analysis_batch",
+            template_id="analysis_batch.v1",
+            params={"goal_ids": goal_ids, "count": len(chunk)},
+            ai_response=ai_response,
+            tokens_used=tokens_used
+        )
+    
+    await db.goals.bulk_write(operations, ordered=False)
+    await cache.invalidate(user_tag(user_id), *(goal_tag(str(goal_doc["_id"])) for goal_doc in goal_docs))
+    
+    # 단일 분석 경로(목표당 시스템 프롬프트 + 왕복 1회)와 비교한 예상 토큰 수
+    single_goal_tokens = sum(
+        system_tokens + estimate_tokens(render_prompt("analysis.v1", {
+            key: item["goal_doc"][key]
+            for key in ("title", "description", "category", "target_value",
+                        "current_value", "unit", "deadline", "priority")
+        })) + ANALYSIS_COMPLETION_TOKENS
+        for item in items
+    )
+    batch_tokens = sum(item["estimated_prompt_tokens"] for item in results) + ANALYSIS_COMPLETION_TOKENS * len(items)
+    
+    return {
+        "results": results,
+        "stats": {
+            "goal_count": len(items),
+            "request_count": len(chunks),
+            "tokens_used_per_goal": round(sum(r["tokens_used"] for r in results) / len(items), 1),
+            "latency_ms_per_goal": round(sum(r["latency_ms"] for r in results) / len(items), 2),
+            "estimated_tokens_per_goal": round(batch_tokens / len(items), 1),
+            "single_goal_estimated_tokens_per_goal": round(single_goal_tokens / len(items), 1),
+        },
+        "message": "목표 일괄 분석이 완료되었습니다."
+    }
@@ -1,31 +1,59 @@
 from fastapi import APIRouter, Depends, HTTPException, status, Query
+from fastapi.encoders import jsonable_encoder
 from motor.motor_asyncio import AsyncIOMotorDatabase
 from bson import ObjectId
+from pymongo import ReturnDocument
 from typing import List, Optional, Dict, Any, Annotated
 from datetime import datetime
+from redis.asyncio import Redis
+import asyncio
 
 from app.models.goal import GoalCreate, GoalUpdate, Goal, GoalInDB
+from app.models.progress import ProgressLog
 from app.models.user import User, PyObjectId
 from app.routers.auth import get_current_user
-from app.core.database import get_database
+from app.core.cache import TwoTierCache, goal_tag, user_tag
+from app.core.ai_interactions import AIInteractionBuffer
+from app.core.database import get_ai_interaction_buffer, get_cache, get_database, get_read_router, get_redis
+from app.core.db_budget import db_call_budget
+from app.core.leaderboard import update_goal_score, remove_goal_score
+from app.core.read_routing import CausalReads, ReadRouter
+from app.core.similarity import index_goal, remove_goal
+from app.routers.coaching_messages import get_cached_coaching_message
+from app.routers.action_plans import plan_completion
 
 router = APIRouter()
 
+# 목표 번들에서 선택할 수 있는 항목
+BUNDLE_FIELDS = ("goal", "logs", "plan", "coaching")
+
 
 @router.get("/", response_model=List[Goal])
+@db_call_budget(2)
 async def get_goals(
     current_user: Annotated[User, Depends(get_current_user)],
-    db: Annotated[AsyncIOMotorDatabase, Depends(get_database)],
+    read_router: Annotated[ReadRouter, Depends(get_read_router)],
+    cache: Annotated[TwoTierCache, Depends(get_cache)],
     status: Optional[str] = Query(None, description="목표 상태 필터"),
     category: Optional[str] = Query(None, description="카테고리 필터")
 ):
-    """사용자의 목표 목록을 조회합니다."""
-    print("--------------------------------")
-    print(f"목표 조회 요청 - 사용자 ID: {current_user.id}")
-    print(f"필터 조건 - status: {status}, category: {category}")
-    
+    """사용자의 목표 목록을 조회합니다 (사용자 태그로 캐시)."""
     # user_id를 문자열로 검색 (저장할 때 문자열로 저장되므로)
     user_id_str = str(current_user.id)
+    return await cache.get_or_set(
+        "goals.list",
+        f"{user_id_str}:{status or ''}:{category or ''}",
+        lambda: _load_goals(read_router.for_user("goals", user_id_str), user_id_str, status, category),
+        tags=[user_tag(user_id_str)]
+    )
+
+
+async def _load_goals(
+    reads: CausalReads,
+    user_id_str: str,
+    status: Optional[str],
+    category: Optional[str]
+) -> List[Dict[str, Any]]:
     filter_query: Dict[str, Any] = {"user_id": user_id_str}
     
     if status:
@@ -33,20 +61,11 @@ async def get_goals(
     if category:
         filter_query["category"] = category
     
-    print(f"MongoDB 쿼리: {filter_query}")
+    async with reads.session() as (db, session):
+        goal_docs = await db.goals.find(filter_query, session=session).sort("created_at", -1).to_list(length=None)
     
-    # 전체 목표 수 확인
-    total_goals = await db.goals.count_documents({})
-    user_goals_count_str = await db.goals.count_documents({"user_id": user_id_str})
-    user_goals_count_obj = await db.goals.count_documents({"user_id": ObjectId(current_user.id)})
-    print(f"데이터베이스 전체 목표 수: {total_goals}")
-    print(f"현재 사용자 목표 수 (문자열 검색): {user_goals_count_str}")
-    print(f"현재 사용자 목표 수 (ObjectId 검색): {user_goals_count_obj}")
-    
-    goals_cursor = db.goals.find(filter_query).sort("created_at", -1)
     goals = []
-    
-    async for goal_doc in goals_cursor:
+    for goal_doc in goal_docs:
         goals.append(Goal(
             id=str(goal_doc["_id"]),
             user_id=str(goal_doc["user_id"]),
@@ -64,38 +83,17 @@ async def get_goals(
             updated_at=goal_doc["updated_at"]
         ))
     
-    print(f"최종 반환할 목표 수: {len(goals)}")
-    return goals
-
-
-@router.get("/debug/all")
-async def get_all_goals_debug(
-    current_user: Annotated[User, Depends(get_current_user)],
-    db: Annotated[AsyncIOMotorDatabase, Depends(get_database)]
-):
-    """디버깅용: 모든 목표 조회"""
-    print(f"디버깅: 현재 사용자 ID: {current_user.id}, 타입: {type(current_user.id)}")
-    
-    all_goals_cursor = db.goals.find({})
-    all_goals = []
-    async for goal_doc in all_goals_cursor:
-        all_goals.append({
-            "_id": str(goal_doc["_id"]),
-            "user_id": str(goal_doc["user_id"]),
-            "user_id_type": str(type(goal_doc["user_id"])),
-            "title": goal_doc["title"],
-            "created_at": goal_doc["created_at"]
-        })
-    
-    print(f"데이터베이스의 모든 목표: {all_goals}")
-    return {"current_user_id": str(current_user.id), "all_goals": all_goals}
+    return jsonable_encoder(goals)
 
 
 @router.post("/", response_model=Goal)
+@db_call_budget(6)
 async def create_goal(
     goal_data: GoalCreate,
     current_user: User = Depends(get_current_user),
-    db: AsyncIOMotorDatabase = Depends(get_database)
+    db: AsyncIOMotorDatabase = Depends(get_database),
+    redis: Optional[Redis] = Depends(get_redis),
+    cache: TwoTierCache = Depends(get_cache)
 ):
     """새 목표를 생성합니다."""
     print(f"목표 생성 요청 - 사용자 ID: {current_user.id}")
@@ -124,6 +122,7 @@ async def create_goal(
     
     result = await db.goals.insert_one(goal_dict)
     print(f"MongoDB 삽입 결과 ID: {result.inserted_id}")
+    await cache.invalidate(user_tag(user_id_str))
     
     # 방금 생성된 목표를 바로 조회해서 확인
     created_goal = await db.goals.find_one({"_id": result.inserted_id})
@@ -133,6 +132,10 @@ async def create_goal(
     # 생성된 목표 조회
     goal_doc = await db.goals.find_one({"_id": result.inserted_id})
     
+    # 커뮤니티 텍스트 유사도 인덱스 및 리더보드 갱신
+    await index_goal(db, goal_doc)
+    await update_goal_score(redis, goal_doc)
+    
     return Goal(
         id=str(goal_doc["_id"]),
         user_id=str(goal_doc["user_id"]),
@@ -152,16 +155,33 @@ async def create_goal(
 
 
 @router.get("/{goal_id}", response_model=Goal)
+@db_call_budget(3)
 async def get_goal(
     goal_id: str,
     current_user: User = Depends(get_current_user),
-    db: AsyncIOMotorDatabase = Depends(get_database)
+    read_router: ReadRouter = Depends(get_read_router),
+    cache: TwoTierCache = Depends(get_cache)
 ):
-    """특정 목표를 조회합니다."""
-    goal_doc = await db.goals.find_one({
-        "_id": ObjectId(goal_id),
-        "user_id": str(current_user.id)
-    })
+    """특정 목표를 조회합니다 (목표 태그로 캐시)."""
+    user_id_str = str(current_user.id)
+    return await cache.get_or_set(
+        "goals.detail",
+        f"{user_id_str}:{goal_id}",
+        lambda: _load_goal(read_router.for_user("goals", user_id_str), user_id_str, goal_id),
+        tags=[goal_tag(goal_id)]
+    )
+
+
+async def _load_goal(reads: CausalReads, user_id_str: str, goal_id: str) -> Dict[str, Any]:
+    # API 로 생성한 목표는 문자열 _id 로 저장되므로 ObjectId/문자열 _id 를 한 번에 조회
+    id_candidates: List[Any] = [goal_id]
+    if ObjectId.is_valid(goal_id):
+        id_candidates.append(ObjectId(goal_id))
+    async with reads.session() as (db, session):
+        goal_doc = await db.goals.find_one({
+            "_id": {"$in": id_candidates},
+            "user_id": user_id_str
+        }, session=session)
     
     if not goal_doc:
         raise HTTPException(
@@ -169,7 +189,7 @@ async def get_goal(
             detail="목표를 찾을 수 없습니다."
         )
     
-    return Goal(
+    return jsonable_encoder(Goal(
         id=str(goal_doc["_id"]),
         user_id=str(goal_doc["user_id"]),
         title=goal_doc["title"],
@@ -184,46 +204,128 @@ async def get_goal(
         ai_analysis=goal_doc.get("ai_analysis"),
         created_at=goal_doc["created_at"],
         updated_at=goal_doc["updated_at"]
-    )
+    ))
+
+
+@router.get("/{goal_id}/bundle")
+@db_call_budget(6)
+async def get_goal_bundle(
+    goal_id: str,
+    current_user: User = Depends(get_current_user),
+    read_router: ReadRouter = Depends(get_read_router),
+    cache: TwoTierCache = Depends(get_cache),
+    interactions: AIInteractionBuffer = Depends(get_ai_interaction_buffer),
+    fields: str = Query(",".join(BUNDLE_FIELDS), description="쉼표로 구분한 항목 (goal, logs, plan, coaching)"),
+    logs_limit: int = Query(20, ge=1, le=100, description="최신 진도 기록 수"),
+    message_type: str = Query("daily", description="코칭 메시지 타입")
+) -> Dict[str, Any]:
+    """목표, 최신 진도 기록, 최근 실행 계획, 캐시된 코칭 메시지를 한 번에 조회합니다.
+
+    진도 페이지가 목표를 선택할 때 한 번의 요청(인증 1회)으로 그릴 수 있도록 하며,
+    각 항목의 조회는 동시에 실행합니다. 목표는 선택하지 않아도 소유 확인을 위해 조회합니다 (캐시).
+    """
+    requested = {field.strip() for field in fields.split(",") if field.strip()}
+    unknown = requested - set(BUNDLE_FIELDS)
+    if unknown:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"알 수 없는 항목입니다: {', '.join(sorted(unknown))}"
+        )
+    if not ObjectId.is_valid(goal_id):
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="목표를 찾을 수 없습니다."
+        )
+
+    user_id_str = str(current_user.id)
+    reads = read_router.for_user("goals", user_id_str)
+    # 코칭 메시지가 캐시에 없으면 같은 목표 조회 결과를 사용
+    goal_task = asyncio.ensure_future(cache.get_or_set(
+        "goals.detail",
+        f"{user_id_str}:{goal_id}",
+        lambda: _load_goal(reads, user_id_str, goal_id),
+        tags=[goal_tag(goal_id)]
+    ))
+    loaders: Dict[str, Any] = {"goal": goal_task}
+    if "logs" in requested:
+        loaders["logs"] = _load_recent_logs(reads, user_id_str, goal_id, logs_limit)
+    if "plan" in requested:
+        loaders["plan"] = _load_latest_plan(reads, user_id_str, goal_id)
+    if "coaching" in requested:
+        loaders["coaching"] = get_cached_coaching_message(
+            cache, interactions, user_id_str, goal_id, lambda: goal_task, message_type
+        )
+
+    # 모든 조회가 끝난 뒤 오류를 전달 (목표가 없으면 404 가 먼저)
+    results = await asyncio.gather(*loaders.values(), return_exceptions=True)
+    for result in results:
+        if isinstance(result, BaseException):
+            raise result
+    bundle = dict(zip(loaders.keys(), results))
+    return {field: bundle[field] for field in BUNDLE_FIELDS if field in requested}
+
+
+async def _load_recent_logs(
+    reads: CausalReads, user_id_str: str, goal_id: str, limit: int
+) -> List[Dict[str, Any]]:
+    async with reads.session() as (db, session):
+        log_docs = await db.progress_logs.find({
+            "goal_id": goal_id,
+            "user_id": user_id_str
+        }, session=session).sort("created_at", -1).limit(limit).to_list(length=limit)
+    
+    logs = []
+    for log_doc in log_docs:
+        logs.append(ProgressLog(
+            id=str(log_doc["_id"]),
+            user_id=str(log_doc["user_id"]),
+            goal_id=str(log_doc["goal_id"]),
+            log_type=log_doc["log_type"],
+            value=log_doc.get("value"),
+            description=log_doc["description"],
+            mood_score=log_doc.get("mood_score"),
+            created_at=log_doc["created_at"]
+        ))
+    return jsonable_encoder(logs)
+
+
+async def _load_latest_plan(reads: CausalReads, user_id_str: str, goal_id: str) -> Optional[Dict[str, Any]]:
+    async with reads.session() as (db, session):
+        plan_doc = await db.action_plans.find_one(
+            {"goal_id": goal_id, "user_id": user_id_str},
+            sort=[("created_at", -1)],
+            session=session
+        )
+    if not plan_doc:
+        return None
+    plan_doc["id"] = str(plan_doc.pop("_id"))
+    plan_doc["completion_rate"] = plan_completion(plan_doc.get("steps", []))[2]
+    return jsonable_encoder(plan_doc)
 
 
 @router.put("/{goal_id}", response_model=Goal)
+@db_call_budget(5)
 async def update_goal(
     goal_id: str,
     goal_update: GoalUpdate,
     current_user: User = Depends(get_current_user),
-    db: AsyncIOMotorDatabase = Depends(get_database)
+    db: AsyncIOMotorDatabase = Depends(get_database),
+    redis: Optional[Redis] = Depends(get_redis),
+    cache: TwoTierCache = Depends(get_cache)
 ):
     """목표를 수정합니다."""
     print(f"목표 수정 요청 - goal_id: {goal_id}, user_id: {current_user.id}")
     print(f"수정 데이터: {goal_update}")
     
-    # 먼저 목표가 존재하는지 확인
-    goal_with_objectid = await db.goals.find_one({"_id": ObjectId(goal_id)})
-    goal_with_string = await db.goals.find_one({"_id": goal_id})
-    
-    print(f"ObjectId로 검색한 목표: {goal_with_objectid is not None}")
-    print(f"문자열로 검색한 목표: {goal_with_string is not None}")
-    
-    if goal_with_objectid:
-        print(f"ObjectId로 찾은 목표의 user_id: {goal_with_objectid.get('user_id')}, 타입: {type(goal_with_objectid.get('user_id'))}")
-    if goal_with_string:
-        print(f"문자열로 찾은 목표의 user_id: {goal_with_string.get('user_id')}, 타입: {type(goal_with_string.get('user_id'))}")
-    
-    # 기존 목표 확인 - ObjectId 방식 시도
+    # 기존 목표 확인 - ObjectId/문자열 _id 를 한 번에 조회
+    id_candidates: List[Any] = [goal_id]
+    if ObjectId.is_valid(goal_id):
+        id_candidates.append(ObjectId(goal_id))
     existing_goal = await db.goals.find_one({
-        "_id": ObjectId(goal_id),
+        "_id": {"$in": id_candidates},
         "user_id": str(current_user.id)
     })
     
-    # ObjectId 방식으로 찾지 못했다면 문자열 방식 시도
-    if not existing_goal:
-        existing_goal = await db.goals.find_one({
-            "_id": goal_id,
-            "user_id": str(current_user.id)
-        })
-        print(f"문자열 방식으로 찾은 목표: {existing_goal is not None}")
-    
     if not existing_goal:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -232,32 +334,28 @@ async def update_goal(
     
     # 업데이트할 필드만 추출
     update_data = goal_update.dict(exclude_unset=True)
+    goal_doc = existing_goal
     if update_data:
         update_data["updated_at"] = datetime.utcnow()
         
-        # 문자열 _id로 업데이트 시도
-        result = await db.goals.update_one(
-            {"_id": goal_id},
-            {"$set": update_data}
+        # 찾은 문서의 실제 _id 로 수정하고 수정된 문서를 바로 받음
+        goal_doc = await db.goals.find_one_and_update(
+            {"_id": existing_goal["_id"]},
+            {"$set": update_data},
+            return_document=ReturnDocument.AFTER
         )
-        
-        # 문자열 방식으로 업데이트되지 않았다면 ObjectId 방식 시도
-        if result.modified_count == 0:
-            await db.goals.update_one(
-                {"_id": ObjectId(goal_id)},
-                {"$set": update_data}
+        if not goal_doc:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail="목표를 찾을 수 없습니다."
             )
-        
-        print(f"업데이트 결과: {result.modified_count}개 수정됨")
-    
-    # 업데이트된 목표 조회 - 문자열 방식 먼저 시도
-    goal_doc = await db.goals.find_one({"_id": goal_id})
-    
-    # 문자열 방식으로 찾지 못했다면 ObjectId 방식 시도
-    if not goal_doc:
-        goal_doc = await db.goals.find_one({"_id": ObjectId(goal_id)})
-        
-    print(f"업데이트 후 목표 재조회 성공: {goal_doc is not None}")
+        await cache.invalidate(user_tag(str(current_user.id)), goal_tag(str(goal_doc["_id"])))
+
+    # 커뮤니티 텍스트 유사도 인덱스 및 리더보드 갱신
+    if update_data:
+        await index_goal(db, goal_doc)
+    if {"current_value", "target_value", "status", "category"} & update_data.keys():
+        await update_goal_score(redis, goal_doc)
     
     return Goal(
         id=str(goal_doc["_id"]),
@@ -278,10 +376,13 @@ async def update_goal(
 
 
 @router.delete("/{goal_id}")
+@db_call_budget(7)
 async def delete_goal(
     goal_id: str,
     current_user: User = Depends(get_current_user),
-    db: AsyncIOMotorDatabase = Depends(get_database)
+    db: AsyncIOMotorDatabase = Depends(get_database),
+    redis: Optional[Redis] = Depends(get_redis),
+    cache: TwoTierCache = Depends(get_cache)
 ):
     """목표를 삭제합니다."""
     print(f"목표 삭제 요청 - goal_id: {goal_id}, user_id: {current_user.id}")
@@ -321,4 +422,8 @@ async def delete_goal(
             detail="목표를 찾을 수 없습니다."
         )
     
+    await cache.invalidate(user_tag(str(current_user.id)), goal_tag(goal_id))
+    await remove_goal(db, goal_id)
+    await remove_goal_score(redis, goal_id)
+    
     return {"message": "목표가 삭제되었습니다."} 
\ No newline at end of file
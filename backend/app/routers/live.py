@@ -0,0 +1,100 @@
+import asyncio
+import json
+from typing import Optional
+
+from bson import ObjectId
+from fastapi import APIRouter, WebSocket, WebSocketDisconnect, status
+
+from app.core.config import settings
+from app.core.live_updates import LiveUpdateHub, Subscription
+from app.core.security import verify_token
+
+router = APIRouter()
+
+
+async def _authenticate(websocket: WebSocket) -> Optional[str]:
+    """첫 메시지 {"type": "auth", "token": ...} 의 JWT 를 확인하고 사용자 ID 를 반환합니다.
+
+    토큰을 URL 쿼리에 넣으면 접근 로그에 남으므로 연결 후 첫 메시지로 받습니다.
+    """
+    try:
+        raw = await asyncio.wait_for(
+            websocket.receive_text(), timeout=settings.LIVE_UPDATES_AUTH_TIMEOUT_SECONDS
+        )
+        message = json.loads(raw)
+    except (asyncio.TimeoutError, ValueError):
+        return None
+    if not isinstance(message, dict) or message.get("type") != "auth":
+        return None
+    user_id = verify_token(str(message.get("token", "")))
+    if not user_id:
+        return None
+
+    # ObjectId와 문자열 모두 시도하여 사용자 조회 (get_current_user 와 같은 방식)
+    db = websocket.app.state.mongodb
+    user_doc = None
+    if ObjectId.is_valid(user_id):
+        user_doc = await db.users.find_one({"_id": ObjectId(user_id)}, {"_id": 1})
+    if not user_doc:
+        user_doc = await db.users.find_one({"_id": user_id}, {"_id": 1})
+    return str(user_doc["_id"]) if user_doc else None
+
+
+async def _send_updates(websocket: WebSocket, subscription: Subscription) -> None:
+    while True:
+        message = await subscription.queue.get()
+        await websocket.send_text(message)
+
+
+async def _receive(websocket: WebSocket) -> None:
+    """클라이언트 메시지는 연결 유지용 ping 만 처리합니다."""
+    while True:
+        raw = await websocket.receive_text()
+        try:
+            message = json.loads(raw)
+        except ValueError:
+            continue
+        if isinstance(message, dict) and message.get("type") == "ping":
+            await websocket.send_text(json.dumps({"type": "pong"}))
+
+
+@router.websocket("/ws")
+async def live_updates(websocket: WebSocket):
+    """목표/진행 기록의 실시간 변경분을 받는 WebSocket.
+
+    연결 후 첫 메시지로 {"type": "auth", "token": "<JWT>"} 를 보내야 하며,
+    이후 {"type": "insert" | "update" | "replace", "collection", "id", ...} 메시지를 받습니다.
+    {"type": "resync"} 를 받으면 목록을 다시 조회해야 합니다.
+    """
+    hub: LiveUpdateHub = websocket.app.state.live_updates
+    await websocket.accept()
+
+    user_id = await _authenticate(websocket)
+    if not user_id:
+        await websocket.close(code=status.WS_1008_POLICY_VIOLATION)
+        return
+
+    subscription = hub.subscribe(user_id)
+    if subscription is None:
+        # 워커당 연결 수 초과: 클라이언트는 잠시 후 다시 연결 (로드 밸런서가 다른 워커로 보냄)
+        await websocket.close(code=status.WS_1013_TRY_AGAIN_LATER)
+        return
+
+    tasks = []
+    try:
+        await websocket.send_text(json.dumps({"type": "hello", "live": hub.available}))
+        tasks = [
+            asyncio.create_task(_send_updates(websocket, subscription)),
+            asyncio.create_task(_receive(websocket)),
+        ]
+        done, _ = await asyncio.wait(tasks, return_when=asyncio.FIRST_COMPLETED)
+        for task in done:
+            exception = task.exception()
+            if exception is not None and not isinstance(exception, WebSocketDisconnect):
+                raise exception
+    except WebSocketDisconnect:
+        pass
+    finally:
+        for task in tasks:
+            task.cancel()
+        hub.unsubscribe(subscription)
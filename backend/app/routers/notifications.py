@@ -0,0 +1,67 @@
+from fastapi import APIRouter, Depends, Query
+from motor.motor_asyncio import AsyncIOMotorDatabase
+from bson import ObjectId
+from datetime import datetime
+from typing import Any, Dict, List, Annotated, Optional
+
+from app.models.notification import Notification, NotificationReadRequest
+from app.models.user import User
+from app.routers.auth import get_current_user
+from app.core.database import get_database
+from app.core.db_budget import db_call_budget
+
+router = APIRouter()
+
+
+@router.get("/", response_model=List[Notification])
+@db_call_budget(3)
+async def get_notifications(
+    current_user: Annotated[User, Depends(get_current_user)],
+    db: Annotated[AsyncIOMotorDatabase, Depends(get_database)],
+    since: Optional[datetime] = Query(None, description="이 시각 이후에 만들어진 알림만 (마지막으로 받은 created_at)"),
+    unread_only: bool = Query(False, description="읽지 않은 알림만"),
+    limit: int = Query(20, ge=1, le=100)
+):
+    """마감 임박/초과 알림을 최신순으로 조회합니다.
+
+    주기적으로 폴링할 때는 since 에 마지막으로 받은 created_at 을 넣으면
+    (user_id, created_at) 인덱스 범위만 읽으므로 새 알림이 없을 때 비용이 거의 없습니다.
+    """
+    filter_query: Dict[str, Any] = {"user_id": str(current_user.id)}
+    if since:
+        filter_query["created_at"] = {"$gt": since}
+    if unread_only:
+        filter_query["read"] = False
+
+    notifications = []
+    async for doc in db.notifications.find(filter_query).sort("created_at", -1).limit(limit):
+        notifications.append(Notification(
+            id=str(doc["_id"]),
+            user_id=doc["user_id"],
+            goal_id=doc["goal_id"],
+            kind=doc["kind"],
+            title=doc["title"],
+            message=doc["message"],
+            deadline=doc["deadline"],
+            read=doc.get("read", False),
+            created_at=doc["created_at"]
+        ))
+    return notifications
+
+
+@router.post("/read")
+@db_call_budget(3)
+async def mark_notifications_read(
+    request: NotificationReadRequest,
+    current_user: Annotated[User, Depends(get_current_user)],
+    db: Annotated[AsyncIOMotorDatabase, Depends(get_database)]
+):
+    """알림을 읽음으로 표시합니다."""
+    ids = [ObjectId(notification_id) for notification_id in request.ids if ObjectId.is_valid(notification_id)]
+    if not ids:
+        return {"updated": 0}
+    result = await db.notifications.update_many(
+        {"_id": {"$in": ids}, "user_id": str(current_user.id)},
+        {"$set": {"read": True}}
+    )
+    return {"updated": result.modified_count}
@@ -1,31 +1,41 @@
 from fastapi import APIRouter, Depends, HTTPException, status
 from motor.motor_asyncio import AsyncIOMotorDatabase
 from bson import ObjectId
-from typing import List, Annotated
+from typing import Any, List, Annotated, Optional
+from redis.asyncio import Redis
 from datetime import datetime
+from pymongo import ReturnDocument
 
 from app.models.progress import ProgressLogCreate, ProgressLogUpdate, ProgressLog, ProgressLogInDB
 from app.models.user import User
 from app.routers.auth import get_current_user
-from app.core.database import get_database
+from app.core.cache import TwoTierCache, goal_tag, user_tag
+from app.core.database import get_cache, get_database, get_read_router, get_redis
+from app.core.db_budget import db_call_budget
+from app.core.leaderboard import update_goal_score
+from app.core.goal_status import progress_update, record_transition
+from app.core.read_routing import ReadRouter
 
 router = APIRouter()
 
 
 @router.get("/goal/{goal_id}", response_model=List[ProgressLog])
+@db_call_budget(3)
 async def get_progress_logs(
     goal_id: str,
     current_user: Annotated[User, Depends(get_current_user)],
-    db: Annotated[AsyncIOMotorDatabase, Depends(get_database)]
+    read_router: Annotated[ReadRouter, Depends(get_read_router)]
 ):
-    """특정 목표의 진도 기록을 조회합니다."""
-    logs_cursor = db.progress_logs.find({
-        "goal_id": goal_id,
-        "user_id": str(current_user.id)
-    }).sort("created_at", -1)
+    """특정 목표의 진도 기록을 조회합니다 (방금 기록한 진도는 인과적 세션으로 항상 포함)."""
+    reads = read_router.for_user("progress", str(current_user.id))
+    async with reads.session() as (db, session):
+        log_docs = await db.progress_logs.find({
+            "goal_id": goal_id,
+            "user_id": str(current_user.id)
+        }, session=session).sort("created_at", -1).to_list(length=None)
     
     logs = []
-    async for log_doc in logs_cursor:
+    for log_doc in log_docs:
         logs.append(ProgressLog(
             id=str(log_doc["_id"]),
             user_id=str(log_doc["user_id"]),
@@ -41,15 +51,21 @@ async def get_progress_logs(
 
 
 @router.post("/", response_model=ProgressLog)
+@db_call_budget(7)
 async def create_progress_log(
     progress_data: ProgressLogCreate,
     current_user: Annotated[User, Depends(get_current_user)],
-    db: Annotated[AsyncIOMotorDatabase, Depends(get_database)]
+    db: Annotated[AsyncIOMotorDatabase, Depends(get_database)],
+    redis: Annotated[Optional[Redis], Depends(get_redis)],
+    cache: Annotated[TwoTierCache, Depends(get_cache)]
 ):
     """새 진도 기록을 생성합니다."""
-    # 목표 존재 확인
+    # 목표 존재 확인 - API 로 생성한 목표는 문자열 _id 이므로 ObjectId/문자열 _id 를 한 번에 조회
+    id_candidates: List[Any] = [progress_data.goal_id]
+    if ObjectId.is_valid(progress_data.goal_id):
+        id_candidates.append(ObjectId(progress_data.goal_id))
     goal_doc = await db.goals.find_one({
-        "_id": ObjectId(progress_data.goal_id),
+        "_id": {"$in": id_candidates},
         "user_id": str(current_user.id)
     })
     
@@ -69,18 +85,24 @@ async def create_progress_log(
         mood_score=progress_data.mood_score
     )
     
-    result = await db.progress_logs.insert_one(progress_in_db.dict(by_alias=True))
+    log_doc = progress_in_db.dict(by_alias=True)
+    await db.progress_logs.insert_one(log_doc)
     
     # 목표의 current_value 업데이트 (progress 타입인 경우)
+    # 목표치에 도달한 활성 목표는 같은 업데이트에서 completed 로 전환
     if progress_data.log_type == "progress" and progress_data.value is not None:
-        await db.goals.update_one(
-            {"_id": ObjectId(progress_data.goal_id)},
-            {"$set": {"current_value": progress_data.value, "updated_at": datetime.utcnow()}}
+        # 찾은 문서의 실제 _id 로 수정
+        updated_goal = await db.goals.find_one_and_update(
+            {"_id": goal_doc["_id"]},
+            progress_update(progress_data.value, datetime.utcnow()),
+            return_document=ReturnDocument.AFTER
         )
+        await cache.invalidate(user_tag(str(current_user.id)), goal_tag(progress_data.goal_id))
+        if updated_goal:
+            await record_transition(db, goal_doc, updated_goal, source="progress")
+            await update_goal_score(redis, updated_goal)
     
-    # 생성된 기록 조회
-    log_doc = await db.progress_logs.find_one({"_id": result.inserted_id})
-    
+    # 저장한 문서로 응답 (다시 조회하지 않음)
     return ProgressLog(
         id=str(log_doc["_id"]),
         user_id=str(log_doc["user_id"]),
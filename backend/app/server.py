@@ -0,0 +1,98 @@
+"""프로덕션 서버 실행 모듈.
+
+gunicorn 마스터가 uvicorn 워커들을 관리합니다. max_requests 로 종료된 워커는
+gunicorn 이 새로 띄우므로 요청 수 기반 재시작(메모리 누수 완화)이 가능합니다.
+SIGTERM 을 받으면 새 연결을 받지 않고 처리 중인 요청이 끝날 때까지
+SERVER_GRACEFUL_TIMEOUT_SECONDS 동안 기다린 뒤, 각 워커가 main.py 의 lifespan
+종료 단계(버퍼 플러시, MongoDB/Redis 연결 종료)를 실행합니다.
+
+실행:
+    python -m app.server
+"""
+import multiprocessing
+from typing import Any, Dict
+
+from app.core.config import settings
+from app.core.metrics import mark_process_dead
+
+
+def default_worker_count() -> int:
+    return max(1, multiprocessing.cpu_count())
+
+
+def worker_count() -> int:
+    return settings.SERVER_WORKERS or default_worker_count()
+
+
+def child_exit(server, worker) -> None:
+    mark_process_dead(worker.pid)
+
+
+def gunicorn_options() -> Dict[str, Any]:
+    return {
+        "bind": f"{settings.SERVER_HOST}:{settings.SERVER_PORT}",
+        "workers": worker_count(),
+        "worker_class": "app.server.GoalMasterUvicornWorker",
+        "keepalive": settings.SERVER_KEEPALIVE_SECONDS,
+        "backlog": settings.SERVER_BACKLOG,
+        "max_requests": settings.SERVER_MAX_REQUESTS,
+        "max_requests_jitter": settings.SERVER_MAX_REQUESTS_JITTER,
+        "graceful_timeout": settings.SERVER_GRACEFUL_TIMEOUT_SECONDS,
+        "timeout": settings.SERVER_WORKER_TIMEOUT_SECONDS,
+        "accesslog": "-" if settings.SERVER_ACCESS_LOG else None,
+        "errorlog": "-",
+        "child_exit": child_exit,
+    }
+
+
+try:
+    from gunicorn.app.base import BaseApplication
+    from uvicorn.workers import UvicornWorker
+
+    class GoalMasterUvicornWorker(UvicornWorker):
+        CONFIG_KWARGS = {
+            "loop": settings.SERVER_LOOP,
+            "http": settings.SERVER_HTTP,
+            "timeout_graceful_shutdown": settings.SERVER_GRACEFUL_TIMEOUT_SECONDS,
+        }
+
+    class GoalMasterApplication(BaseApplication):
+        def __init__(self, options: Dict[str, Any]):
+            self.options = options
+            super().__init__()
+
+        def load_config(self) -> None:
+            for key, value in self.options.items():
+                if key in self.cfg.settings and value is not None:
+                    self.cfg.set(key, value)
+
+        def load(self):
+            from main import app
+            return app
+
+except ImportError:  # gunicorn 은 POSIX 전용 (Windows 로컬 실행 시 단일 프로세스로 대체)
+    BaseApplication = None
+
+
+def run() -> None:
+    if BaseApplication is None:
+        import uvicorn
+
+        print("gunicorn 을 사용할 수 없어 단일 uvicorn 프로세스로 실행합니다.")
+        uvicorn.run(
+            "main:app",
+            host=settings.SERVER_HOST,
+            port=settings.SERVER_PORT,
+            loop=settings.SERVER_LOOP,
+            http=settings.SERVER_HTTP,
+            timeout_keep_alive=settings.SERVER_KEEPALIVE_SECONDS,
+            backlog=settings.SERVER_BACKLOG,
+            timeout_graceful_shutdown=settings.SERVER_GRACEFUL_TIMEOUT_SECONDS,
+        )
+        return
+
+    GoalMasterApplication(gunicorn_options()).run()
+
+
+if __name__ == "__main__":
+    run()
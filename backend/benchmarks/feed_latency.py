@@ -0,0 +1,120 @@
+"""커뮤니티 피드 조회 지연 시간 벤치마크 (하루 10k 게시글 기준).
+
+로컬 mongod 와 Redis 가 필요하며 별도의 벤치마크 데이터베이스를 사용합니다.
+
+실행 예:
+    python -m benchmarks.feed_latency --mongodb-url mongodb://localhost:27017 --redis-url redis://localhost:6379/15
+"""
+import argparse
+import asyncio
+import json
+import random
+import statistics
+import time
+from datetime import datetime, timedelta
+from typing import Callable, Dict, List
+
+import motor.motor_asyncio
+import redis.asyncio as aioredis
+from bson import ObjectId
+
+from app.core.community_feed import get_feed_page
+from app.core.indexes import sync_indexes
+
+CATEGORIES = ["health", "education", "career", "personal", "finance"]
+
+
+async def seed_posts(db, count: int, seed: int) -> None:
+    rng = random.Random(seed)
+    day_start = datetime.utcnow().replace(microsecond=0) - timedelta(days=1)
+    docs = []
+    for _ in range(count):
+        created_at = day_start + timedelta(milliseconds=rng.randrange(24 * 60 * 60 * 1000))
+        docs.append({
+            "_id": str(ObjectId()),
+            "user_id": str(ObjectId()),
+            "author": f"사용자{rng.randrange(1000)}",
+            "title": "오늘의 목표 달성 기록",
+            "content": "꾸준히 기록하니 목표가 점점 가까워지고 있어요!" * rng.randint(1, 4),
+            "category": rng.choice(CATEGORIES),
+            "created_at": created_at,
+        })
+    await db.community_posts.delete_many({})
+    for start in range(0, len(docs), 1000):
+        await db.community_posts.insert_many(docs[start:start + 1000], ordered=False)
+    await sync_indexes(db, collections=["community_posts"])
+
+
+async def measure(label: str, iterations: int, call: Callable) -> Dict[str, float]:
+    latencies: List[float] = []
+    for _ in range(iterations):
+        started = time.perf_counter()
+        await call()
+        latencies.append((time.perf_counter() - started) * 1000)
+    latencies.sort()
+    return {
+        "scenario": label,
+        "p50_ms": round(statistics.median(latencies), 3),
+        "p95_ms": round(latencies[int(len(latencies) * 0.95) - 1], 3),
+        "p99_ms": round(latencies[int(len(latencies) * 0.99) - 1], 3),
+    }
+
+
+async def run(args) -> List[Dict[str, float]]:
+    client = motor.motor_asyncio.AsyncIOMotorClient(args.mongodb_url)
+    db = client[args.database]
+    redis = aioredis.from_url(args.redis_url, decode_responses=True)
+    try:
+        await seed_posts(db, args.posts, args.seed)
+        results = []
+
+        async def cold_first_page():
+            await redis.flushdb()
+            await get_feed_page(db, None, category="health", limit=args.limit)
+
+        async def hot_first_page():
+            await get_feed_page(db, redis, category="health", limit=args.limit)
+
+        async def hot_second_page():
+            page = await get_feed_page(db, redis, category="health", limit=args.limit)
+            await get_feed_page(db, redis, category="health", cursor=page.next_cursor, limit=args.limit)
+
+        deep = await get_feed_page(db, None, category=None, limit=args.posts // 2)
+
+        async def deep_cursor_page():
+            await get_feed_page(db, redis, category=None, cursor=deep.next_cursor, limit=args.limit)
+
+        results.append(await measure("mongo_first_page", args.iterations, cold_first_page))
+        await get_feed_page(db, redis, category="health", limit=args.limit)  # 캐시 적재
+        results.append(await measure("redis_first_page", args.iterations, hot_first_page))
+        results.append(await measure("redis_first_two_pages", args.iterations, hot_second_page))
+        results.append(await measure("mongo_deep_cursor_page", args.iterations, deep_cursor_page))
+        return results
+    finally:
+        await client.drop_database(args.database)
+        await redis.flushdb()
+        await redis.aclose()
+        client.close()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="커뮤니티 피드 조회 지연 시간 벤치마크")
+    parser.add_argument("--mongodb-url", default="mongodb://localhost:27017")
+    parser.add_argument("--redis-url", default="redis://localhost:6379/15")
+    parser.add_argument("--database", default="goalmaster_bench_feed")
+    parser.add_argument("--posts", type=int, default=10_000)
+    parser.add_argument("--limit", type=int, default=20)
+    parser.add_argument("--iterations", type=int, default=200)
+    parser.add_argument("--seed", type=int, default=7)
+    parser.add_argument("--output", help="결과를 저장할 JSON 파일 경로")
+    args = parser.parse_args()
+
+    results = asyncio.run(run(args))
+    print(json.dumps(results, ensure_ascii=False, indent=2))
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            json.dump(results, f, ensure_ascii=False, indent=2)
+
+
+if __name__ == "__main__":
+    main()
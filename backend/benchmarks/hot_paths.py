@@ -0,0 +1,217 @@
+"""요청마다 실행되는 백엔드 기본 연산의 마이크로 벤치마크.
+
+PyObjectId 검증, JWT 발급/검증, Goal/ProgressLog 모델 생성, 프롬프트 렌더링,
+fallback 분석 생성을 DB/네트워크 없이 측정합니다. 각 항목은 호출당 시간(µs)의 절대 예산이 있고,
+결과를 JSONL 이력 파일에 추가하고, 최근 실행들의 중앙값보다 --max-regression 이상 느려지면 회귀로 판단합니다.
+예산 초과나 회귀가 있으면 종료 코드 1 로 끝나므로 CI 에서 회귀 검사로 사용할 수 있습니다.
+
+실행 예:
+    python -m benchmarks.hot_paths
+    python -m benchmarks.hot_paths --only jwt --history results/hot_paths.jsonl --max-regression 0.3
+"""
+import argparse
+import json
+import os
+import subprocess
+import sys
+import time
+from datetime import datetime, timedelta
+from typing import Any, Callable, Dict, List, NamedTuple, Optional
+
+from bson import ObjectId
+from pydantic import TypeAdapter
+
+from app.core.ai_fallback import fallback_analysis
+from app.core.prompts import render_prompt
+from app.core.security import create_access_token, verify_token
+from app.models.goal import Goal
+from app.models.progress import ProgressLog
+from app.models.user import PyObjectId
+
+
+class Case(NamedTuple):
+    name: str
+    func: Callable[[], Any]
+    budget_us: float  # 호출당 허용 시간 (일반 개발용 노트북 기준의 넉넉한 상한)
+
+
+def build_cases() -> List[Case]:
+    now = datetime.utcnow()
+    user_id = str(ObjectId())
+    goal_doc = {
+        "_id": ObjectId(),
+        "user_id": user_id,
+        "title": "올해 책 24권 읽기",
+        "description": "자기계발을 위해 한 달에 두 권씩 읽습니다",
+        "category": "education",
+        "target_value": 24.0,
+        "current_value": 9.0,
+        "unit": "권",
+        "deadline": now + timedelta(days=120),
+        "priority": "high",
+        "status": "active",
+        "ai_analysis": None,
+        "created_at": now,
+        "updated_at": now,
+    }
+    log_doc = {
+        "_id": ObjectId(),
+        "user_id": user_id,
+        "goal_id": str(goal_doc["_id"]),
+        "log_type": "progress",
+        "value": 9.0,
+        "description": "오늘도 계획대로 읽었습니다.",
+        "mood_score": 8,
+        "created_at": now,
+    }
+    analysis_params = {
+        key: goal_doc[key]
+        for key in ("title", "description", "category", "target_value", "current_value", "unit", "deadline", "priority")
+    }
+    coaching_params = {
+        "message_type": "daily",
+        "title": goal_doc["title"],
+        "progress_rate": goal_doc["current_value"] / goal_doc["target_value"] * 100,
+        "current_value": goal_doc["current_value"],
+        "target_value": goal_doc["target_value"],
+        "unit": goal_doc["unit"],
+        "deadline": goal_doc["deadline"],
+    }
+    object_id_adapter = TypeAdapter(PyObjectId)
+    object_id_str = str(ObjectId())
+    token = create_access_token(subject=user_id)
+
+    def goal_model() -> Goal:
+        return Goal(
+            id=str(goal_doc["_id"]),
+            user_id=str(goal_doc["user_id"]),
+            title=goal_doc["title"],
+            description=goal_doc["description"],
+            category=goal_doc["category"],
+            target_value=goal_doc["target_value"],
+            current_value=goal_doc["current_value"],
+            unit=goal_doc["unit"],
+            deadline=goal_doc["deadline"],
+            priority=goal_doc["priority"],
+            status=goal_doc["status"],
+            ai_analysis=goal_doc.get("ai_analysis"),
+            created_at=goal_doc["created_at"],
+            updated_at=goal_doc["updated_at"]
+        )
+
+    def progress_log_model() -> ProgressLog:
+        return ProgressLog(
+            id=str(log_doc["_id"]),
+            user_id=str(log_doc["user_id"]),
+            goal_id=str(log_doc["goal_id"]),
+            log_type=log_doc["log_type"],
+            value=log_doc.get("value"),
+            description=log_doc["description"],
+            mood_score=log_doc.get("mood_score"),
+            created_at=log_doc["created_at"]
+        )
+
+    return [
+        Case("objectid.validate", lambda: object_id_adapter.validate_python(object_id_str), 10.0),
+        Case("jwt.create_access_token", lambda: create_access_token(subject=user_id), 100.0),
+        Case("jwt.verify_token", lambda: verify_token(token), 150.0),
+        Case("model.goal", goal_model, 25.0),
+        Case("model.progress_log", progress_log_model, 20.0),
+        Case("prompt.analysis", lambda: render_prompt("analysis.v1", analysis_params), 20.0),
+        Case("prompt.coaching", lambda: render_prompt("coaching.v1", coaching_params), 20.0),
+        Case("fallback.analysis", lambda: fallback_analysis(goal_doc), 15.0),
+    ]
+
+
+def measure(func: Callable[[], Any], min_seconds: float, repeat: int) -> Dict[str, float]:
+    """호출 횟수를 min_seconds 이상 걸리도록 늘린 뒤 repeat 번 반복해 호출당 최소/중앙값을 구합니다."""
+    loops = 1
+    while True:
+        started = time.perf_counter()
+        for _ in range(loops):
+            func()
+        if time.perf_counter() - started >= min_seconds:
+            break
+        loops *= 2
+
+    samples = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        for _ in range(loops):
+            func()
+        samples.append((time.perf_counter() - started) / loops * 1_000_000)
+    samples.sort()
+    return {"loops": loops, "best_us": round(samples[0], 3), "median_us": round(samples[len(samples) // 2], 3)}
+
+
+def git_commit() -> Optional[str]:
+    try:
+        return subprocess.check_output(["git", "rev-parse", "--short", "HEAD"], text=True).strip()
+    except Exception:
+        return None
+
+
+def baseline(history_path: str, runs: int) -> Dict[str, float]:
+    """최근 runs 번 실행의 항목별 best_us 중앙값 (한 번의 튀는 측정에 흔들리지 않도록)."""
+    if not os.path.exists(history_path):
+        return {}
+    with open(history_path, encoding="utf-8") as f:
+        history = [json.loads(line) for line in f if line.strip()][-runs:]
+    samples: Dict[str, List[float]] = {}
+    for run in history:
+        for name, result in run["results"].items():
+            samples.setdefault(name, []).append(result["best_us"])
+    return {name: sorted(values)[len(values) // 2] for name, values in samples.items()}
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="백엔드 기본 연산 마이크로 벤치마크")
+    parser.add_argument("--only", help="이름에 이 문자열이 포함된 항목만 실행")
+    parser.add_argument("--min-seconds", type=float, default=0.2, help="반복 한 번의 최소 측정 시간")
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--history", default="results/hot_paths.jsonl", help="실행 결과를 누적하는 JSONL 파일")
+    parser.add_argument("--max-regression", type=float, default=0.25, help="기준값 대비 허용 증가율")
+    parser.add_argument("--baseline-runs", type=int, default=5, help="기준값을 계산할 최근 실행 수")
+    parser.add_argument("--no-record", action="store_true", help="이력 파일에 결과를 추가하지 않음")
+    args = parser.parse_args()
+
+    cases = [case for case in build_cases() if not args.only or args.only in case.name]
+    previous = baseline(args.history, args.baseline_runs)
+
+    results: Dict[str, Dict[str, float]] = {}
+    failures = []
+    for case in cases:
+        result = measure(case.func, args.min_seconds, args.repeat)
+        result["budget_us"] = case.budget_us
+        results[case.name] = result
+
+        line = f"{case.name:<26} {result['best_us']:>10.3f}µs (중앙값 {result['median_us']:.3f}µs, 예산 {case.budget_us}µs)"
+        before = previous.get(case.name)
+        if before:
+            change = (result["best_us"] - before) / before
+            line += f"  기준 {before:.3f}µs ({change:+.1%})"
+            if change > args.max_regression:
+                failures.append(f"{case.name}: 기준값 대비 {change:+.1%}")
+        if result["best_us"] > case.budget_us:
+            failures.append(f"{case.name}: {result['best_us']:.3f}µs > 예산 {case.budget_us}µs")
+        print(line)
+
+    if not args.no_record:
+        os.makedirs(os.path.dirname(os.path.abspath(args.history)), exist_ok=True)
+        with open(args.history, "a", encoding="utf-8") as f:
+            f.write(json.dumps({
+                "commit": git_commit(),
+                "timestamp": datetime.utcnow().isoformat(),
+                "python": sys.version.split()[0],
+                "results": results,
+            }, ensure_ascii=False) + "\n")
+
+    if failures:
+        print("\n회귀 또는 예산 초과:")
+        for failure in failures:
+            print(f"  {failure}")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
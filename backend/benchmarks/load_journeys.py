@@ -0,0 +1,304 @@
+"""사용자 여정 기반 종단 간 부하 벤치마크.
+
+FastAPI 앱과 LLM 스텁 서버를 같은 프로세스에서 uvicorn 으로 띄우고, 로컬 mongod/Redis 에
+기존 사용자 데이터를 채운 뒤 동시 HTTP 클라이언트로 다음 여정을 반복합니다.
+
+    회원가입 → 로그인 → 목표 생성 → 진도 기록 → ProgressPage 조회(목표 목록/목표 번들) → AI 분석
+
+라우트별 처리량과 p50/p95/p99, 읽기 캐시 적중률을 출력하고 JSON 으로 저장하며, --compare 로
+이전 커밋의 결과와 비교할 수 있습니다. 별도의 벤치마크 데이터베이스를 사용하고 종료 시 삭제합니다.
+
+실행 예:
+    python -m benchmarks.load_journeys --users 200 --concurrency 32 --output results/load.json
+    python -m benchmarks.load_journeys --compare results/load.json
+"""
+import argparse
+import asyncio
+import contextlib
+import json
+import math
+import os
+import random
+import subprocess
+import sys
+import time
+import uuid
+from collections import defaultdict
+from datetime import datetime, timedelta
+from typing import Any, Dict, List, Optional
+
+import httpx
+
+CATEGORIES = ["health", "education", "career", "personal", "finance"]
+GOAL_TEMPLATES = [
+    ("매일 30분 달리기", "체력을 기르기 위해 매일 달리기를 합니다", "health", 30, "일"),
+    ("책 12권 읽기", "자기계발을 위해 한 달에 한 권씩 읽습니다", "education", 12, "권"),
+    ("토익 900점 달성", "영어 실력을 키워 토익 점수를 올립니다", "career", 900, "점"),
+    ("명상 100일 연속", "마음의 안정을 위해 아침마다 명상을 합니다", "personal", 100, "일"),
+    ("비상금 300만원 모으기", "매달 자동이체로 비상금을 저축합니다", "finance", 300, "만원"),
+]
+
+
+def configure_environment(args) -> None:
+    """앱 설정은 임포트 시점에 읽히므로 main 을 임포트하기 전에 환경 변수를 지정합니다."""
+    os.environ.update({
+        "MONGODB_URL": args.mongodb_url,
+        "MONGODB_DATABASE": args.database,
+        "REDIS_URL": args.redis_url,
+        "LLM_PROVIDER": "stub",
+        "LLM_STUB_URL": f"http://127.0.0.1:{args.stub_port}/v1",
+        "DEBUG": "false",
+    })
+
+
+def percentile(sorted_values: List[float], ratio: float) -> float:
+    if not sorted_values:
+        return 0.0
+    return sorted_values[max(math.ceil(len(sorted_values) * ratio) - 1, 0)]
+
+
+class RouteStats:
+    def __init__(self):
+        self.latencies: Dict[str, List[float]] = defaultdict(list)
+        self.errors: Dict[str, int] = defaultdict(int)
+        # 라우트별 실패 응답 코드 (연결 오류는 "error") - 조회 버그 등으로 인한 실패를 바로 구분
+        self.error_statuses: Dict[str, Dict[str, int]] = defaultdict(lambda: defaultdict(int))
+
+    def record(self, route: str, latency_ms: float, ok: bool, status: str = "") -> None:
+        self.latencies[route].append(latency_ms)
+        if not ok:
+            self.errors[route] += 1
+            self.error_statuses[route][status] += 1
+
+    def summary(self, elapsed: float) -> Dict[str, Dict[str, float]]:
+        routes = {}
+        for route, values in sorted(self.latencies.items()):
+            values = sorted(values)
+            routes[route] = {
+                "requests": len(values),
+                "errors": self.errors.get(route, 0),
+                "error_statuses": dict(self.error_statuses.get(route, {})),
+                "rps": round(len(values) / elapsed, 2),
+                "p50_ms": round(percentile(values, 0.50), 3),
+                "p95_ms": round(percentile(values, 0.95), 3),
+                "p99_ms": round(percentile(values, 0.99), 3),
+            }
+        return routes
+
+
+class JourneyClient:
+    """라우트 템플릿 이름으로 지연 시간을 기록하는 HTTP 클라이언트."""
+
+    def __init__(self, http: httpx.AsyncClient, stats: RouteStats):
+        self.http = http
+        self.stats = stats
+        self.headers: Dict[str, str] = {}
+
+    async def call(self, method: str, route: str, path: str, **kwargs) -> Optional[Any]:
+        started = time.perf_counter()
+        try:
+            response = await self.http.request(method, path, headers=self.headers, **kwargs)
+            ok, status = response.status_code < 400, str(response.status_code)
+        except httpx.HTTPError:
+            response, ok, status = None, False, "error"
+        self.stats.record(f"{method} {route}", (time.perf_counter() - started) * 1000, ok, status)
+        return response.json() if ok else None
+
+
+async def run_journey(client: JourneyClient, run_id: str, index: int, args, rng: random.Random) -> None:
+    email = f"load-{run_id}-{index}@bench.goalmaster.dev"
+    password = "benchmark-password"
+    registered = await client.call("POST", "/api/auth/register", "/api/auth/register", json={
+        "email": email, "password": password, "profile": {"name": f"부하테스트{index}"}
+    })
+    if registered is None:
+        return
+    login = await client.call("POST", "/api/auth/login", "/api/auth/login", json={"email": email, "password": password})
+    if login is None:
+        return
+    client.headers = {"Authorization": f"Bearer {login['access_token']}"}
+
+    goal_ids = []
+    for title, description, category, target, unit in rng.sample(GOAL_TEMPLATES, args.goals_per_user):
+        goal = await client.call("POST", "/api/goals/", "/api/goals/", json={
+            "title": title, "description": description, "category": category,
+            "target_value": target, "current_value": 0, "unit": unit,
+            "deadline": (datetime.utcnow() + timedelta(days=rng.randint(30, 180))).isoformat(),
+            "priority": rng.choice(["high", "medium", "low"]),
+        })
+        if goal is not None:
+            goal_ids.append(goal["id"])
+
+    for goal_id in goal_ids:
+        for _ in range(args.logs_per_goal):
+            await client.call("POST", "/api/progress/", "/api/progress/", json={
+                "goal_id": goal_id, "log_type": "progress", "value": rng.randint(1, 3),
+                "description": "오늘도 계획대로 진행했습니다.", "mood_score": rng.randint(4, 9),
+            })
+
+    # ProgressPage 조회: 목표 목록, 선택한 목표의 진도 기록과 코칭 메시지 (목표 번들 한 번)
+    for goal_id in goal_ids:
+        await client.call("GET", "/api/goals/", "/api/goals/")
+        await client.call(
+            "GET", "/api/goals/{goal_id}/bundle", f"/api/goals/{goal_id}/bundle",
+            params={"fields": "logs,coaching", "logs_limit": 100, "message_type": "daily"}
+        )
+
+    if goal_ids:
+        await client.call("POST", "/api/ai/analyze-goal", "/api/ai/analyze-goal", params={"goal_id": goal_ids[0]})
+
+
+async def seed_background(db, users: int, seed: int) -> None:
+    """부하 중 컬렉션 크기가 현실적이도록 합성 데이터 생성기로 기존 사용자 데이터를 채웁니다."""
+    from app.core.security import get_password_hash
+    from scripts.generate_data import generate_shard
+
+    password_hash = get_password_hash("seed-password")
+    anchor = datetime.utcnow().replace(hour=0, minute=0, second=0, microsecond=0)
+    for shard, first_user in enumerate(range(0, users, 1000)):
+        docs = generate_shard(shard, first_user, min(1000, users - first_user), seed, anchor, password_hash)
+        for collection, items in docs.items():
+            for start in range(0, len(items), 5000):
+                await db[collection].insert_many(items[start:start + 5000], ordered=False)
+
+
+async def start_server(app, port: int):
+    import uvicorn
+
+    server = uvicorn.Server(uvicorn.Config(app, host="127.0.0.1", port=port, log_level="warning", lifespan="on"))
+    task = asyncio.create_task(server.serve())
+    while not server.started:
+        if task.done():
+            task.result()
+        await asyncio.sleep(0.05)
+    return server, task
+
+
+async def stop_server(server, task) -> None:
+    server.should_exit = True
+    await task
+
+
+def git_commit() -> Optional[str]:
+    try:
+        return subprocess.check_output(["git", "rev-parse", "--short", "HEAD"], text=True).strip()
+    except Exception:
+        return None
+
+
+async def run(args) -> Dict[str, Any]:
+    configure_environment(args)
+    import motor.motor_asyncio
+    import redis.asyncio as aioredis
+
+    from main import app
+    from scripts.llm_stub_server import StubConfig, create_app
+
+    mongo = motor.motor_asyncio.AsyncIOMotorClient(args.mongodb_url)
+    db = mongo[args.database]
+    redis = aioredis.from_url(args.redis_url)
+    await mongo.drop_database(args.database)
+    await redis.flushdb()
+
+    stub_server = api_server = None
+    try:
+        await seed_background(db, args.seed_users, args.seed)
+        stub_server = await start_server(create_app(StubConfig(latency=args.llm_latency, seed=args.seed)), args.stub_port)
+        api_server = await start_server(app, args.port)
+
+        stats = RouteStats()
+        run_id = uuid.uuid4().hex[:8]
+        semaphore = asyncio.Semaphore(args.concurrency)
+        limits = httpx.Limits(max_connections=args.concurrency, max_keepalive_connections=args.concurrency)
+
+        async with httpx.AsyncClient(base_url=f"http://127.0.0.1:{args.port}", limits=limits, timeout=60.0) as http:
+            async def journey(index: int) -> None:
+                async with semaphore:
+                    await run_journey(JourneyClient(http, stats), run_id, index, args, random.Random(args.seed + index))
+
+            # 앱 로그가 측정 결과 출력과 섞이지 않도록 실행 중에는 표준 출력을 버림
+            with open(os.devnull, "w") as devnull, contextlib.redirect_stdout(devnull):
+                started = time.perf_counter()
+                await asyncio.gather(*(journey(index) for index in range(args.users)))
+                elapsed = time.perf_counter() - started
+
+        routes = stats.summary(elapsed)
+        total_requests = sum(route["requests"] for route in routes.values())
+        return {
+            "meta": {
+                "commit": git_commit(),
+                "timestamp": datetime.utcnow().isoformat(),
+                "users": args.users,
+                "concurrency": args.concurrency,
+                "goals_per_user": args.goals_per_user,
+                "logs_per_goal": args.logs_per_goal,
+                "seed_users": args.seed_users,
+                "llm_latency": args.llm_latency,
+            },
+            "total": {
+                "requests": total_requests,
+                "errors": sum(route["errors"] for route in routes.values()),
+                "elapsed_seconds": round(elapsed, 3),
+                "rps": round(total_requests / elapsed, 2),
+            },
+            "routes": routes,
+            "cache": app.state.cache.snapshot(),
+        }
+    finally:
+        if api_server is not None:
+            await stop_server(*api_server)
+        if stub_server is not None:
+            await stop_server(*stub_server)
+        await mongo.drop_database(args.database)
+        await redis.flushdb()
+        await redis.aclose()
+        mongo.close()
+
+
+def compare(current: Dict[str, Any], baseline: Dict[str, Any]) -> None:
+    print(f"\n기준 커밋 {baseline['meta'].get('commit')} 대비 (p95, rps)")
+    for route, stats in current["routes"].items():
+        base = baseline["routes"].get(route)
+        if base is None:
+            print(f"  {route}: 새 라우트")
+            continue
+        p95_change = (stats["p95_ms"] - base["p95_ms"]) / base["p95_ms"] * 100 if base["p95_ms"] else 0.0
+        rps_change = (stats["rps"] - base["rps"]) / base["rps"] * 100 if base["rps"] else 0.0
+        print(f"  {route}: p95 {base['p95_ms']} → {stats['p95_ms']}ms ({p95_change:+.1f}%), rps {rps_change:+.1f}%")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="사용자 여정 기반 종단 간 부하 벤치마크")
+    parser.add_argument("--mongodb-url", default="mongodb://localhost:27017")
+    parser.add_argument("--redis-url", default="redis://localhost:6379/15")
+    parser.add_argument("--database", default="goalmaster_bench_load")
+    parser.add_argument("--port", type=int, default=8766)
+    parser.add_argument("--stub-port", type=int, default=8101)
+    parser.add_argument("--users", type=int, default=100, help="실행할 여정(신규 사용자) 수")
+    parser.add_argument("--concurrency", type=int, default=16)
+    parser.add_argument("--goals-per-user", type=int, default=3)
+    parser.add_argument("--logs-per-goal", type=int, default=5)
+    parser.add_argument("--seed-users", type=int, default=1000, help="미리 채워 둘 기존 사용자 수")
+    parser.add_argument("--llm-latency", default="lognormal:300,0.4")
+    parser.add_argument("--seed", type=int, default=7)
+    parser.add_argument("--output", help="결과를 저장할 JSON 파일 경로")
+    parser.add_argument("--compare", help="비교할 이전 결과 JSON 파일 경로")
+    args = parser.parse_args()
+    if not 1 <= args.goals_per_user <= len(GOAL_TEMPLATES):
+        parser.error(f"--goals-per-user 는 1~{len(GOAL_TEMPLATES)} 사이여야 합니다")
+
+    result = asyncio.run(run(args))
+    print(json.dumps(result, ensure_ascii=False, indent=2))
+    if args.output:
+        os.makedirs(os.path.dirname(os.path.abspath(args.output)), exist_ok=True)
+        with open(args.output, "w", encoding="utf-8") as f:
+            json.dump(result, f, ensure_ascii=False, indent=2)
+    if args.compare:
+        with open(args.compare, encoding="utf-8") as f:
+            compare(result, json.load(f))
+    if result["total"]["errors"]:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,116 @@
+"""Prometheus 지표 기록이 요청당 추가하는 시간을 측정합니다.
+
+같은 라우트 구성의 FastAPI 앱을 미들웨어 유무로 나누어 ASGI 로 직접 호출하고,
+요청마다 MongoDB 명령 이벤트(started/succeeded) 처리 비용을 더해 예산과 비교합니다.
+예산을 넘으면 종료 코드 1 로 끝나므로 CI 에서 회귀 검사로 사용할 수 있습니다.
+
+실행 예:
+    python -m benchmarks.metrics_overhead --requests 20000 --mongo-commands 3 --budget-us 100
+"""
+import argparse
+import asyncio
+import json
+import sys
+import time
+from types import SimpleNamespace
+from typing import Dict
+
+from fastapi import FastAPI
+
+from app.core.metrics import MongoCommandMetrics, PrometheusMiddleware
+
+
+def build_app(with_metrics: bool) -> FastAPI:
+    app = FastAPI()
+
+    @app.get("/api/goals/{goal_id}")
+    async def get_goal(goal_id: str):
+        return {"id": goal_id}
+
+    @app.get("/health")
+    async def health():
+        return {"status": "healthy"}
+
+    if with_metrics:
+        app.add_middleware(PrometheusMiddleware)
+    return app
+
+
+async def call(app: FastAPI, path: str) -> None:
+    scope = {
+        "type": "http", "asgi": {"version": "3.0"}, "http_version": "1.1",
+        "method": "GET", "scheme": "http", "path": path, "raw_path": path.encode(),
+        "root_path": "", "query_string": b"", "headers": [],
+        "client": ("127.0.0.1", 1), "server": ("testserver", 80),
+    }
+
+    async def receive():
+        return {"type": "http.request", "body": b"", "more_body": False}
+
+    async def send(message):
+        pass
+
+    await app(scope, receive, send)
+
+
+async def time_requests(app: FastAPI, count: int) -> float:
+    # 라우팅 캐시/지표 라벨 생성을 위한 워밍업
+    for index in range(200):
+        await call(app, f"/api/goals/{index}")
+    started = time.perf_counter()
+    for index in range(count):
+        await call(app, f"/api/goals/{index}" if index % 2 else "/health")
+    return (time.perf_counter() - started) / count * 1_000_000
+
+
+def time_mongo_events(count: int) -> float:
+    listener = MongoCommandMetrics()
+    connection_id = ("localhost", 27017)
+    started_event = SimpleNamespace(
+        connection_id=connection_id, request_id=0, command_name="find", command={"find": "goals"}
+    )
+    finished_event = SimpleNamespace(connection_id=connection_id, request_id=0, duration_micros=800)
+    started = time.perf_counter()
+    for request_id in range(count):
+        started_event.request_id = finished_event.request_id = request_id
+        listener.started(started_event)
+        listener.succeeded(finished_event)
+    return (time.perf_counter() - started) / count * 1_000_000
+
+
+def run(args) -> Dict[str, float]:
+    baseline_us = asyncio.run(time_requests(build_app(False), args.requests))
+    instrumented_us = asyncio.run(time_requests(build_app(True), args.requests))
+    mongo_event_us = time_mongo_events(args.requests)
+
+    overhead_us = max(instrumented_us - baseline_us, 0.0) + mongo_event_us * args.mongo_commands
+    return {
+        "baseline_us_per_request": round(baseline_us, 2),
+        "instrumented_us_per_request": round(instrumented_us, 2),
+        "mongo_event_us_per_command": round(mongo_event_us, 2),
+        "mongo_commands_per_request": args.mongo_commands,
+        "overhead_us_per_request": round(overhead_us, 2),
+        "budget_us_per_request": args.budget_us,
+        "within_budget": overhead_us <= args.budget_us,
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Prometheus 지표 기록 오버헤드 벤치마크")
+    parser.add_argument("--requests", type=int, default=20_000)
+    parser.add_argument("--mongo-commands", type=int, default=3, help="요청당 MongoDB 명령 수 가정")
+    parser.add_argument("--budget-us", type=float, default=100.0, help="요청당 허용 오버헤드 (마이크로초)")
+    parser.add_argument("--output", help="결과를 저장할 JSON 파일 경로")
+    args = parser.parse_args()
+
+    result = run(args)
+    print(json.dumps(result, ensure_ascii=False, indent=2))
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            json.dump(result, f, ensure_ascii=False, indent=2)
+    if not result["within_budget"]:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
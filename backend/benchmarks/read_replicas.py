@@ -0,0 +1,244 @@
+"""세컨더리 읽기 라우팅(READ_PREFERENCES)이 프라이머리 읽기 부하를 얼마나 줄이는지 측정합니다.
+
+로컬 3멤버 레플리카 셋에 합성 데이터를 넣고, 같은 부하(목표 목록/번들, 진도 기록, 커뮤니티 매칭/피드 조회와
+진도 기록 쓰기)를 READ_ROUTING_ENABLED=false(모두 프라이머리) 와 true 로 서버를 띄워 각각 실행합니다.
+멤버마다 `top` 명령의 벤치마크 데이터베이스 네임스페이스 읽기 횟수(queries + getmore + commands) 증가량으로
+멤버별 부하를 비교하므로 복제(oplog) 읽기는 포함되지 않습니다.
+진도를 기록한 직후 같은 사용자가 진도 기록을 조회해 방금 쓴 기록이 보이는지(read-your-writes)도 확인합니다.
+
+읽기 캐시가 DB 읽기를 가리지 않도록 서버는 CACHE_ENABLED=false 로 실행하며, Redis 가 필요합니다.
+
+로컬 3멤버 레플리카 셋 준비 예:
+    for i in 0 1 2; do
+        mkdir -p /tmp/rs/$i
+        mongod --replSet bench --port 2702$i --dbpath /tmp/rs/$i --bind_ip 127.0.0.1 --fork --logpath /tmp/rs/$i.log
+    done
+    mongosh --port 27020 --eval 'rs.initiate({_id: "bench", members: [
+        {_id: 0, host: "127.0.0.1:27020", priority: 2},
+        {_id: 1, host: "127.0.0.1:27021"},
+        {_id: 2, host: "127.0.0.1:27022"}]})'
+
+실행 예:
+    python -m benchmarks.read_replicas --mongodb-url "mongodb://127.0.0.1:27020/?replicaSet=bench" --output results/replicas.json
+"""
+import argparse
+import asyncio
+import json
+import os
+import random
+import time
+from collections import defaultdict
+from datetime import datetime
+from typing import Any, Dict, List, Tuple
+
+import httpx
+import motor.motor_asyncio
+
+from app.core.security import create_access_token
+from benchmarks.load_journeys import percentile
+from benchmarks.server_throughput import start_server, stop_server, wait_until_ready
+from scripts.generate_data import generate_shard
+
+READ_ROUTES = ("goals.list", "goals.bundle", "progress.logs", "community.similar", "community.posts")
+
+
+async def seed(db, users: int, seed_value: int) -> List[Tuple[str, List[str]]]:
+    """합성 데이터를 넣고 (사용자 ID, 목표 ID 목록) 을 반환합니다."""
+    anchor = datetime.utcnow().replace(hour=0, minute=0, second=0, microsecond=0)
+    docs = generate_shard(0, 0, users, seed_value, anchor, "-")
+    for collection, items in docs.items():
+        for start in range(0, len(items), 5000):
+            await db[collection].insert_many(items[start:start + 5000], ordered=False)
+    await db.community_posts.insert_many([
+        {
+            "user_id": user["_id"],
+            "author": user["profile"]["name"],
+            "title": f"벤치마크 게시글 {index}",
+            "content": "꾸준히 기록하고 있습니다.",
+            "category": "health",
+            "created_at": datetime.utcnow(),
+        }
+        for index, user in enumerate(docs["users"][:200])
+    ])
+    goals_by_user: Dict[str, List[str]] = defaultdict(list)
+    for goal in docs["goals"]:
+        goals_by_user[goal["user_id"]].append(str(goal["_id"]))
+    return [(user_id, goal_ids) for user_id, goal_ids in goals_by_user.items()]
+
+
+async def members(mongodb_url: str) -> List[Tuple[str, motor.motor_asyncio.AsyncIOMotorClient]]:
+    client = motor.motor_asyncio.AsyncIOMotorClient(mongodb_url)
+    hello = await client.admin.command("hello")
+    client.close()
+    if len(hello.get("hosts", [])) < 2:
+        raise SystemExit("레플리카 셋 URL 이 필요합니다 (멤버가 2개 이상이어야 세컨더리 읽기를 비교할 수 있음).")
+    return [
+        (host, motor.motor_asyncio.AsyncIOMotorClient(f"mongodb://{host}/?directConnection=true"))
+        for host in hello["hosts"]
+    ]
+
+
+async def member_reads(member_clients, database: str) -> Dict[str, Dict[str, Any]]:
+    """멤버별 역할과 벤치마크 데이터베이스 네임스페이스의 누적 읽기 횟수."""
+    snapshot = {}
+    for host, client in member_clients:
+        hello = await client.admin.command("hello")
+        totals = (await client.admin.command("top"))["totals"]
+        reads = sum(
+            stats[kind]["count"]
+            for namespace, stats in totals.items()
+            if namespace.startswith(f"{database}.")
+            for kind in ("queries", "getmore", "commands")
+        )
+        role = "primary" if hello.get("isWritablePrimary") else "secondary" if hello.get("secondary") else "other"
+        snapshot[host] = {"role": role, "reads": reads}
+    return snapshot
+
+
+async def drive_load(base_url: str, users: List[Tuple[str, List[str]]], args) -> Dict[str, Any]:
+    tokens = {user_id: create_access_token(subject=user_id) for user_id, _ in users}
+    latencies: Dict[str, List[float]] = defaultdict(list)
+    errors: Dict[str, int] = defaultdict(int)
+    checks = {"read_your_writes": 0, "violations": 0}
+    deadline = time.monotonic() + args.duration
+
+    async def timed(client: httpx.AsyncClient, route: str, method: str, url: str, **kwargs) -> httpx.Response:
+        started = time.perf_counter()
+        response = await client.request(method, url, **kwargs)
+        latencies[route].append((time.perf_counter() - started) * 1000)
+        if response.status_code >= 400:
+            errors[route] += 1
+        return response
+
+    async def worker(rng: random.Random) -> None:
+        async with httpx.AsyncClient(base_url=base_url, timeout=30.0) as client:
+            while time.monotonic() < deadline:
+                user_id, goal_ids = rng.choice(users)
+                goal_id = rng.choice(goal_ids)
+                headers = {"Authorization": f"Bearer {tokens[user_id]}"}
+                if rng.random() < args.write_ratio:
+                    created = await timed(client, "progress.create", "POST", "/api/progress/", headers=headers, json={
+                        "goal_id": goal_id, "log_type": "progress", "value": 1.0, "description": "벤치마크 기록"
+                    })
+                    if created.status_code != 200:
+                        continue
+                    logs = await timed(client, "progress.logs", "GET", f"/api/progress/goal/{goal_id}", headers=headers)
+                    checks["read_your_writes"] += 1
+                    if created.json()["id"] not in {log["id"] for log in logs.json()}:
+                        checks["violations"] += 1
+                    continue
+                route = rng.choice(READ_ROUTES)
+                if route == "goals.list":
+                    await timed(client, route, "GET", "/api/goals/", headers=headers)
+                elif route == "goals.bundle":
+                    await timed(client, route, "GET", f"/api/goals/{goal_id}/bundle",
+                                params={"fields": "goal,logs,plan"}, headers=headers)
+                elif route == "progress.logs":
+                    await timed(client, route, "GET", f"/api/progress/goal/{goal_id}", headers=headers)
+                elif route == "community.similar":
+                    await timed(client, route, "GET", "/api/community/users/similar-goals", headers=headers)
+                else:
+                    await timed(client, route, "GET", "/api/community/posts", params={"limit": 20})
+
+    started = time.perf_counter()
+    await asyncio.gather(*(worker(random.Random(args.seed + index)) for index in range(args.concurrency)))
+    elapsed = time.perf_counter() - started
+
+    routes = {}
+    for route, values in sorted(latencies.items()):
+        values.sort()
+        routes[route] = {
+            "requests": len(values),
+            "errors": errors[route],
+            "p50_ms": round(percentile(values, 0.50), 3),
+            "p95_ms": round(percentile(values, 0.95), 3),
+            "p99_ms": round(percentile(values, 0.99), 3),
+        }
+    total = sum(len(values) for values in latencies.values())
+    return {"rps": round(total / elapsed, 1), "routes": routes, **checks}
+
+
+async def run_mode(args, routed: bool, users, member_clients) -> Dict[str, Any]:
+    os.environ["READ_ROUTING_ENABLED"] = "true" if routed else "false"
+    process = start_server(args.workers, args.port)
+    try:
+        await wait_until_ready(f"http://127.0.0.1:{args.port}/health", args.startup_timeout)
+        before = await member_reads(member_clients, args.database)
+        load = await drive_load(f"http://127.0.0.1:{args.port}", users, args)
+        after = await member_reads(member_clients, args.database)
+    finally:
+        stop_server(process)
+
+    per_member = {
+        host: {"role": after[host]["role"], "reads": after[host]["reads"] - before[host]["reads"]}
+        for host in after
+    }
+    total_reads = sum(member["reads"] for member in per_member.values())
+    primary_reads = sum(member["reads"] for member in per_member.values() if member["role"] == "primary")
+    result = {
+        "read_routing": routed,
+        "members": per_member,
+        "primary_reads": primary_reads,
+        "primary_read_share": round(primary_reads / total_reads, 4) if total_reads else 0.0,
+        **load,
+    }
+    print(json.dumps(result, ensure_ascii=False))
+    return result
+
+
+async def run(args) -> Dict[str, Any]:
+    client = motor.motor_asyncio.AsyncIOMotorClient(args.mongodb_url)
+    db = client[args.database]
+    member_clients = await members(args.mongodb_url)
+    try:
+        users = await seed(db, args.users, args.seed)
+        baseline = await run_mode(args, False, users, member_clients)
+        routed = await run_mode(args, True, users, member_clients)
+    finally:
+        await client.drop_database(args.database)
+        client.close()
+        for _, member_client in member_clients:
+            member_client.close()
+
+    reduction = 1 - routed["primary_reads"] / baseline["primary_reads"] if baseline["primary_reads"] else 0.0
+    print(
+        f"프라이머리 읽기: {baseline['primary_reads']} → {routed['primary_reads']} ({reduction:.1%} 감소), "
+        f"read-your-writes 위반: {routed['violations']}/{routed['read_your_writes']}"
+    )
+    return {"primary_only": baseline, "routed": routed, "primary_read_reduction": round(reduction, 4)}
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="세컨더리 읽기 라우팅의 프라이머리 부하 감소 벤치마크")
+    parser.add_argument("--mongodb-url", default=os.environ.get(
+        "MONGODB_URL", "mongodb://127.0.0.1:27020/?replicaSet=bench"
+    ))
+    parser.add_argument("--database", default="goalmaster_bench_replicas")
+    parser.add_argument("--users", type=int, default=500)
+    parser.add_argument("--concurrency", type=int, default=32)
+    parser.add_argument("--duration", type=float, default=30.0, help="모드별 부하 시간(초)")
+    parser.add_argument("--write-ratio", type=float, default=0.1, help="진도 기록 쓰기(+ 즉시 조회) 비율")
+    parser.add_argument("--workers", type=int, default=2)
+    parser.add_argument("--port", type=int, default=8767)
+    parser.add_argument("--seed", type=int, default=7)
+    parser.add_argument("--startup-timeout", type=float, default=30.0)
+    parser.add_argument("--output", help="결과를 저장할 JSON 파일 경로")
+    args = parser.parse_args()
+
+    # 서버 프로세스는 같은 벤치마크 데이터베이스를 사용하고, 읽기 캐시와 백그라운드 작업은 끔
+    os.environ.update({
+        "MONGODB_URL": args.mongodb_url,
+        "MONGODB_DATABASE": args.database,
+        "CACHE_ENABLED": "false",
+        "LIVE_UPDATES_ENABLED": "false",
+        "DEADLINE_SCAN_ENABLED": "false",
+        "GOAL_STATUS_ENGINE_ENABLED": "false",
+    })
+    report = asyncio.run(run(args))
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            json.dump(report, f, ensure_ascii=False, indent=2)
+
+
+if __name__ == "__main__":
+    main()
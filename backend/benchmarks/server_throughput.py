@@ -0,0 +1,135 @@
+"""단일 워커와 다중 워커 서버의 처리량(rps)과 지연 시간을 비교합니다.
+
+`python -m app.server` 를 워커 수만 바꿔 서브프로세스로 띄운 뒤 동시 요청을 보냅니다.
+기본 대상은 /health 이며 MongoDB 와 Redis 가 떠 있어야 lifespan 이 정상 시작됩니다.
+
+실행 예:
+    python -m benchmarks.server_throughput --workers 1 4 --concurrency 64 --duration 10
+"""
+import argparse
+import asyncio
+import json
+import os
+import signal
+import statistics
+import subprocess
+import sys
+import time
+from typing import Dict, List
+
+import httpx
+
+
+def start_server(workers: int, port: int) -> subprocess.Popen:
+    env = dict(os.environ)
+    env.update({
+        "SERVER_WORKERS": str(workers),
+        "SERVER_PORT": str(port),
+        "SERVER_HOST": "127.0.0.1",
+        "SERVER_ACCESS_LOG": "false",
+    })
+    return subprocess.Popen(
+        [sys.executable, "-m", "app.server"],
+        env=env,
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
+    )
+
+
+def stop_server(process: subprocess.Popen) -> None:
+    # SIGTERM 으로 graceful shutdown 경로(lifespan 종료 포함)를 그대로 사용
+    process.send_signal(signal.SIGTERM)
+    try:
+        process.wait(timeout=60)
+    except subprocess.TimeoutExpired:
+        process.kill()
+        process.wait()
+
+
+async def wait_until_ready(url: str, timeout: float) -> None:
+    deadline = time.monotonic() + timeout
+    async with httpx.AsyncClient() as client:
+        while time.monotonic() < deadline:
+            try:
+                response = await client.get(url, timeout=1.0)
+                if response.status_code == 200:
+                    return
+            except httpx.HTTPError:
+                pass
+            await asyncio.sleep(0.2)
+    raise RuntimeError(f"서버가 {timeout}초 안에 준비되지 않았습니다: {url}")
+
+
+async def drive_load(url: str, concurrency: int, duration: float) -> Dict[str, float]:
+    latencies: List[float] = []
+    errors = 0
+    deadline = time.monotonic() + duration
+    limits = httpx.Limits(max_connections=concurrency, max_keepalive_connections=concurrency)
+
+    async with httpx.AsyncClient(limits=limits, timeout=10.0) as client:
+        async def worker() -> None:
+            nonlocal errors
+            while time.monotonic() < deadline:
+                started = time.perf_counter()
+                try:
+                    response = await client.get(url)
+                    if response.status_code != 200:
+                        errors += 1
+                        continue
+                except httpx.HTTPError:
+                    errors += 1
+                    continue
+                latencies.append((time.perf_counter() - started) * 1000)
+
+        started = time.monotonic()
+        await asyncio.gather(*(worker() for _ in range(concurrency)))
+        elapsed = time.monotonic() - started
+
+    latencies.sort()
+    if not latencies:
+        return {"requests": 0, "errors": errors, "rps": 0.0, "p50_ms": 0.0, "p99_ms": 0.0}
+    return {
+        "requests": len(latencies),
+        "errors": errors,
+        "rps": round(len(latencies) / elapsed, 1),
+        "p50_ms": round(statistics.median(latencies), 3),
+        "p99_ms": round(latencies[max(int(len(latencies) * 0.99) - 1, 0)], 3),
+    }
+
+
+def run(args) -> List[Dict[str, float]]:
+    results = []
+    for workers in args.workers:
+        process = start_server(workers, args.port)
+        url = f"http://127.0.0.1:{args.port}{args.path}"
+        try:
+            asyncio.run(wait_until_ready(url, args.startup_timeout))
+            # 워커 워밍업
+            asyncio.run(drive_load(url, args.concurrency, min(args.duration, 2.0)))
+            result = asyncio.run(drive_load(url, args.concurrency, args.duration))
+        finally:
+            stop_server(process)
+        results.append({"workers": workers, **result})
+    return results
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="서버 워커 수별 처리량 벤치마크")
+    parser.add_argument("--workers", type=int, nargs="+", default=[1, os.cpu_count() or 1])
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--path", default="/health")
+    parser.add_argument("--concurrency", type=int, default=64)
+    parser.add_argument("--duration", type=float, default=10.0)
+    parser.add_argument("--startup-timeout", type=float, default=30.0)
+    parser.add_argument("--output", help="결과를 저장할 JSON 파일 경로")
+    args = parser.parse_args()
+
+    results = run(args)
+    print(json.dumps(results, ensure_ascii=False, indent=2))
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            json.dump(results, f, ensure_ascii=False, indent=2)
+
+
+if __name__ == "__main__":
+    main()
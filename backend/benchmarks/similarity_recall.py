@@ -0,0 +1,119 @@
+"""MinHash/LSH 유사 목표 검색의 재현율과 지연 시간을 전수 Jaccard 비교와 대조합니다.
+
+DB 없이 메모리에서 실행됩니다.
+
+실행 예:
+    python -m benchmarks.similarity_recall --goals 5000 --queries 200 --k 10
+"""
+import argparse
+import json
+import random
+import statistics
+import time
+from collections import defaultdict
+from typing import Dict, List, Set
+
+from app.core.similarity import estimate_similarity, lsh_bands, minhash, shingles
+
+TOPICS = [
+    ("매일 {n}분 달리기", "체력을 기르기 위해 매일 달리기를 합니다", "분"),
+    ("체중 {n}kg 감량", "식단 관리와 운동으로 체중을 줄입니다", "kg"),
+    ("책 {n}권 읽기", "올해 자기계발을 위해 책을 꾸준히 읽습니다", "권"),
+    ("토익 {n}점 달성", "영어 실력을 키워 토익 점수를 올립니다", "점"),
+    ("비상금 {n}만원 모으기", "매달 자동이체로 비상금을 저축합니다", "만원"),
+    ("파이썬 프로젝트 {n}개 완성", "개발 실력을 높이기 위해 사이드 프로젝트를 진행합니다", "개"),
+    ("기타 연습 {n}시간", "좋아하는 곡을 연주할 수 있도록 기타를 연습합니다", "시간"),
+    ("명상 {n}일 연속", "마음의 안정을 위해 아침마다 명상을 합니다", "일"),
+]
+NOISE = ["꾸준히", "이번 분기에", "주말마다", "퇴근 후", "친구와 함께", "천천히", "열심히", "새해 목표로"]
+
+
+def generate_goals(count: int, seed: int) -> List[Dict]:
+    rng = random.Random(seed)
+    goals = []
+    for index in range(count):
+        title, description, unit = rng.choice(TOPICS)
+        n = rng.choice([5, 10, 12, 20, 30, 50, 100, 300, 800])
+        noise = " ".join(rng.sample(NOISE, rng.randint(0, 3)))
+        goals.append({
+            "_id": str(index),
+            "title": title.format(n=n),
+            "description": f"{noise} {description}",
+            "unit": unit,
+            "target_value": n,
+        })
+    return goals
+
+
+def jaccard(a: Set[str], b: Set[str]) -> float:
+    return len(a & b) / len(a | b) if a or b else 0.0
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="MinHash/LSH 재현율 및 지연 시간 벤치마크")
+    parser.add_argument("--goals", type=int, default=5000)
+    parser.add_argument("--queries", type=int, default=200)
+    parser.add_argument("--k", type=int, default=10)
+    parser.add_argument("--seed", type=int, default=7)
+    parser.add_argument("--output", help="결과를 저장할 JSON 파일 경로")
+    args = parser.parse_args()
+
+    goals = generate_goals(args.goals, args.seed)
+
+    started = time.perf_counter()
+    features = [shingles(goal) for goal in goals]
+    signatures = [minhash(feature) for feature in features]
+    buckets: Dict[str, List[int]] = defaultdict(list)
+    for index, signature in enumerate(signatures):
+        for band in lsh_bands(signature):
+            buckets[band].append(index)
+    build_seconds = time.perf_counter() - started
+
+    rng = random.Random(args.seed + 1)
+    query_ids = rng.sample(range(len(goals)), min(args.queries, len(goals)))
+    brute_latencies, lsh_latencies, recalls, candidate_counts = [], [], [], []
+
+    for query in query_ids:
+        started = time.perf_counter()
+        exact = sorted(
+            ((jaccard(features[query], features[other]), other) for other in range(len(goals)) if other != query),
+            reverse=True,
+        )[:args.k]
+        brute_latencies.append(time.perf_counter() - started)
+
+        started = time.perf_counter()
+        candidates = {
+            other
+            for band in lsh_bands(signatures[query])
+            for other in buckets[band]
+            if other != query
+        }
+        approx = sorted(
+            ((estimate_similarity(signatures[query], signatures[other]), other) for other in candidates),
+            reverse=True,
+        )[:args.k]
+        lsh_latencies.append(time.perf_counter() - started)
+
+        exact_ids = {other for _, other in exact}
+        recalls.append(len(exact_ids & {other for _, other in approx}) / len(exact_ids))
+        candidate_counts.append(len(candidates))
+
+    result = {
+        "goals": args.goals,
+        "queries": len(query_ids),
+        "k": args.k,
+        "index_build_seconds": round(build_seconds, 3),
+        "recall_at_k": round(statistics.mean(recalls), 4),
+        "mean_candidates": round(statistics.mean(candidate_counts), 1),
+        "brute_force_ms_p50": round(statistics.median(brute_latencies) * 1000, 3),
+        "lsh_ms_p50": round(statistics.median(lsh_latencies) * 1000, 3),
+        "speedup": round(statistics.median(brute_latencies) / max(statistics.median(lsh_latencies), 1e-9), 1),
+    }
+    print(json.dumps(result, ensure_ascii=False, indent=2))
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            json.dump(result, f, ensure_ascii=False, indent=2)
+
+
+if __name__ == "__main__":
+    main()
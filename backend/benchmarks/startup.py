@@ -0,0 +1,158 @@
+"""워커 콜드 스타트 시간 벤치마크.
+
+매 실행마다 새 파이썬 프로세스에서 `import main` 시간, lifespan 시작/종료 시간, 첫 OpenAPI 스키마 생성 시간을
+측정합니다 (스키마는 /openapi.json 이나 /docs 를 처음 요청할 때 만들어지므로 시작 시간에는 포함되지 않음).
+lifespan 은 MongoDB/Redis 에 연결하지 않고 클라이언트만 만들기 때문에 DB 없이 실행할 수 있습니다.
+
+import 직후 LAZY_MODULES 가 이미 로드되어 있거나, 중앙값이 예산을 넘으면 종료 코드 1 로 끝나므로
+CI 에서 시작 시간 회귀 검사로 사용할 수 있습니다. 무거운 모듈의 import 시간은 --importtime 으로 확인합니다.
+
+실행 예:
+    python -m benchmarks.startup
+    python -m benchmarks.startup --runs 10 --budget-ms 2500 --output results/startup.json
+    python -m benchmarks.startup --importtime 15
+"""
+import argparse
+import json
+import os
+import subprocess
+import sys
+import time
+from pathlib import Path
+from typing import Dict, List, Tuple
+
+# 처음 사용할 때 가져와야 하는 모듈 (import main 시점에 로드되면 실패)
+LAZY_MODULES = ("openai", "apscheduler", "passlib")
+
+# 중앙값 기준 시작 시간 예산 (CLI 기본값과 tests/test_startup.py 가 함께 사용)
+COLD_START_BUDGET_MS = 3000.0
+IMPORT_BUDGET_MS = 2000.0
+
+BACKEND_DIR = Path(__file__).resolve().parents[1]
+
+_CHILD = """
+import asyncio, json, sys, time
+started = time.perf_counter()
+import main
+imported = time.perf_counter()
+eager = [name for name in {lazy!r} if name in sys.modules]
+
+async def run():
+    async with main.app.router.lifespan_context(main.app):
+        ready = time.perf_counter()
+        main.app.openapi()
+        openapi = time.perf_counter()
+    return ready, openapi, time.perf_counter()
+
+entered = time.perf_counter()
+ready, openapi, stopped = asyncio.run(run())
+print(json.dumps({{
+    "import_ms": (imported - started) * 1000,
+    "lifespan_startup_ms": (ready - entered) * 1000,
+    "openapi_ms": (openapi - ready) * 1000,
+    "lifespan_shutdown_ms": (stopped - openapi) * 1000,
+    "eager_modules": eager,
+}}))
+"""
+
+
+def child_env() -> Dict[str, str]:
+    env = dict(os.environ)
+    # 측정 중 주기 작업이 외부 서비스에 연결을 시도하지 않도록 함 (작업 시작 비용은 그대로 측정)
+    env.setdefault("MONGODB_SERVER_SELECTION_TIMEOUT_MS", "500")
+    env.setdefault("LIVE_UPDATES_ENABLED", "false")
+    return env
+
+
+def run_once(env: Dict[str, str]) -> Dict:
+    started = time.perf_counter()
+    output = subprocess.run(
+        [sys.executable, "-c", _CHILD.format(lazy=LAZY_MODULES)],
+        capture_output=True, text=True, env=env, check=True, cwd=BACKEND_DIR
+    ).stdout
+    elapsed = (time.perf_counter() - started) * 1000
+    result = json.loads(output.strip().splitlines()[-1])
+    result["process_ms"] = elapsed
+    return result
+
+
+def importtime(top: int, env: Dict[str, str]) -> None:
+    """`python -X importtime` 기준 누적 import 시간이 큰 모듈."""
+    stderr = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", "import main"],
+        capture_output=True, text=True, env=env, check=True, cwd=BACKEND_DIR
+    ).stderr
+    rows = []
+    for line in stderr.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        _, cumulative, name = line[len("import time:"):].split("|")
+        rows.append((int(cumulative), name.rstrip()))
+    for cumulative, name in sorted(rows, reverse=True)[:top]:
+        print(f"{cumulative / 1000:>9.1f}ms  {name}")
+
+
+def median(values: List[float]) -> float:
+    ordered = sorted(values)
+    return ordered[len(ordered) // 2]
+
+
+def measure(
+    runs: int,
+    env: Dict[str, str],
+    budget_ms: float = COLD_START_BUDGET_MS,
+    import_budget_ms: float = IMPORT_BUDGET_MS
+) -> Tuple[List[Dict], Dict[str, float], List[str]]:
+    """새 프로세스에서 runs 회 측정하고 (실행별 결과, 중앙값, 예산 위반 목록)을 반환합니다."""
+    run_once(env)  # .pyc 생성 등 첫 실행 비용 제외
+    results = [run_once(env) for _ in range(runs)]
+    for result in results:
+        result["cold_start_ms"] = result["import_ms"] + result["lifespan_startup_ms"]
+
+    summary = {
+        key: round(median([result[key] for result in results]), 1)
+        for key in ("import_ms", "lifespan_startup_ms", "cold_start_ms", "openapi_ms", "lifespan_shutdown_ms", "process_ms")
+    }
+
+    failures = []
+    eager = sorted({name for result in results for name in result["eager_modules"]})
+    if eager:
+        failures.append(f"import main 시점에 로드된 지연 로딩 대상 모듈: {', '.join(eager)}")
+    if summary["import_ms"] > import_budget_ms:
+        failures.append(f"import_ms {summary['import_ms']}ms > 예산 {import_budget_ms}ms")
+    if summary["cold_start_ms"] > budget_ms:
+        failures.append(f"cold_start_ms {summary['cold_start_ms']}ms > 예산 {budget_ms}ms")
+    return results, summary, failures
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="워커 콜드 스타트 시간 벤치마크")
+    parser.add_argument("--runs", type=int, default=5)
+    parser.add_argument("--budget-ms", type=float, default=COLD_START_BUDGET_MS, help="import + lifespan 시작 시간 예산 (중앙값)")
+    parser.add_argument("--import-budget-ms", type=float, default=IMPORT_BUDGET_MS, help="import main 시간 예산 (중앙값)")
+    parser.add_argument("--importtime", type=int, metavar="N", help="누적 import 시간 상위 N 개 모듈만 출력")
+    parser.add_argument("--output", help="결과를 저장할 JSON 파일 경로")
+    args = parser.parse_args()
+
+    env = child_env()
+    if args.importtime:
+        importtime(args.importtime, env)
+        return
+
+    runs, summary, failures = measure(args.runs, env, args.budget_ms, args.import_budget_ms)
+    for key, value in summary.items():
+        print(f"{key:<22} {value:>9.1f}ms")
+
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            json.dump({"runs": runs, "median": summary, "failures": failures}, f, ensure_ascii=False, indent=2)
+
+    if failures:
+        print("\n시작 시간 예산 초과:")
+        for failure in failures:
+            print(f"  {failure}")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
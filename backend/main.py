@@ -1,23 +1,133 @@
-from fastapi import FastAPI
+from fastapi import FastAPI, Request
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import JSONResponse, Response
 from contextlib import asynccontextmanager
+import asyncio
+from datetime import timedelta
 import motor.motor_asyncio
+import redis.asyncio as aioredis
 import os
 
 from app.routers import auth, goals, progress, community
-from app.routers import goal_analysis, action_planning, coaching_messages, ai_test
+from app.routers import goal_analysis, action_planning, action_plans, coaching_messages, ai_test, admin, live, notifications
 from app.core.config import settings
+from app.core.ai_interactions import AIInteractionBuffer
+from app.core.cache import TwoTierCache
+from app.core.deadline_scheduler import DeadlineScanner
+from app.core.goal_status import GoalStatusEngine
+from app.core.live_updates import LiveUpdateHub
+from app.core.read_routing import CausalWriteListener, CausalWriteMiddleware, ReadRouter
+from app.core.llm import llm_breaker, close_llm_provider
+from app.core.indexes import sync_indexes_in_background
+from app.core.health import PoolStatsListener, ReadinessProbe
+from app.core.db_budget import DBBudgetListener, DBBudgetMiddleware
+from app.core.metrics import MongoCommandMetrics, PrometheusMiddleware, metrics_response
+from app.core.slow_queries import SlowQueryLog
 
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     # 시작 시 실행
-    mongodb_client = motor.motor_asyncio.AsyncIOMotorClient(settings.MONGODB_URL)
+    pool_stats = PoolStatsListener()
+    slow_queries = SlowQueryLog(
+        settings.SLOW_QUERY_THRESHOLD_MS,
+        max_entries=settings.SLOW_QUERY_MAX_ENTRIES,
+        explain=settings.SLOW_QUERY_EXPLAIN
+    )
+    mongodb_client = motor.motor_asyncio.AsyncIOMotorClient(
+        settings.MONGODB_URL,
+        maxPoolSize=settings.MONGODB_MAX_POOL_SIZE,
+        minPoolSize=settings.MONGODB_MIN_POOL_SIZE,
+        maxIdleTimeMS=settings.MONGODB_MAX_IDLE_TIME_MS,
+        waitQueueTimeoutMS=settings.MONGODB_WAIT_QUEUE_TIMEOUT_MS,
+        serverSelectionTimeoutMS=settings.MONGODB_SERVER_SELECTION_TIMEOUT_MS,
+        event_listeners=[pool_stats, MongoCommandMetrics(), DBBudgetListener(), CausalWriteListener(), slow_queries]
+    )
+    slow_queries.bind(mongodb_client, asyncio.get_running_loop())
+    app.state.slow_queries = slow_queries
     app.state.mongodb_client = mongodb_client
-    app.state.mongodb = mongodb_client.goalmaster
+    app.state.mongodb = mongodb_client[settings.MONGODB_DATABASE]
+    app.state.redis = aioredis.from_url(settings.REDIS_URL, decode_responses=True)
+    # 라우트별 읽기 선호도 (대시보드/커뮤니티 읽기는 세컨더리, 자신의 쓰기는 인과적 세션으로 보장)
+    app.state.read_router = ReadRouter(
+        app.state.mongodb,
+        app.state.redis,
+        preferences=settings.READ_PREFERENCES,
+        max_staleness=settings.READ_MAX_STALENESS_SECONDS,
+        causal_window=settings.READ_CAUSAL_WINDOW_SECONDS,
+        enabled=settings.READ_ROUTING_ENABLED
+    )
+    app.state.cache = TwoTierCache(
+        app.state.redis,
+        local_max_entries=settings.CACHE_LOCAL_MAX_ENTRIES,
+        local_ttl=settings.CACHE_LOCAL_TTL_SECONDS,
+        ttl=settings.CACHE_TTL_SECONDS,
+        lock_timeout=settings.CACHE_LOCK_TIMEOUT_SECONDS,
+        early_refresh_beta=settings.CACHE_EARLY_REFRESH_BETA,
+        enabled=settings.CACHE_ENABLED
+    )
+    app.state.cache.start()
+    # goals/progress_logs change stream 을 /ws 연결들에 전달 (워커당 감시자 하나)
+    app.state.live_updates = LiveUpdateHub(
+        app.state.mongodb,
+        queue_size=settings.LIVE_UPDATES_QUEUE_SIZE,
+        max_connections=settings.LIVE_UPDATES_MAX_CONNECTIONS,
+        enabled=settings.LIVE_UPDATES_ENABLED
+    )
+    app.state.live_updates.start()
+    app.state.readiness = ReadinessProbe(
+        app.state.mongodb,
+        app.state.redis,
+        pool_stats,
+        max_pool_size=settings.MONGODB_MAX_POOL_SIZE,
+        mongo_timeout=settings.HEALTH_MONGO_TIMEOUT_SECONDS,
+        redis_timeout=settings.HEALTH_REDIS_TIMEOUT_SECONDS,
+        cache_seconds=settings.HEALTH_CACHE_SECONDS
+    )
+
+    # 인덱스 레지스트리(app/models/indexes.py) 동기화는 시작을 막지 않도록 백그라운드에서 실행
+    index_sync = asyncio.create_task(sync_indexes_in_background(app.state.mongodb))
+
+    # 마감 임박/초과 알림 스캔 (워커들이 Redis lease 로 샤드를 나눠 처리)
+    app.state.deadline_scanner = DeadlineScanner(
+        app.state.mongodb,
+        app.state.redis,
+        interval=settings.DEADLINE_SCAN_INTERVAL_SECONDS,
+        shards=settings.DEADLINE_SCAN_SHARDS,
+        batch_size=settings.DEADLINE_SCAN_BATCH_SIZE,
+        horizon=timedelta(hours=settings.DEADLINE_REMINDER_HORIZON_HOURS),
+        overdue_lookback=timedelta(days=settings.DEADLINE_OVERDUE_LOOKBACK_DAYS),
+        enabled=settings.DEADLINE_SCAN_ENABLED
+    )
+    app.state.deadline_scanner.start()
+    # 목표치 도달/마감 경과 목표의 상태 자동 전환 (주기마다 워커 하나가 실행)
+    app.state.goal_status_engine = GoalStatusEngine(
+        app.state.mongodb,
+        app.state.redis,
+        app.state.cache,
+        interval=settings.GOAL_STATUS_INTERVAL_SECONDS,
+        batch_size=settings.GOAL_STATUS_BATCH_SIZE,
+        max_batches=settings.GOAL_STATUS_MAX_BATCHES,
+        expire_after=timedelta(days=settings.GOAL_EXPIRE_AFTER_DAYS),
+        enabled=settings.GOAL_STATUS_ENGINE_ENABLED
+    )
+    app.state.goal_status_engine.start()
+
+    ai_interaction_buffer = AIInteractionBuffer(app.state.mongodb)
+    ai_interaction_buffer.start()
+    app.state.ai_interaction_buffer = ai_interaction_buffer
     try:
         yield
     finally:
+        # 종료 시 버퍼에 남은 AI 상호작용 기록을 저장
+        index_sync.cancel()
+        await app.state.deadline_scanner.close()
+        await app.state.goal_status_engine.close()
+        await app.state.live_updates.close()
+        await ai_interaction_buffer.close()
+        await app.state.cache.close()
+        await close_llm_provider()
+        await app.state.redis.aclose()
         mongodb_client.close()
 
 
@@ -37,11 +147,22 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+# 요청당 MongoDB 호출 수 집계 및 라우트별 예산 확인
+app.add_middleware(DBBudgetMiddleware)
+
+# 쓰기 요청의 마지막 쓰기 시각을 사용자별로 저장 (이후 세컨더리 읽기의 인과적 세션에 사용)
+app.add_middleware(CausalWriteMiddleware)
+
+# 라우트별 요청 시간/상태 코드 지표 (/metrics)
+app.add_middleware(PrometheusMiddleware)
+
 # 라우터 등록
 app.include_router(auth.router, prefix="/api/auth", tags=["authentication"])
 app.include_router(goals.router, prefix="/api/goals", tags=["goals"])
 app.include_router(progress.router, prefix="/api/progress", tags=["progress"])
 app.include_router(community.router, prefix="/api/community", tags=["community"])
+app.include_router(notifications.router, prefix="/api/notifications", tags=["notifications"])
+app.include_router(action_plans.router, prefix="/api/action-plans", tags=["action_plans"])
 
 # AI 관련 라우터들 (기능별로 분리)
 app.include_router(goal_analysis.router, prefix="/api/ai", tags=["goal_analysis"])
@@ -49,6 +170,12 @@ app.include_router(action_planning.router, prefix="/api/ai", tags=["action_plann
 app.include_router(coaching_messages.router, prefix="/api/ai", tags=["coaching_messages"])
 app.include_router(ai_test.router, prefix="/api/ai", tags=["ai_test"])
 
+# 목표/진행 기록 실시간 업데이트 (WebSocket)
+app.include_router(live.router, tags=["live"])
+
+# 운영용 관리자 API (ADMIN_API_KEY 설정 시 활성화)
+app.include_router(admin.router, prefix="/api/admin", tags=["admin"])
+
 
 @app.get("/")
 async def root():
@@ -56,5 +183,26 @@ async def root():
 
 
 @app.get("/health")
+@app.get("/health/live")
 async def health_check():
-    return {"status": "healthy", "message": "서비스가 정상적으로 실행 중입니다."} 
\ No newline at end of file
+    """프로세스 생존 여부 (liveness). 외부 의존성은 확인하지 않습니다."""
+    return {
+        "status": "healthy",
+        "message": "서비스가 정상적으로 실행 중입니다.",
+        "llm_circuit": llm_breaker.snapshot()
+    }
+
+
+@app.get("/health/ready")
+async def readiness_check(request: Request):
+    """MongoDB/Redis 연결과 커넥션 풀 상태 (readiness). 준비되지 않았으면 503."""
+    result = await request.app.state.readiness.check()
+    status_code = 503 if result["status"] == ReadinessProbe.NOT_READY else 200
+    return JSONResponse(content=result, status_code=status_code)
+
+
+@app.get("/metrics", include_in_schema=False)
+async def metrics():
+    """Prometheus 수집용 지표."""
+    content, content_type = metrics_response()
+    return Response(content=content, media_type=content_type)
@@ -0,0 +1 @@
+# Command line tools (stub servers, generators, maintenance jobs)
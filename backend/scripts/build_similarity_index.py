@@ -0,0 +1,38 @@
+"""goals 컬렉션 전체로 커뮤니티 텍스트 유사도 인덱스(goal_signatures)를 다시 만듭니다.
+
+실행 예:
+    python -m scripts.build_similarity_index --batch-size 1000
+"""
+import argparse
+import asyncio
+import time
+
+import motor.motor_asyncio
+
+from app.core.config import settings
+from app.core.indexes import sync_indexes
+from app.core.similarity import rebuild_index
+
+
+async def run(batch_size: int) -> None:
+    client = motor.motor_asyncio.AsyncIOMotorClient(settings.MONGODB_URL)
+    db = client[settings.MONGODB_DATABASE]
+    try:
+        await sync_indexes(db, collections=["goal_signatures"])
+        started = time.perf_counter()
+        indexed = await rebuild_index(db, batch_size=batch_size)
+        elapsed = time.perf_counter() - started
+        print(f"유사도 인덱스 재구축 완료: {indexed}개 목표, {elapsed:.1f}초")
+    finally:
+        client.close()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="목표 텍스트 유사도 인덱스 재구축")
+    parser.add_argument("--batch-size", type=int, default=500)
+    args = parser.parse_args()
+    asyncio.run(run(args.batch_size))
+
+
+if __name__ == "__main__":
+    main()
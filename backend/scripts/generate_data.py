@@ -0,0 +1,389 @@
+"""대규모 부하 테스트용 합성 데이터 생성기.
+
+users / goals / progress_logs / action_plans / ai_interactions 문서를 app/models 의 저장 형식에 맞춰
+생성합니다. 사용자당 목표 수는 파레토 분포로 치우쳐 있고, 진도 기록은 몇 번의 몰아서 기록하는 구간(burst)에
+모이며, 목표 상태는 active/completed/paused/cancelled 가 섞여 있습니다.
+
+사용자를 샤드 단위로 나눠 프로세스 풀에서 생성하고, 각 프로세스가 자신의 MongoClient 로
+insert_many(ordered=False) 를 실행합니다. 샤드마다 시드가 정해져 있어 같은 인자로 실행하면
+ObjectId 를 포함해 같은 데이터가 만들어집니다.
+
+실행 예:
+    python -m scripts.generate_data --users 200000 --workers 8 --drop
+    python -m scripts.generate_data --users 50000 --dry-run     # 삽입 없이 생성 속도만 측정
+"""
+import argparse
+import asyncio
+import json
+import os
+import random
+import time
+from concurrent.futures import ProcessPoolExecutor
+from datetime import datetime, timedelta
+from typing import Any, Dict, List, Optional
+
+from bson import ObjectId
+from pymongo import MongoClient
+
+from app.core.config import settings
+
+COLLECTIONS = ("users", "goals", "progress_logs", "action_plans", "ai_interactions")
+
+CATEGORIES = ["health", "education", "career", "personal", "finance"]
+CATEGORY_WEIGHTS = [30, 25, 20, 15, 10]
+STATUSES = ["active", "completed", "paused", "cancelled"]
+STATUS_WEIGHTS = [60, 25, 10, 5]
+PRIORITIES = ["high", "medium", "low"]
+PRIORITY_WEIGHTS = [25, 55, 20]
+LOG_TYPES = ["progress", "milestone", "setback", "note"]
+LOG_TYPE_WEIGHTS = [75, 8, 7, 10]
+INTERACTION_TYPES = ["coaching", "analysis", "planning"]
+INTERACTION_WEIGHTS = [70, 20, 10]
+MOOD_SCORES = list(range(1, 11)) + [None, None]  # 약 17% 는 기분 점수 없이 기록
+
+# 카테고리별 (제목 템플릿, 설명, 목표값 범위, 단위)
+GOAL_TEMPLATES: Dict[str, List[tuple]] = {
+    "health": [
+        ("매일 {n}분 달리기", "체력을 기르기 위해 꾸준히 달립니다", (10, 60), "분"),
+        ("체중 {n}kg 감량", "식단 조절과 운동으로 건강하게 감량합니다", (3, 15), "kg"),
+        ("하루 물 {n}잔 마시기", "수분 섭취 습관을 만듭니다", (6, 10), "잔"),
+        ("주 {n}회 헬스장 가기", "근력 운동을 규칙적으로 합니다", (2, 6), "회"),
+    ],
+    "education": [
+        ("올해 책 {n}권 읽기", "자기계발을 위해 독서 습관을 만듭니다", (6, 52), "권"),
+        ("파이썬 강의 {n}강 완주", "온라인 강의로 프로그래밍을 배웁니다", (20, 120), "강"),
+        ("영어 단어 {n}개 암기", "매일 조금씩 어휘력을 늘립니다", (500, 3000), "개"),
+    ],
+    "career": [
+        ("토익 {n}점 달성", "영어 점수를 올려 이직을 준비합니다", (700, 990), "점"),
+        ("포트폴리오 프로젝트 {n}개 완성", "개인 프로젝트로 경력을 쌓습니다", (1, 5), "개"),
+        ("자격증 {n}개 취득", "업무 관련 자격증을 준비합니다", (1, 3), "개"),
+    ],
+    "personal": [
+        ("명상 {n}일 연속", "아침마다 마음을 정리합니다", (30, 365), "일"),
+        ("일기 {n}편 쓰기", "하루를 돌아보는 습관을 만듭니다", (30, 365), "편"),
+        ("새벽 6시 기상 {n}일", "아침 시간을 활용합니다", (30, 100), "일"),
+    ],
+    "finance": [
+        ("비상금 {n}만원 모으기", "매달 자동이체로 저축합니다", (100, 1000), "만원"),
+        ("가계부 {n}일 작성", "지출을 기록하고 점검합니다", (30, 365), "일"),
+        ("투자 공부 {n}시간", "재테크 기초를 공부합니다", (20, 200), "시간"),
+    ],
+}
+LOG_DESCRIPTIONS = {
+    "progress": ["오늘도 계획대로 진행했습니다.", "조금 힘들었지만 해냈어요.", "목표량을 채웠습니다.", "컨디션이 좋아서 더 했어요."],
+    "milestone": ["중간 목표를 달성했습니다!", "절반을 넘었어요.", "첫 번째 마일스톤 완료!"],
+    "setback": ["바빠서 하지 못했습니다.", "컨디션이 좋지 않았어요.", "계획이 틀어졌습니다."],
+    "note": ["방법을 바꿔 보려고 합니다.", "다음 주 계획을 세웠습니다.", "동기부여가 필요해요."],
+}
+STEP_TITLES = ["현재 상태 점검", "세부 계획 수립", "환경 준비", "첫 주 실행", "중간 점검", "습관화", "최종 점검"]
+FAMILY_NAMES = "김이박최정강조윤장임한오서신권황안송류홍"
+GIVEN_NAMES = ["민준", "서연", "도윤", "지우", "하준", "서윤", "은우", "지민", "시우", "하은", "예준", "수아"]
+COACHING_MESSAGES = [
+    "꾸준함이 가장 큰 힘입니다. 오늘도 한 걸음 나아가세요!",
+    "지금까지 잘 해오셨어요. 목표가 눈앞에 있습니다.",
+    "잠시 쉬어가도 괜찮아요. 내일 다시 시작해봐요.",
+]
+
+EPOCH = datetime(1970, 1, 1)
+
+_client: Optional[MongoClient] = None
+
+
+def object_id(rng: random.Random, at: datetime) -> ObjectId:
+    """생성 시각을 담은 결정적 ObjectId (시드가 같으면 같은 값)."""
+    return ObjectId((int((at - EPOCH).total_seconds()) << 64 | rng.getrandbits(64)).to_bytes(12, "big"))
+
+
+def skewed_count(rng: random.Random, alpha: float, minimum: int, maximum: int) -> int:
+    """파레토 분포를 따르는 개수 (대부분 작고 일부만 큰 값)."""
+    return min(maximum, minimum - 1 + int(rng.paretovariate(alpha)))
+
+
+def bursty_times(rng: random.Random, count: int, start: datetime, end: datetime) -> List[datetime]:
+    """count 개의 시각을 몇 개의 구간에 몰아서 생성합니다 (연속 기록 후 공백이 생기는 패턴)."""
+    span = max((end - start).total_seconds(), 3600.0)
+    bursts = [rng.random() * span for _ in range(max(1, count // 8))]
+    times = []
+    for _ in range(count):
+        offset = rng.choice(bursts) + rng.expovariate(1 / 86400)  # 구간 시작 후 평균 하루
+        times.append(start + timedelta(seconds=min(offset, span)))
+    times.sort()
+    return times
+
+
+def generate_shard(
+    shard: int,
+    first_user: int,
+    users: int,
+    seed: int,
+    anchor: datetime,
+    password_hash: str,
+) -> Dict[str, List[Dict[str, Any]]]:
+    """샤드 하나(users 명)의 문서를 컬렉션별 리스트로 생성합니다.
+
+    범주형 필드는 rng.choices(k=n) 로 한 번에 뽑아 열 단위로 만든 뒤 문서로 묶습니다.
+    """
+    rng = random.Random(seed * 1_000_003 + shard)
+    docs: Dict[str, List[Dict[str, Any]]] = {name: [] for name in COLLECTIONS}
+
+    signup_days = [rng.uniform(1, 730) for _ in range(users)]
+    goal_counts = [skewed_count(rng, 1.6, 1, 30) for _ in range(users)]
+    total_goals = sum(goal_counts)
+    categories = rng.choices(CATEGORIES, CATEGORY_WEIGHTS, k=total_goals)
+    statuses = rng.choices(STATUSES, STATUS_WEIGHTS, k=total_goals)
+    priorities = rng.choices(PRIORITIES, PRIORITY_WEIGHTS, k=total_goals)
+
+    goal_index = 0
+    for offset in range(users):
+        number = first_user + offset
+        signed_up = anchor - timedelta(days=signup_days[offset])
+        user_id = object_id(rng, signed_up)
+        docs["users"].append({
+            "_id": user_id,
+            "email": f"user{number}@synthetic.goalmaster.dev",
+            "password_hash": password_hash,
+            "profile": {
+                "name": rng.choice(FAMILY_NAMES) + rng.choice(GIVEN_NAMES),
+                "avatar_url": None,
+                "timezone": "Asia/Seoul",
+                "preferences": {},
+            },
+            "created_at": signed_up,
+            "updated_at": signed_up,
+        })
+
+        for _ in range(goal_counts[offset]):
+            category, status, priority = categories[goal_index], statuses[goal_index], priorities[goal_index]
+            goal_index += 1
+            _append_goal(rng, docs, str(user_id), category, status, priority, signed_up, anchor)
+    return docs
+
+
+def _append_goal(
+    rng: random.Random,
+    docs: Dict[str, List[Dict[str, Any]]],
+    user_id: str,
+    category: str,
+    status: str,
+    priority: str,
+    signed_up: datetime,
+    anchor: datetime,
+) -> None:
+    title_template, description, (low, high), unit = rng.choice(GOAL_TEMPLATES[category])
+    target = rng.randint(low, high)
+    created_at = signed_up + timedelta(seconds=rng.random() * (anchor - signed_up).total_seconds())
+    deadline = created_at + timedelta(days=rng.randint(30, 365))
+    goal_id = object_id(rng, created_at)
+    goal_id_str = str(goal_id)
+
+    if status == "completed":
+        current = target
+    elif status == "cancelled":
+        current = int(target * rng.random() * 0.3)
+    else:
+        current = int(target * rng.betavariate(2, 3))
+
+    log_count = 0 if status == "cancelled" and rng.random() < 0.5 else skewed_count(rng, 1.2, 0, 200)
+    log_times = bursty_times(rng, log_count, created_at, min(anchor, deadline))
+    log_types = rng.choices(LOG_TYPES, LOG_TYPE_WEIGHTS, k=log_count)
+    moods = rng.choices(MOOD_SCORES, k=log_count)
+    picks = rng.choices(range(12), k=log_count)
+    updated_at = log_times[-1] if log_times else created_at
+
+    docs["goals"].append({
+        "_id": goal_id,
+        "user_id": user_id,
+        "title": title_template.format(n=target),
+        "description": description,
+        "category": category,
+        "target_value": float(target),
+        "current_value": float(current),
+        "unit": unit,
+        "deadline": deadline,
+        "priority": priority,
+        "status": status,
+        "ai_analysis": None,
+        "created_at": created_at,
+        "updated_at": updated_at,
+    })
+
+    step = max(target / max(log_count, 1), 1)
+    for index, (logged_at, log_type, mood, pick) in enumerate(zip(log_times, log_types, moods, picks)):
+        descriptions = LOG_DESCRIPTIONS[log_type]
+        docs["progress_logs"].append({
+            "_id": object_id(rng, logged_at),
+            "user_id": user_id,
+            "goal_id": goal_id_str,
+            "log_type": log_type,
+            "value": round(min(step * (index + 1), target), 1) if log_type == "progress" else None,
+            "description": descriptions[pick % len(descriptions)],
+            "mood_score": mood,
+            "created_at": logged_at,
+        })
+
+    if rng.random() < 0.3:
+        planned_at = created_at + timedelta(minutes=rng.randint(1, 120))
+        step_count = rng.randint(3, 7)
+        docs["action_plans"].append({
+            "_id": object_id(rng, planned_at),
+            "goal_id": goal_id_str,
+            "user_id": user_id,
+            "title": f"{title_template.format(n=target)} 실행 계획",
+            "description": "AI가 생성한 맞춤형 실행 계획",
+            "steps": [
+                {
+                    "step_number": number + 1,
+                    "title": STEP_TITLES[number],
+                    "description": f"{STEP_TITLES[number]} 단계를 진행합니다.",
+                    "estimated_time": rng.choice([15, 30, 60, 120]),
+                    "is_completed": status == "completed" or rng.random() < 0.3,
+                    "completed_at": None,
+                }
+                for number in range(step_count)
+            ],
+            "ai_generated": True,
+            "created_at": planned_at,
+            "updated_at": planned_at,
+        })
+
+    interaction_count = skewed_count(rng, 1.5, 0, 40)
+    interaction_times = bursty_times(rng, interaction_count, created_at, anchor)
+    for interacted_at, interaction_type in zip(
+        interaction_times, rng.choices(INTERACTION_TYPES, INTERACTION_WEIGHTS, k=interaction_count)
+    ):
+        docs["ai_interactions"].append({
+            "_id": object_id(rng, interacted_at),
+            "user_id": user_id,
+            "goal_id": goal_id_str,
+            "interaction_type": interaction_type,
+            "prompt": {
+                "template_id": f"{interaction_type}.v1",
+                "params": {"title": title_template.format(n=target), "category": category, "unit": unit},
+            },
+            "tokens_used": rng.randint(150, 900),
+            "ai_response": rng.choice(COACHING_MESSAGES),
+            "created_at": interacted_at,
+        })
+
+
+def _init_worker(mongodb_url: Optional[str]) -> None:
+    global _client
+    # fork 된 프로세스마다 별도의 클라이언트 (부모의 연결을 공유하지 않음)
+    _client = MongoClient(mongodb_url, w=1) if mongodb_url else None
+
+
+def _run_shard(job: Dict[str, Any]) -> Dict[str, Any]:
+    started = time.perf_counter()
+    docs = generate_shard(
+        job["shard"], job["first_user"], job["users"], job["seed"], job["anchor"], job["password_hash"]
+    )
+    generated = time.perf_counter() - started
+    counts = {name: len(items) for name, items in docs.items()}
+    if _client is not None:
+        db = _client[job["database"]]
+        batch_size = job["batch_size"]
+        for name, items in docs.items():
+            for start in range(0, len(items), batch_size):
+                db[name].insert_many(items[start:start + batch_size], ordered=False, bypass_document_validation=True)
+    return {"counts": counts, "generate_seconds": generated, "total_seconds": time.perf_counter() - started}
+
+
+def run(args) -> Dict[str, Any]:
+    from app.core.security import get_password_hash
+
+    anchor = datetime.strptime(args.anchor, "%Y-%m-%d") if args.anchor else datetime.utcnow().replace(
+        hour=0, minute=0, second=0, microsecond=0
+    )
+    password_hash = get_password_hash(args.password)  # bcrypt 는 느리므로 한 번만 계산해 공유
+
+    if not args.dry_run and args.drop:
+        with MongoClient(args.mongodb_url) as client:
+            for name in COLLECTIONS:
+                client[args.database].drop_collection(name)
+
+    jobs = [
+        {
+            "shard": shard,
+            "first_user": first_user,
+            "users": min(args.shard_size, args.users - first_user),
+            "seed": args.seed,
+            "anchor": anchor,
+            "password_hash": password_hash,
+            "database": args.database,
+            "batch_size": args.batch_size,
+        }
+        for shard, first_user in enumerate(range(0, args.users, args.shard_size))
+    ]
+
+    totals = {name: 0 for name in COLLECTIONS}
+    started = time.perf_counter()
+    with ProcessPoolExecutor(
+        max_workers=args.workers,
+        initializer=_init_worker,
+        initargs=(None if args.dry_run else args.mongodb_url,),
+    ) as pool:
+        for done, result in enumerate(pool.map(_run_shard, jobs), start=1):
+            for name, count in result["counts"].items():
+                totals[name] += count
+            if done % max(1, len(jobs) // 10) == 0 or done == len(jobs):
+                written = sum(totals.values())
+                print(f"  {done}/{len(jobs)} 샤드, {written}개 문서, {written / (time.perf_counter() - started):,.0f} docs/s")
+    elapsed = time.perf_counter() - started
+
+    report: Dict[str, Any] = {
+        "database": None if args.dry_run else args.database,
+        "seed": args.seed,
+        "anchor": anchor.strftime("%Y-%m-%d"),
+        "workers": args.workers,
+        "counts": totals,
+        "documents": sum(totals.values()),
+        "elapsed_seconds": round(elapsed, 3),
+        "docs_per_second": round(sum(totals.values()) / elapsed, 1),
+    }
+
+    if args.sync_indexes and not args.dry_run:
+        # 대량 삽입 후에 인덱스를 만드는 편이 삽입 중 인덱스를 유지하는 것보다 빠름
+        report["indexes"] = asyncio.run(_sync_indexes(args.mongodb_url, args.database))
+    return report
+
+
+async def _sync_indexes(mongodb_url: str, database: str) -> Dict[str, List[str]]:
+    import motor.motor_asyncio
+
+    from app.core.indexes import sync_indexes
+
+    client = motor.motor_asyncio.AsyncIOMotorClient(mongodb_url)
+    try:
+        return await sync_indexes(client[database], collections=list(COLLECTIONS))
+    finally:
+        client.close()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="대규모 합성 데이터 생성")
+    parser.add_argument("--mongodb-url", default=settings.MONGODB_URL)
+    parser.add_argument("--database", default=settings.MONGODB_DATABASE)
+    parser.add_argument("--users", type=int, default=10000)
+    parser.add_argument("--workers", type=int, default=os.cpu_count() or 4)
+    parser.add_argument("--shard-size", type=int, default=1000, help="프로세스 하나가 한 번에 생성하는 사용자 수")
+    parser.add_argument("--batch-size", type=int, default=5000, help="insert_many 한 번에 넣는 문서 수")
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--anchor", help="생성 기준일 (YYYY-MM-DD, 기본: 오늘). 같은 시드와 기준일이면 같은 데이터")
+    parser.add_argument("--password", default="password123", help="모든 합성 사용자의 비밀번호")
+    parser.add_argument("--drop", action="store_true", help="생성 전에 대상 컬렉션 삭제")
+    parser.add_argument("--sync-indexes", action="store_true", help="삽입 후 인덱스 레지스트리 동기화")
+    parser.add_argument("--dry-run", action="store_true", help="DB 에 쓰지 않고 생성 속도만 측정")
+    parser.add_argument("--output", help="결과를 저장할 JSON 파일 경로")
+    args = parser.parse_args()
+
+    report = run(args)
+    print(json.dumps(report, ensure_ascii=False, indent=2))
+    if args.output:
+        os.makedirs(os.path.dirname(os.path.abspath(args.output)), exist_ok=True)
+        with open(args.output, "w", encoding="utf-8") as f:
+            json.dump(report, f, ensure_ascii=False, indent=2)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,226 @@
+"""로컬 OpenAI 호환 LLM 스텁 서버.
+
+부하 테스트와 CI 에서 비용 없이 AI 라우트를 호출할 수 있도록 /v1/chat/completions 를
+흉내 냅니다. 응답 내용은 프롬프트 해시로 결정되고, 지연 시간과 오류는 시드가 고정된
+난수로 결정되므로 같은 설정이면 같은 결과를 재현할 수 있습니다.
+
+실행 예:
+    python -m scripts.llm_stub_server --port 8100 --latency lognormal:300,0.4 --error-rate 0.02
+    LLM_PROVIDER=stub LLM_STUB_URL=http://localhost:8100/v1 uvicorn main:app
+"""
+import argparse
+import asyncio
+import hashlib
+import json
+import random
+import re
+import time
+import uuid
+from dataclasses import dataclass
+from typing import Any, Dict, List, Tuple
+
+from fastapi import FastAPI, Request
+from fastapi.responses import JSONResponse, StreamingResponse
+
+from app.core.prompts import estimate_tokens
+
+
+@dataclass
+class StubConfig:
+    latency: str = "fixed:0"  # fixed:ms | uniform:min,max | normal:mean,std | lognormal:median,sigma | exponential:mean
+    error_rate: float = 0.0
+    error_status: int = 500
+    seed: int = 42
+    stream_chunk_chars: int = 16
+    stream_chunk_delay_ms: float = 5.0
+
+
+def parse_latency(spec: str) -> Tuple[str, List[float]]:
+    kind, _, raw = spec.partition(":")
+    params = [float(value) for value in raw.split(",") if value]
+    expected = {"fixed": 1, "uniform": 2, "normal": 2, "lognormal": 2, "exponential": 1}
+    if kind not in expected or len(params) != expected[kind]:
+        raise ValueError(f"잘못된 지연 시간 분포입니다: {spec}")
+    return kind, params
+
+
+class _Sampler:
+    def __init__(self, config: StubConfig):
+        self.kind, self.params = parse_latency(config.latency)
+        self.error_rate = config.error_rate
+        self.rng = random.Random(config.seed)
+
+    def latency_seconds(self) -> float:
+        p = self.params
+        if self.kind == "fixed":
+            ms = p[0]
+        elif self.kind == "uniform":
+            ms = self.rng.uniform(p[0], p[1])
+        elif self.kind == "normal":
+            ms = self.rng.gauss(p[0], p[1])
+        elif self.kind == "lognormal":
+            ms = p[0] * self.rng.lognormvariate(0, p[1])
+        else:
+            ms = self.rng.expovariate(1 / p[0]) if p[0] > 0 else 0
+        return max(0.0, ms) / 1000
+
+    def should_fail(self) -> bool:
+        return self.rng.random() < self.error_rate
+
+
+def _digest(prompt: str) -> bytes:
+    return hashlib.sha256(prompt.encode("utf-8")).digest()
+
+
+def _analysis(seed_bytes: bytes, offset: int = 0) -> Dict[str, Any]:
+    return {
+        "difficulty_score": round(3 + seed_bytes[offset % 32] / 255 * 6, 1),
+        "estimated_duration": 14 + seed_bytes[(offset + 1) % 32] % 150,
+        "success_probability": round(0.4 + seed_bytes[(offset + 2) % 32] / 255 * 0.55, 2),
+        "suggestions": "목표를 주 단위로 나누고 매일 진도를 기록해보세요.",
+    }
+
+
+def build_content(prompt: str) -> str:
+    """프롬프트 종류에 맞는 결정적 응답을 만듭니다."""
+    seed_bytes = _digest(prompt)
+
+    goal_ids = re.findall(r"\[목표 ID: ([^\]]+)\]", prompt)
+    if goal_ids:
+        results = [
+            {"goal_id": goal_id, **_analysis(seed_bytes, index * 3)}
+            for index, goal_id in enumerate(goal_ids)
+        ]
+        return json.dumps({"results": results}, ensure_ascii=False)
+
+    if '"steps"' in prompt:
+        plan = {
+            "title": "단계별 실행 계획",
+            "description": "스텁 서버가 생성한 실행 계획",
+            "steps": [
+                {
+                    "step_number": number,
+                    "title": f"{number}단계",
+                    "description": "구체적인 실행 방법을 정하고 실천합니다.",
+                    "estimated_time": 15 + seed_bytes[number] % 90,
+                }
+                for number in range(1, 4)
+            ],
+        }
+        return json.dumps(plan, ensure_ascii=False)
+
+    if "difficulty_score" in prompt:
+        return json.dumps(_analysis(seed_bytes), ensure_ascii=False)
+
+    return "오늘도 목표를 향해 한 걸음 나아가셨네요! 작은 진전을 꾸준히 기록해보세요. 💪"
+
+
+def create_app(config: StubConfig) -> FastAPI:
+    sampler = _Sampler(config)
+    app = FastAPI(title="GoalMaster LLM Stub")
+    app.state.request_count = 0
+
+    @app.get("/health")
+    async def health():
+        return {"status": "ok", "requests": app.state.request_count}
+
+    @app.get("/v1/models")
+    async def models():
+        return {"object": "list", "data": [{"id": "stub-model", "object": "model", "owned_by": "stub"}]}
+
+    @app.post("/v1/chat/completions")
+    async def chat_completions(request: Request):
+        body = await request.json()
+        app.state.request_count += 1
+        latency = sampler.latency_seconds()
+        fail = sampler.should_fail()
+
+        await asyncio.sleep(latency)
+        if fail:
+            return JSONResponse(
+                status_code=config.error_status,
+                content={"error": {"message": "stub injected error", "type": "server_error", "code": None}},
+            )
+
+        messages = body.get("messages", [])
+        prompt = "\n".join(str(message.get("content", "")) for message in messages)
+        content = build_content(prompt)
+        model = body.get("model", "stub-model")
+        completion_id = f"chatcmpl-{uuid.uuid4().hex[:24]}"
+        created = int(time.time())
+        prompt_tokens = estimate_tokens(prompt)
+        completion_tokens = estimate_tokens(content)
+
+        if body.get("stream"):
+            async def event_stream():
+                step = max(1, config.stream_chunk_chars)
+                for start in range(0, len(content), step):
+                    chunk = {
+                        "id": completion_id,
+                        "object": "chat.completion.chunk",
+                        "created": created,
+                        "model": model,
+                        "choices": [{"index": 0, "delta": {"content": content[start:start + step]}, "finish_reason": None}],
+                    }
+                    yield f"data: {json.dumps(chunk, ensure_ascii=False)}\n\n"
+                    await asyncio.sleep(config.stream_chunk_delay_ms / 1000)
+                done = {
+                    "id": completion_id,
+                    "object": "chat.completion.chunk",
+                    "created": created,
+                    "model": model,
+                    "choices": [{"index": 0, "delta": {}, "finish_reason": "stop"}],
+                }
+                yield f"data: {json.dumps(done)}\n\n"
+                yield "data: [DONE]\n\n"
+
+            return StreamingResponse(event_stream(), media_type="text/event-stream")
+
+        return {
+            "id": completion_id,
+            "object": "chat.completion",
+            "created": created,
+            "model": model,
+            "choices": [{
+                "index": 0,
+                "message": {"role": "assistant", "content": content},
+                "finish_reason": "stop",
+            }],
+            "usage": {
+                "prompt_tokens": prompt_tokens,
+                "completion_tokens": completion_tokens,
+                "total_tokens": prompt_tokens + completion_tokens,
+            },
+        }
+
+    return app
+
+
+def main() -> None:
+    import uvicorn
+
+    parser = argparse.ArgumentParser(description="로컬 OpenAI 호환 LLM 스텁 서버")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8100)
+    parser.add_argument("--latency", default="fixed:0", help="예: fixed:200, uniform:50,300, lognormal:300,0.4")
+    parser.add_argument("--error-rate", type=float, default=0.0)
+    parser.add_argument("--error-status", type=int, default=500)
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--stream-chunk-chars", type=int, default=16)
+    parser.add_argument("--stream-chunk-delay-ms", type=float, default=5.0)
+    args = parser.parse_args()
+
+    config = StubConfig(
+        latency=args.latency,
+        error_rate=args.error_rate,
+        error_status=args.error_status,
+        seed=args.seed,
+        stream_chunk_chars=args.stream_chunk_chars,
+        stream_chunk_delay_ms=args.stream_chunk_delay_ms,
+    )
+    parse_latency(config.latency)
+    uvicorn.run(create_app(config), host=args.host, port=args.port, log_level="warning")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,38 @@
+"""goals 컬렉션을 스트리밍하여 카테고리별 리더보드(Redis sorted set)를 다시 채웁니다.
+
+실행 예:
+    python -m scripts.rebuild_leaderboards --batch-size 1000
+"""
+import argparse
+import asyncio
+import time
+
+import motor.motor_asyncio
+import redis.asyncio as aioredis
+
+from app.core.config import settings
+from app.core.leaderboard import rebuild_leaderboards
+
+
+async def run(batch_size: int) -> None:
+    client = motor.motor_asyncio.AsyncIOMotorClient(settings.MONGODB_URL)
+    redis = aioredis.from_url(settings.REDIS_URL, decode_responses=True)
+    try:
+        started = time.perf_counter()
+        ranked = await rebuild_leaderboards(client[settings.MONGODB_DATABASE], redis, batch_size=batch_size)
+        elapsed = time.perf_counter() - started
+        print(f"리더보드 재구축 완료: {ranked}개 목표, {elapsed:.1f}초")
+    finally:
+        await redis.aclose()
+        client.close()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="카테고리별 리더보드 재구축")
+    parser.add_argument("--batch-size", type=int, default=1000)
+    args = parser.parse_args()
+    asyncio.run(run(args.batch_size))
+
+
+if __name__ == "__main__":
+    main()
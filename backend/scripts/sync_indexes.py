@@ -0,0 +1,59 @@
+"""인덱스 레지스트리(app/models/indexes.py)를 MongoDB 에 반영하거나 쿼리 커버리지를 검사합니다.
+
+실행 예:
+    python -m scripts.sync_indexes                       # 없는 인덱스 생성, 중복/미등록 인덱스 보고
+    python -m scripts.sync_indexes --drop-unregistered   # 레지스트리에 없는 인덱스 삭제
+    python -m scripts.sync_indexes --check-queries       # DB 없이 쿼리 형태별 인덱스 커버리지 검사
+"""
+import argparse
+import asyncio
+import json
+import sys
+
+import motor.motor_asyncio
+
+from app.core.config import settings
+from app.core.indexes import sync_indexes
+from app.models.indexes import QUERY_SHAPES, covering_index
+
+
+def check_queries() -> int:
+    uncovered = 0
+    for shape in QUERY_SHAPES:
+        match = covering_index(shape)
+        if match is None:
+            uncovered += 1
+            print(f"[없음] {shape.source} ({shape.collection})")
+            continue
+        spec, sort_covered = match
+        sort_note = "" if not shape.sort or sort_covered else " (정렬은 메모리에서 수행)"
+        print(f"[인덱스] {shape.source} -> {spec.collection}.{spec.name}{sort_note}")
+    return uncovered
+
+
+async def run(drop_unregistered: bool) -> None:
+    client = motor.motor_asyncio.AsyncIOMotorClient(settings.MONGODB_URL)
+    try:
+        report = await sync_indexes(client[settings.MONGODB_DATABASE], drop_unregistered=drop_unregistered)
+        print(json.dumps(report, ensure_ascii=False, indent=2))
+    finally:
+        client.close()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="MongoDB 인덱스 레지스트리 동기화")
+    parser.add_argument("--drop-unregistered", action="store_true", help="레지스트리에 없는 인덱스를 삭제")
+    parser.add_argument("--check-queries", action="store_true", help="쿼리 형태별 인덱스 커버리지만 검사")
+    args = parser.parse_args()
+
+    if args.check_queries:
+        uncovered = check_queries()
+        if uncovered:
+            print(f"인덱스가 없는 쿼리 {uncovered}개")
+            sys.exit(1)
+        return
+    asyncio.run(run(args.drop_unregistered))
+
+
+if __name__ == "__main__":
+    main()
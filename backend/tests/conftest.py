@@ -0,0 +1,260 @@
+import functools
+import os
+import threading
+import time
+import uuid
+from itertools import count
+from types import SimpleNamespace
+from typing import Any, Callable, Dict, List, Tuple
+
+# 설정은 임포트 시점에 읽히므로 앱 모듈을 가져오기 전에 지정
+# 라우터 테스트는 DB 호출 예산을 넘으면 실패하도록 strict 모드로 실행
+os.environ["DB_BUDGET_MODE"] = "strict"
+os.environ["LIVE_UPDATES_ENABLED"] = "false"
+os.environ["DEADLINE_SCAN_ENABLED"] = "false"
+os.environ["GOAL_STATUS_ENGINE_ENABLED"] = "false"
+
+import fakeredis.aioredis
+import httpx
+import mongomock.collection
+import motor.motor_asyncio
+import pytest
+from mongomock_motor import AsyncMongoMockClient, AsyncMongoMockDatabase
+from pymongo import monitoring
+
+from app.core.llm import LLMProvider, LLMResult, set_llm_provider
+
+# 라우터 테스트용 MongoDB/Redis: mongomock-motor 와 fakeredis 를 lifespan 에 연결합니다.
+# mongomock 은 pymongo 명령 이벤트를 발생시키지 않으므로 컬렉션 호출을 실제 드라이버가 보낼 명령으로 바꿔
+# 클라이언트에 등록된 CommandListener(DB 호출 예산, 지표, 느린 쿼리 등)에 전달합니다.
+
+
+def _filter(args: Tuple, kwargs: Dict[str, Any], name: str = "filter") -> Dict[str, Any]:
+    return (args[0] if args else kwargs.get(name)) or {}
+
+
+def _bulk_updates(args: Tuple, kwargs: Dict[str, Any]) -> Dict[str, Any]:
+    return {"updates": [{"q": getattr(request, "_filter", {})} for request in (args[0] if args else kwargs["requests"])]}
+
+
+# 컬렉션 메서드 -> (명령 이름, 명령 본문)
+_COMMANDS: Dict[str, Tuple[str, Callable[[Tuple, Dict[str, Any]], Dict[str, Any]]]] = {
+    "find_one": ("find", lambda args, kwargs: {"filter": _filter(args, kwargs), "sort": kwargs.get("sort")}),
+    "count_documents": ("aggregate", lambda args, kwargs: {"pipeline": [{"$match": _filter(args, kwargs)}]}),
+    "estimated_document_count": ("count", lambda args, kwargs: {}),
+    "distinct": ("distinct", lambda args, kwargs: {"key": args[0], "query": (args[1] if len(args) > 1 else kwargs.get("filter")) or {}}),
+    "aggregate": ("aggregate", lambda args, kwargs: {"pipeline": args[0] if args else kwargs["pipeline"]}),
+    "insert_one": ("insert", lambda args, kwargs: {}),
+    "insert_many": ("insert", lambda args, kwargs: {}),
+    "update_one": ("update", lambda args, kwargs: {"updates": [{"q": _filter(args, kwargs)}]}),
+    "update_many": ("update", lambda args, kwargs: {"updates": [{"q": _filter(args, kwargs)}]}),
+    "replace_one": ("update", lambda args, kwargs: {"updates": [{"q": _filter(args, kwargs)}]}),
+    "bulk_write": ("update", _bulk_updates),
+    "find_one_and_update": ("findAndModify", lambda args, kwargs: {"query": _filter(args, kwargs)}),
+    "find_one_and_replace": ("findAndModify", lambda args, kwargs: {"query": _filter(args, kwargs)}),
+    "find_one_and_delete": ("findAndModify", lambda args, kwargs: {"query": _filter(args, kwargs)}),
+    "delete_one": ("delete", lambda args, kwargs: {"deletes": [{"q": _filter(args, kwargs)}]}),
+    "delete_many": ("delete", lambda args, kwargs: {"deletes": [{"q": _filter(args, kwargs)}]}),
+}
+
+
+class CommandEvents:
+    """mongomock 컬렉션 호출을 pymongo 명령 이벤트로 바꿔 등록된 리스너에 전달합니다."""
+
+    def __init__(self):
+        self.listeners: List[monitoring.CommandListener] = []
+        self._request_ids = count(1)
+        # mongomock 내부에서 다시 호출하는 메서드(find_one -> find 등)는 한 번만 기록
+        self._depth = threading.local()
+
+    def emit(self, collection, command_name: str, body: Dict[str, Any], call: Callable[[], Any]) -> Any:
+        if getattr(self._depth, "value", 0) or not self.listeners:
+            return call()
+        command = {command_name: collection.name, **body}
+        common = {
+            "command_name": command_name,
+            "database_name": collection.database.name,
+            "request_id": next(self._request_ids),
+            "connection_id": ("mongomock", 27017),
+            "operation_id": None,
+            "service_id": None,
+        }
+        for listener in self.listeners:
+            listener.started(SimpleNamespace(command=command, **common))
+        self._depth.value = 1
+        started = time.perf_counter()
+        try:
+            result = call()
+        except Exception as e:
+            event = SimpleNamespace(duration_micros=int((time.perf_counter() - started) * 1e6), failure={"errmsg": str(e)}, **common)
+            for listener in self.listeners:
+                listener.failed(event)
+            raise
+        finally:
+            self._depth.value = 0
+        event = SimpleNamespace(duration_micros=int((time.perf_counter() - started) * 1e6), reply={"ok": 1}, **common)
+        for listener in self.listeners:
+            listener.succeeded(event)
+        return result
+
+
+command_events = CommandEvents()
+
+
+def _wrap_collection_method(name: str, original: Callable) -> Callable:
+    command_name, build = _COMMANDS[name]
+
+    @functools.wraps(original)
+    def wrapper(self, *args, **kwargs):
+        return command_events.emit(self, command_name, build(args, kwargs), lambda: original(self, *args, **kwargs))
+
+    return wrapper
+
+
+def _wrap_cursor_compute(original: Callable) -> Callable:
+    # Motor 의 find 는 커서를 처음 읽을 때 명령을 보내므로 mongomock 커서가 결과를 처음 계산할 때 기록
+    @functools.wraps(original)
+    def wrapper(self, *args, **kwargs):
+        if self._results:
+            return original(self, *args, **kwargs)
+        body = {"filter": self._spec or {}, "sort": self._sort}
+        return command_events.emit(self.collection, "find", body, lambda: original(self, *args, **kwargs))
+
+    return wrapper
+
+
+@pytest.fixture(scope="session", autouse=True)
+def mongomock_command_events():
+    with pytest.MonkeyPatch.context() as patch:
+        for name in _COMMANDS:
+            patch.setattr(mongomock.collection.Collection, name, _wrap_collection_method(name, getattr(mongomock.collection.Collection, name)))
+        patch.setattr(mongomock.collection.Cursor, "_compute_results", _wrap_cursor_compute(mongomock.collection.Cursor._compute_results))
+        # 읽기 선호도를 적용한 데이터베이스(ReadRouter)도 비동기 인터페이스를 유지
+        patch.setattr(
+            AsyncMongoMockDatabase,
+            "with_options",
+            lambda self, **options: AsyncMongoMockDatabase(self.client, self.delegate.with_options(**options)),
+            raising=False
+        )
+        yield command_events
+
+
+@pytest.fixture
+def anyio_backend():
+    return "asyncio"
+
+
+class StaticLLMProvider(LLMProvider):
+    """네트워크 없이 고정된 응답을 돌려주는 LLM 제공자."""
+
+    name = "test"
+
+    def __init__(self, content: str):
+        self.content = content
+        self.calls = 0
+
+    async def complete(self, messages, max_tokens, temperature, model) -> LLMResult:
+        self.calls += 1
+        return LLMResult(content=self.content, tokens_used=42)
+
+
+@pytest.fixture(autouse=True)
+def llm_provider():
+    provider = StaticLLMProvider("오늘도 한 걸음 나아갔습니다. 내일은 10분 더 달려 보세요!")
+    set_llm_provider(provider)
+    yield provider
+    set_llm_provider(None)
+
+
+@pytest.fixture
+async def app(monkeypatch):
+    """mongomock/fakeredis 로 lifespan 을 실행한 앱."""
+    import main
+
+    def mongo_client(*args, event_listeners=(), **kwargs):
+        command_events.listeners = [listener for listener in event_listeners if isinstance(listener, monitoring.CommandListener)]
+        return AsyncMongoMockClient()
+
+    monkeypatch.setattr(main.motor.motor_asyncio, "AsyncIOMotorClient", mongo_client)
+    monkeypatch.setattr(main.aioredis, "from_url", lambda *args, **kwargs: fakeredis.aioredis.FakeRedis(decode_responses=True))
+    try:
+        async with main.app.router.lifespan_context(main.app):
+            yield main.app
+    finally:
+        command_events.listeners = []
+
+
+@pytest.fixture
+async def client(app):
+    # 앱 예외(strict 모드의 DBBudgetExceeded 포함)는 테스트 실패로 전달됨
+    async with httpx.AsyncClient(transport=httpx.ASGITransport(app=app), base_url="http://testserver") as http:
+        yield http
+
+
+@pytest.fixture
+def db(app):
+    return app.state.mongodb
+
+
+_user_numbers = count(1)
+
+
+@pytest.fixture
+def register_user(client):
+    async def register(name: str = "테스트 사용자") -> Dict[str, str]:
+        """API 로 회원가입하고 인증 헤더를 반환합니다."""
+        response = await client.post("/api/auth/register", json={
+            "email": f"user{next(_user_numbers)}@test.goalmaster.dev",
+            "password": "test-password",
+            "profile": {"name": name},
+        })
+        assert response.status_code == 200, response.text
+        return {"Authorization": f"Bearer {response.json()['access_token']}"}
+
+    return register
+
+
+@pytest.fixture
+async def auth_headers(register_user):
+    return await register_user()
+
+
+@pytest.fixture
+def create_goal(client):
+    async def create(headers: Dict[str, str], **overrides) -> Dict[str, Any]:
+        """API 로 목표를 생성합니다 (_id 는 PyObjectId 직렬화로 문자열로 저장됨)."""
+        payload = {
+            "title": "매일 30분 달리기",
+            "description": "체력을 기르기 위해 매일 달리기를 합니다",
+            "category": "health",
+            "target_value": 30,
+            "current_value": 0,
+            "unit": "일",
+            "deadline": "2030-01-01T00:00:00",
+            "priority": "medium",
+            **overrides,
+        }
+        response = await client.post("/api/goals/", json=payload, headers=headers)
+        assert response.status_code == 200, response.text
+        return response.json()
+
+    return create
+
+
+# mongomock 이 지원하지 않는 기능(explain, arrayFilters 등)은 실제 mongod 에서만 검증
+# 예: TEST_MONGODB_URL=mongodb://localhost:27017 pytest
+TEST_MONGODB_URL = os.environ.get("TEST_MONGODB_URL")
+
+
+@pytest.fixture
+async def real_mongodb():
+    """TEST_MONGODB_URL 의 mongod 에 만든 임시 데이터베이스 (지정하지 않으면 테스트를 건너뜀)."""
+    if not TEST_MONGODB_URL:
+        pytest.skip("TEST_MONGODB_URL 미지정 (실제 mongod 필요)")
+    client = motor.motor_asyncio.AsyncIOMotorClient(TEST_MONGODB_URL)
+    name = f"goalmaster_test_{uuid.uuid4().hex[:8]}"
+    try:
+        yield client[name]
+    finally:
+        await client.drop_database(name)
+        client.close()
@@ -0,0 +1,75 @@
+from datetime import datetime
+from types import SimpleNamespace
+
+import httpx
+import pytest
+from bson import ObjectId
+from fastapi import FastAPI
+
+from app.core.database import get_database
+from app.routers import action_plans
+from app.routers.auth import get_current_user
+
+pytestmark = pytest.mark.anyio
+
+
+@pytest.fixture
+async def plans(real_mongodb):
+    """실제 mongod 에 연결한 실행 계획 라우터 (mongomock 은 arrayFilters 미지원)."""
+    app = FastAPI()
+    app.include_router(action_plans.router, prefix="/api/action-plans")
+    app.dependency_overrides[get_current_user] = lambda: SimpleNamespace(id="user-1")
+    app.dependency_overrides[get_database] = lambda: real_mongodb
+    async with httpx.AsyncClient(transport=httpx.ASGITransport(app=app), base_url="http://testserver") as http:
+        yield http
+
+
+async def _insert_plan(db, user_id: str = "user-1") -> str:
+    result = await db.action_plans.insert_one({
+        "user_id": user_id, "goal_id": "goal-1", "title": "달리기 계획", "description": "",
+        "steps": [
+            {"step_number": 1, "title": "3km", "is_completed": False},
+            {"step_number": 2, "title": "5km", "is_completed": True, "completed_at": datetime(2030, 1, 1)},
+            {"step_number": 3, "title": "10km", "is_completed": False},
+        ],
+        "created_at": datetime(2030, 1, 1),
+    })
+    return str(result.inserted_id)
+
+
+async def _completion(db, plan_id: str):
+    plan = await db.action_plans.find_one({"_id": ObjectId(plan_id)})
+    return [step["is_completed"] for step in plan["steps"]]
+
+
+async def test_update_step_toggles_only_target_step(plans, real_mongodb):
+    plan_id = await _insert_plan(real_mongodb)
+
+    response = await plans.patch(f"/api/action-plans/{plan_id}/steps/1", json={"is_completed": True})
+    assert response.status_code == 200, response.text
+    body = response.json()
+    assert (body["step_number"], body["is_completed"]) == (1, True)
+    assert body["completed_at"] is not None
+    assert (body["completed_steps"], body["total_steps"], body["completion_rate"]) == (2, 3, 66.7)
+    assert await _completion(real_mongodb, plan_id) == [True, True, False]
+
+    response = await plans.patch(f"/api/action-plans/{plan_id}/steps/2", json={"is_completed": False})
+    body = response.json()
+    assert (body["is_completed"], body["completed_at"]) == (False, None)
+    assert (body["completed_steps"], body["completion_rate"]) == (1, 33.3)
+    assert await _completion(real_mongodb, plan_id) == [True, False, False]
+
+
+async def test_update_step_returns_404_for_unknown_step_or_plan(plans, real_mongodb):
+    plan_id = await _insert_plan(real_mongodb)
+    other_plan_id = await _insert_plan(real_mongodb, user_id="user-2")
+
+    for path in (
+        f"/api/action-plans/{plan_id}/steps/9",
+        f"/api/action-plans/{other_plan_id}/steps/1",
+        "/api/action-plans/not-an-id/steps/1",
+    ):
+        response = await plans.patch(path, json={"is_completed": True})
+        assert response.status_code == 404, path
+    assert await _completion(real_mongodb, plan_id) == [False, True, False]
+    assert await _completion(real_mongodb, other_plan_id) == [False, True, False]
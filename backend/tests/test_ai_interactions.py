@@ -0,0 +1,99 @@
+import pytest
+from mongomock_motor import AsyncMongoMockClient
+from pymongo.errors import AutoReconnect
+
+from app.core.ai_interactions import AIInteractionBuffer, decode_ai_response
+
+pytestmark = pytest.mark.anyio
+
+
+def _record(buffer: AIInteractionBuffer, response: str = "좋아요", tokens_used: int = 10) -> None:
+    buffer.record(
+        user_id="user-1",
+        goal_id="goal-1",
+        interaction_type="coaching",
+        template_id="coaching.v1",
+        params={"title": "달리기"},
+        ai_response=response,
+        tokens_used=tokens_used,
+    )
+
+
+class FailingOnce:
+    """처음 한 번만 지정한 메서드 호출을 실패시키는 컬렉션 래퍼."""
+
+    def __init__(self, collection, method: str):
+        self._collection = collection
+        self._method = method
+        self.failed = False
+
+    def __getattr__(self, name):
+        attribute = getattr(self._collection, name)
+        if name != self._method or self.failed:
+            return attribute
+
+        async def fail(*args, **kwargs):
+            if name == "insert_many":
+                # 기록은 저장되었지만 응답을 받지 못한 경우
+                await attribute(*args, **kwargs)
+            self.failed = True
+            raise AutoReconnect("connection reset")
+
+        return fail
+
+
+@pytest.fixture
+def db():
+    return AsyncMongoMockClient()["interactions"]
+
+
+async def test_flush_stores_compressed_records_and_daily_stats(db):
+    buffer = AIInteractionBuffer(db, max_buffer_size=100, compress_threshold=16)
+    _record(buffer, "짧음", tokens_used=5)
+    _record(buffer, "긴 응답 " * 50, tokens_used=7)
+
+    assert await buffer.flush() == 2
+    docs = await db.ai_interactions.find({}).sort("tokens_used", 1).to_list(length=None)
+    assert [decode_ai_response(doc) for doc in docs] == ["짧음", "긴 응답 " * 50]
+    assert "ai_response_z" in docs[1]
+    stats = await db.ai_usage_daily.find_one({"interaction_type": "coaching"})
+    assert (stats["count"], stats["tokens_used"]) == (2, 12)
+
+
+async def test_stats_failure_does_not_wedge_the_buffer(db):
+    buffer = AIInteractionBuffer(db, max_buffer_size=100)
+    stats_collection = FailingOnce(db.ai_usage_daily, "bulk_write")
+    buffer.db = type("DB", (), {"ai_interactions": db.ai_interactions, "ai_usage_daily": stats_collection})()
+
+    _record(buffer)
+    _record(buffer)
+    assert await buffer.flush() == 2
+    assert stats_collection.failed
+
+    # 기록은 다시 넣지 않고 통계만 다음 플러시에서 반영
+    _record(buffer)
+    assert await buffer.flush() == 1
+    for _ in range(3):
+        assert await buffer.flush() == 0
+    assert await db.ai_interactions.count_documents({}) == 3
+    stats = await db.ai_usage_daily.find_one({"interaction_type": "coaching"})
+    assert (stats["count"], stats["tokens_used"]) == (3, 30)
+
+
+async def test_insert_retry_after_lost_reply_counts_records_once(db):
+    buffer = AIInteractionBuffer(db, max_buffer_size=100)
+    interactions = FailingOnce(db.ai_interactions, "insert_many")
+    buffer.db = type("DB", (), {"ai_interactions": interactions, "ai_usage_daily": db.ai_usage_daily})()
+
+    _record(buffer)
+    _record(buffer)
+    assert await buffer.flush() == 0
+    assert interactions.failed
+
+    # 이미 저장된 기록은 중복 키로 저장된 것으로 처리
+    _record(buffer)
+    assert await buffer.flush() == 3
+    assert await buffer.flush() == 0
+    assert await db.ai_interactions.count_documents({}) == 3
+    stats = await db.ai_usage_daily.find_one({"interaction_type": "coaching"})
+    assert stats["count"] == 3
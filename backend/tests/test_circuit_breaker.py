@@ -0,0 +1,80 @@
+import asyncio
+
+import pytest
+
+from app.core import llm
+from app.core.circuit_breaker import CircuitBreaker, CircuitOpenError
+from app.core.llm import LLMProvider, LLMResult, chat_completion, set_llm_provider
+
+pytestmark = pytest.mark.anyio
+
+
+class HangingProvider(LLMProvider):
+    """호출이 끝나지 않는 제공자 (요청 취소 재현용)."""
+
+    name = "hanging"
+
+    def __init__(self):
+        self.started = asyncio.Event()
+        self.fail = False
+
+    async def complete(self, messages, max_tokens, temperature, model) -> LLMResult:
+        self.started.set()
+        if self.fail:
+            raise ConnectionError("provider down")
+        await asyncio.Event().wait()
+
+
+@pytest.fixture
+def breaker(monkeypatch):
+    breaker = CircuitBreaker("test", minimum_calls=2, window_size=4, open_seconds=0.05)
+    monkeypatch.setattr(llm, "llm_breaker", breaker)
+    return breaker
+
+
+def test_breaker_opens_then_half_opens_then_closes():
+    breaker = CircuitBreaker("test", minimum_calls=2, window_size=4, open_seconds=0.0)
+    breaker.record_failure()
+    breaker.record_failure()
+    assert breaker.state == CircuitBreaker.HALF_OPEN  # open_seconds=0 이므로 바로 시험 호출 허용
+    assert breaker.allow_request()
+    assert not breaker.allow_request()
+    breaker.record_success(0.1)
+    assert breaker.state == CircuitBreaker.CLOSED
+
+
+def test_release_returns_half_open_slot_without_recording():
+    breaker = CircuitBreaker("test", minimum_calls=1, open_seconds=0.0)
+    breaker.record_failure()
+    assert breaker.allow_request()
+    assert not breaker.allow_request()
+    breaker.release()
+    assert breaker.state == CircuitBreaker.HALF_OPEN
+    assert breaker.allow_request()
+
+
+async def test_cancelled_half_open_call_releases_trial_slot(breaker, llm_provider):
+    provider = HangingProvider()
+    set_llm_provider(provider)
+    provider.fail = True
+    for _ in range(2):
+        with pytest.raises(ConnectionError):
+            await chat_completion([{"role": "user", "content": "hi"}], max_tokens=10)
+    with pytest.raises(CircuitOpenError):
+        await chat_completion([{"role": "user", "content": "hi"}], max_tokens=10)
+
+    await asyncio.sleep(0.06)
+    provider.fail = False
+    provider.started.clear()
+    trial = asyncio.ensure_future(chat_completion([{"role": "user", "content": "hi"}], max_tokens=10))
+    await provider.started.wait()
+    assert breaker.state == CircuitBreaker.HALF_OPEN
+    trial.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await trial
+
+    # 취소된 시험 호출이 슬롯을 돌려줬으므로 다음 호출이 시험 호출이 되어 회로를 닫음
+    set_llm_provider(llm_provider)
+    result = await chat_completion([{"role": "user", "content": "hi"}], max_tokens=10)
+    assert result.content == llm_provider.content
+    assert breaker.state == CircuitBreaker.CLOSED
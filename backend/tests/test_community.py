@@ -0,0 +1,44 @@
+from datetime import datetime, timedelta
+
+import pytest
+
+from app.core.similarity import rebuild_index
+
+pytestmark = pytest.mark.anyio
+
+async def _seed_similar_users(db, start: int, stop: int) -> None:
+    """같은 카테고리/비슷한 제목의 활성 목표를 가진 사용자를 직접 추가합니다."""
+    users, goals = [], []
+    for number in range(start, stop):
+        user_id = f"seed-user-{number}"
+        users.append({"_id": user_id, "email": f"{user_id}@test.goalmaster.dev", "profile": {"name": f"러너 {number}"}})
+        goals.append({
+            "_id": f"seed-goal-{number}", "user_id": user_id, "title": "매일 30분 달리기",
+            "description": "체력을 기르기 위해 매일 달리기를 합니다", "category": "health",
+            "target_value": 30, "current_value": 0, "unit": "일", "status": "active",
+            "created_at": datetime(2030, 1, 1) + timedelta(minutes=number),
+        })
+    await db.users.insert_many(users)
+    await db.goals.insert_many(goals)
+    await rebuild_index(db)
+
+
+@pytest.mark.parametrize("mode", ["category", "text"])
+async def test_similar_users_command_count_does_not_grow_with_matches(client, db, auth_headers, create_goal, mode):
+    await create_goal(auth_headers)
+
+    async def similar():
+        response = await client.get(
+            "/api/community/users/similar-goals", params={"mode": mode, "limit": 50}, headers=auth_headers
+        )
+        assert response.status_code == 200, response.text
+        return response.json(), int(response.headers["X-DB-Commands"])
+
+    await _seed_similar_users(db, 0, 4)
+    users, commands = await similar()
+    assert len(users) == 4
+
+    await _seed_similar_users(db, 4, 40)
+    users, commands_10x = await similar()
+    assert len(users) == 40
+    assert commands_10x == commands
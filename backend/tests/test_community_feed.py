@@ -0,0 +1,88 @@
+from datetime import datetime, timedelta
+
+import fakeredis.aioredis
+import pytest
+from mongomock_motor import AsyncMongoMockClient
+
+from app.core import community_feed
+from app.core.community_feed import _to_post, _warm_cache, get_feed_page, push_post
+
+pytestmark = pytest.mark.anyio
+
+_BASE = datetime(2030, 1, 1)
+
+
+@pytest.fixture
+def server():
+    return fakeredis.FakeServer()
+
+
+@pytest.fixture
+def redis(server):
+    return fakeredis.aioredis.FakeRedis(server=server, decode_responses=True)
+
+
+async def _add_post(db, number: int, category: str = "health") -> dict:
+    doc = {
+        "_id": f"post-{number:03d}", "user_id": "user-1", "author": "러너", "title": f"{number}번째 기록",
+        "content": "오늘도 달렸습니다.", "category": category, "created_at": _BASE + timedelta(minutes=number),
+    }
+    await db.community_posts.insert_one(doc)
+    return doc
+
+
+async def _read_posts(db):
+    return await db.community_posts.find({}).sort([("created_at", -1), ("_id", -1)]).to_list(length=None)
+
+
+async def test_cold_cache_is_warmed_from_primary_not_replica(redis):
+    primary = AsyncMongoMockClient()["feed"]
+    replica = AsyncMongoMockClient()["feed"]  # 아직 새 글을 반영하지 못한 세컨더리
+    for number in (1, 2):
+        await _add_post(primary, number)
+        await _add_post(replica, number)
+    await _add_post(primary, 3)
+
+    page = await get_feed_page(replica, redis, limit=10, primary=primary)
+    assert [post.id for post in page.posts] == ["post-003", "post-002", "post-001"]
+    cached = await get_feed_page(replica, redis, limit=10, primary=primary)
+    assert [post.id for post in cached.posts] == ["post-003", "post-002", "post-001"]
+
+
+async def test_post_written_before_warm_finishes_is_kept(redis):
+    db = AsyncMongoMockClient()["feed"]
+    await _add_post(db, 1)
+    docs = await _read_posts(db)
+
+    # 캐시를 채우기 전에 작성된 글: 리스트가 없어 LPUSHX 는 건너뜀
+    late = await _add_post(db, 2)
+    await push_post(redis, _to_post(late))
+    await _warm_cache(redis, None, docs)
+
+    page = await get_feed_page(db, redis, limit=10)
+    assert [post.id for post in page.posts] == ["post-002", "post-001"]
+
+
+async def test_post_written_during_warm_is_merged_on_retry(redis, server, monkeypatch):
+    db = AsyncMongoMockClient()["feed"]
+    await _add_post(db, 1)
+    docs = await _read_posts(db)
+    late = _to_post(await _add_post(db, 2))
+    other_worker = fakeredis.FakeRedis(server=server)
+    merge_recent = community_feed._merge_recent
+    seen = []
+
+    def merge_while_posting(posts, recent, category):
+        seen.append(len(recent))
+        if len(seen) == 1:
+            # WATCH 이후 저장 전에 다른 워커의 push_post 가 실행됨 (리스트가 없어 LPUSHX 는 건너뜀)
+            other_worker.zadd(community_feed._RECENT_KEY, {late.model_dump_json(): 1.0})
+            other_worker.lpushx(community_feed._feed_key(None), late.model_dump_json())
+        return merge_recent(posts, recent, category)
+
+    monkeypatch.setattr(community_feed, "_merge_recent", merge_while_posting)
+    await _warm_cache(redis, None, docs)
+
+    assert seen == [0, 1]
+    page = await get_feed_page(db, redis, limit=10)
+    assert [post.id for post in page.posts] == ["post-002", "post-001"]
@@ -0,0 +1,116 @@
+import httpx
+import pytest
+from fastapi import Depends, FastAPI
+from mongomock_motor import AsyncMongoMockClient
+
+from app.core.db_budget import DBBudgetExceeded, DBBudgetListener, DBBudgetMiddleware, db_call_budget, track_db_calls
+
+pytestmark = pytest.mark.anyio
+
+
+@pytest.fixture
+def budget_app(mongomock_command_events):
+    """예산을 지키는 라우트와 넘는 라우트만 있는 작은 앱."""
+    mongomock_command_events.listeners = [DBBudgetListener()]
+    db = AsyncMongoMockClient()["budget"]
+    app = FastAPI()
+    app.add_middleware(DBBudgetMiddleware)
+
+    def get_db():
+        return db
+
+    @app.get("/within")
+    @db_call_budget(2)
+    async def within(db=Depends(get_db)):
+        await db.goals.find_one({"user_id": "a"})
+        await db.users.find_one({"_id": "a"})
+        return {}
+
+    @app.get("/over")
+    @db_call_budget(1)
+    async def over(db=Depends(get_db)):
+        await db.goals.find_one({"user_id": "a"})
+        await db.users.find_one({"_id": "a"})
+        return {}
+
+    @app.get("/n-plus-one")
+    @db_call_budget(10, max_repeats=2)
+    async def n_plus_one(db=Depends(get_db)):
+        for user_id in ("a", "b", "c"):
+            await db.users.find_one({"_id": user_id})
+        return {}
+
+    yield app
+    mongomock_command_events.listeners = []
+
+
+async def _get(app: FastAPI, path: str) -> httpx.Response:
+    async with httpx.AsyncClient(transport=httpx.ASGITransport(app=app), base_url="http://testserver") as http:
+        return await http.get(path)
+
+
+async def test_strict_mode_fails_route_over_budget(budget_app):
+    assert (await _get(budget_app, "/within")).status_code == 200
+    with pytest.raises(DBBudgetExceeded, match="MongoDB 명령 2회 \\(예산 1회\\)"):
+        await _get(budget_app, "/over")
+
+
+async def test_strict_mode_fails_repeated_query_shape(budget_app):
+    with pytest.raises(DBBudgetExceeded, match="같은 형태의 쿼리 3회 반복"):
+        await _get(budget_app, "/n-plus-one")
+
+
+async def test_track_db_calls_groups_by_shape(mongomock_command_events):
+    mongomock_command_events.listeners = [DBBudgetListener()]
+    db = AsyncMongoMockClient()["budget"]
+    try:
+        with track_db_calls() as stats:
+            await db.users.find_one({"_id": "a"})
+            await db.users.find_one({"_id": "b"})
+            await db.goals.find({"user_id": "a"}).sort("created_at", -1).to_list(length=None)
+    finally:
+        mongomock_command_events.listeners = []
+    assert stats.commands == 3
+    assert stats.max_repeats() == 2
+
+
+async def test_routers_stay_within_budget(client, register_user, create_goal):
+    """주요 라우트를 strict 모드로 실행합니다 (예산을 넘으면 DBBudgetExceeded 로 실패)."""
+    headers = await register_user()
+    other = await register_user("다른 사용자")
+
+    assert (await client.get("/api/auth/me", headers=headers)).status_code == 200
+    assert (await client.post("/api/auth/refresh", headers=headers)).status_code == 200
+
+    goal = await create_goal(headers)
+    await create_goal(headers, title="책 12권 읽기", category="education", target_value=12, unit="권")
+    await create_goal(other, title="주 3회 달리기")
+
+    listed = await client.get("/api/goals/", headers=headers)
+    assert listed.status_code == 200
+    assert len(listed.json()) == 2
+    assert int(listed.headers["X-DB-Commands"]) == 2  # 인증 1회 + 목록 1회
+    assert (await client.get("/api/goals/debug/all", headers=headers)).status_code == 404
+    filtered = await client.get("/api/goals/", params={"status": "active", "category": "health"}, headers=headers)
+    assert [item["id"] for item in filtered.json()] == [goal["id"]]
+
+    updated = await client.put(f"/api/goals/{goal['id']}", json={"current_value": 3}, headers=headers)
+    assert updated.status_code == 200
+    assert updated.json()["current_value"] == 3
+
+    assert (await client.get(f"/api/progress/goal/{goal['id']}", headers=headers)).status_code == 200
+    assert (await client.get("/api/notifications/", headers=headers)).status_code == 200
+    assert (await client.post("/api/notifications/read", json={"ids": []}, headers=headers)).status_code == 200
+
+    post = await client.post("/api/community/posts", json={
+        "title": "첫 기록", "content": "오늘 5km 달렸습니다.", "category": "health"
+    }, headers=headers)
+    assert post.status_code == 200
+    feed = await client.get("/api/community/posts", params={"category": "health"})
+    assert [item["id"] for item in feed.json()["posts"]] == [post.json()["id"]]
+    similar = await client.get("/api/community/users/similar-goals", headers=headers)
+    assert [user["name"] for user in similar.json()] == ["다른 사용자"]
+    assert (await client.get("/api/community/leaderboards/health", headers=headers)).status_code == 200
+    assert (await client.get("/api/community/leaderboards/health/me", headers=headers)).status_code == 200
+
+    assert (await client.delete(f"/api/goals/{goal['id']}", headers=headers)).status_code == 200
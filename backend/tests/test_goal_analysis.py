@@ -0,0 +1,21 @@
+import json
+
+import pytest
+
+pytestmark = pytest.mark.anyio
+
+
+async def test_analysis_is_saved_on_goal_created_through_api(client, db, auth_headers, create_goal, llm_provider):
+    goal = await create_goal(auth_headers)
+    llm_provider.content = json.dumps({
+        "difficulty_score": 4, "estimated_duration": 60, "success_probability": 0.8, "suggestions": "주 3회부터 시작하세요"
+    }, ensure_ascii=False)
+
+    response = await client.post("/api/ai/analyze-goal", params={"goal_id": goal["id"]}, headers=auth_headers)
+    assert response.status_code == 200, response.text
+
+    stored = await db.goals.find_one({"_id": goal["id"]})
+    assert stored["ai_analysis"] == response.json()["analysis"]
+    assert stored["ai_analysis"]["suggestions"] == "주 3회부터 시작하세요"
+    detail = await client.get(f"/api/goals/{goal['id']}", headers=auth_headers)
+    assert detail.json()["ai_analysis"]["difficulty_score"] == stored["ai_analysis"]["difficulty_score"]
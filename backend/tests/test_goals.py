@@ -0,0 +1,72 @@
+from datetime import datetime
+
+import pytest
+
+pytestmark = pytest.mark.anyio
+
+
+async def test_bundle_for_goal_created_through_api(client, db, auth_headers, create_goal, llm_provider):
+    goal = await create_goal(auth_headers)
+    stored = await db.goals.find_one({"title": goal["title"]})
+    assert stored["_id"] == goal["id"]  # PyObjectId 가 문자열로 직렬화되어 저장됨
+
+    user_id = goal["user_id"]
+    await db.progress_logs.insert_many([
+        {"user_id": user_id, "goal_id": goal["id"], "log_type": "progress", "value": day,
+         "description": f"{day}일차", "created_at": datetime(2030, 1, day)}
+        for day in (1, 2, 3)
+    ])
+    await db.action_plans.insert_one({
+        "user_id": user_id, "goal_id": goal["id"], "title": "달리기 계획", "description": "",
+        "steps": [{"step_number": 1, "title": "5km", "is_completed": True}, {"step_number": 2, "title": "10km"}],
+        "created_at": datetime(2030, 1, 1),
+    })
+
+    response = await client.get(f"/api/goals/{goal['id']}/bundle", params={"logs_limit": 2}, headers=auth_headers)
+    assert response.status_code == 200, response.text
+    bundle = response.json()
+    assert bundle["goal"]["id"] == goal["id"]
+    assert [log["description"] for log in bundle["logs"]] == ["3일차", "2일차"]
+    assert bundle["plan"]["completion_rate"] == 50.0
+    assert bundle["coaching"]["message"] == llm_provider.content
+
+    # 선택한 항목만, 코칭 메시지는 캐시에서
+    response = await client.get(
+        f"/api/goals/{goal['id']}/bundle", params={"fields": "logs,coaching"}, headers=auth_headers
+    )
+    assert set(response.json()) == {"logs", "coaching"}
+    assert llm_provider.calls == 1
+
+
+async def test_goal_detail_and_bundle_are_scoped_to_owner(client, register_user, create_goal):
+    owner = await register_user()
+    other = await register_user("다른 사용자")
+    goal = await create_goal(owner)
+
+    assert (await client.get(f"/api/goals/{goal['id']}", headers=owner)).json()["id"] == goal["id"]
+    assert (await client.get(f"/api/goals/{goal['id']}", headers=other)).status_code == 404
+    assert (await client.get(f"/api/goals/{goal['id']}/bundle", headers=other)).status_code == 404
+
+
+async def test_progress_log_updates_and_completes_api_created_goal(client, db, auth_headers, create_goal):
+    goal = await create_goal(auth_headers, target_value=5)
+
+    response = await client.post("/api/progress/", json={
+        "goal_id": goal["id"], "log_type": "progress", "value": 3, "description": "3일차"
+    }, headers=auth_headers)
+    assert response.status_code == 200, response.text
+    detail = (await client.get(f"/api/goals/{goal['id']}", headers=auth_headers)).json()
+    assert (detail["current_value"], detail["status"]) == (3, "active")
+
+    # 목표치에 도달하면 같은 업데이트에서 completed 로 전환되고 전환 이벤트가 남음
+    response = await client.post("/api/progress/", json={
+        "goal_id": goal["id"], "log_type": "progress", "value": 5, "description": "목표 달성"
+    }, headers=auth_headers)
+    assert response.status_code == 200, response.text
+    detail = (await client.get(f"/api/goals/{goal['id']}", headers=auth_headers)).json()
+    assert (detail["current_value"], detail["status"]) == (5, "completed")
+    event = await db.goal_status_events.find_one({"goal_id": goal["id"]})
+    assert (event["from_status"], event["to_status"]) == ("active", "completed")
+
+    logs = (await client.get(f"/api/progress/goal/{goal['id']}", headers=auth_headers)).json()
+    assert [log["description"] for log in logs] == ["목표 달성", "3일차"]
@@ -0,0 +1,129 @@
+from typing import Any, Dict, Optional, Set, Tuple
+
+import pytest
+from pymongo import monitoring
+
+from app.core.indexes import sync_indexes
+from app.models.indexes import QUERY_SHAPES, IndexKeys, QueryShape, covering_index, uncovered_queries
+
+pytestmark = pytest.mark.anyio
+
+
+def _equality_fields(query: Dict[str, Any]) -> Optional[Tuple[str, ...]]:
+    """최상위 동등/$in 조건 필드 ($ne, 범위 조건은 인덱스 접두사로 보지 않음). _id 조회는 None."""
+    if "_id" in query:
+        return None
+    return tuple(sorted(
+        field for field, condition in query.items()
+        if not field.startswith("$") and not (isinstance(condition, dict) and set(condition) - {"$eq", "$in"})
+    ))
+
+
+def _sort_keys(sort: Any) -> IndexKeys:
+    if not sort:
+        return ()
+    return tuple((field, direction) for field, direction in (sort.items() if isinstance(sort, dict) else sort))
+
+
+def _normalized(shape: QueryShape) -> Tuple[str, Tuple[str, ...], IndexKeys]:
+    return shape.collection, tuple(sorted(shape.equality)), shape.sort
+
+
+class QueryShapeRecorder(monitoring.CommandListener):
+    """라우터가 실제로 보낸 읽기 명령을 QueryShape 로 기록합니다 (_id 조회 제외)."""
+
+    def __init__(self):
+        self.shapes: Set[QueryShape] = set()
+
+    def started(self, event):
+        command = event.command
+        name = event.command_name
+        if name == "find":
+            query, sort = command["filter"], command.get("sort")
+        elif name == "distinct":
+            query, sort = command["query"], None
+        elif name == "findAndModify":
+            query, sort = command["query"], None
+        elif name == "aggregate" and command["pipeline"] and "$match" in command["pipeline"][0]:
+            pipeline = command["pipeline"]
+            query, sort = pipeline[0]["$match"], pipeline[1].get("$sort") if len(pipeline) > 1 else None
+        else:
+            return
+        equality = _equality_fields(query)
+        if equality is None or (not equality and not sort):
+            return
+        self.shapes.add(QueryShape(name, command[name], equality, _sort_keys(sort)))
+
+    def succeeded(self, event):
+        pass
+
+    def failed(self, event):
+        pass
+
+
+def test_registered_query_shapes_are_covered():
+    assert uncovered_queries() == []
+
+
+async def test_router_queries_are_registered_and_covered(client, mongomock_command_events, register_user, create_goal):
+    recorder = QueryShapeRecorder()
+    mongomock_command_events.listeners.append(recorder)
+
+    async def ok(method: str, path: str, **kwargs):
+        response = await client.request(method, path, **kwargs)
+        assert response.status_code == 200, f"{method} {path}: {response.text}"
+        return response.json()
+
+    credentials = {"email": "index-check@test.goalmaster.dev", "password": "test-password"}
+    await ok("POST", "/api/auth/register", json={**credentials, "profile": {"name": "인덱스 확인"}})
+    login = await ok("POST", "/api/auth/login", json=credentials)
+    headers = {"Authorization": f"Bearer {login['access_token']}"}
+    other = await register_user("다른 사용자")
+    goal = await create_goal(headers)
+    await create_goal(other, title="주 3회 달리기")
+    await ok("GET", "/api/goals/", headers=headers)
+    await ok("GET", "/api/goals/", params={"status": "active", "category": "health"}, headers=headers)
+    await ok("POST", "/api/progress/", json={
+        "goal_id": goal["id"], "log_type": "progress", "value": 3, "description": "3일차"
+    }, headers=headers)
+    await ok("GET", f"/api/progress/goal/{goal['id']}", headers=headers)
+    await ok("GET", f"/api/goals/{goal['id']}/bundle", headers=headers)
+    await ok("GET", "/api/notifications/", headers=headers)
+    await ok("GET", "/api/community/posts")
+    await ok("GET", "/api/community/posts", params={"category": "health"})
+    await ok("GET", "/api/community/users/similar-goals", headers=headers)
+    await ok("GET", "/api/community/users/similar-goals", params={"mode": "text"}, headers=headers)
+    await ok("GET", "/api/community/leaderboards/health/me", headers=headers)
+
+    # 진도 기록 쓰기/조회 경로가 실제로 실행되었는지 확인
+    assert ("progress_logs", ("goal_id", "user_id"), (("created_at", -1),)) in {
+        _normalized(shape) for shape in recorder.shapes
+    }
+    assert len(recorder.shapes) >= 10
+    registered = {_normalized(shape) for shape in QUERY_SHAPES}
+    unregistered = [shape for shape in recorder.shapes if _normalized(shape) not in registered]
+    assert unregistered == []
+    assert [shape for shape in recorder.shapes if covering_index(shape) is None] == []
+
+
+def _winning_stages(plan: Dict[str, Any]) -> Set[str]:
+    stages = {plan["stage"]}
+    for child in [plan.get("inputStage")] + plan.get("inputStages", []):
+        if child:
+            stages |= _winning_stages(child)
+    return stages
+
+
+async def test_covering_index_matches_explain_plan(real_mongodb):
+    """covering_index 가 고른 인덱스를 hint 로 지정해 실제 플래너가 IXSCAN 과 인덱스 정렬을 쓰는지 확인합니다."""
+    await sync_indexes(real_mongodb)
+    for shape in QUERY_SHAPES:
+        spec, sort_covered = covering_index(shape)
+        cursor = real_mongodb[shape.collection].find({field: "x" for field in shape.equality}).hint(spec.name)
+        if shape.sort:
+            cursor = cursor.sort(list(shape.sort))
+        explain = await cursor.explain()
+        stages = _winning_stages(explain["queryPlanner"]["winningPlan"])
+        assert "IXSCAN" in stages, shape.source
+        if shape.sort and sort_covered:
+            assert "SORT" not in stages, shape.source
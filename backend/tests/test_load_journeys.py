@@ -0,0 +1,22 @@
+import random
+from types import SimpleNamespace
+
+import pytest
+
+from benchmarks.load_journeys import JourneyClient, RouteStats, run_journey
+
+pytestmark = pytest.mark.anyio
+
+
+async def test_load_journey_runs_without_errors(client):
+    """부하 벤치마크의 사용자 여정이 오류 없이 끝나는지 확인합니다 (mongod 없이 라우터만 검증)."""
+    stats = RouteStats()
+    args = SimpleNamespace(goals_per_user=2, logs_per_goal=2)
+    for index in range(2):
+        await run_journey(JourneyClient(client, stats), "test", index, args, random.Random(index))
+
+    summary = stats.summary(elapsed=1.0)
+    assert {route: (values["errors"], values["error_statuses"]) for route, values in summary.items() if values["errors"]} == {}
+    assert summary["POST /api/progress/"]["requests"] == 8
+    assert summary["GET /api/goals/{goal_id}/bundle"]["requests"] == 4
+    assert summary["POST /api/ai/analyze-goal"]["requests"] == 2
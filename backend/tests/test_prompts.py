@@ -0,0 +1,20 @@
+import re
+from pathlib import Path
+
+from app.core.prompts import PROMPT_TEMPLATES, render_prompt
+
+ROUTERS = Path(__file__).resolve().parents[1] / "app" / "routers"
+
+
+def test_superseded_template_still_renders_stored_params():
+    assert render_prompt("coaching_summary.v1", {"title": "달리기", "progress_rate": 42.0}) == "목표: 달리기, 진도율: 42.0%"
+
+
+def test_every_template_used_by_routers_is_registered():
+    used = set()
+    for path in ROUTERS.glob("*.py"):
+        source = path.read_text(encoding="utf-8")
+        used.update(re.findall(r'render_prompt\(\s*"([^"]+)"', source))
+        used.update(re.findall(r'template_id="([^"]+)"', source))
+    assert used
+    assert used <= set(PROMPT_TEMPLATES)
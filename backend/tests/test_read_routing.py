@@ -0,0 +1,58 @@
+from types import SimpleNamespace
+
+import fakeredis.aioredis
+import httpx
+import pytest
+from bson import Timestamp
+from fastapi import FastAPI
+from mongomock_motor import AsyncMongoMockClient
+
+from app.core.cache import TwoTierCache, user_tag
+from app.core.read_routing import CausalWriteListener, CausalWriteMiddleware, ReadRouter
+from app.core.security import create_access_token
+
+pytestmark = pytest.mark.anyio
+
+
+def _write(time: int) -> None:
+    """쓰기 명령 응답을 받은 것처럼 CausalWriteListener 에 전달합니다 (mongomock 응답에는 operationTime 이 없음)."""
+    CausalWriteListener().succeeded(SimpleNamespace(
+        command_name="update", reply={"ok": 1, "operationTime": Timestamp(time, 1)}
+    ))
+
+
+async def test_write_time_is_remembered_before_cache_invalidation():
+    redis = fakeredis.aioredis.FakeRedis(decode_responses=True)
+    router = ReadRouter(
+        AsyncMongoMockClient()["routing"], redis,
+        preferences={"goals": "secondaryPreferred"}, max_staleness=90, causal_window=60
+    )
+    cache = TwoTierCache(redis, local_max_entries=10, local_ttl=1.0, ttl=60, lock_timeout=1.0, early_refresh_beta=0.0)
+    seen_at_invalidation = []
+    invalidate_script = cache._invalidate_script
+
+    async def spy(keys, args):
+        # 태그 버전이 바뀌는 시점에 동시 읽기가 보게 될 마지막 쓰기 시각
+        seen_at_invalidation.append((await router.last_write("user-1")).operation_time)
+        return await invalidate_script(keys=keys, args=args)
+
+    cache._invalidate_script = spy
+
+    app = FastAPI()
+    app.add_middleware(CausalWriteMiddleware)
+    app.state.read_router = router
+
+    @app.post("/write")
+    async def write():
+        _write(100)
+        await cache.invalidate(user_tag("user-1"))
+        _write(101)  # 무효화 뒤의 쓰기는 응답 전에 저장
+        return {}
+
+    headers = {"Authorization": f"Bearer {create_access_token('user-1')}"}
+    async with httpx.AsyncClient(transport=httpx.ASGITransport(app=app), base_url="http://testserver") as http:
+        assert (await http.post("/write", headers=headers)).status_code == 200
+
+    assert seen_at_invalidation == [Timestamp(100, 1)]
+    assert (await router.last_write("user-1")).operation_time == Timestamp(101, 1)
+    assert router.snapshot()["counts"]["remembered"] == 2
@@ -0,0 +1,12 @@
+from benchmarks.startup import COLD_START_BUDGET_MS, IMPORT_BUDGET_MS, LAZY_MODULES, child_env, measure
+
+
+def test_cold_start_stays_within_budget():
+    """새 프로세스에서 import main 과 lifespan 시작 시간을 재고 지연 로딩 대상 모듈이 로드되지 않았는지 확인합니다."""
+    assert set(LAZY_MODULES) >= {"openai", "apscheduler", "passlib"}
+    runs, summary, failures = measure(3, child_env())
+
+    assert [run["eager_modules"] for run in runs] == [[], [], []]
+    assert summary["import_ms"] <= IMPORT_BUDGET_MS
+    assert summary["cold_start_ms"] <= COLD_START_BUDGET_MS
+    assert failures == []
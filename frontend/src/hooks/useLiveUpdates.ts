@@ -0,0 +1,93 @@
+import { useEffect, useRef, useState } from 'react';
+import axios from 'axios';
+
+// 백엔드 /ws 에서 받는 목표/진행 기록 변경분
+export type LiveUpdateMessage =
+  | { type: 'insert' | 'replace'; collection: string; id: string; document: Record<string, any> }
+  | { type: 'update'; collection: string; id: string; fields: Record<string, any>; removed: string[] }
+  | { type: 'resync' };
+
+const PING_INTERVAL_MS = 30000;
+const MAX_RETRY_DELAY_MS = 30000;
+
+// axios baseURL(http/https)을 WebSocket 주소(ws/wss)로 변환
+const liveUpdatesUrl = () => {
+  const base = axios.defaults.baseURL || window.location.origin;
+  return `${base.replace(/^http/, 'ws').replace(/\/$/, '')}/ws`;
+};
+
+// 최신순 목록에 변경분을 적용 (insert 는 앞에 추가, 이미 있으면 교체)
+export const applyLiveUpdate = <T extends { id: string }>(items: T[], message: LiveUpdateMessage): T[] => {
+  if (message.type === 'resync') return items;
+  if (message.type === 'update') {
+    return items.map(item => {
+      if (item.id !== message.id) return item;
+      const updated: Record<string, any> = { ...item, ...message.fields };
+      message.removed.forEach(field => delete updated[field]);
+      return updated as T;
+    });
+  }
+  const document = message.document as T;
+  if (items.some(item => item.id === message.id)) {
+    return items.map(item => (item.id === message.id ? document : item));
+  }
+  return message.type === 'insert' ? [document, ...items] : items;
+};
+
+// 로그인한 사용자의 변경분을 구독합니다. 연결이 끊겼다가 다시 연결되면 그 사이 변경을 놓쳤을 수 있으므로 resync 를 전달합니다.
+// 반환값은 서버가 변경분을 보내고 있는지 여부입니다 (false 이면 기존처럼 직접 다시 조회해야 함).
+export const useLiveUpdates = (token: string | null, onMessage: (message: LiveUpdateMessage) => void) => {
+  const [isLive, setIsLive] = useState(false);
+  const handlerRef = useRef(onMessage);
+  handlerRef.current = onMessage;
+
+  useEffect(() => {
+    if (!token) return;
+
+    let socket: WebSocket | null = null;
+    let stopped = false;
+    let attempts = 0;
+    let connectedBefore = false;
+    let retryTimer: ReturnType<typeof setTimeout> | undefined;
+    let pingTimer: ReturnType<typeof setInterval> | undefined;
+
+    const connect = () => {
+      socket = new WebSocket(liveUpdatesUrl());
+      socket.onopen = () => {
+        socket?.send(JSON.stringify({ type: 'auth', token }));
+        pingTimer = setInterval(() => socket?.send(JSON.stringify({ type: 'ping' })), PING_INTERVAL_MS);
+      };
+      socket.onmessage = (event) => {
+        const message = JSON.parse(event.data);
+        if (message.type === 'pong') return;
+        if (message.type === 'hello') {
+          attempts = 0;
+          setIsLive(Boolean(message.live));
+          if (connectedBefore) handlerRef.current({ type: 'resync' });
+          connectedBefore = true;
+          return;
+        }
+        handlerRef.current(message as LiveUpdateMessage);
+      };
+      socket.onclose = () => {
+        clearInterval(pingTimer);
+        setIsLive(false);
+        if (stopped) return;
+        // 지수 백오프로 다시 연결
+        const delay = Math.min(MAX_RETRY_DELAY_MS, 1000 * 2 ** attempts);
+        attempts += 1;
+        retryTimer = setTimeout(connect, delay);
+      };
+    };
+
+    connect();
+    return () => {
+      stopped = true;
+      clearTimeout(retryTimer);
+      clearInterval(pingTimer);
+      socket?.close();
+    };
+  }, [token]);
+
+  return isLive;
+};
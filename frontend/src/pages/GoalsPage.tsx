@@ -18,7 +18,8 @@ const GoalsPage: React.FC = () => {
     active: '진행중',
     completed: '완료',
     paused: '일시정지',
-    cancelled: '취소'
+    cancelled: '취소',
+    expired: '기한 만료'
   };
 
   const categoryLabels = {
@@ -45,7 +46,8 @@ const GoalsPage: React.FC = () => {
     active: 'bg-blue-100 text-blue-800',
     completed: 'bg-green-100 text-green-800',
     paused: 'bg-yellow-100 text-yellow-800',
-    cancelled: 'bg-red-100 text-red-800'
+    cancelled: 'bg-red-100 text-red-800',
+    expired: 'bg-gray-100 text-gray-800'
   };
 
   const fetchGoals = async () => {
@@ -126,18 +128,6 @@ const GoalsPage: React.FC = () => {
     setIsEditModalOpen(true);
   };
 
-  const handleDebugCheck = async () => {
-    try {
-      console.log('디버깅 API 호출 중...');
-      const response = await axios.get('/api/goals/debug/all');
-      console.log('디버깅 API 응답:', response.data);
-      alert('디버깅 정보가 콘솔에 출력되었습니다. F12를 눌러 확인하세요.');
-    } catch (error) {
-      console.error('디버깅 API 호출 실패:', error);
-      alert('디버깅 API 호출에 실패했습니다.');
-    }
-  };
-
   if (isLoading) {
     return (
       <div className="px-4 py-6 sm:px-0">
@@ -153,12 +143,6 @@ const GoalsPage: React.FC = () => {
       <div className="flex justify-between items-center mb-6">
         <h1 className="text-3xl font-bold text-gray-900">목표 관리</h1>
         <div className="flex space-x-2">
-          {/* <button
-            onClick={handleDebugCheck}
-            className="bg-red-600 hover:bg-red-700 text-white font-bold py-2 px-4 rounded-lg text-sm"
-          >
-            디버깅 확인
-          </button> */}
           <button
             onClick={() => setIsCreateModalOpen(true)}
             className="bg-primary-600 hover:bg-primary-700 text-white font-bold py-2 px-4 rounded-lg"
@@ -183,6 +167,7 @@ const GoalsPage: React.FC = () => {
               <option value="completed">완료</option>
               <option value="paused">일시정지</option>
               <option value="cancelled">취소</option>
+              <option value="expired">기한 만료</option>
             </select>
           </div>
           <div>
@@ -286,6 +271,7 @@ const GoalsPage: React.FC = () => {
                     <option value="completed">완료</option>
                     <option value="paused">일시정지</option>
                     <option value="cancelled">취소</option>
+                    <option value="expired" disabled>기한 만료</option>
                   </select>
                   <div className="flex space-x-2">
                     <button
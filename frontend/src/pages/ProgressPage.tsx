@@ -3,6 +3,8 @@ import axios from 'axios';
 import { Chart as ChartJS, CategoryScale, LinearScale, PointElement, LineElement, Title, Tooltip, Legend, ArcElement } from 'chart.js';
 import { Line, Doughnut } from 'react-chartjs-2';
 import { Goal } from '../types/goal';
+import { useAuth } from '../contexts/AuthContext';
+import { applyLiveUpdate, LiveUpdateMessage, useLiveUpdates } from '../hooks/useLiveUpdates';
 
 ChartJS.register(CategoryScale, LinearScale, PointElement, LineElement, Title, Tooltip, Legend, ArcElement);
 
@@ -23,6 +25,7 @@ interface AICoachingMessage {
 }
 
 const ProgressPage: React.FC = () => {
+  const { token } = useAuth();
   const [goals, setGoals] = useState<Goal[]>([]);
   const [selectedGoal, setSelectedGoal] = useState<Goal | null>(null);
   const [progressLogs, setProgressLogs] = useState<ProgressLog[]>([]);
@@ -53,30 +56,51 @@ const ProgressPage: React.FC = () => {
     }
   };
 
-  const fetchProgressLogs = async (goalId: string) => {
+  // 선택한 목표의 진도 기록과 코칭 메시지를 한 번의 요청으로 조회 (/api/goals/{id}/bundle)
+  const fetchGoalBundle = async (goalId: string, fields: string = 'logs,coaching') => {
     try {
-      const response = await axios.get(`/api/progress/goal/${goalId}`);
-      setProgressLogs(response.data);
+      const response = await axios.get(`/api/goals/${goalId}/bundle`, {
+        params: { fields, logs_limit: 100, message_type: 'daily' }
+      });
+      if (response.data.logs) {
+        setProgressLogs(response.data.logs);
+      }
+      if (response.data.coaching) {
+        setCoachingMessage(response.data.coaching);
+      }
     } catch (error) {
-      console.error('진도 기록 조회 실패:', error);
+      console.error('목표 정보 조회 실패:', error);
+      if (fields.includes('coaching')) {
+        // 실패 시 기본 메시지 설정
+        setCoachingMessage({
+          message: "오늘도 목표를 향해 한 걸음씩 나아가고 계시는군요! 꾸준히 노력하는 모습이 멋집니다. 💪",
+          type: "daily",
+          created_at: new Date().toISOString()
+        });
+      }
     }
   };
 
-  const fetchCoachingMessage = async (goalId: string) => {
-    try {
-      const response = await axios.get(`/api/ai/get-coaching/${goalId}?message_type=daily`);
-      setCoachingMessage(response.data);
-    } catch (error) {
-      console.error('AI 코칭 메시지 조회 실패:', error);
-      // 실패 시 기본 메시지 설정
-      setCoachingMessage({
-        message: "오늘도 목표를 향해 한 걸음씩 나아가고 계시는군요! 꾸준히 노력하는 모습이 멋집니다. 💪",
-        type: "daily",
-        created_at: new Date().toISOString()
-      });
+  const fetchProgressLogs = (goalId: string) => fetchGoalBundle(goalId, 'logs');
+
+  // 서버에서 받은 변경분을 목록에 바로 적용 (목록 전체를 다시 조회하지 않음)
+  const handleLiveUpdate = (message: LiveUpdateMessage) => {
+    if (message.type === 'resync') {
+      fetchGoals();
+      if (selectedGoal) fetchProgressLogs(selectedGoal.id);
+      return;
+    }
+    if (message.collection === 'goals') {
+      setGoals(current => applyLiveUpdate(current, message));
+      setSelectedGoal(current => (current && current.id === message.id ? applyLiveUpdate([current], message)[0] : current));
+    } else if (message.collection === 'progress_logs') {
+      if (message.type !== 'update' && message.document.goal_id !== selectedGoal?.id) return;
+      setProgressLogs(current => applyLiveUpdate(current, message));
     }
   };
 
+  const isLive = useLiveUpdates(token, handleLiveUpdate);
+
   useEffect(() => {
     const loadData = async () => {
       setIsLoading(true);
@@ -88,10 +112,9 @@ const ProgressPage: React.FC = () => {
 
   useEffect(() => {
     if (selectedGoal) {
-      fetchProgressLogs(selectedGoal.id);
-      fetchCoachingMessage(selectedGoal.id);
+      fetchGoalBundle(selectedGoal.id);
     }
-  }, [selectedGoal]);
+  }, [selectedGoal?.id]);
 
   const handleAddProgress = async (e: React.FormEvent) => {
     e.preventDefault();
@@ -118,9 +141,11 @@ const ProgressPage: React.FC = () => {
       });
       setIsAddingProgress(false);
       
-      // 데이터 새로고침
-      fetchProgressLogs(selectedGoal.id);
-      fetchGoals(); // 목표의 current_value가 업데이트될 수 있음
+      // 실시간 연결이 있으면 새 기록과 목표의 current_value 변경이 /ws 로 전달됨
+      if (!isLive) {
+        fetchProgressLogs(selectedGoal.id);
+        fetchGoals(); // 목표의 current_value가 업데이트될 수 있음
+      }
     } catch (error) {
       console.error('진도 기록 추가 실패:', error);
       alert('진도 기록 추가에 실패했습니다.');
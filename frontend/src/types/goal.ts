@@ -9,7 +9,7 @@ export interface Goal {
   unit: string;
   deadline: string;
   priority: 'high' | 'medium' | 'low';
-  status: 'active' | 'completed' | 'paused' | 'cancelled';
+  status: 'active' | 'completed' | 'paused' | 'cancelled' | 'expired';
   ai_analysis?: {
     difficulty_score: number;
     estimated_duration: number;
@@ -1,43 +1,17 @@
 // MongoDB 초기화 스크립트
-// GoalMaster 데이터베이스 생성 및 기본 인덱스 설정
+// GoalMaster 데이터베이스 및 개발용 샘플 데이터 생성
 
 // 데이터베이스 선택
 db = db.getSiblingDB('goalmaster');
 
-// 컬렉션 생성 및 인덱스 설정
-
-// Users 컬렉션
-db.createCollection('users');
-db.users.createIndex({ "email": 1 }, { unique: true });
-db.users.createIndex({ "created_at": 1 });
-
-// Goals 컬렉션
-db.createCollection('goals');
-db.goals.createIndex({ "user_id": 1 });
-db.goals.createIndex({ "status": 1 });
-db.goals.createIndex({ "category": 1 });
-db.goals.createIndex({ "deadline": 1 });
-db.goals.createIndex({ "created_at": -1 });
-
-// Action_Plans 컬렉션
-db.createCollection('action_plans');
-db.action_plans.createIndex({ "goal_id": 1 });
-db.action_plans.createIndex({ "user_id": 1 });
-db.action_plans.createIndex({ "created_at": -1 });
-
-// Progress_Logs 컬렉션
-db.createCollection('progress_logs');
-db.progress_logs.createIndex({ "goal_id": 1 });
-db.progress_logs.createIndex({ "user_id": 1 });
-db.progress_logs.createIndex({ "created_at": -1 });
-db.progress_logs.createIndex({ "log_type": 1 });
-
-// AI_Interactions 컬렉션
-db.createCollection('ai_interactions');
-db.ai_interactions.createIndex({ "user_id": 1 });
-db.ai_interactions.createIndex({ "goal_id": 1 });
-db.ai_interactions.createIndex({ "interaction_type": 1 });
-db.ai_interactions.createIndex({ "created_at": -1 });
+// 컬렉션 생성
+// 인덱스는 backend/app/models/indexes.py 레지스트리가 기준이며
+// 백엔드 시작 시 또는 `python -m scripts.sync_indexes` 로 생성됩니다.
+['users', 'goals', 'action_plans', 'progress_logs', 'ai_interactions'].forEach(function (name) {
+    if (!db.getCollectionNames().includes(name)) {
+        db.createCollection(name);
+    }
+});
 
 // 샘플 데이터 생성 (개발 환경용)
 const sampleUser = {